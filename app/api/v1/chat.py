@@ -8,6 +8,7 @@ from pydantic import BaseModel, UUID4
 from datetime import datetime
 
 from app.core.deps import get_db, get_current_user
+from app.core.lazy import LazySingleton
 from app.models.user import User
 from app.services.chat_service import ChatService
 from app.models.chat import ChatSessionStatus, ChatSessionState
@@ -46,8 +47,8 @@ class UpdateSessionStateRequest(BaseModel):
     state: ChatSessionState
     context: Optional[dict] = None
 
-# Initialize service
-chat_service = ChatService()
+# Initialize service on first request
+chat_service = LazySingleton(ChatService)
 
 @router.post("/sessions", response_model=CreateSessionResponse, status_code=201)
 async def create_chat_session(
@@ -14,14 +14,13 @@ from datetime import datetime
 import json
 import os
 
-# Conditionally import GCP services
-USE_GCP = os.getenv("USE_GCP", "true").lower() == "true"
-if USE_GCP:
-    try:
-        from google.cloud import pubsub_v1
-    except ImportError:
-        USE_GCP = False
-        pubsub_v1 = None
+from app.core.lazy import module_available
+
+# Pub/Sub is imported when a PDF job is first published
+USE_GCP = (
+    os.getenv("USE_GCP", "true").lower() == "true"
+    and module_available("google.cloud.pubsub_v1")
+)
 
 from app.models.user import User
 from app.models.motion import Motion, MotionDraft, Document
@@ -201,7 +200,9 @@ async def generate_pdf_background(
 ):
     """Background task to generate PDF"""
     try:
-        if USE_GCP and pubsub_v1:
+        if USE_GCP:
+            from google.cloud import pubsub_v1
+
             # Publish to Pub/Sub for processing
             publisher = pubsub_v1.PublisherClient()
             topic_path = publisher.topic_path(settings.PROJECT_ID, settings.PUBSUB_TOPIC)
@@ -12,6 +12,7 @@ from app.core.database import get_db
 from app.models.user import User
 from app.models.motion import Motion, MotionDraft
 from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.endpoints.llm import discard_predraft, schedule_predraft
 from app.services.intake import intake_service
 
 router = APIRouter()
@@ -39,6 +40,7 @@ class ValidationResponse(BaseModel):
     valid: bool
     errors: Dict[str, str] = {}
     next_step: Optional[IntakeStepResponse] = None
+    predraft_started: bool = False  # Intake complete; sections are being drafted ahead
 
 @router.get("/rfo/steps")
 async def get_rfo_steps(
@@ -227,7 +229,9 @@ async def submit_intake_step(
             question_data=submission.answers
         )
         db.add(draft)
-    
+
+    # Answers changed: any pre-draft was made from the old ones
+    discard_predraft(motion)
     await db.commit()
     
     # Get all answers so far for condition evaluation
@@ -283,11 +287,15 @@ async def submit_intake_step(
             next_step_response = None
     else:
         next_step_response = None
-    
+
+    # Last step saved: every answer the motion needs is in, so start drafting
+    predraft_started = next_step_response is None and schedule_predraft(db, motion, current_user)
+
     return ValidationResponse(
         valid=True,
         errors={},
-        next_step=next_step_response
+        next_step=next_step_response,
+        predraft_started=predraft_started
     )
 
 @router.get("/rfo/{motion_id}/summary")
@@ -2,11 +2,16 @@
 LLM integration endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select
+from datetime import datetime
+import asyncio
+import json
 import logging
+import os
 import uuid
 
 from app.models.user import User
@@ -15,12 +20,36 @@ from app.models.profile import Profile
 from app.api.v1.endpoints.auth import get_current_user
 from app.core.database import get_db
 from app.services import semantic_check_service
-from app.services.fact_gate import GateContext, merge_intake_values, run_fact_gate
-from app.services.llm_service import llm_service
+from app.services.fact_gate import (
+    GateContext,
+    GatePlan,
+    GateResult,
+    StreamingGate,
+    compile_gate_plan,
+    merge_intake_values,
+    run_fact_gate,
+    run_fact_gate_many,
+)
+from app.services.llm_scheduler import background_priority
+from app.services.llm_service import SECTION_CONCURRENCY, llm_service
+from app.services.progress_indicator_service import OperationType, progress_service
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# A queued/running job whose state has not changed for this long is presumed
+# dead (worker restart) and is resumed by the next submit
+MOTION_JOB_STALE_SECONDS = int(os.getenv("MOTION_JOB_STALE_SECONDS", "300"))
+_ACTIVE_JOB_STATUSES = ("queued", "running")
+# Jobs running in this worker, by job id
+_motion_jobs: Dict[str, asyncio.Task] = {}
+
+# Draft a motion in the background as soon as its intake is complete
+# (opt-in: spends tokens on motions the user may still edit or abandon)
+SPECULATIVE_DRAFTING_ENABLED = os.getenv("SPECULATIVE_DRAFTING_ENABLED", "false").lower() == "true"
+# Pre-drafts running in this worker, by motion id
+_predrafts: Dict[str, asyncio.Task] = {}
+
 class RewriteRequest(BaseModel):
     motion_type: str  # 'RFO' or 'RESPONSE'
     section: str  # 'facts', 'relief', 'best_interests', etc.
@@ -44,6 +73,19 @@ class ProcessMotionResponse(BaseModel):
     total_tokens: int
     errors: List[str] = []
     corrections: List[Dict[str, Any]] = []
+    sections_reused: int = 0
+    sections_prefetched: int = 0
+
+class MotionJobResponse(BaseModel):
+    job_id: str
+    motion_id: str
+    status: str  # queued, running, completed, failed
+    sections_total: int
+    sections_done: int
+    resumed: bool = False
+    error: Optional[str] = None
+    result: Optional[ProcessMotionResponse] = None
+    progress: Optional[Dict[str, Any]] = None
 
 
 def _gate_context(motion: Motion, drafts, profile_data: Dict[str, Any]) -> GateContext:
@@ -66,6 +108,237 @@ def _gate_context(motion: Motion, drafts, profile_data: Dict[str, Any]) -> GateC
         intake_values=intake_values,
     )
 
+async def _load_motion(motion_id: str, current_user: User, db: AsyncSession):
+    """(motion, profile_data, drafts) for an owned motion; 404/400 otherwise."""
+    motion_result = await db.execute(
+        select(Motion)
+        .where(Motion.id == uuid.UUID(motion_id))
+        .where(Motion.user_id == current_user.id)
+    )
+    motion = motion_result.scalar_one_or_none()
+
+    if not motion:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Motion not found"
+        )
+
+    profile_result = await db.execute(
+        select(Profile)
+        .where(Profile.user_id == current_user.id)
+    )
+    profile = profile_result.scalar_one_or_none()
+
+    profile_data = {}
+    if profile:
+        profile_data = {
+            "is_petitioner": profile.is_petitioner,
+            "county": profile.county,
+            "case_number": profile.case_number,
+            "party_name": profile.party_name,
+            "other_party_name": profile.other_party_name,
+            "children_info": profile.children_info
+        }
+
+    drafts_result = await db.execute(
+        select(MotionDraft)
+        .where(MotionDraft.motion_id == motion.id)
+        .order_by(MotionDraft.step_number)
+    )
+    drafts = drafts_result.scalars().all()
+
+    if not drafts:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No draft sections found for this motion"
+        )
+    return motion, profile_data, drafts
+
+
+def _save_gated_section(
+    draft: MotionDraft,
+    gated,
+    model: Optional[str],
+    tokens: int,
+    fingerprint: Optional[str] = None,
+) -> None:
+    draft.llm_output = gated.text
+    draft.llm_model = model
+    draft.llm_tokens_used = tokens
+    draft.input_fingerprint = fingerprint
+    draft.is_complete = True
+
+
+def _stored_fingerprint(draft: MotionDraft) -> Optional[str]:
+    """Fingerprint of the draft's stored output, if there is one to reuse."""
+    if draft.is_complete and draft.llm_output:
+        return draft.input_fingerprint
+    return None
+
+
+def _draft_inputs(drafts) -> List[Dict[str, Any]]:
+    """What llm_service.process_complete_motion needs from each draft row."""
+    return [
+        {
+            "step_number": draft.step_number,
+            "step_name": draft.step_name,
+            "question_data": draft.question_data,
+            "input_fingerprint": _stored_fingerprint(draft)
+        }
+        for draft in drafts
+    ]
+
+
+def _prefetched(motion: Motion) -> Dict[str, Dict[str, Any]]:
+    """Speculatively pre-drafted sections, by input fingerprint."""
+    return (motion.speculative_drafts or {}).get("sections") or {}
+
+
+def _reused_corrections(motion: Motion, section_name: Optional[str]) -> List[Dict[str, Any]]:
+    """Gate corrections recorded for an unchanged section on the previous run."""
+    previous = (motion.fact_check or {}).get("corrections") or []
+    return [
+        c for c in previous
+        if c.get("section") == (section_name or "") and c.get("type") != "semantic_flag"
+    ]
+
+
+def _regate_reused(
+    motion: Motion, draft: MotionDraft, gate_plan: GatePlan
+) -> List[Dict[str, Any]]:
+    """Re-gate an unchanged section's stored output; its corrections for this run.
+
+    The fingerprint covers what the section's prompt sees, but the gate checks
+    every section against the whole merged intake, so an edit to another step
+    can change what it allows. The stored text is already gated, so this is
+    normally a no-op that keeps the previous corrections; anything the current
+    plan newly rejects is corrected in the stored text and reported.
+    """
+    previous = _reused_corrections(motion, draft.step_name)
+    gate_plan.ctx.section_name = draft.step_name or ""
+    gated = run_fact_gate(draft.llm_output, gate_plan.ctx, gate_plan)
+    draft.llm_output = gated.text
+    new = [c.as_dict() for c in gated.corrections]
+    return previous + [c for c in new if c not in previous]
+
+
+class _MotionRun:
+    """What one processing run has gated, reused and failed so far."""
+
+    def __init__(self):
+        self.corrections: List[Dict[str, Any]] = []
+        self.gated_texts: List[str] = []
+        self.reused_texts: List[str] = []
+        self.errors: List[str] = []
+        self.sections_processed = 0
+        self.sections_prefetched = 0
+        self.total_tokens = 0
+
+
+def _apply_section(
+    run: _MotionRun,
+    section: Dict[str, Any],
+    drafts,
+    motion: Motion,
+    gate_plan: GatePlan,
+    model: Optional[str],
+    gated: Optional[GateResult] = None,
+) -> None:
+    """Gate one llm_service section result and save it onto its draft.
+
+    gated is the section's result if it was already gated (run_fact_gate_many).
+    """
+    run.total_tokens += section.get("tokens_used", 0)
+    if not section.get("success"):
+        run.errors.append(f"Section {section.get('section')}: {section.get('error')}")
+        return
+    draft = next((d for d in drafts if d.step_number == section.get("step_number")), None)
+    if draft is None:
+        return
+    if section.get("reused"):
+        # Unchanged inputs: keep the stored output, re-gated against this run's intake
+        run.corrections.extend(_regate_reused(motion, draft, gate_plan))
+        run.reused_texts.append(draft.llm_output)
+        run.sections_processed += 1
+        return
+    if gated is None:
+        gate_plan.ctx.section_name = section.get("section") or ""
+        gated = run_fact_gate(section.get("rewritten_text"), gate_plan.ctx, gate_plan)
+    _save_gated_section(
+        draft, gated, model, section.get("tokens_used", 0), section.get("input_fingerprint")
+    )
+    run.gated_texts.append(gated.text)
+    run.corrections.extend(c.as_dict() for c in gated.corrections)
+    run.sections_processed += 1
+    if section.get("speculative"):
+        run.sections_prefetched += 1
+
+
+async def _finish_motion(
+    motion: Motion,
+    draft_count: int,
+    sections_processed: int,
+    gated_texts: List[str],
+    corrections: List[Dict[str, Any]],
+    gate_plan: GatePlan,
+    profile_data: Dict[str, Any],
+    reused_texts: Optional[List[str]] = None,
+) -> None:
+    """Semantic check, fact_check report and status — shared by batch and stream.
+
+    gated_texts are the sections rewritten on this run; reused_texts are
+    unchanged sections kept from the previous run. Only new text is sent to
+    the semantic check; previous reviewer flags are kept while the text they
+    quote is still in an unchanged section.
+    """
+    if reused_texts:
+        previous = (motion.fact_check or {}).get("corrections") or []
+        kept_text = "\n\n".join(reused_texts)
+        corrections.extend(
+            c for c in previous
+            if c.get("type") == "semantic_flag"
+            and (not gated_texts or (c.get("original") or "") in kept_text)
+        )
+
+    # One semantic refute-pass over the newly gated text (flag-only, fail-open)
+    if gated_texts:
+        corrections.extend(
+            await semantic_check_service.check_text(
+                "\n\n".join(gated_texts), gate_plan.ctx.intake_values, profile_data,
+                plan=gate_plan,
+            )
+        )
+
+    motion.fact_check = {"version": 1, "corrections": corrections}
+
+    # Update motion status if all sections processed
+    if sections_processed == draft_count:
+        motion.status = "ready_for_review"
+
+
+async def _replay(text: str):
+    """A stored section as a one-chunk delta stream."""
+    yield text
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _rewrite_gate_context(request: RewriteRequest) -> GateContext:
+    context = request.context or {}
+    return GateContext(
+        section_name=request.section,
+        party_name=context.get("party_name") or "",
+        other_party_name=context.get("other_party_name") or "",
+        is_petitioner=context.get("party_role", "Petitioner") != "Respondent",
+        case_number=context.get("case_number") or "",
+        county=context.get("county") or "",
+        children=context.get("children_info") or [],
+        intake_values={"user_input": request.user_input},
+    )
+
+
 class DeclarationRequest(BaseModel):
     narrative: str
     declarant_name: str
@@ -107,6 +380,84 @@ async def rewrite_text(
             error=str(e)
         )
 
+def _background_sessions(db: AsyncSession):
+    """Session factory for work that outlives the request (and its session)."""
+    return async_sessionmaker(db.bind, class_=AsyncSession, expire_on_commit=False)
+
+
+def discard_predraft(motion: Motion) -> None:
+    """Drop a motion's speculative pre-draft: its inputs are being edited."""
+    task = _predrafts.pop(str(motion.id), None)
+    if task is not None:
+        task.cancel()
+    motion.speculative_drafts = None
+
+
+def schedule_predraft(db: AsyncSession, motion: Motion, user: User) -> bool:
+    """Start pre-drafting a motion whose intake just completed (if enabled)."""
+    if not SPECULATIVE_DRAFTING_ENABLED:
+        return False
+    motion_id = str(motion.id)
+    task = asyncio.create_task(_run_predraft(_background_sessions(db), motion_id, user.id))
+    _predrafts[motion_id] = task
+
+    def forget(done: asyncio.Task) -> None:
+        if _predrafts.get(motion_id) is done:
+            del _predrafts[motion_id]
+
+    task.add_done_callback(forget)
+    return True
+
+
+async def _run_predraft(session_factory, motion_id: str, user_id) -> None:
+    """Draft every section ahead of /process-motion, at background priority.
+
+    Nothing is gated or written onto the drafts: raw section results are
+    stored by input fingerprint in motions.speculative_drafts, and a later
+    process-motion uses only those whose inputs still match.
+    """
+    try:
+        async with session_factory() as db:
+            user = await db.get(User, user_id)
+            motion, profile_data, drafts = await _load_motion(motion_id, user, db)
+            with background_priority():
+                result = await llm_service.process_complete_motion(
+                    motion_type=motion.motion_type,
+                    all_drafts=_draft_inputs(drafts),
+                    profile_data=profile_data,
+                    max_concurrency=SECTION_CONCURRENCY
+                )
+            motion.speculative_drafts = {
+                "created_at": datetime.utcnow().isoformat(),
+                "sections": {
+                    section["input_fingerprint"]: {
+                        "step_number": section.get("step_number"),
+                        "rewritten_text": section.get("rewritten_text"),
+                        "tokens_used": section.get("tokens_used", 0),
+                        "model": section.get("model"),
+                    }
+                    for section in result.get("sections", [])
+                    if section.get("success") and not section.get("reused")
+                },
+            }
+            await db.commit()
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        # Speculative: the user's own process-motion call drafts normally
+        logger.warning(f"Pre-draft of motion {motion_id} failed: {str(e)}")
+
+
+async def _join_predraft(motion_id: str) -> None:
+    """Wait for this worker's in-flight pre-draft of the motion, if any.
+
+    Shielded so a client that gives up does not cancel the pre-draft.
+    """
+    task = _predrafts.get(motion_id)
+    if task is not None:
+        await asyncio.gather(asyncio.shield(task), return_exceptions=True)
+
+
 @router.post("/process-motion", response_model=ProcessMotionResponse)
 async def process_complete_motion(
     request: ProcessMotionRequest,
@@ -116,118 +467,57 @@ async def process_complete_motion(
 ):
     """Process all sections of a motion through LLM"""
     try:
-        # Get motion and verify ownership
-        motion_result = await db.execute(
-            select(Motion)
-            .where(Motion.id == uuid.UUID(request.motion_id))
-            .where(Motion.user_id == current_user.id)
-        )
-        motion = motion_result.scalar_one_or_none()
-        
-        if not motion:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Motion not found"
-            )
-        
-        # Get user profile
-        profile_result = await db.execute(
-            select(Profile)
-            .where(Profile.user_id == current_user.id)
-        )
-        profile = profile_result.scalar_one_or_none()
-        
-        profile_data = {}
-        if profile:
-            profile_data = {
-                "is_petitioner": profile.is_petitioner,
-                "county": profile.county,
-                "case_number": profile.case_number,
-                "party_name": profile.party_name,
-                "other_party_name": profile.other_party_name,
-                "children_info": profile.children_info
-            }
-        
-        # Get all drafts for the motion
-        drafts_result = await db.execute(
-            select(MotionDraft)
-            .where(MotionDraft.motion_id == motion.id)
-            .order_by(MotionDraft.step_number)
+        await _join_predraft(request.motion_id)
+        motion, profile_data, drafts = await _load_motion(
+            request.motion_id, current_user, db
         )
-        drafts = drafts_result.scalars().all()
-        
-        if not drafts:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No draft sections found for this motion"
-            )
-        
-        # Prepare draft data
-        draft_data = [
-            {
-                "step_number": draft.step_number,
-                "step_name": draft.step_name,
-                "question_data": draft.question_data
-            }
-            for draft in drafts
-        ]
-        
+
         # Process through LLM
         result = await llm_service.process_complete_motion(
             motion_type=motion.motion_type,
-            all_drafts=draft_data,
+            all_drafts=_draft_inputs(drafts),
             profile_data=profile_data,
-            should_abort=http_request.is_disconnected
+            should_abort=http_request.is_disconnected,
+            max_concurrency=SECTION_CONCURRENCY,
+            prefetched=_prefetched(motion)
         )
         
-        # Gate each rewritten section against user-entered facts, then save
-        gate_ctx = _gate_context(motion, drafts, profile_data)
-        corrections: List[Dict[str, Any]] = []
-        gated_texts: List[str] = []
-        errors = []
-        sections_processed = 0
-
-        for section in result.get("sections", []):
-            if section.get("success"):
-                # Find and update the corresponding draft
-                for draft in drafts:
-                    if draft.step_number == section.get("step_number"):
-                        gate_ctx.section_name = section.get("section") or ""
-                        gated = run_fact_gate(section.get("rewritten_text"), gate_ctx)
-                        draft.llm_output = gated.text
-                        gated_texts.append(gated.text)
-                        corrections.extend(c.as_dict() for c in gated.corrections)
-                        draft.llm_model = result.get("model")
-                        draft.llm_tokens_used = section.get("tokens_used", 0)
-                        draft.is_complete = True
-                        sections_processed += 1
-                        break
-            else:
-                errors.append(f"Section {section.get('section')}: {section.get('error')}")
-
-        # One semantic refute-pass over the whole gated motion (flag-only, fail-open)
-        if gated_texts:
-            corrections.extend(
-                await semantic_check_service.check_text(
-                    "\n\n".join(gated_texts), gate_ctx.intake_values, profile_data
-                )
+        # Gate every rewritten section against user-entered facts (across the
+        # gate's worker pool, off the event loop), then save
+        gate_plan = compile_gate_plan(_gate_context(motion, drafts, profile_data))
+        sections = result.get("sections", [])
+        rewritten = [s for s in sections if s.get("success") and not s.get("reused")]
+        gated = await asyncio.to_thread(
+            run_fact_gate_many,
+            [s.get("rewritten_text") for s in rewritten],
+            gate_plan.ctx,
+            gate_plan,
+            [s.get("section") or "" for s in rewritten],
+        )
+        gated_by_section = {id(s): g for s, g in zip(rewritten, gated)}
+        run = _MotionRun()
+        for section in sections:
+            _apply_section(
+                run, section, drafts, motion, gate_plan, result.get("model"),
+                gated_by_section.get(id(section)),
             )
 
-        motion.fact_check = {"version": 1, "corrections": corrections}
-
-        # Update motion status if all sections processed
-        if sections_processed == len(drafts):
-            motion.status = "ready_for_review"
-
+        await _finish_motion(
+            motion, len(drafts), run.sections_processed, run.gated_texts, run.corrections,
+            gate_plan, profile_data, run.reused_texts
+        )
+        motion.speculative_drafts = None
         await db.commit()
 
         return ProcessMotionResponse(
             motion_id=request.motion_id,
             success=result.get("success", False),
-            sections_processed=sections_processed,
+            sections_processed=run.sections_processed,
             total_tokens=result.get("total_tokens", 0),
-            errors=errors,
-            corrections=corrections
+            errors=run.errors,
+            corrections=run.corrections,
+            sections_reused=len(run.reused_texts),
+            sections_prefetched=run.sections_prefetched
         )
         
     except HTTPException:
@@ -239,6 +529,332 @@ async def process_complete_motion(
             detail=f"Error processing motion: {str(e)}"
         )
 
+@router.post("/rewrite/stream")
+async def rewrite_text_stream(
+    request: RewriteRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """Server-Sent Events variant of /rewrite with sentence-level fact gating.
+
+    Events: ``text`` (gated sentences as they complete) then ``done`` with the
+    RewriteResponse fields plus the full-text ``fact_check`` report.
+    """
+    gate = StreamingGate(_rewrite_gate_context(request))
+
+    async def events():
+        outcome: Dict[str, Any] = {}
+        async for delta in llm_service.stream_rfo_section(
+            section_name=request.section,
+            user_answers={"user_input": request.user_input},
+            context=request.context or {},
+            outcome=outcome,
+        ):
+            for piece in gate.feed(delta):
+                yield _sse("text", {"text": piece})
+        tail, gated = gate.finish()
+        for piece in tail:
+            yield _sse("text", {"text": piece})
+        response = RewriteResponse(
+            original=request.user_input,
+            rewritten=gated.text,
+            tokens_used=outcome.get("tokens_used", 0),
+            success=outcome.get("success", False),
+            error=outcome.get("error"),
+        )
+        yield _sse("done", {**response.model_dump(), "fact_check": gated.as_report()})
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@router.post("/process-motion/stream")
+async def process_complete_motion_stream(
+    request: ProcessMotionRequest,
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Server-Sent Events variant of /process-motion.
+
+    Sections stream one after another. Events: ``section`` (a section
+    starts), ``text`` (gated sentences as they complete), ``section_done``
+    (authoritative gated text and corrections for the section) and a final
+    ``done`` carrying the same payload /process-motion returns.
+    """
+    await _join_predraft(request.motion_id)
+    motion, profile_data, drafts = await _load_motion(request.motion_id, current_user, db)
+    motion_id, draft_ids = motion.id, [draft.id for draft in drafts]
+    gate_plan = compile_gate_plan(_gate_context(motion, drafts, profile_data))
+    context = llm_service.motion_context(profile_data)
+    prefetched = _prefetched(motion)
+
+    async def events():
+        # The request-scoped session is closed once this handler returns, so
+        # the stream reloads its rows before writing to them
+        try:
+            stream_motion = await db.get(Motion, motion_id)
+            stream_drafts = [await db.get(MotionDraft, draft_id) for draft_id in draft_ids]
+            corrections: List[Dict[str, Any]] = []
+            gated_texts: List[str] = []
+            reused_texts: List[str] = []
+            errors: List[str] = []
+            sections_processed = 0
+            sections_prefetched = 0
+            total_tokens = 0
+
+            for draft in stream_drafts:
+                # Stop paying for sections nobody is waiting on (finding L18)
+                if await http_request.is_disconnected():
+                    break
+                answers = draft.question_data or {}
+                context.update(answers)
+                fingerprint = llm_service.section_fingerprint(draft.step_name, answers, context)
+                step = {"step_number": draft.step_number, "section": draft.step_name}
+                yield _sse("section", step)
+
+                if _stored_fingerprint(draft) == fingerprint:
+                    # Unchanged inputs: replay the stored output, re-gated
+                    section_corrections = _regate_reused(stream_motion, draft, gate_plan)
+                    reused_texts.append(draft.llm_output)
+                    corrections.extend(section_corrections)
+                    sections_processed += 1
+                    yield _sse("section_done", {**step, "success": True, "reused": True,
+                                                "text": draft.llm_output,
+                                                "corrections": section_corrections})
+                    continue
+
+                gate_plan.ctx.section_name = draft.step_name or ""
+                gate = StreamingGate(gate_plan.ctx, gate_plan)
+
+                ahead = prefetched.get(fingerprint)
+                if ahead:
+                    # Pre-drafted from these exact inputs: gate it, skip the model
+                    sections_prefetched += 1
+                    outcome: Dict[str, Any] = {"success": True, "model": ahead.get("model"),
+                                               "tokens_used": ahead.get("tokens_used", 0)}
+                    deltas = _replay(ahead.get("rewritten_text", ""))
+                else:
+                    outcome = {}
+                    deltas = llm_service.stream_rfo_section(
+                        draft.step_name, answers, context, outcome=outcome
+                    )
+                async for delta in deltas:
+                    for piece in gate.feed(delta):
+                        yield _sse("text", {**step, "text": piece})
+                tail, gated = gate.finish()
+                for piece in tail:
+                    yield _sse("text", {**step, "text": piece})
+
+                total_tokens += outcome.get("tokens_used", 0)
+                if not outcome.get("success"):
+                    errors.append(f"Section {draft.step_name}: {outcome.get('error')}")
+                    yield _sse("section_done", {**step, "success": False,
+                                                "error": outcome.get("error")})
+                    continue
+                _save_gated_section(draft, gated, outcome.get("model"),
+                                    outcome.get("tokens_used", 0), fingerprint)
+                gated_texts.append(gated.text)
+                section_corrections = [c.as_dict() for c in gated.corrections]
+                corrections.extend(section_corrections)
+                sections_processed += 1
+                yield _sse("section_done", {**step, "success": True, "text": gated.text,
+                                            "corrections": section_corrections})
+
+            await _finish_motion(
+                stream_motion, len(stream_drafts), sections_processed, gated_texts,
+                corrections, gate_plan, profile_data, reused_texts
+            )
+            stream_motion.speculative_drafts = None
+            await db.commit()
+
+            response = ProcessMotionResponse(
+                motion_id=request.motion_id,
+                success=not errors and sections_processed == len(stream_drafts),
+                sections_processed=sections_processed,
+                total_tokens=total_tokens,
+                errors=errors,
+                corrections=corrections,
+                sections_reused=len(reused_texts),
+                sections_prefetched=sections_prefetched,
+            )
+            yield _sse("done", response.model_dump())
+        except Exception as e:
+            logger.error(f"Error streaming motion: {str(e)}")
+            yield _sse("error", {"detail": f"Error processing motion: {str(e)}"})
+        finally:
+            await db.close()
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+def _job_is_stale(job: Dict[str, Any]) -> bool:
+    if job.get("job_id") in _motion_jobs:
+        return False
+    try:
+        updated = datetime.fromisoformat(job.get("updated_at") or "")
+    except ValueError:
+        return True
+    return (datetime.utcnow() - updated).total_seconds() > MOTION_JOB_STALE_SECONDS
+
+
+def _job_response(motion_id: str, job: Dict[str, Any]) -> MotionJobResponse:
+    return MotionJobResponse(
+        job_id=job["job_id"],
+        motion_id=motion_id,
+        status=job.get("status", "queued"),
+        sections_total=job.get("sections_total", 0),
+        sections_done=job.get("sections_done", 0),
+        resumed=job.get("resumed", False),
+        error=job.get("error"),
+        result=job.get("result"),
+        progress=progress_service.get_operation(job["job_id"]),
+    )
+
+
+def _save_job(motion: Motion, job: Dict[str, Any], **changes) -> Dict[str, Any]:
+    job = {**job, **changes, "updated_at": datetime.utcnow().isoformat()}
+    # New dict: plain JSON columns only track reassignment
+    motion.processing_job = job
+    return job
+
+
+async def _run_motion_job(session_factory, job_id: str, motion_id: str, user_id) -> None:
+    """Process a motion in the background, committing each section as it lands.
+
+    Completed sections keep their input fingerprint, so a resumed job
+    reuses them and only redrafts what was unfinished.
+    """
+    async with session_factory() as db:
+        try:
+            await _join_predraft(motion_id)
+            user = await db.get(User, user_id)
+            motion, profile_data, drafts = await _load_motion(motion_id, user, db)
+            job = _save_job(motion, motion.processing_job or {}, status="running")
+            await db.commit()
+            await progress_service.start_operation(job_id, "Drafting sections")
+
+            gate_plan = compile_gate_plan(_gate_context(motion, drafts, profile_data))
+            run = _MotionRun()
+            lock = asyncio.Lock()
+
+            async def on_section(section: Dict[str, Any]) -> None:
+                nonlocal job
+                async with lock:
+                    _apply_section(run, section, drafts, motion, gate_plan, section.get("model"))
+                    job = _save_job(motion, job, sections_done=run.sections_processed)
+                    await db.commit()
+                await progress_service.update_progress(
+                    job_id, current_step=run.sections_processed,
+                    message=f"Finished {section.get('section') or 'section'}"
+                )
+
+            result = await llm_service.process_complete_motion(
+                motion_type=motion.motion_type,
+                all_drafts=_draft_inputs(drafts),
+                profile_data=profile_data,
+                max_concurrency=SECTION_CONCURRENCY,
+                on_section=on_section,
+                prefetched=_prefetched(motion)
+            )
+
+            await progress_service.update_progress(job_id, message="Checking facts")
+            await _finish_motion(
+                motion, len(drafts), run.sections_processed, run.gated_texts,
+                run.corrections, gate_plan, profile_data, run.reused_texts
+            )
+            motion.speculative_drafts = None
+            response = ProcessMotionResponse(
+                motion_id=motion_id,
+                success=result.get("success", False),
+                sections_processed=run.sections_processed,
+                total_tokens=run.total_tokens,
+                errors=run.errors,
+                corrections=run.corrections,
+                sections_reused=len(run.reused_texts),
+                sections_prefetched=run.sections_prefetched
+            )
+            job = _save_job(motion, job, status="completed", result=response.model_dump())
+            await db.commit()
+            await progress_service.complete_operation(job_id, result={"motion_id": motion_id})
+        except asyncio.CancelledError:
+            # Worker shutting down: leave the job active so it goes stale and resumes
+            raise
+        except Exception as e:
+            logger.error(f"Motion job {job_id} failed: {str(e)}")
+            await db.rollback()
+            motion = await db.get(Motion, uuid.UUID(motion_id))
+            if motion is not None:
+                _save_job(motion, motion.processing_job or {"job_id": job_id},
+                          status="failed", error=f"Error processing motion: {str(e)}")
+                await db.commit()
+            await progress_service.fail_operation(job_id, str(e))
+
+
+@router.post(
+    "/process-motion/jobs",
+    response_model=MotionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_motion_job(
+    request: ProcessMotionRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Job variant of /process-motion: returns at once, work continues server-side.
+
+    Poll GET /process-motion/jobs/{job_id}. Submitting while a job is active
+    returns that job; submitting after a job went stale resumes it under
+    the same id, skipping sections that were already saved.
+    """
+    motion, _, drafts = await _load_motion(request.motion_id, current_user, db)
+    job = motion.processing_job or {}
+    active = job.get("status") in _ACTIVE_JOB_STATUSES
+    if active and not _job_is_stale(job):
+        return _job_response(request.motion_id, job)
+
+    job_id = job["job_id"] if active else str(uuid.uuid4())
+    job = _save_job(motion, {
+        "job_id": job_id,
+        "status": "queued",
+        "sections_total": len(drafts),
+        "sections_done": 0,
+        "resumed": active,
+    })
+    await db.commit()
+
+    progress_service.create_operation(
+        OperationType.MOTION_PROCESSING,
+        total_steps=len(drafts),
+        metadata={"user_id": str(current_user.id), "motion_id": request.motion_id},
+        operation_id=job_id
+    )
+    task = asyncio.create_task(
+        _run_motion_job(_background_sessions(db), job_id, request.motion_id, current_user.id)
+    )
+    _motion_jobs[job_id] = task
+    task.add_done_callback(lambda _: _motion_jobs.pop(job_id, None))
+    return _job_response(request.motion_id, job)
+
+
+@router.get("/process-motion/jobs/{job_id}", response_model=MotionJobResponse)
+async def get_motion_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Status, progress and (once completed) the /process-motion result of a job."""
+    motions_result = await db.execute(
+        select(Motion).where(Motion.user_id == current_user.id)
+    )
+    for motion in motions_result.scalars().all():
+        job = motion.processing_job or {}
+        if job.get("job_id") == job_id:
+            return _job_response(str(motion.id), job)
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Job not found"
+    )
+
+
 @router.post("/rewrite-declaration")
 async def rewrite_declaration(
     request: DeclarationRequest,
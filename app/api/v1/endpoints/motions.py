@@ -13,6 +13,7 @@ from app.models.user import User
 from app.models.profile import Profile
 from app.models.motion import Motion, MotionDraft, MotionType
 from app.api.v1.endpoints.auth import get_current_user
+from app.api.v1.endpoints.llm import discard_predraft
 
 router = APIRouter()
 
@@ -256,6 +257,8 @@ async def save_draft(
         )
         db.add(draft)
 
+    # Any speculative pre-draft was made from the previous answers
+    discard_predraft(motion)
     await db.commit()
     await db.refresh(draft)
 
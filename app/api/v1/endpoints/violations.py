@@ -8,8 +8,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
 from app.core.database import get_db
+from app.core.lazy import LazySingleton
 from app.services import semantic_check_service
-from app.services.fact_gate import GateContext, run_fact_gate
+from app.services.fact_gate import GateContext, compile_gate_plan, run_fact_gate
 from app.services.violation_intake_steps import build_wizard_steps
 from app.services.violation_service import ViolationFilingService
 from app.api.v1.endpoints.auth import get_current_user
@@ -50,8 +51,8 @@ class ViolationFilingResponse(BaseModel):
     corrections: list[Dict[str, Any]] = []
     error: Optional[str] = None
 
-# Initialize service
-violation_service = ViolationFilingService()
+# Initialize service on first request
+violation_service = LazySingleton(ViolationFilingService)
 
 
 def _declaration_gate_context(
@@ -123,17 +124,15 @@ async def process_violation_filing(
             )
 
         # Gate the generated declaration against user-entered facts
-        gated = run_fact_gate(
-            result["declaration"],
-            _declaration_gate_context(intake_data.dict(), profile_data),
-        )
+        gate_plan = compile_gate_plan(_declaration_gate_context(intake_data.dict(), profile_data))
+        gated = run_fact_gate(result["declaration"], plan=gate_plan)
         result["declaration"] = gated.text
         result["corrections"] = [c.as_dict() for c in gated.corrections]
 
         # One semantic refute-pass over the gated declaration (flag-only, fail-open)
         result["corrections"].extend(
             await semantic_check_service.check_text(
-                gated.text, intake_data.dict(), profile_data or {}
+                gated.text, gate_plan.ctx.intake_values, profile_data or {}, plan=gate_plan
             )
         )
 
@@ -7,15 +7,14 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
-# Conditionally import GCP services
-USE_GCP = os.getenv("USE_GCP", "true").lower() == "true"
-if USE_GCP:
-    try:
-        from google.cloud import secretmanager
-    except ImportError:
-        USE_GCP = False
-
 from app.core.config import settings
+from app.core.lazy import module_available
+
+# Secret Manager is imported when a password is first fetched
+USE_GCP = (
+    os.getenv("USE_GCP", "true").lower() == "true"
+    and module_available("google.cloud.secretmanager")
+)
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +55,8 @@ class Database:
             return "local-dev-password"
 
         try:
+            from google.cloud import secretmanager
+
             client = secretmanager.SecretManagerServiceClient()
             name = f"projects/{settings.PROJECT_ID}/secrets/{settings.DB_PASSWORD_SECRET}/versions/latest"
             response = client.access_secret_version(request={"name": name})
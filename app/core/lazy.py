@@ -0,0 +1,62 @@
+"""
+Deferred construction for module-level singletons and optional SDKs.
+
+Importing app.main used to build service singletons that open GCP clients
+or Vertex models, and to import SDKs (vertexai, google-cloud-*) that take
+seconds to load, before the first request could be served. Now:
+
+- module_available(name) tells whether an SDK is installed without
+  importing it; the SDK itself is imported where its backend is built.
+- LazySingleton(factory) stands in for a module-level singleton. The name
+  imports as before and the object is built on first attribute access.
+"""
+import importlib.util
+import threading
+from typing import Any, Callable
+
+
+def module_available(name: str) -> bool:
+    """True if `name` can be imported; does not import it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazySingleton:
+    """Proxy that builds its target on first use and forwards to it."""
+
+    __slots__ = ("_factory", "_instance", "_lock")
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _resolve(self) -> Any:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    object.__setattr__(self, "_instance", self._factory())
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        if self._instance is None:
+            return f"<lazy {getattr(self._factory, '__name__', 'singleton')} (not built)>"
+        return repr(self._instance)
+
+
+def is_built(singleton: Any) -> bool:
+    """Whether a LazySingleton has been built (plain objects always are)."""
+    if isinstance(singleton, LazySingleton):
+        return object.__getattribute__(singleton, "_instance") is not None
+    return True
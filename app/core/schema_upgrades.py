@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 # (table, column, SQL type) — append-only
 COLUMN_UPGRADES: List[Tuple[str, str, str]] = [
     ("motions", "fact_check", "JSON"),
+    ("motion_drafts", "input_fingerprint", "VARCHAR(64)"),
+    ("motions", "processing_job", "JSON"),
+    ("motions", "speculative_drafts", "JSON"),
 ]
 
 
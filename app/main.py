@@ -11,6 +11,8 @@ from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.database import Base, db, init_db
 from app.middleware.rate_limiter import RateLimiterMiddleware
+from app.services.fact_gate import shutdown_gate_pool
+from app.services.llm_clients import llm_clients
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,6 +27,8 @@ async def lifespan(app: FastAPI):
     yield
     # Cleanup
     logger.info("Shutting down California Motion Writer API")
+    await llm_clients.aclose()
+    shutdown_gate_pool()
 
 # Create FastAPI app
 app = FastAPI(
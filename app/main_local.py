@@ -19,6 +19,8 @@ load_dotenv('.env.development')
 
 from app.api.v1.router import api_router
 from app.core.database_local import Base, engine, get_db
+from app.services.fact_gate import shutdown_gate_pool
+from app.services.llm_clients import llm_clients
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,6 +40,8 @@ async def lifespan(app: FastAPI):
 
     # Cleanup
     logger.info("Shutting down California Motion Writer API")
+    await llm_clients.aclose()
+    shutdown_gate_pool()
 
 # Create FastAPI app
 app = FastAPI(
@@ -12,12 +12,14 @@ RATE_LIMITS = {
 
     # LLM rewrite endpoints - moderate limits
     "/api/v1/llm/rewrite": "20/hour",
+    "/api/v1/llm/rewrite/stream": "20/hour",
     "/api/v1/llm/rewrite-declaration": "10/hour",
     "/api/v1/llm/enhance-best-interests": "10/hour",
     "/api/v1/llm/parse-served-motion": "10/hour",
 
     # Full motion processing - strict limits
     "/api/v1/llm/process-motion": "5/hour",
+    "/api/v1/llm/process-motion/stream": "5/hour",
     "/api/v1/documents/generate-pdf": "10/hour",
     "/api/v1/documents/generate-pdf-sync": "20/hour",
 
@@ -42,6 +42,8 @@ class Motion(Base):
     intake_data = Column(JSON)  # Store complete intake responses
     generated_text = Column(Text)  # Generated declaration or other text
     fact_check = Column(JSON)  # Fact-gate corrections report (nullable)
+    processing_job = Column(JSON)  # Latest /process-motion/jobs state (nullable)
+    speculative_drafts = Column(JSON)  # Pre-drafted sections by input fingerprint (nullable)
     
     # Filing Info
     filing_date = Column(Date)
@@ -75,6 +77,7 @@ class MotionDraft(Base):
     llm_output = Column(Text)  # Rewritten text
     llm_model = Column(String(50))
     llm_tokens_used = Column(Integer)
+    input_fingerprint = Column(String(64))  # Hash of what produced llm_output
     
     # Status
     is_complete = Column(Boolean, default=False)
@@ -27,6 +27,8 @@ elif os.getenv("USE_GCP", "false").lower() == "true" and os.getenv("USE_MOCK_LLM
     from app.services.vertex_llm_service import VertexLLMService as LLMService
 else:
     from app.services.llm_service import LLMService
+from app.core.lazy import LazySingleton, module_available
+from app.services.llm_clients import llm_clients
 from app.services.violation_service import ViolationFilingService
 
 logger = logging.getLogger(__name__)
@@ -35,7 +37,7 @@ class ChatService:
     """Handle chat sessions, messages, and conversation flow"""
 
     def __init__(self):
-        self.llm_service = LLMService()
+        self.llm_service = llm_clients.shared(LLMService)
         self.violation_service = ViolationFilingService()
 
         # Try to import enhanced LLM chat service if available
@@ -48,16 +50,15 @@ class ChatService:
                 if self.use_llm
                 else "USE_CLAUDE set but ANTHROPIC_API_KEY missing — pattern-based fallback"
             )
+        elif module_available("vertexai"):
+            from app.services.llm_chat_service import llm_chat_service
+            self.llm_chat_service = llm_chat_service
+            self.use_llm = True
+            logger.info("Using enhanced LLM chat service")
         else:
-            try:
-                from app.services.llm_chat_service import llm_chat_service
-                self.llm_chat_service = llm_chat_service
-                self.use_llm = True
-                logger.info("Using enhanced LLM chat service")
-            except ImportError:
-                self.llm_chat_service = None
-                self.use_llm = False
-                logger.info("Using pattern-based chat service")
+            self.llm_chat_service = None
+            self.use_llm = False
+            logger.info("Using pattern-based chat service")
 
         # Import memory and template services
         try:
@@ -700,5 +701,5 @@ class ChatService:
 
         else:
             return current_state
-# Create global instance
-chat_service = ChatService()
+# Create global instance (built on first use)
+chat_service = LazySingleton(ChatService)
@@ -2,12 +2,18 @@
 Claim-to-exhibit citation service — inserts "(Exhibit X)" citations inline in
 the declaration so each factual claim points at its supporting exhibit.
 
-Zero-drift guardrail: the LLM output with citations stripped must equal the
-original text (whitespace/punctuation-normalized), and every cited letter must
-be a real exhibit. Any doubt → the original text is used unchanged; workstream
-D's authentication paragraphs still enumerate every exhibit, so the filing
-stays court-ready on fallback. This function never raises and never blocks
-PDF generation.
+Index protocol: the declaration is split with fact_gate's sentence_spans and
+the model sees the numbered sentences. It returns only a JSON map of sentence
+number to exhibit letters; the citations are spliced in locally after the
+cited sentences. The declaration text never round-trips through the model, so
+it cannot drift, and the output is a few dozen tokens instead of the whole
+declaration.
+
+Any doubt (unparseable map, unknown letter or sentence number, error or
+timeout) → that citation or the whole pass is dropped and the original text is
+used; workstream D's authentication paragraphs still enumerate every exhibit,
+so the filing stays court-ready on fallback. This function never raises and
+never blocks PDF generation.
 """
 from __future__ import annotations
 
@@ -15,9 +21,11 @@ import asyncio
 import logging
 import re
 import unicodedata
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.services import llm_service as llm_backend
+from app.services.fact_gate.types import sentence_spans
+from app.services.llm_json import parse_llm_json
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +54,7 @@ def validate_citation_output(original: str, candidate: str, letters: set) -> boo
     return _norm(strip_citations(candidate)) == _norm(original)
 
 
-def build_citation_prompt(declaration_text: str, lettered: List[Tuple[str, dict]]) -> str:
+def build_citation_prompt(sentences: List[str], lettered: List[Tuple[str, dict]]) -> str:
     exhibit_lines = []
     for letter_str, item in lettered:
         date_val = item.get("source_date") or "undated"
@@ -54,17 +62,58 @@ def build_citation_prompt(declaration_text: str, lettered: List[Tuple[str, dict]
         tags = ", ".join(item.get("tags") or [])
         exhibit_lines.append(f"- Exhibit {letter_str}: {item.get('evidence_type', 'document')} "
                              f"dated {date_val} — {desc}" + (f" [tags: {tags}]" if tags else ""))
+    numbered = "\n".join(f"[{i}] {sentence}" for i, sentence in enumerate(sentences, 1))
 
-    return f"""You are inserting exhibit citations into a court declaration. Reproduce the declaration EXACTLY, character for character, changing NOTHING except adding "(Exhibit X)" immediately after sentences that are directly supported by an exhibit below. Cite only clearly supported sentences; when unsure, do not cite.
+    return f"""You are matching the sentences of a court declaration to the exhibits that support them. Cite only sentences directly and clearly supported by an exhibit below; when unsure, do not cite.
 
 Exhibits:
 {chr(10).join(exhibit_lines)}
 
-Declaration:
----
-{declaration_text}
----
-Output ONLY the declaration text with citations added. No commentary."""
+Declaration sentences:
+{numbered}
+
+Return STRICT JSON mapping sentence numbers to exhibit letters, listing only cited sentences, e.g. {{"citations": {{"1": ["A"], "4": ["B", "C"]}}}}. Return {{"citations": {{}}}} if nothing is clearly supported. No commentary."""
+
+
+def parse_citation_map(
+    data: Dict[str, Any], sentence_count: int, letters: set
+) -> Dict[int, List[str]]:
+    """Validated {sentence index (0-based): letters}; invalid entries are dropped."""
+    citations = data.get("citations")
+    if not isinstance(citations, dict):
+        return {}
+    mapping: Dict[int, List[str]] = {}
+    for key, cited in citations.items():
+        try:
+            index = int(key) - 1
+        except (TypeError, ValueError):
+            continue
+        if not 0 <= index < sentence_count:
+            continue
+        if isinstance(cited, str):
+            cited = [cited]
+        if not isinstance(cited, list):
+            continue
+        valid = [c for c in dict.fromkeys(cited) if isinstance(c, str) and c in letters]
+        if valid:
+            mapping[index] = valid
+    return mapping
+
+
+def splice_citations(
+    text: str, spans: List[Tuple[int, int]], mapping: Dict[int, List[str]]
+) -> str:
+    """Insert "(Exhibit X)" after each mapped sentence; other text is untouched."""
+    parts: List[str] = []
+    position = 0
+    for index, (_start, end) in enumerate(spans):
+        if index not in mapping:
+            continue
+        parts.append(text[position:end])
+        parts.append("".join(f" (Exhibit {letter})" for letter in mapping[index]))
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
 
 
 async def insert_claim_citations(
@@ -78,10 +127,12 @@ async def insert_claim_citations(
     if llm_backend.USE_MOCK_LLM:
         return declaration_text
 
+    spans = sentence_spans(declaration_text)
+    sentences = [declaration_text[start:end] for start, end in spans]
     try:
         raw, tokens, model = await asyncio.wait_for(
             llm_backend.llm_service._generate(
-                build_citation_prompt(declaration_text, lettered),
+                build_citation_prompt(sentences, lettered),
                 "claim_citation",
                 user_id,
             ),
@@ -91,11 +142,21 @@ async def insert_claim_citations(
         logger.warning("Claim citation skipped: %s", type(exc).__name__)
         return declaration_text
 
+    data = parse_llm_json(raw)
+    if not isinstance(data.get("citations"), dict):
+        # Usually a map cut off at the output cap on a long declaration
+        logger.warning(
+            "Claim citation map did not parse: sentences=%d output_chars=%d tokens=%s model=%s",
+            len(spans), len(raw), tokens, model,
+        )
+        return declaration_text
     letters = {letter_str for letter_str, _ in lettered}
-    candidate = raw.strip()
-    valid = validate_citation_output(declaration_text, candidate, letters)
+    mapping = parse_citation_map(data, len(spans), letters)
+    cited = splice_citations(declaration_text, spans, mapping)
+    # Holds by construction; kept as the guardrail of last resort
+    valid = validate_citation_output(declaration_text, cited, letters)
     logger.info(
-        "Claim citation: input_chars=%d output_chars=%d valid=%s tokens=%s model=%s",
-        len(declaration_text), len(candidate), valid, tokens, model,
+        "Claim citation: sentences=%d cited=%d output_chars=%d valid=%s tokens=%s model=%s",
+        len(spans), len(mapping), len(raw), valid, tokens, model,
     )
-    return candidate if valid else declaration_text
+    return cited if valid else declaration_text
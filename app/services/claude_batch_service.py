@@ -0,0 +1,206 @@
+"""
+Offline batch backend for non-interactive Claude operations.
+
+Evidence ranking, semantic refutation, served-motion extraction and bulk
+reprocessing do not need an answer in seconds. Operations listed in
+LLM_BATCH_OPERATIONS are queued here instead of calling messages.create:
+requests accumulate for up to LLM_BATCH_FLUSH_SECONDS (or until
+LLM_BATCH_MAX_REQUESTS are waiting), go out as one Message Batch, and each
+caller's await resolves when the batch ends. Batches are billed at half the
+interactive price and do not draw on the interactive rate limits that chat
+competes for.
+
+generate() keeps the ClaudeLLMService contract — (text, tokens, model) —
+and shares its llm_cache keys, so a batched answer also serves a later
+interactive request for the same prompt. Per-request failures (errored,
+canceled, expired) and batches that outlive LLM_BATCH_TIMEOUT_SECONDS raise
+BatchRequestError; callers already fail open on generation errors.
+
+Off by default: batches can take minutes, so only list operations whose
+callers can wait that long.
+"""
+import asyncio
+import logging
+import os
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.services.claude_llm_service import (
+    DRAFTING_MODEL,
+    OPERATION_MAX_TOKENS,
+    OPERATION_MODELS,
+    ClaudeLLMService,
+    system_text,
+)
+from app.services.llm_cache import cache_key, llm_cache
+from app.services.token_usage import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+Generation = Tuple[str, TokenUsage, str]
+
+BATCH_OPERATIONS = frozenset(
+    op.strip() for op in os.getenv("LLM_BATCH_OPERATIONS", "").split(",") if op.strip()
+)
+BATCH_MAX_REQUESTS = int(os.getenv("LLM_BATCH_MAX_REQUESTS", "100"))
+BATCH_FLUSH_SECONDS = float(os.getenv("LLM_BATCH_FLUSH_SECONDS", "2"))
+BATCH_POLL_SECONDS = float(os.getenv("LLM_BATCH_POLL_SECONDS", "10"))
+BATCH_TIMEOUT_SECONDS = float(os.getenv("LLM_BATCH_TIMEOUT_SECONDS", "3600"))
+
+
+class BatchRequestError(Exception):
+    """A batched request did not succeed (errored, canceled, expired, timed out)."""
+
+
+def is_batched(operation: str) -> bool:
+    return operation in BATCH_OPERATIONS
+
+
+class ClaudeBatchService:
+    """Queue → Message Batch → poll → resolve each caller's future."""
+
+    def __init__(
+        self,
+        backend: ClaudeLLMService,
+        max_requests: int = BATCH_MAX_REQUESTS,
+        flush_seconds: float = BATCH_FLUSH_SECONDS,
+        poll_seconds: float = BATCH_POLL_SECONDS,
+        timeout_seconds: float = BATCH_TIMEOUT_SECONDS,
+    ):
+        self.backend = backend
+        self.max_requests = max_requests
+        self.flush_seconds = flush_seconds
+        self.poll_seconds = poll_seconds
+        self.timeout_seconds = timeout_seconds
+        self._pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.Task] = None
+        self._tasks: set = set()
+
+    async def generate(
+        self,
+        prompt: str,
+        operation: str,
+        user_id: Optional[str] = None,
+        motion_prefix: Optional[str] = None,
+    ) -> Generation:
+        """Same contract as ClaudeLLMService.generate; resolves when the batch ends."""
+        model = OPERATION_MODELS.get(operation, DRAFTING_MODEL)
+        max_tokens = OPERATION_MAX_TOKENS.get(operation, 3000)
+        system = self.backend._system_blocks(operation, motion_prefix)
+        params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "system": system,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+        async def call() -> Generation:
+            return await self._enqueue(params)
+
+        key = cache_key("anthropic", model, operation, system_text(system), prompt, max_tokens)
+        return await llm_cache.get_or_generate(key, call, operation, user_id)
+
+    async def generate_many(
+        self,
+        prompts: List[str],
+        operation: str,
+        user_id: Optional[str] = None,
+    ) -> List[Union[Generation, Exception]]:
+        """Bulk reprocessing: one result (or the exception) per prompt, in order."""
+        return await asyncio.gather(
+            *(self.generate(prompt, operation, user_id) for prompt in prompts),
+            return_exceptions=True,
+        )
+
+    async def flush(self) -> None:
+        """Submit everything queued now instead of waiting for the timer."""
+        if self._flush_timer is not None and self._flush_timer is not asyncio.current_task():
+            self._flush_timer.cancel()
+        self._flush_timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        futures = {custom_id: future for custom_id, _, future in pending}
+        try:
+            batch = await self.backend._get_client().messages.batches.create(
+                requests=[
+                    {"custom_id": custom_id, "params": params}
+                    for custom_id, params, _ in pending
+                ]
+            )
+        except Exception as exc:
+            logger.warning(f"Batch submission failed: {type(exc).__name__}")
+            self._fail(futures, exc)
+            return
+        logger.info(f"Submitted message batch {batch.id} with {len(pending)} requests")
+        self._spawn(self._collect(batch.id, futures))
+
+    async def close(self) -> None:
+        """Cancel timers and pollers; waiting callers get BatchRequestError."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        pending, self._pending = self._pending, []
+        self._fail(
+            {custom_id: future for custom_id, _, future in pending},
+            BatchRequestError("batch backend closed"),
+        )
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _enqueue(self, params: Dict[str, Any]) -> Generation:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((uuid.uuid4().hex, params, future))
+        if len(self._pending) >= self.max_requests:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = self._spawn(self._flush_later())
+        return await future
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_seconds)
+        await self.flush()
+
+    async def _collect(self, batch_id: str, futures: Dict[str, asyncio.Future]) -> None:
+        client = self.backend._get_client()
+        deadline = time.monotonic() + self.timeout_seconds
+        try:
+            while True:
+                batch = await client.messages.batches.retrieve(batch_id)
+                if batch.processing_status == "ended":
+                    break
+                if time.monotonic() >= deadline:
+                    await client.messages.batches.cancel(batch_id)
+                    raise BatchRequestError(f"batch {batch_id} timed out")
+                await asyncio.sleep(self.poll_seconds)
+
+            async for entry in await client.messages.batches.results(batch_id):
+                future = futures.pop(entry.custom_id, None)
+                if future is None or future.done():
+                    continue
+                if entry.result.type == "succeeded":
+                    message = entry.result.message
+                    text = next((b.text for b in message.content if b.type == "text"), "")
+                    future.set_result((text, TokenUsage.from_anthropic(message.usage), message.model))
+                else:
+                    future.set_exception(
+                        BatchRequestError(f"batch request {entry.result.type}")
+                    )
+            self._fail(futures, BatchRequestError(f"batch {batch_id} returned no result"))
+        except Exception as exc:
+            logger.warning(f"Message batch {batch_id} failed: {exc}")
+            self._fail(futures, exc)
+
+    def _fail(self, futures: Dict[str, asyncio.Future], exc: Exception) -> None:
+        for future in futures.values():
+            if not future.done():
+                future.set_exception(exc)
+        futures.clear()
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
@@ -5,13 +5,29 @@ Routes operations to the right model tier:
 - claude-haiku-4-5: chat, intent classification, UPL checks (high volume, low cost)
 - claude-opus-4-8: declaration/motion drafting (quality-sensitive legal writing)
 
-The stable system prompt (base prompt + UPL guardrails) is cached via
-prompt caching; per-request content goes in the user message.
+generate() and generate_with_images() go through model_router:
+per-operation deadlines, fallback to FALLBACK_MODELS on timeout/overload,
+and hedged requests for chat. Each provider call then waits for an
+llm_scheduler slot on the model it hits. stream() takes a scheduler slot
+but is not routed: no deadline, fallback or hedging, and its errors do not
+count towards the router's model stats.
+
+The stable system prompt (base prompt + UPL guardrails, plus the drafting
+reference for drafting operations) and the optional per-motion fact anchor
+are cached via prompt caching; per-request content goes in the user message.
+See app/services/prompt_prefix.py for the prefix layout.
 """
 import base64
 import logging
 import os
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.services.llm_cache import cache_key, llm_cache
+from app.services.llm_clients import llm_clients
+from app.services.llm_scheduler import llm_scheduler
+from app.services.model_router import ModelRouter
+from app.services.prompt_prefix import warn_if_uncacheable
+from app.services.token_usage import TokenUsage
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +46,22 @@ OPERATION_MODELS = {
     "evidence_ranking": CHAT_MODEL,
     "conversation_threading": CHAT_MODEL,
     "screenshot_reading": CHAT_MODEL,
-    # Verbatim reproduction fidelity matters for citations — use the drafting tier
+    # Output is only a sentence→exhibit index map, but matching claims to the
+    # exhibit that supports them is a filed-citation judgment — drafting tier
     "claim_citation": DRAFTING_MODEL,
     # Adversarial refute-pass over drafted motions — needs drafting-tier judgment
     "semantic_check": DRAFTING_MODEL,
 }
 
+# Secondary model per tier when the primary times out or is overloaded
+FALLBACK_MODELS = {
+    CHAT_MODEL: os.getenv("CLAUDE_CHAT_FALLBACK_MODEL", "claude-sonnet-4-5"),
+    DRAFTING_MODEL: os.getenv("CLAUDE_DRAFTING_FALLBACK_MODEL", "claude-sonnet-4-5"),
+}
+
+# Shared by every backend instance so latency/error stats are process-wide
+model_router = ModelRouter(FALLBACK_MODELS)
+
 # Mirrors the per-operation output limits used by the Vertex backend
 OPERATION_MAX_TOKENS = {
     "chat_response": 1024,
@@ -49,7 +75,8 @@ OPERATION_MAX_TOKENS = {
     "evidence_ranking": 2000,
     "conversation_threading": 6000,
     "screenshot_reading": 6000,
-    "claim_citation": 6000,
+    # Index map only, but a long declaration can cite a few hundred sentences
+    "claim_citation": 2048,
     "semantic_check": 1500,
 }
 
@@ -67,47 +94,120 @@ UPL_GUARDRAILS = """LEGAL-COMPLIANCE GUARDRAILS (strictly enforced — unauthori
 - When drafting document text, output plain text only — no markdown, no tables, no HTML entities."""
 
 
+def system_text(blocks: list) -> str:
+    """Every system block's text — what the cache key must cover."""
+    return "\n\n".join(block["text"] for block in blocks)
+
+
 class ClaudeLLMService:
     """Thin generation backend; budget checks and prompt building stay in LLMService."""
 
-    def __init__(self, base_system_prompt: str = ""):
+    def __init__(
+        self,
+        base_system_prompt: str = "",
+        drafting_references: Optional[Dict[str, str]] = None,
+    ):
         self.base_system_prompt = base_system_prompt
+        self.drafting_references = drafting_references or {}
+        self.router = model_router
         self._client = None
+        for operation in self.drafting_references:
+            warn_if_uncacheable(
+                self._system_blocks(operation)[0]["text"],
+                OPERATION_MODELS.get(operation, DRAFTING_MODEL),
+            )
 
     @property
     def available(self) -> bool:
         return bool(os.getenv("ANTHROPIC_API_KEY"))
 
     def _get_client(self):
-        if self._client is None:
-            from anthropic import AsyncAnthropic
+        # Borrow the process-wide pooled client unless one was injected
+        if self._client is not None:
+            return self._client
+        return llm_clients.anthropic()
 
-            self._client = AsyncAnthropic()
-        return self._client
-
-    def _system_blocks(self) -> list:
+    def _system_blocks(
+        self,
+        operation: Optional[str] = None,
+        motion_prefix: Optional[str] = None,
+    ) -> list:
         # Stable content only — anything volatile here would invalidate the cache
         text = f"{self.base_system_prompt}\n\n{UPL_GUARDRAILS}".strip()
-        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+        reference = self.drafting_references.get(operation)
+        if reference:
+            text = f"{text}\n\n{reference}"
+        blocks = [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+        if motion_prefix:
+            # Second breakpoint: shared by every section of one motion
+            blocks.append(
+                {"type": "text", "text": motion_prefix, "cache_control": {"type": "ephemeral"}}
+            )
+        return blocks
 
     async def generate(
         self,
         prompt: str,
         operation: str,
         user_id: Optional[str] = None,
-    ) -> Tuple[str, int, str]:
-        """Generate text for an operation. Returns (text, total_tokens, model_id)."""
+        motion_prefix: Optional[str] = None,
+    ) -> Tuple[str, TokenUsage, str]:
+        """Generate text for an operation. Returns (text, TokenUsage, model_id).
+
+        motion_prefix (e.g. the fact anchor) is sent as a cached system block
+        so every section of a motion reuses it. Byte-identical requests are
+        served from llm_cache with zero tokens.
+        """
+        model = OPERATION_MODELS.get(operation, DRAFTING_MODEL)
+        max_tokens = OPERATION_MAX_TOKENS.get(operation, 3000)
+        system = self._system_blocks(operation, motion_prefix)
+
+        async def request(routed_model: str) -> Tuple[str, TokenUsage, str]:
+            response = await self._get_client().messages.create(
+                model=routed_model,
+                max_tokens=max_tokens,
+                system=system,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            text = next((b.text for b in response.content if b.type == "text"), "")
+            return text, TokenUsage.from_anthropic(response.usage), routed_model
+
+        def admit(routed_model: str):
+            return llm_scheduler.slot(routed_model, operation, user_id)
+
+        async def call() -> Tuple[str, TokenUsage, str]:
+            return await self.router.call(operation, model, request, admit)
+
+        key = cache_key("anthropic", model, operation, system_text(system), prompt, max_tokens)
+        return await llm_cache.get_or_generate(key, call, operation, user_id)
+
+    async def stream(
+        self,
+        prompt: str,
+        operation: str,
+        user_id: Optional[str] = None,
+        streamed: Optional[Dict[str, Any]] = None,
+        motion_prefix: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Yield text deltas as they arrive; fills streamed["tokens"/"model"] at the end.
+
+        Unrouted: the operation's model is called directly, and a failure
+        propagates to the caller instead of falling back.
+        """
         client = self._get_client()
         model = OPERATION_MODELS.get(operation, DRAFTING_MODEL)
-        response = await client.messages.create(
+        async with llm_scheduler.slot(model, operation, user_id), client.messages.stream(
             model=model,
             max_tokens=OPERATION_MAX_TOKENS.get(operation, 3000),
-            system=self._system_blocks(),
+            system=self._system_blocks(operation, motion_prefix),
             messages=[{"role": "user", "content": prompt}],
-        )
-        text = next((b.text for b in response.content if b.type == "text"), "")
-        tokens = response.usage.input_tokens + response.usage.output_tokens
-        return text, tokens, model
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+            final = await stream.get_final_message()
+        if streamed is not None:
+            streamed["tokens"] = TokenUsage.from_anthropic(final.usage)
+            streamed["model"] = model
 
     async def generate_with_images(
         self,
@@ -115,10 +215,10 @@ class ClaudeLLMService:
         images: List[Tuple[bytes, str]],
         operation: str,
         user_id: Optional[str] = None,
-    ) -> Tuple[str, int, str]:
+    ) -> Tuple[str, TokenUsage, str]:
         """Generate from images + text (e.g. chat screenshots).
 
-        images: list of (raw_bytes, media_type). Returns (text, total_tokens, model_id).
+        images: list of (raw_bytes, media_type). Returns (text, TokenUsage, model_id).
         """
         client = self._get_client()
         model = OPERATION_MODELS.get(operation, CHAT_MODEL)
@@ -134,12 +234,18 @@ class ClaudeLLMService:
             for raw, media_type in images
         ]
         content.append({"type": "text", "text": prompt})
-        response = await client.messages.create(
-            model=model,
-            max_tokens=OPERATION_MAX_TOKENS.get(operation, 3000),
-            system=self._system_blocks(),
-            messages=[{"role": "user", "content": content}],
-        )
-        text = next((b.text for b in response.content if b.type == "text"), "")
-        tokens = response.usage.input_tokens + response.usage.output_tokens
-        return text, tokens, model
+
+        async def request(routed_model: str) -> Tuple[str, TokenUsage, str]:
+            response = await client.messages.create(
+                model=routed_model,
+                max_tokens=OPERATION_MAX_TOKENS.get(operation, 3000),
+                system=self._system_blocks(operation),
+                messages=[{"role": "user", "content": content}],
+            )
+            text = next((b.text for b in response.content if b.type == "text"), "")
+            return text, TokenUsage.from_anthropic(response.usage), routed_model
+
+        def admit(routed_model: str):
+            return llm_scheduler.slot(routed_model, operation, user_id)
+
+        return await self.router.call(operation, model, request, admit)
@@ -9,17 +9,18 @@ from dataclasses import dataclass
 import asyncio
 from collections import defaultdict
 
-# Conditionally import GCP libraries
+from app.core.lazy import LazySingleton, module_available
+from app.services.llm_scheduler import llm_scheduler
+from app.services.token_usage import TokenUsage, estimate_tokens
+
+# GCP libraries are imported when the monitoring clients are built
 USE_GCP = os.getenv("USE_GCP", "true").lower() == "true"
 
-if USE_GCP:
-    try:
-        from google.cloud import monitoring_v3
-        from google.cloud import billing_v1
-        from google.cloud import logging as cloud_logging
-    except ImportError:
-        USE_GCP = False
-        print("Warning: GCP monitoring libraries not available")
+if USE_GCP and not (
+    module_available("google.cloud.monitoring_v3") and module_available("google.cloud.billing_v1")
+):
+    USE_GCP = False
+    print("Warning: GCP monitoring libraries not available")
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +85,8 @@ class CostMonitoringService:
     def _init_gcp_clients(self):
         """Initialize GCP monitoring and billing clients"""
         try:
+            from google.cloud import billing_v1, monitoring_v3
+
             self.monitoring_client = monitoring_v3.MetricServiceClient()
             self.billing_client = billing_v1.CloudBillingClient()
             logger.info("GCP monitoring clients initialized")
@@ -100,21 +103,32 @@ class CostMonitoringService:
         user_id: Optional[str] = None,
         metadata: Optional[Dict] = None
     ) -> UsageMetrics:
-        """Track LLM API usage and calculate cost"""
+        """Track LLM API usage and calculate cost.
+
+        tokens_used may be a TokenUsage: cost is then charged on its billable
+        tokens (cache reads discounted, cache writes at a premium) and the
+        per-kind breakdown is kept in the metric metadata.
+        """
+        metadata = dict(metadata or {})
+        billable_tokens = tokens_used
+        if isinstance(tokens_used, TokenUsage):
+            billable_tokens = tokens_used.billable_tokens
+            metadata.update(tokens_used.as_dict())
+
         # Calculate estimated cost
         cost_per_token = SERVICE_COSTS.get(f"vertex_ai_{model}", 0.00125) / 1000
-        estimated_cost = tokens_used * cost_per_token
+        estimated_cost = billable_tokens * cost_per_token
 
         # Create metrics record
         metric = UsageMetrics(
             timestamp=datetime.utcnow(),
             service="vertex_ai",
             operation=operation,
-            tokens_used=tokens_used,
+            tokens_used=int(tokens_used),
             requests_count=1,
             estimated_cost=estimated_cost,
             user_id=user_id,
-            metadata=metadata or {}
+            metadata=metadata
         )
 
         # Store metric
@@ -133,6 +147,26 @@ class CostMonitoringService:
 
         return metric
 
+    def track_cache_hit(
+        self,
+        operation: str,
+        tokens_saved: int,
+        user_id: Optional[str] = None
+    ) -> UsageMetrics:
+        """Record an LLM call answered from cache — no provider spend"""
+        metric = UsageMetrics(
+            timestamp=datetime.utcnow(),
+            service="llm_cache",
+            operation=operation,
+            tokens_used=0,
+            requests_count=1,
+            estimated_cost=0.0,
+            user_id=user_id,
+            metadata={"tokens_saved": tokens_saved}
+        )
+        self.usage_metrics.append(metric)
+        return metric
+
     async def _check_cost_thresholds(self):
         """Check if costs exceed thresholds and trigger alerts"""
         today = datetime.utcnow().date()
@@ -233,6 +267,12 @@ class CostMonitoringService:
         total_tokens = sum(m.tokens_used for m in filtered_metrics)
         total_requests = sum(m.requests_count for m in filtered_metrics)
         total_cost = sum(m.estimated_cost for m in filtered_metrics)
+        # Prompt-cache effectiveness, from provider-reported usage breakdowns
+        breakdowns = [m.metadata or {} for m in filtered_metrics]
+        cache_read = sum(b.get("cache_read_input_tokens", 0) for b in breakdowns)
+        cache_write = sum(b.get("cache_creation_input_tokens", 0) for b in breakdowns)
+        uncached_input = sum(b.get("input_tokens", 0) for b in breakdowns)
+        prompt_tokens = cache_read + cache_write + uncached_input
 
         # Group by service
         by_service = defaultdict(lambda: {"tokens": 0, "requests": 0, "cost": 0.0})
@@ -256,11 +296,16 @@ class CostMonitoringService:
             "totals": {
                 "tokens": total_tokens,
                 "requests": total_requests,
-                "estimated_cost": round(total_cost, 2)
+                "estimated_cost": round(total_cost, 2),
+                "cache_read_input_tokens": cache_read,
+                "cache_creation_input_tokens": cache_write,
+                "cache_read_ratio": round(cache_read / prompt_tokens, 3) if prompt_tokens else 0.0
             },
             "by_service": dict(by_service),
             "by_operation": dict(by_operation),
             "metrics_count": len(filtered_metrics),
+            # Live outbound queue state (not filtered by period or user)
+            "llm_queues": llm_scheduler.metrics(),
             "daily_limit": self.daily_limit,
             "monthly_limit": self.monthly_limit,
             "current_daily_cost": round(self.cost_accumulator[datetime.utcnow().date()], 2)
@@ -312,8 +357,7 @@ class CostMonitoringService:
         if max_tokens:
             recommended_limit = min(recommended_limit, max_tokens)
 
-        # Estimate tokens in text (rough: 1 token ≈ 4 characters)
-        estimated_input_tokens = len(text) // 4
+        estimated_input_tokens = estimate_tokens(text)
 
         # Calculate available tokens for output
         available_output_tokens = recommended_limit - estimated_input_tokens
@@ -335,8 +379,8 @@ class CostMonitoringService:
             "available_output_tokens": available_output_tokens
         }
 
-# Singleton instance
-cost_monitor = CostMonitoringService()
+# Singleton instance, built on first use (it opens GCP clients)
+cost_monitor = LazySingleton(CostMonitoringService)
 
 # Helper functions for easy integration
 async def track_llm_cost(
@@ -344,9 +388,17 @@ async def track_llm_cost(
     tokens: int,
     user_id: Optional[str] = None
 ) -> UsageMetrics:
-    """Track LLM usage and cost"""
+    """Track LLM usage and cost; pass the backend's TokenUsage when there is one"""
     return await cost_monitor.track_llm_usage(operation, tokens, user_id=user_id)
 
+async def track_cache_hit(
+    operation: str,
+    tokens_saved: int,
+    user_id: Optional[str] = None
+) -> UsageMetrics:
+    """Track an LLM call served from cache (zero cost, separate line item)"""
+    return cost_monitor.track_cache_hit(operation, tokens_saved, user_id)
+
 async def check_budget(
     tokens: int,
     operation: str,
@@ -4,13 +4,28 @@ intake claims so the most relevant emails surface first.
 
 Privacy contract: only candidate METADATA (from/date/subject/snippet) reaches
 the prompt — full bodies are never sent. Content is never logged.
+
+Rescans are cheap: rankings are cached per (user, message id, claims hash),
+so only messages that are new, or whose claims changed, reach the model.
+Large scans are pre-filtered locally with BM25 over from/subject/snippet
+against the claims to the top EVIDENCE_RANKING_TOP_K, and the remainder is
+ranked in concurrent chunks. A failed chunk leaves its candidates unranked
+without affecting the others.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import math
+import os
+import re
+import time
+from collections import Counter, OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
 from app.services import llm_service as llm_backend
+from app.services.llm_cache import cache_enabled
 from app.services.llm_json import parse_llm_json
 from app.api.v1.endpoints.evidence import VALID_TAGS
 
@@ -23,6 +38,20 @@ NOTICE_UNRANKED = (
 MAX_CLAIMS_CHARS = 4_000
 _MAX_WHY_CHARS = 200
 
+EVIDENCE_RANKING_TOP_K = int(os.getenv("EVIDENCE_RANKING_TOP_K", "60"))
+EVIDENCE_RANKING_CHUNK_SIZE = int(os.getenv("EVIDENCE_RANKING_CHUNK_SIZE", "20"))
+EVIDENCE_RANKING_CACHE_TTL_SECONDS = int(os.getenv("EVIDENCE_RANKING_CACHE_TTL_SECONDS", "86400"))
+EVIDENCE_RANKING_CACHE_MAX_ENTRIES = int(os.getenv("EVIDENCE_RANKING_CACHE_MAX_ENTRIES", "10000"))
+
+_BM25_K1 = 1.5
+_BM25_B = 0.75
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "the and for that with this was were have has had not but you your are "
+    "from they their them she her his him our out all any can will would "
+    "been being into about there what when which who how".split()
+)
+
 
 def build_claims_narrative(intake_data: Dict[str, Any], drafts: List[Dict[str, Any]]) -> str:
     """The user's factual claims, formatted for the ranking prompt."""
@@ -76,6 +105,121 @@ def sanitize_rankings(raw: Dict[str, Any], valid_ids: set) -> Dict[str, Dict[str
     return out
 
 
+def _tokens(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 2 and t not in _STOPWORDS]
+
+
+def lexical_scores(candidates: List[Dict[str, Any]], claims: str) -> List[float]:
+    """BM25 score of each candidate's from/subject/snippet against the claims."""
+    docs = [
+        _tokens(f"{c.get('from', '')} {c.get('subject', '')} {c.get('snippet', '')}")
+        for c in candidates
+    ]
+    query = set(_tokens(claims))
+    if not docs or not query:
+        return [0.0] * len(docs)
+    avg_len = sum(len(d) for d in docs) / len(docs) or 1.0
+    doc_freq = Counter(term for d in docs for term in set(d) if term in query)
+    idf = {
+        term: math.log(1 + (len(docs) - n + 0.5) / (n + 0.5)) for term, n in doc_freq.items()
+    }
+    scores = []
+    for doc in docs:
+        counts = Counter(doc)
+        norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * len(doc) / avg_len)
+        scores.append(sum(
+            idf[term] * counts[term] * (_BM25_K1 + 1) / (counts[term] + norm)
+            for term in idf if term in counts
+        ))
+    return scores
+
+
+def prefilter(candidates: List[Dict[str, Any]], claims: str, top_k: int) -> List[Dict[str, Any]]:
+    """The top_k candidates by lexical score, in their original order."""
+    if len(candidates) <= top_k:
+        return list(candidates)
+    scores = lexical_scores(candidates, claims)
+    best = sorted(range(len(candidates)), key=lambda i: -scores[i])[:top_k]
+    return [candidates[i] for i in sorted(best)]
+
+
+def claims_hash(claims_narrative: str) -> str:
+    return hashlib.sha256(claims_narrative.encode("utf-8")).hexdigest()
+
+
+CacheKey = Tuple[str, str, str]  # (user id, message id, claims hash)
+
+
+class RankingCache:
+    """LRU + TTL map of (user, message id, claims hash) -> ranking entry.
+
+    An entry of None records that the model saw the message and did not
+    rank it, so a rescan does not ask again.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = EVIDENCE_RANKING_CACHE_TTL_SECONDS,
+        max_entries: int = EVIDENCE_RANKING_CACHE_MAX_ENTRIES,
+        clock=time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+
+    def get(self, key: CacheKey) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """(found, entry)."""
+        item = self._entries.get(key)
+        if item is None:
+            return False, None
+        expires_at, entry = item
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry
+
+    def put(self, key: CacheKey, entry: Optional[Dict[str, Any]]) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, entry)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+ranking_cache = RankingCache()
+
+
+async def _rank_chunk(
+    chunk: List[Dict[str, Any]],
+    claims_narrative: str,
+    user_id: Optional[str],
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Rankings keyed by message_id; None if the response had no rankings list."""
+    raw, tokens, model = await llm_backend.llm_service._generate(
+        build_ranking_prompt(chunk, claims_narrative),
+        "evidence_ranking",
+        user_id,
+    )
+    parsed = parse_llm_json(raw)
+    if not isinstance(parsed.get("rankings"), list):
+        # Malformed or truncated: nothing was ranked or declined
+        logger.warning(
+            "Evidence ranking: unparseable response for %d candidates (model=%s)",
+            len(chunk), model,
+        )
+        return None
+    rankings = sanitize_rankings(parsed, {c["message_id"] for c in chunk})
+    logger.info(
+        "Evidence ranking: candidates=%d ranked=%d tokens=%s model=%s",
+        len(chunk), len(rankings), tokens, model,
+    )
+    return rankings
+
+
 async def rank_candidates(
     candidates: List[Dict[str, Any]],
     claims_narrative: str,
@@ -87,22 +231,49 @@ async def rank_candidates(
     if llm_backend.USE_MOCK_LLM or not claims_narrative.strip():
         return [dict(c) for c in candidates], NOTICE_UNRANKED
 
-    try:
-        raw, tokens, model = await llm_backend.llm_service._generate(
-            build_ranking_prompt(candidates, claims_narrative),
-            "evidence_ranking",
-            user_id,
-        )
-    except Exception as exc:
-        logger.warning("Evidence ranking failed: %s", type(exc).__name__)
-        return [dict(c) for c in candidates], NOTICE_UNRANKED
+    use_cache = cache_enabled()
+    digest = claims_hash(claims_narrative)
+    rankings: Dict[str, Dict[str, Any]] = {}
+    answered = 0  # candidates the model has ranked (or declined to) now or before
+    to_rank = []
+    for c in prefilter(candidates, claims_narrative, EVIDENCE_RANKING_TOP_K):
+        found, entry = False, None
+        if use_cache:
+            found, entry = ranking_cache.get((user_id or "", c["message_id"], digest))
+        if not found:
+            to_rank.append(c)
+            continue
+        answered += 1
+        if entry:
+            rankings[c["message_id"]] = entry
 
-    rankings = sanitize_rankings(
-        parse_llm_json(raw), {c["message_id"] for c in candidates}
+    cached = answered
+    chunks = [
+        to_rank[i:i + EVIDENCE_RANKING_CHUNK_SIZE]
+        for i in range(0, len(to_rank), EVIDENCE_RANKING_CHUNK_SIZE)
+    ]
+    results = await asyncio.gather(
+        *(_rank_chunk(chunk, claims_narrative, user_id) for chunk in chunks),
+        return_exceptions=True,
     )
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            logger.warning("Evidence ranking failed: %s", type(result).__name__)
+            continue
+        if result is None:  # unparseable; ask again on the next scan
+            continue
+        answered += len(chunk)
+        rankings.update(result)
+        if use_cache:
+            for c in chunk:
+                key = (user_id or "", c["message_id"], digest)
+                ranking_cache.put(key, result.get(c["message_id"]))
+
+    if not answered:
+        return [dict(c) for c in candidates], NOTICE_UNRANKED
     logger.info(
-        "Evidence ranking: candidates=%d ranked=%d tokens=%s model=%s",
-        len(candidates), len(rankings), tokens, model,
+        "Evidence ranking: scanned=%d prefiltered=%d cached=%d chunks=%d",
+        len(candidates), cached + len(to_rank), cached, len(chunks),
     )
 
     ranked = []
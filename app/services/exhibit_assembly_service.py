@@ -16,15 +16,8 @@ import PyPDF2
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    PageBreak,
-    Table,
-    TableStyle,
-)
 from reportlab.lib import colors
+# reportlab.platypus (slow to import) is loaded by the functions that lay out pages
 
 # Sentinel for sorting items with null source_date after dated items.
 _NULL_DATE_SENTINEL = "9999-99-99"
@@ -84,6 +77,8 @@ def _exhibit_story(letter_str: str, item: dict) -> list:
 
     Shared by build_exhibit_pages and exhibit_formatting.build_exhibit_packet.
     """
+    from reportlab.platypus import Paragraph, Spacer
+
     styles, heading_style, sub_style = _exhibit_styles()
     body_style = styles["Normal"]
 
@@ -122,6 +117,8 @@ def build_exhibit_pages(lettered: List[Tuple[str, dict]]) -> bytes:
     Returns:
         PDF bytes.
     """
+    from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
     buf = io.BytesIO()
     doc = SimpleDocTemplate(
         buf,
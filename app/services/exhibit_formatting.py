@@ -16,7 +16,7 @@ from __future__ import annotations
 import io
 import math
 from functools import partial
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 import PyPDF2
 from reportlab.lib import colors
@@ -24,7 +24,11 @@ from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas as rl_canvas
-from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+# reportlab.platypus is imported where packets are built: it takes a few
+# hundred ms to load and only the document endpoints need it
+if TYPE_CHECKING:
+    from reportlab.platypus import Table
 
 from app.services.exhibit_assembly_service import _exhibit_story
 
@@ -74,6 +78,8 @@ def _caption_header(canv, doc, caption: Dict[str, str]) -> None:
 
 
 def _render_story(story: list, caption: Dict[str, str]) -> bytes:
+    from reportlab.platypus import SimpleDocTemplate
+
     buf = io.BytesIO()
     doc = SimpleDocTemplate(
         buf,
@@ -94,6 +100,8 @@ def _page_count(pdf_bytes: bytes) -> int:
 
 
 def _index_table(rows: List[Tuple[str, str, str, int]]) -> Table:
+    from reportlab.platypus import Table, TableStyle
+
     table_data = [["Exhibit", "Date", "Description", "Page"]]
     for letter_str, date_val, desc, page in rows:
         if len(desc) > _INDEX_DESC_MAX:
@@ -114,6 +122,8 @@ def _index_table(rows: List[Tuple[str, str, str, int]]) -> Table:
 
 def _render_index(rows: List[Tuple[str, str, str, int]], caption: Dict[str, str]) -> bytes:
     """Index pages, chunked so the page count is exactly ceil(rows/28)."""
+    from reportlab.platypus import PageBreak, Paragraph, Spacer
+
     styles = getSampleStyleSheet()
     heading = ParagraphStyle(
         "IndexHeading", parent=styles["Heading1"], fontSize=16, spaceAfter=12, alignment=1
@@ -166,6 +176,8 @@ def build_exhibit_packet(lettered: List[Tuple[str, dict]], caption: Dict[str, st
     start pages (index pages included in the numbering), then render the index
     and merge everything.
     """
+    from reportlab.platypus import Paragraph
+
     if not lettered:
         return _render_story([Paragraph("EXHIBITS", getSampleStyleSheet()["Heading1"])], caption)
 
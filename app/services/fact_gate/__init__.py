@@ -4,7 +4,11 @@ text before it can reach a court PDF (real-LLM findings L1-L4, L7, L8, L15).
 
 Pure stdlib; no imports from other app services.
 """
+from app.services.fact_gate.batch import run_fact_gate_many, shutdown_gate_pool
 from app.services.fact_gate.gate import run_fact_gate
+from app.services.fact_gate.plan import GatePlan, compile_gate_plan
+from app.services.fact_gate.incremental import regate
+from app.services.fact_gate.stream import StreamingGate
 from app.services.fact_gate.types import (
     Correction,
     GateContext,
@@ -14,6 +18,12 @@ from app.services.fact_gate.types import (
 
 __all__ = [
     "run_fact_gate",
+    "run_fact_gate_many",
+    "shutdown_gate_pool",
+    "regate",
+    "compile_gate_plan",
+    "GatePlan",
+    "StreamingGate",
     "Correction",
     "GateContext",
     "GateResult",
@@ -49,6 +49,7 @@ class AllowedFacts:
     amounts: Dict[Decimal, Set[str]] = field(default_factory=dict)  # value -> source keys
     dates: Set[Tuple[int, int, int]] = field(default_factory=set)
     month_days: Set[Tuple[int, int]] = field(default_factory=set)  # year-less entries
+    dated_month_days: Set[Tuple[int, int]] = field(default_factory=set)  # (m, d) of `dates`
     ages: Dict[str, int] = field(default_factory=dict)  # child first name -> age today
     address_tokens: Set[str] = field(default_factory=set)
 
@@ -176,4 +177,5 @@ def build_allowed_facts(ctx: GateContext) -> AllowedFacts:
     for address in ctx.profile_addresses or []:
         if isinstance(address, str):
             facts.address_tokens |= address_tokens_from(address)
+    facts.dated_month_days = {(month, day) for _, month, day in facts.dates}
     return facts
@@ -13,40 +13,60 @@ instructions. All of it is unverifiable, so it is removed — narrowly:
 
 Every removal produces a needs_review Correction quoting the removed text.
 """
+import bisect
 import re
 from typing import List, Optional, Set, Tuple
 
+from app.services.fact_gate.segments import Replacement, SegmentedText
 from app.services.fact_gate.types import (
     Correction,
     GateContext,
     excerpt,
     iter_scalars,
-    sentence_spans,
 )
 
 _MARK = "\x00"  # placed at removal sites so the short-sentence rule can see them
+_MARK_RE = re.compile(_MARK)
 
 _SECTION_NUM = r"\d+(?:\.\d+)*(?:\([a-zA-Z0-9]+\))*"
 _CASE_TAIL = r"(?:\s*\(\d{4}\))?(?:\s*\d+\s+Cal\.(?:\s?App\.)?\s?\d*(?:st|nd|rd|th|d)?\s+\d+)?"
-_CITATION_RES = [
-    re.compile(
+# (pattern, anchors): every match contains one of its anchor literals and
+# starts at most _ANCHOR_WORDS_BACK whitespace-separated words before the
+# anchor's own word (anchors are matched case-insensitively for re.I
+# patterns). The literals are found with str.find, and each pattern only
+# runs in the windows around its own anchors instead of over the whole text.
+_CITATIONS = [
+    (re.compile(
         rf"\b(?:Family|Civil|Penal|Evidence|Welfare\s+and\s+Institutions)\s+Code,?"
         rf"\s+(?:sections?|§§?)\s*{_SECTION_NUM}",
         re.I,
-    ),
-    re.compile(rf"\b(?:Fam|Civ|Pen|Evid)\.?\s+Code,?\s+(?:sections?|§§?)\s*{_SECTION_NUM}", re.I),
-    re.compile(rf"\bCode\s+of\s+Civil\s+Procedure,?\s+(?:sections?|§§?)\s*{_SECTION_NUM}", re.I),
-    re.compile(rf"\bCalifornia\s+Rules\s+of\s+Court,?\s+rules?\s+{_SECTION_NUM}", re.I),
-    re.compile(
+    ), ("code",)),
+    (re.compile(rf"\b(?:Fam|Civ|Pen|Evid)\.?\s+Code,?\s+(?:sections?|§§?)\s*{_SECTION_NUM}", re.I),
+     ("code",)),
+    (re.compile(rf"\bCode\s+of\s+Civil\s+Procedure,?\s+(?:sections?|§§?)\s*{_SECTION_NUM}", re.I),
+     ("code",)),
+    (re.compile(rf"\bCalifornia\s+Rules\s+of\s+Court,?\s+rules?\s+{_SECTION_NUM}", re.I),
+     ("california",)),
+    (re.compile(
         r"\b(?:(?:[A-Z][A-Za-z]+\s+){0,3}Superior\s+Court\s+)?"
         r"[Ll]ocal\s+[Rr]ules?\s+(?:No\.\s*)?\d[\d.]*"
-    ),
-    re.compile(
+    ), ("Local", "local")),
+    (re.compile(
         rf"\bIn\s+re\s+(?:the\s+)?(?:Marriage\s+of\s+)?[A-Z][A-Za-z'’-]+{_CASE_TAIL}"
-    ),
-    re.compile(rf"\b[A-Z][A-Za-z'’-]+\s+v\.\s+[A-Z][A-Za-z'’-]+{_CASE_TAIL}"),
+    ), ("In",)),
+    (re.compile(rf"\b[A-Z][A-Za-z'’-]+\s+v\.\s+[A-Z][A-Za-z'’-]+{_CASE_TAIL}"), ("v.",)),
 ]
+_ANCHOR_REACH = 48  # non-space characters scanned past an anchor
+_ANCHOR_WORDS_BACK = 5  # "San Diego County Superior Court" before "Local"
 _PAREN_RE = re.compile(r"\([^()]*\)")
+_TIDY = [
+    (_MARK_RE, ""),
+    (re.compile(r"\(\s*\)"), ""),
+    (re.compile(r"[ \t]{2,}"), " "),
+    (re.compile(r" ([.,;:!?])"), r"\1"),
+    (re.compile(r"[ \t]+\n"), "\n"),
+    (re.compile(r"\n{3,}"), "\n\n"),
+]
 _CONNECTOR_RE = re.compile(r"(?:pursuant\s+to|under|;\s*see(?:\s+also)?|,?\s*citing)[\s(]*$", re.I)
 
 _STREET_SUFFIX = r"(?:Street|Avenue|Boulevard|Drive|Road|Lane|Way|St|Ave|Blvd|Dr|Rd|Ln)"
@@ -116,11 +136,17 @@ def _merge_spans(spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
     return merged
 
 
-def _expand_span(text: str, start: int, end: int) -> Tuple[int, int]:
-    """Widen a citation span to its parenthetical or leading connector."""
-    for match in _PAREN_RE.finditer(text):
-        if match.start() <= start and end <= match.end():
-            return match.start(), match.end()
+def _expand_span(
+    text: str, start: int, end: int, parens: List[Tuple[int, int]]
+) -> Tuple[int, int]:
+    """Widen a citation span to its parenthetical or leading connector.
+
+    parens are the innermost parentheticals of text, in order (they never
+    overlap, so the only candidate is the last one starting at or before start).
+    """
+    i = bisect.bisect_right(parens, (start, len(text))) - 1
+    if i >= 0 and end <= parens[i][1]:
+        return parens[i]
     lookback = text[max(0, start - 30):start]
     match = _CONNECTOR_RE.search(lookback)
     if match:
@@ -128,7 +154,7 @@ def _expand_span(text: str, start: int, end: int) -> Tuple[int, int]:
     return start, end
 
 
-def _removal(removed_text: str, message: str) -> Correction:
+def _removal(removed_text: str, message: str, span: Tuple[int, int]) -> Correction:
     return Correction(
         type="authority_removed",
         severity="needs_review",
@@ -136,16 +162,99 @@ def _removal(removed_text: str, message: str) -> Correction:
         original=excerpt(removed_text),
         replacement=None,
         message=message,
+        start=span[0],
+        end=span[1],
     )
 
 
-def _remove_citations(text: str, corrections: List[Correction]) -> str:
-    raw = [(m.start(), m.end()) for rx in _CITATION_RES for m in rx.finditer(text)]
-    expanded = [_expand_span(text, start, end) for start, end in _merge_spans(raw)]
-    for start, end in reversed(_merge_spans(expanded)):
-        corrections.append(_removal(text[start:end], _CITATION_MESSAGE))
-        text = text[:start] + _MARK + text[end:]
-    return text
+def _reach(text: str, start: int) -> int:
+    """Offset _ANCHOR_REACH non-space characters after start."""
+    edge, seen = start, 0
+    while edge < len(text) and seen < _ANCHOR_REACH:
+        step = min(len(text), edge + 2 * _ANCHOR_REACH)
+        seen += len("".join(text[edge:step].split()))
+        edge = step
+    return edge
+
+
+def _reach_back(text: str, start: int, floor: int) -> int:
+    """Start of the word _ANCHOR_WORDS_BACK words before the one at start.
+
+    Counted in words, not characters: the patterns bound how many words come
+    before an anchor but not how long each one is. Stops at floor (the end
+    of the previous window), which keeps the walks linear overall.
+    """
+    edge = start
+    for word in range(_ANCHOR_WORDS_BACK + 1):  # the anchor's own word, then the rest
+        if word:
+            while edge > floor and text[edge - 1].isspace():
+                edge -= 1
+        while edge > floor and not text[edge - 1].isspace():
+            edge -= 1
+    return edge
+
+
+def _anchor_windows(haystack: str, anchors: Tuple[str, ...]) -> List[Tuple[int, int]]:
+    """Merged windows around every occurrence of the anchors."""
+    found = []
+    for anchor in anchors:
+        i = haystack.find(anchor)
+        while i >= 0:
+            found.append((i, i + len(anchor)))
+            i = haystack.find(anchor, i + 1)
+    windows: List[Tuple[int, int]] = []
+    for start, end in sorted(found):
+        if windows and start <= windows[-1][1]:
+            # Inside the current window, so its reach back is already covered
+            windows[-1] = (windows[-1][0], max(windows[-1][1], _reach(haystack, end)))
+        else:
+            floor = windows[-1][1] if windows else 0
+            windows.append((_reach_back(haystack, start, floor), _reach(haystack, end)))
+    return _merge_spans(windows)
+
+
+def _citation_spans(text: str) -> List[Tuple[int, int]]:
+    """Every citation match, scanning only the windows around anchor literals.
+
+    Finds the same citations as running each pattern over the whole text:
+    every match is redone from its start without the window, so a window
+    never cuts one short.
+    """
+    folded = text.lower()
+    if len(folded) != len(text):  # lowercasing changed offsets; scan everything
+        folded = None
+    windows_for = {}  # patterns sharing anchors share windows
+    spans = []
+    for rx, anchors in _CITATIONS:
+        fold = bool(rx.flags & re.I)
+        key = (anchors, fold)
+        if key not in windows_for:
+            if not fold:
+                windows_for[key] = _anchor_windows(text, anchors)
+            elif folded is not None:
+                windows_for[key] = _anchor_windows(folded, anchors)
+            else:
+                windows_for[key] = [(0, len(text))]
+        for lo, hi in windows_for[key]:
+            for match in rx.finditer(text, lo, hi):
+                # The window may have cut the match short; take its full extent
+                whole = rx.match(text, match.start())
+                spans.append((match.start(), (whole or match).end()))
+    return spans
+
+
+def _remove_citations(doc: SegmentedText, corrections: List[Correction]) -> SegmentedText:
+    text = doc.text
+    raw = _citation_spans(text)
+    if not raw:
+        return doc
+    parens = [(m.start(), m.end()) for m in _PAREN_RE.finditer(text)]
+    expanded = [_expand_span(text, start, end, parens) for start, end in _merge_spans(raw)]
+    spans = _merge_spans(expanded)
+    for start, end in reversed(spans):
+        corrections.append(
+            _removal(text[start:end], _CITATION_MESSAGE, doc.origin_span(start, end)))
+    return doc.apply([(start, end, _MARK) for start, end in spans])
 
 
 def _sentence_removal_reason(
@@ -162,42 +271,46 @@ def _sentence_removal_reason(
 
 
 def _remove_sentences(
-    text: str, allowed_tokens: Set[str], ctx: GateContext, corrections: List[Correction]
-) -> str:
-    support_ok = _support_requested(ctx)
+    doc: SegmentedText, allowed_tokens: Set[str], support_ok: bool,
+    corrections: List[Correction],
+) -> SegmentedText:
+    text = doc.text
     removals = []
-    for start, end in sentence_spans(text):
-        reason = _sentence_removal_reason(text[start:end], allowed_tokens, support_ok)
+    for index, (start, end) in enumerate(doc.spans):
+        reason = _sentence_removal_reason(doc.sentence(index), allowed_tokens, support_ok)
         if reason:
             removals.append((start, end, reason))
     for start, end, reason in reversed(removals):
         clean = text[start:end].replace(_MARK, "")
         if re.search(r"[A-Za-z]", clean):
-            corrections.append(_removal(clean, reason))
+            corrections.append(_removal(clean, reason, doc.origin_span(start, end)))
+    edits: List[Replacement] = []
+    for start, end, _ in removals:
         while end < len(text) and text[end] in " \t":
             end += 1
-        text = text[:start] + text[end:]
-    return text
+        edits.append((start, end, ""))
+    return doc.apply(edits)
 
 
-def _tidy(text: str) -> str:
-    text = text.replace(_MARK, "")
-    text = re.sub(r"\(\s*\)", "", text)
-    text = re.sub(r"[ \t]{2,}", " ", text)
-    text = re.sub(r" ([.,;:!?])", r"\1", text)
-    text = re.sub(r"[ \t]+\n", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text
+def _tidy(doc: SegmentedText) -> SegmentedText:
+    for pattern, repl in _TIDY:
+        doc = doc.sub(pattern, repl)
+    return doc
 
 
 def strip_authority(
-    text: str, allowed_address_tokens: Set[str], ctx: GateContext
+    text: str,
+    allowed_address_tokens: Set[str],
+    ctx: GateContext,
+    support_requested: Optional[bool] = None,
+    doc: Optional[SegmentedText] = None,
 ) -> Tuple[str, List[Correction]]:
     """Remove unverifiable legal authority; every removal is a Correction."""
-    original = text
     corrections: List[Correction] = []
-    text = _remove_citations(text, corrections)
-    text = _remove_sentences(text, allowed_address_tokens, ctx, corrections)
+    if support_requested is None:
+        support_requested = _support_requested(ctx)
+    marked = _remove_citations(SegmentedText.of(text, doc), corrections)
+    stripped = _remove_sentences(marked, allowed_address_tokens, support_requested, corrections)
     if not corrections:
-        return original, []
-    return _tidy(text), corrections
+        return text, []
+    return _tidy(stripped).text, corrections
@@ -0,0 +1,145 @@
+"""
+Batch fact gating across a process pool.
+
+The gate is pure-Python and CPU-bound, so gating many sections one after the
+other in a web worker serializes on one core. run_fact_gate_many shards the
+texts across a process pool instead: the compiled GatePlan is pickled once
+per call and unpickled once per worker process, each worker gates a
+contiguous shard, and the results come back in input order — identical to
+calling run_fact_gate on each text.
+
+Small batches (under FACT_GATE_POOL_MIN_CHARS in total, or a single worker)
+are gated in-process, where pool overhead would cost more than it saves. If
+the pool cannot be used (it failed to start, a worker died, the plan cannot
+be pickled) the remaining texts are gated in-process, so this never raises.
+The pool uses spawned processes, started on first use and kept for the life
+of the process; shutdown_gate_pool() stops it.
+
+Results gated in a worker come back without GateResult.doc: the SegmentedText
+edit chain would be pickled back with every result, and is several times the
+size of the text. regate() on such a result gates the edited text in full.
+"""
+import dataclasses
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from app.services.fact_gate.gate import run_fact_gate
+from app.services.fact_gate.plan import GatePlan, compile_gate_plan
+from app.services.fact_gate.types import GateContext, GateResult
+
+logger = logging.getLogger(__name__)
+
+FACT_GATE_WORKERS = int(os.getenv("FACT_GATE_WORKERS", "0"))  # 0: one per CPU
+FACT_GATE_POOL_MIN_CHARS = int(os.getenv("FACT_GATE_POOL_MIN_CHARS", "200000"))
+_SHARDS_PER_WORKER = 4  # smaller shards even out uneven section lengths
+
+_Item = Tuple[Optional[str], str]  # (text, section name)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# In a worker: the plan of the call being served, by call key
+_worker_plan: Tuple[str, Optional[GatePlan]] = ("", None)
+
+
+def _workers() -> int:
+    return FACT_GATE_WORKERS if FACT_GATE_WORKERS > 0 else (os.cpu_count() or 1)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=_workers(), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def shutdown_gate_pool() -> None:
+    """Stop the worker processes; the next pooled call starts new ones."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _gate_items(items: Sequence[_Item], plan: GatePlan) -> List[GateResult]:
+    return [
+        run_fact_gate(text, dataclasses.replace(plan.ctx, section_name=name), plan)
+        for text, name in items
+    ]
+
+
+def _gate_shard(key: str, plan_bytes: bytes, items: List[_Item]) -> List[GateResult]:
+    """Worker entry point: unpickle the call's plan once, then gate the shard.
+
+    Each result's doc is dropped so only the text and corrections are pickled back.
+    """
+    global _worker_plan
+    if _worker_plan[0] != key:
+        _worker_plan = (key, pickle.loads(plan_bytes))
+    return [dataclasses.replace(result, doc=None) for result in _gate_items(items, _worker_plan[1])]
+
+
+def _shards(items: List[_Item], count: int) -> List[List[_Item]]:
+    """Contiguous shards of roughly equal total length, in input order."""
+    target = sum(len(text or "") for text, _ in items) / count
+    shards: List[List[_Item]] = [[]]
+    size = 0
+    for item in items:
+        if shards[-1] and size >= target:
+            shards.append([])
+            size = 0
+        shards[-1].append(item)
+        size += len(item[0] or "")
+    return shards
+
+
+def run_fact_gate_many(
+    texts: Sequence[Optional[str]],
+    ctx: Optional[GateContext] = None,
+    plan: Optional[GatePlan] = None,
+    section_names: Optional[Sequence[str]] = None,
+) -> List[GateResult]:
+    """run_fact_gate for every text, in input order, across the worker pool.
+
+    ctx/plan are as for run_fact_gate. section_names, if given, names each
+    text's section (Correction.section); otherwise ctx.section_name is used.
+    Never raises.
+    """
+    if not isinstance(ctx, GateContext):
+        ctx = plan.ctx if isinstance(plan, GatePlan) else GateContext()
+    if not isinstance(plan, GatePlan):
+        plan = compile_gate_plan(ctx)
+    plan = dataclasses.replace(plan, ctx=ctx)
+    names = list(section_names) if section_names is not None else []
+    items: List[_Item] = [
+        (text, names[i] if i < len(names) else ctx.section_name) for i, text in enumerate(texts)
+    ]
+    total = sum(len(text) for text, _ in items if isinstance(text, str))
+    workers = min(_workers(), len(items))
+    if workers <= 1 or total < FACT_GATE_POOL_MIN_CHARS:
+        return _gate_items(items, plan)
+
+    shards = _shards(items, workers * _SHARDS_PER_WORKER)
+    results: List[GateResult] = []
+    try:
+        plan_bytes = pickle.dumps(plan)
+        pool = _get_pool()
+        key = uuid.uuid4().hex
+        futures: List[Future] = [pool.submit(_gate_shard, key, plan_bytes, shard) for shard in shards]
+        for future in futures:
+            results.extend(future.result())
+    except Exception:
+        logger.warning("fact-gate: worker pool unavailable; gating in-process", exc_info=True)
+        shutdown_gate_pool()
+        results.extend(_gate_items(items[len(results):], plan))
+    return results
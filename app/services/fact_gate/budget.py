@@ -0,0 +1,43 @@
+"""
+Per-pass time budget for the fact gate.
+
+Every pattern the gate runs is linear in its input (tests/test_fact_gate_redos.py
+holds them to it), but a pathological draft can still make a pass do far
+more work than any real declaration. run_fact_gate runs each pass under
+pass_budget(); check_budget() raises PassTimeout once the pass is past its
+deadline, and the gate skips that pass like any other failure.
+
+Python cannot interrupt a regex mid-match, so the budget is cooperative:
+SegmentedText checks it at the per-match and per-sentence steps every pass
+goes through (index_at, sentence, origin_span, sub). A single match is never
+cut short — keeping each one linear is the pattern audit's job — but a pass
+stops within one step of running out of time. Outside pass_budget() the
+check is a no-op.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_deadline: ContextVar[Optional[float]] = ContextVar("fact_gate_deadline", default=None)
+
+
+class PassTimeout(Exception):
+    """A gate pass ran past its time budget."""
+
+
+@contextmanager
+def pass_budget(seconds: float) -> Iterator[None]:
+    """Run the enclosed pass with a deadline `seconds` from now; <= 0 disables."""
+    token = _deadline.set(time.perf_counter() + seconds if seconds > 0 else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def check_budget() -> None:
+    """Raise PassTimeout if the current pass is past its deadline."""
+    deadline = _deadline.get()
+    if deadline is not None and time.perf_counter() > deadline:
+        raise PassTimeout
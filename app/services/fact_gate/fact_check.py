@@ -9,13 +9,15 @@ Amount, date, and age verification against AllowedFacts.
 - Ages (finding L3): computed from children DOBs; numbers are paired with
   the nearest child name in the sentence and corrected in place.
 """
+import bisect
 import re
 from datetime import date
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
 from app.services.fact_gate.allowed_facts import AllowedFacts, MONTH_WORD, month_number
-from app.services.fact_gate.types import Correction, excerpt, sentence_spans
+from app.services.fact_gate.segments import SegmentedText
+from app.services.fact_gate.types import Correction, excerpt
 
 PLACEHOLDER = "[TO BE COMPLETED]"
 
@@ -37,6 +39,7 @@ _BARE_YEARS_RE = re.compile(r"\b(\d{1,2})\s+years\b(?!\s+old)", re.I)
 _DURATION_GUARD_RE = re.compile(
     r"\b(?:for|past|last|over|about|approximately|nearly|than|within)\s*$", re.I
 )
+_DURATION_GUARD_SPAN = len("approximately")  # longest guard word
 
 _UNKNOWN_AMOUNT_MSG = (
     "This dollar amount doesn't match anything you entered — please fill in the correct figure."
@@ -54,29 +57,17 @@ _UNMATCHED_AGE_MSG = (
 )
 
 
-def _apply(text: str, replacements: List[Tuple[int, int, str]]) -> str:
-    for start, end, replacement in sorted(replacements, reverse=True):
-        text = text[:start] + replacement + text[end:]
-    return text
-
-
-def _sentence_at(spans: List[Tuple[int, int]], pos: int) -> Tuple[int, int]:
-    for start, end in spans:
-        if start <= pos < end:
-            return start, end
-    return 0, 0
-
-
 def _correction(kind: str, severity: str, original: str, replacement: Optional[str],
-                message: str) -> Correction:
+                message: str, span: Tuple[int, int]) -> Correction:
     return Correction(type=kind, severity=severity, section="",
-                      original=excerpt(original), replacement=replacement, message=message)
+                      original=excerpt(original), replacement=replacement, message=message,
+                      start=span[0], end=span[1])
 
 
-def _amount_issue(sources: Optional[set], sentence: str) -> Optional[str]:
+def _amount_issue(sources: Optional[set], support_context: bool) -> Optional[str]:
     if sources is None:
         return _UNKNOWN_AMOUNT_MSG
-    if not _SUPPORT_CONTEXT_RE.search(sentence):
+    if not support_context:
         return None
     keys = {key.lower() for key in sources}
     if any("support" in key for key in keys):
@@ -86,23 +77,29 @@ def _amount_issue(sources: Optional[set], sentence: str) -> Optional[str]:
     return None
 
 
-def check_amounts(text: str, facts: AllowedFacts) -> Tuple[str, List[Correction]]:
+def check_amounts(
+    text: str, facts: AllowedFacts, doc: Optional[SegmentedText] = None
+) -> Tuple[str, List[Correction]]:
     """$-prefixed tokens must be user-entered and support-sourced in support sentences."""
+    doc = SegmentedText.of(text, doc)
     corrections: List[Correction] = []
     replacements: List[Tuple[int, int, str]] = []
-    spans = sentence_spans(text)
+    support_context: Dict[Optional[int], bool] = {None: False}  # by sentence index
     for match in _AMOUNT_TOKEN_RE.finditer(text):
         try:
             value = Decimal(match.group().replace("$", "").replace(",", "").strip())
         except InvalidOperation:
             continue
-        start, end = _sentence_at(spans, match.start())
-        issue = _amount_issue(facts.amounts.get(value), text[start:end])
+        index = doc.index_at(match.start())
+        if index not in support_context:
+            support_context[index] = bool(_SUPPORT_CONTEXT_RE.search(doc.sentence(index)))
+        issue = _amount_issue(facts.amounts.get(value), support_context[index])
         if issue:
             replacements.append((match.start(), match.end(), PLACEHOLDER))
-            corrections.append(
-                _correction("amount", "needs_review", match.group(), PLACEHOLDER, issue))
-    return _apply(text, replacements), corrections
+            corrections.append(_correction(
+                "amount", "needs_review", match.group(), PLACEHOLDER, issue,
+                doc.origin_span(match.start(), match.end())))
+    return doc.apply(replacements).text, corrections
 
 
 def _pivot_year(year: int) -> int:
@@ -119,9 +116,7 @@ def _date_allowed(year: Optional[int], month: int, day: int, facts: AllowedFacts
         return None
     if year:
         return (year, month, day) in facts.dates or (month, day) in facts.month_days
-    if (month, day) in facts.month_days:
-        return True
-    return any((m, d) == (month, day) for (_, m, d) in facts.dates)
+    return (month, day) in facts.month_days or (month, day) in facts.dated_month_days
 
 
 def _range_replacement(match: re.Match, facts: AllowedFacts) -> Tuple[Optional[str], str]:
@@ -144,6 +139,14 @@ def _range_replacement(match: re.Match, facts: AllowedFacts) -> Tuple[Optional[s
     return PLACEHOLDER, _UNKNOWN_DATE_MSG
 
 
+def _overlaps_range(bounds: List[int], start: int, end: int) -> bool:
+    """Whether [start, end) overlaps a range; bounds are sorted start/end pairs."""
+    i = bisect.bisect_right(bounds, start)
+    if i % 2:  # start falls inside a range
+        return True
+    return i < len(bounds) and bounds[i] < end
+
+
 def _single_date_candidates(text: str):
     for match in _LONG_DATE_RE.finditer(text):
         yield match, (int(match.group(3)), month_number(match.group(1)), int(match.group(2)))
@@ -153,26 +156,33 @@ def _single_date_candidates(text: str):
         yield match, (_pivot_year(int(match.group(3))), int(match.group(1)), int(match.group(2)))
 
 
-def check_dates(text: str, facts: AllowedFacts) -> Tuple[str, List[Correction]]:
+def check_dates(
+    text: str, facts: AllowedFacts, doc: Optional[SegmentedText] = None
+) -> Tuple[str, List[Correction]]:
     """Verify date mentions; trim ranges to entered endpoints; block unknowns."""
+    doc = SegmentedText.of(text, doc)
     corrections: List[Correction] = []
     replacements: List[Tuple[int, int, str]] = []
-    occupied: List[Tuple[int, int]] = []
+    occupied: List[int] = []  # range starts, then ends, interleaved in order
     for match in _RANGE_RE.finditer(text):
-        occupied.append((match.start(), match.end()))
+        occupied += (match.start(), match.end())
         replacement, message = _range_replacement(match, facts)
         if replacement is not None:
             replacements.append((match.start(), match.end(), replacement))
-            corrections.append(
-                _correction("date", "needs_review", match.group(), replacement, message))
+            corrections.append(_correction(
+                "date", "needs_review", match.group(), replacement, message,
+                doc.origin_span(match.start(), match.end())))
     for match, ymd in _single_date_candidates(text):
-        if any(match.start() < end and match.end() > start for start, end in occupied):
+        # Ranges never overlap each other, so a bisect over their bounds finds
+        # whether this candidate overlaps one
+        if _overlaps_range(occupied, match.start(), match.end()):
             continue
         if _date_allowed(*ymd, facts) is False:
             replacements.append((match.start(), match.end(), PLACEHOLDER))
             corrections.append(_correction(
-                "date", "needs_review", match.group(), PLACEHOLDER, _UNKNOWN_DATE_MSG))
-    return _apply(text, replacements), corrections
+                "date", "needs_review", match.group(), PLACEHOLDER, _UNKNOWN_DATE_MSG,
+                doc.origin_span(match.start(), match.end())))
+    return doc.apply(replacements).text, corrections
 
 
 def _age_candidates(sentence: str, bound_rx: Optional[re.Pattern]):
@@ -197,18 +207,24 @@ def _age_candidates(sentence: str, bound_rx: Optional[re.Pattern]):
     for match in _YEARS_OLD_RE.finditer(sentence):
         add(match, "age")
     for match in _BARE_YEARS_RE.finditer(sentence):
-        if not _DURATION_GUARD_RE.search(sentence[:match.start()]):
+        if not _duration_guarded(sentence, match.start()):
             add(match, "years")
     return candidates
 
 
+def _duration_guarded(sentence: str, pos: int) -> bool:
+    """_DURATION_GUARD_RE against sentence[:pos], without copying the prefix."""
+    while pos and sentence[pos - 1].isspace():  # the pattern's trailing \s*
+        pos -= 1
+    return bool(_DURATION_GUARD_RE.search(sentence, max(0, pos - _DURATION_GUARD_SPAN), pos))
+
+
 def _expected_age(names: List[Tuple[int, str]], pos: int, kind: str, value: int,
                   facts: AllowedFacts) -> Tuple[Optional[int], bool]:
     """(expected age, flag_only). Nearest-preceding name wins, else following."""
-    if names:
-        preceding = [item for item in names if item[0] <= pos]
-        chosen = max(preceding)[1] if preceding else min(n for n in names if n[0] > pos)[1]
-        return facts.ages.get(chosen), False
+    if names:  # in position order
+        i = bisect.bisect_right(names, pos, key=lambda item: item[0])
+        return facts.ages.get(names[i - 1 if i else 0][1]), False
     if kind != "age" or value > 17:
         return None, False
     if len(facts.ages) == 1:
@@ -216,31 +232,51 @@ def _expected_age(names: List[Tuple[int, str]], pos: int, kind: str, value: int,
     return None, True
 
 
-def check_ages(text: str, facts: AllowedFacts) -> Tuple[str, List[Correction]]:
+AgePatterns = Tuple[Pattern, Pattern]  # (child name, "Name (6)")
+
+
+def compile_age_patterns(facts: AllowedFacts) -> Optional[AgePatterns]:
+    """Child-name patterns for check_ages; None when no ages are known."""
+    if not facts.ages:
+        return None
+    names_alt = "|".join(re.escape(name) for name in sorted(facts.ages))
+    return (
+        re.compile(rf"\b({names_alt})\b", re.I),
+        re.compile(rf"\b({names_alt})\s*\(\s*(\d{{1,2}})\s*\)", re.I),
+    )
+
+
+def check_ages(
+    text: str,
+    facts: AllowedFacts,
+    patterns: Optional[AgePatterns] = None,
+    doc: Optional[SegmentedText] = None,
+) -> Tuple[str, List[Correction]]:
     """Correct stated child ages against DOB-derived truth."""
     if not facts.ages:
         return text, []
-    names_alt = "|".join(re.escape(name) for name in sorted(facts.ages))
-    names_rx = re.compile(rf"\b({names_alt})\b", re.I)
-    bound_rx = re.compile(rf"\b({names_alt})\s*\(\s*(\d{{1,2}})\s*\)", re.I)
+    names_rx, bound_rx = patterns or compile_age_patterns(facts)
+    doc = SegmentedText.of(text, doc)
     corrections: List[Correction] = []
     replacements: List[Tuple[int, int, str]] = []
-    for start, end in sentence_spans(text):
-        sentence = text[start:end]
+    for index, (start, end) in enumerate(doc.spans):
+        sentence = doc.sentence(index)
         names = [(m.start(), m.group(1).lower()) for m in names_rx.finditer(sentence)]
         for num_start, num_end, value, kind, bound in _age_candidates(sentence, bound_rx):
             if bound:
                 expected, flag_only = facts.ages.get(bound), False
             else:
                 expected, flag_only = _expected_age(names, num_start, kind, value, facts)
+            span = doc.origin_span(start + num_start, start + num_end)
             if flag_only:
                 corrections.append(_correction(
-                    "age", "needs_review", sentence, None, _UNMATCHED_AGE_MSG))
+                    "age", "needs_review", sentence, None, _UNMATCHED_AGE_MSG, span))
             elif expected is not None and expected != value:
                 replacements.append((start + num_start, start + num_end, str(expected)))
                 corrections.append(_correction(
                     "age", "corrected", text[start + num_start:start + num_end],
                     str(expected),
                     "An age was corrected using the child's date of birth.",
+                    span,
                 ))
-    return _apply(text, replacements), corrections
+    return doc.apply(replacements).text, corrections
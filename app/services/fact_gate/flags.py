@@ -7,9 +7,10 @@ quantifier_flag telling the user to verify the count before signing under
 penalty of perjury.
 """
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from app.services.fact_gate.types import Correction, excerpt, sentence_spans
+from app.services.fact_gate.segments import SegmentedText
+from app.services.fact_gate.types import Correction, excerpt
 
 _UPL_RE = re.compile(
     r"\byou\s+should\s+file\b|\byou\s+should\s+consider\b|\bi\s+recommend\b"
@@ -29,14 +30,12 @@ _UPL_MESSAGE = (
 )
 
 
-def _sentence_text(text: str, spans: List[Tuple[int, int]], pos: int) -> str:
-    for start, end in spans:
-        if start <= pos < end:
-            return text[start:end]
-    return text
+def _sentence_text(doc: SegmentedText, pos: int) -> str:
+    index = doc.index_at(pos)
+    return doc.collapsed(index) if index is not None else doc.text
 
 
-def _flag(kind: str, original: str, message: str) -> Correction:
+def _flag(kind: str, original: str, message: str, span: Tuple[int, int]) -> Correction:
     return Correction(
         type=kind,
         severity="needs_review",
@@ -44,21 +43,26 @@ def _flag(kind: str, original: str, message: str) -> Correction:
         original=excerpt(original),
         replacement=None,
         message=message,
+        start=span[0],
+        end=span[1],
     )
 
 
-def scan_flags(text: str) -> List[Correction]:
+def scan_flags(text: str, doc: Optional[SegmentedText] = None) -> List[Correction]:
     """Corrections only — the text is returned untouched by the caller."""
+    doc = SegmentedText.of(text, doc)
     corrections: List[Correction] = []
-    spans = sentence_spans(text)
     for match in _UPL_RE.finditer(text):
-        corrections.append(
-            _flag("upl_flag", _sentence_text(text, spans, match.start()), _UPL_MESSAGE))
+        corrections.append(_flag(
+            "upl_flag", _sentence_text(doc, match.start()), _UPL_MESSAGE,
+            doc.origin_span(match.start(), match.end()),
+        ))
     for match in _QUANTIFIER_RE.finditer(text):
         corrections.append(_flag(
             "quantifier_flag",
-            _sentence_text(text, spans, match.start()),
+            _sentence_text(doc, match.start()),
             f"The document says \"{match.group()}\" — make sure this count is "
             "accurate before signing under penalty of perjury.",
+            doc.origin_span(match.start(), match.end()),
         ))
     return corrections
@@ -9,80 +9,102 @@ Fact-gate orchestrator. The pass order is load-bearing:
 6. flag-only scans (UPL, quantifiers)
 
 run_fact_gate NEVER raises: a failing pass is skipped, the text is left
-unchanged, and an info Correction records the skip. The gate is idempotent:
-run_fact_gate(result.text, ctx).text == result.text.
+unchanged, and an info Correction records the skip. A pass that runs past
+FACT_GATE_PASS_BUDGET_SECONDS is skipped the same way (budget.py). The gate
+is idempotent: run_fact_gate(result.text, ctx).text == result.text.
+
+Callers gating several texts against one context pass a GatePlan
+(compile_gate_plan) so allowed facts and patterns are built once. Within one
+run the passes share a SegmentedText, re-segmented only where a pass edited.
+Every pass edits through it, so Correction.start/end are offsets into the
+text the gate was given, whichever pass produced them.
 """
 import logging
+import os
 from typing import Callable, List, Optional, Tuple
 
-from app.services.fact_gate.allowed_facts import AllowedFacts, build_allowed_facts
 from app.services.fact_gate.authority_strip import strip_authority
+from app.services.fact_gate.budget import PassTimeout, pass_budget
 from app.services.fact_gate.fact_check import check_ages, check_amounts, check_dates
 from app.services.fact_gate.flags import scan_flags
 from app.services.fact_gate.markdown_strip import strip_markdown
 from app.services.fact_gate.party_check import check_party_roles, fill_placeholders
+from app.services.fact_gate.plan import GatePlan, compile_gate_plan
+from app.services.fact_gate.segments import SegmentedText
 from app.services.fact_gate.types import Correction, GateContext, GateResult
 
 logger = logging.getLogger(__name__)
 
+FACT_GATE_PASS_BUDGET_SECONDS = float(os.getenv("FACT_GATE_PASS_BUDGET_SECONDS", "5"))  # 0: none
+
 _Pass = Tuple[str, str, Callable]
 
 
-def _skipped(name: str, correction_type: str) -> Correction:
+def _skipped(name: str, correction_type: str, reason: str = "could not run") -> Correction:
     return Correction(
         type=correction_type,
         severity="info",
         section="",
         original="",
         replacement=None,
-        message=f"The automated {name} check could not run and was skipped.",
+        message=f"The automated {name} check {reason} and was skipped.",
     )
 
 
-def _build_facts(ctx: GateContext, corrections: List[Correction]) -> Tuple[AllowedFacts, bool]:
-    try:
-        return build_allowed_facts(ctx), True
-    except Exception:
-        logger.warning("fact-gate: allowed-facts build failed; fact passes skipped",
-                       exc_info=True)
-        corrections.append(_skipped("amount, date, and age", "amount"))
-        return AllowedFacts(), False
-
-
-def _passes(ctx: GateContext, facts: AllowedFacts, facts_ok: bool) -> List[_Pass]:
+def _passes(ctx: GateContext, plan: GatePlan) -> List[_Pass]:
+    facts = plan.facts
     passes: List[_Pass] = [
-        ("formatting", "markdown", strip_markdown),
+        ("formatting", "markdown", lambda d: strip_markdown(d.text, d)),
         ("legal-citation", "authority_removed",
-         lambda t: strip_authority(t, facts.address_tokens, ctx)),
-        ("placeholder", "placeholder_filled", lambda t: fill_placeholders(t, ctx)),
-        ("party-role", "party_role", lambda t: check_party_roles(t, ctx)),
+         lambda d: strip_authority(d.text, facts.address_tokens, ctx, plan.support_requested, d)),
+        ("placeholder", "placeholder_filled", lambda d: fill_placeholders(d.text, ctx, d)),
+        ("party-role", "party_role", lambda d: check_party_roles(d.text, ctx, plan.party, d)),
     ]
-    if facts_ok:
+    if plan.facts_ok:
         passes += [
-            ("amount", "amount", lambda t: check_amounts(t, facts)),
-            ("date", "date", lambda t: check_dates(t, facts)),
-            ("age", "age", lambda t: check_ages(t, facts)),
+            ("amount", "amount", lambda d: check_amounts(d.text, facts, d)),
+            ("date", "date", lambda d: check_dates(d.text, facts, d)),
+            ("age", "age", lambda d: check_ages(d.text, facts, plan.ages, d)),
         ]
-    passes.append(("advice-and-quantifier", "upl_flag", lambda t: (t, scan_flags(t))))
+    passes.append(
+        ("advice-and-quantifier", "upl_flag", lambda d: (d.text, scan_flags(d.text, d)))
+    )
     return passes
 
 
-def run_fact_gate(text: Optional[str], ctx: Optional[GateContext] = None) -> GateResult:
-    """Deterministically correct/strip/flag LLM motion text. Never raises."""
+def run_fact_gate(
+    text: Optional[str],
+    ctx: Optional[GateContext] = None,
+    plan: Optional[GatePlan] = None,
+) -> GateResult:
+    """Deterministically correct/strip/flag LLM motion text. Never raises.
+
+    plan must have been compiled from ctx's ground truth; ctx supplies the
+    section name. With only a plan, plan.ctx is used.
+    """
     if not isinstance(ctx, GateContext):
-        ctx = GateContext()
-    current = text if isinstance(text, str) else ""
+        ctx = plan.ctx if isinstance(plan, GatePlan) else GateContext()
+    if not isinstance(plan, GatePlan):
+        plan = compile_gate_plan(ctx)
+    doc = SegmentedText(text if isinstance(text, str) else "")
     corrections: List[Correction] = []
-    facts, facts_ok = _build_facts(ctx, corrections)
-    for name, correction_type, gate_pass in _passes(ctx, facts, facts_ok):
+    if not plan.facts_ok:
+        corrections.append(_skipped("amount, date, and age", "amount"))
+    for name, correction_type, gate_pass in _passes(ctx, plan):
         try:
-            current, new_corrections = gate_pass(current)
+            with pass_budget(FACT_GATE_PASS_BUDGET_SECONDS):
+                current, new_corrections = gate_pass(doc)
+        except PassTimeout:
+            logger.warning("fact-gate: %s pass ran out of time and was skipped", name)
+            corrections.append(_skipped(name, correction_type, "took too long on this text"))
+            continue
         except Exception:
             logger.warning("fact-gate: %s pass failed and was skipped", name, exc_info=True)
             corrections.append(_skipped(name, correction_type))
             continue
+        doc = doc.derive(current)
         corrections.extend(new_corrections)
     for correction in corrections:
         if not correction.section:
             correction.section = ctx.section_name
-    return GateResult(text=current, corrections=corrections)
+    return GateResult(text=doc.text, corrections=corrections, doc=doc)
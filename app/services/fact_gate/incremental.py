@@ -0,0 +1,171 @@
+"""
+Incremental re-gating of hand-edited gate output.
+
+When a user edits part of a gated section, only the paragraphs the edit
+touches are gated again; everything else is already a fixed point of the
+gate. The edit and the re-gated paragraphs are applied through the previous
+result's SegmentedText, so every Correction.start/end still points into the
+text the gate was first given (text the user typed maps to the span it
+replaced).
+
+The unit re-gated is a line, not a sentence: bold and underline markers can
+span sentences and the heading, fence and title rules are line-anchored, so a
+line is the smallest piece the passes treat alone exactly as in the whole
+text. Runs of table lines are re-gated together. The one step that is not
+line-local is the authority pass's whitespace tidy-up, which covers the whole
+text whenever anything was removed; regate() does the same when a re-gated
+line loses a citation, so the result is what gating the edited text in full
+would give.
+
+Corrections merge back as follows: a previous correction whose affected text
+the edit overlaps is dropped, every other one is kept, and the re-gated lines
+add their corrections unless an identical one was kept.
+"""
+import dataclasses
+from typing import List, Optional, Set, Tuple, Union
+
+from app.services.fact_gate.authority_strip import _tidy
+from app.services.fact_gate.gate import run_fact_gate
+from app.services.fact_gate.markdown_strip import _is_table_line
+from app.services.fact_gate.plan import GatePlan, compile_gate_plan
+from app.services.fact_gate.segments import Replacement, SegmentedText, Span, text_edit
+from app.services.fact_gate.types import Correction, GateContext, GateResult
+
+
+def _line_region(text: str, start: int, end: int) -> Span:
+    """[start, end) widened to whole lines with their line breaks, and over any
+    table lines next to them."""
+    start = text.rfind("\n", 0, start) + 1
+    end = text.find("\n", end) + 1 or len(text)
+    while start > 0:
+        above = text.rfind("\n", 0, start - 1) + 1
+        if not _is_table_line(text[above:start - 1]):
+            break
+        start = above
+    while end < len(text):
+        below = text.find("\n", end) + 1 or len(text)
+        if not _is_table_line(text[end:below].rstrip("\n")):
+            break
+        end = below
+    return start, end
+
+
+def _regions(text: str, changed: List[Span]) -> List[Span]:
+    regions: List[Span] = []
+    for start, end in changed:
+        region = _line_region(text, start, end)
+        if regions and region[0] <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], max(regions[-1][1], region[1]))
+        else:
+            regions.append(region)
+    return regions
+
+
+def _context(text: str, start: int) -> str:
+    """What to gate in front of the line at start so it segments as in text.
+
+    After a '.', '!' or '?' the sentence break swallows the line's leading
+    whitespace; alone, that whitespace would open the line's first sentence.
+    The mark and a line break recreate that, and no pass edits them.
+    """
+    if start == len(text) or not text[start].isspace():
+        return ""
+    before = len(text[:start].rstrip())
+    if before and text[before - 1] in ".!?":
+        return text[before - 1] + "\n"
+    return ""
+
+
+def _key(correction: Correction) -> Tuple:
+    if correction.start is None:
+        return correction.type, correction.severity, None, correction.message
+    return correction.type, correction.severity, correction.start, correction.end
+
+
+def _merge(
+    previous: List[Correction], removed: List[Span], added: List[Correction], near: Span
+) -> List[Correction]:
+    """previous without those an edit overlapped, then added ones not already kept.
+
+    removed are the edited spans and near the re-gated lines, both in gate
+    input offsets; only corrections near the re-gated lines can be repeated.
+    """
+    low, high = removed[0][0], removed[-1][1]
+    kept: List[Correction] = []
+    seen: Set[Tuple] = set()
+    for correction in previous:
+        start, end = correction.start, correction.end
+        if start is not None:
+            if start < high and low < end and any(start < r_end and r_start < end for r_start, r_end in removed):
+                continue
+            if end < near[0] or start > near[1]:
+                kept.append(correction)
+                continue
+        kept.append(correction)
+        seen.add(_key(correction))
+    for correction in added:
+        if _key(correction) not in seen:
+            seen.add(_key(correction))
+            kept.append(correction)
+    return kept
+
+
+def regate(
+    previous: GateResult,
+    edits: Union[str, List[Replacement]],
+    ctx: Optional[GateContext] = None,
+    plan: Optional[GatePlan] = None,
+) -> GateResult:
+    """previous with a user's edits applied, re-gating only the lines they touch.
+
+    edits is the edited text, or (start, end, new text) replacements in
+    previous.text. ctx/plan are as for run_fact_gate and must be the ones
+    previous was gated with. A result without its SegmentedText (e.g. one
+    rebuilt from a stored report, or one gated in run_fact_gate_many's worker
+    pool) is gated again in full. Raises ValueError
+    for replacements outside previous.text.
+    """
+    if isinstance(edits, str):
+        edits = [text_edit(previous.text, edits)] if edits != previous.text else []
+    for start, end, _ in edits:
+        if not 0 <= start <= end <= len(previous.text):
+            raise ValueError(f"edit ({start}, {end}) is outside the gated text")
+    base = previous.doc
+    if base is None or base.text != previous.text:
+        return run_fact_gate(SegmentedText(previous.text).apply(edits, resegment=False).text, ctx, plan)
+    if not edits:
+        return GateResult(text=previous.text, corrections=list(previous.corrections), doc=base)
+    if not isinstance(ctx, GateContext):
+        ctx = plan.ctx if isinstance(plan, GatePlan) else GateContext()
+    if not isinstance(plan, GatePlan):
+        plan = compile_gate_plan(ctx)
+
+    edited = base.apply(edits, resegment=False)
+    regions = _regions(edited.text, edited.edited_spans())
+    replacements: List[Replacement] = []
+    added: List[Correction] = []
+    for start, end in regions:
+        context = _context(edited.text, start)
+        result = run_fact_gate(context + edited.text[start:end], ctx, plan)
+        if not result.text.startswith(context):
+            return run_fact_gate(edited.text, ctx, plan)
+        gated = result.text[len(context):]
+        if gated != edited.text[start:end]:
+            replacements.append((start, end, gated))
+        shift = start - len(context)
+        for correction in result.corrections:
+            if correction.start is not None:
+                origin = edited.origin_span(
+                    max(shift + correction.start, start), max(shift + correction.end, start)
+                )
+                correction = dataclasses.replace(correction, start=origin[0], end=origin[1])
+            added.append(correction)
+    doc = edited.apply(replacements, resegment=False)
+    if any(correction.type == "authority_removed" for correction in added):
+        doc = _tidy(doc)
+
+    # apply() merges overlapping edits, so read them back from the new text
+    removed = [base.origin_span(start, end) for start, end, _ in edited.edits]
+    near = edited.origin_span(regions[0][0], regions[-1][1])
+    corrections = _merge(previous.corrections, removed, added, near)
+    return GateResult(text=doc.text, corrections=corrections, doc=doc)
@@ -3,12 +3,15 @@ Markdown/HTML-entity/mojibake → plain text (finding L8: literal **, ###,
 pipe tables, &nbsp;, and mojibake printed onto court PDFs).
 
 The cleanup loops until the text is stable, which also makes it idempotent.
-One aggregate info Correction is emitted when anything changed.
+One aggregate info Correction is emitted when anything changed. Every step
+edits through the SegmentedText, so later passes can map their positions
+back across it.
 """
 import html
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+from app.services.fact_gate.segments import Replacement, SegmentedText
 from app.services.fact_gate.types import Correction
 
 _MAX_PASSES = 5
@@ -30,6 +33,11 @@ _MOJIBAKE = [
     ("â€¦", "..."),
     ("â€", '"'),
 ]
+_MOJIBAKE_RES = [(re.compile(re.escape(bad)), good) for bad, good in _MOJIBAKE]
+# html.unescape's own character-reference pattern, so entities are decoded
+# one edit at a time exactly as unescaping the whole text would
+_CHARREF_RE = re.compile(r"&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)")
+_NBSP_RE = re.compile("\xa0")
 
 _TABLE_LINE_RE = re.compile(r"^\s*\|?.*\|.*\|?\s*$")
 _SEPARATOR_CELL_RE = re.compile(r"^[:\-\s]*$")
@@ -62,44 +70,69 @@ def _table_block_to_lines(block: List[str]) -> List[str]:
     ]
 
 
-def _convert_tables(text: str) -> str:
-    lines = text.split("\n")
-    out: List[str] = []
-    block: List[str] = []
-    for line in lines + [""]:  # sentinel flushes a trailing block
+def _table_edit(text: str, block: List[Tuple[int, str]]) -> Optional[Replacement]:
+    """Replacement for a block of (offset, line) table lines, or None if too short."""
+    if len(block) < 2:
+        return None
+    start, end = block[0][0], block[-1][0] + len(block[-1][1])
+    lines = _table_block_to_lines([line for _, line in block])
+    if lines:
+        return start, end, "\n".join(lines)
+    # Nothing left: the block goes with one of its line breaks
+    if end < len(text):
+        return start, end + 1, ""
+    return max(start - 1, 0), end, ""
+
+
+def _convert_tables(doc: SegmentedText) -> SegmentedText:
+    text = doc.text
+    edits: List[Replacement] = []
+    block: List[Tuple[int, str]] = []
+    position = 0
+    for line in text.split("\n"):
         if _is_table_line(line):
-            block.append(line)
-            continue
-        if len(block) >= 2:
-            out.extend(_table_block_to_lines(block))
+            block.append((position, line))
         else:
-            out.extend(block)
-        block = []
-        out.append(line)
-    return "\n".join(out[:-1])  # drop the sentinel
-
-
-def _clean_once(text: str) -> str:
-    text = _FENCE_RE.sub("", text)
-    text = _convert_tables(text)
-    text = _BOLD_RE.sub(r"\1", text)
-    text = _UNDERLINE_RE.sub(r"\1", text)
-    text = _BACKTICK_RE.sub(r"\1", text)
-    text = _HEADING_RE.sub("", text)
-    text = html.unescape(text).replace(" ", " ")
-    for bad, good in _MOJIBAKE:
-        text = text.replace(bad, good)
-    return text
-
-
-def strip_markdown(text: str) -> Tuple[str, List[Correction]]:
+            edit = _table_edit(text, block)
+            if edit:
+                edits.append(edit)
+            block = []
+        position += len(line) + 1
+    edit = _table_edit(text, block)
+    if edit:
+        edits.append(edit)
+    return doc.apply(edits)
+
+
+def _unescape(match: re.Match) -> str:
+    return html.unescape(match.group())
+
+
+def _clean_once(doc: SegmentedText) -> SegmentedText:
+    doc = doc.sub(_FENCE_RE, "")
+    doc = _convert_tables(doc)
+    doc = doc.sub(_BOLD_RE, r"\1")
+    doc = doc.sub(_UNDERLINE_RE, r"\1")
+    doc = doc.sub(_BACKTICK_RE, r"\1")
+    doc = doc.sub(_HEADING_RE, "")
+    doc = doc.sub(_CHARREF_RE, _unescape).sub(_NBSP_RE, " ")
+    for bad_re, good in _MOJIBAKE_RES:
+        doc = doc.sub(bad_re, good)
+    return doc
+
+
+def strip_markdown(
+    text: str, doc: Optional[SegmentedText] = None
+) -> Tuple[str, List[Correction]]:
     """Plain text plus one aggregate info Correction when anything changed."""
     original = text
+    doc = SegmentedText.of(text, doc)
     for _ in range(_MAX_PASSES):
-        cleaned = _clean_once(text)
-        if cleaned == text:
+        cleaned = _clean_once(doc)
+        if cleaned.text == doc.text:
             break
-        text = cleaned
+        doc = cleaned
+    text = doc.text
     if text == original:
         return text, []
     correction = Correction(
@@ -7,8 +7,10 @@ response sections; the declarant is always the user. Only the two profile
 names participate — exact word-boundary matching, no fuzzy matching or NER.
 """
 import re
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
 
+from app.services.fact_gate.segments import SegmentedText
 from app.services.fact_gate.types import Correction, GateContext, excerpt
 
 _PLACEHOLDER_RE = re.compile(r"\[([A-Z][A-Z'’\s./-]{2,60})\]")
@@ -66,7 +68,9 @@ def _replace_group(match: re.Match, group: int, replacement: str) -> str:
     return whole[:start] + replacement + whole[end:]
 
 
-def _role_correction(original: str, replacement: str, message: str) -> Correction:
+def _role_correction(
+    original: str, replacement: str, message: str, span: Tuple[int, int]
+) -> Correction:
     return Correction(
         type="party_role",
         severity="corrected",
@@ -74,21 +78,52 @@ def _role_correction(original: str, replacement: str, message: str) -> Correctio
         original=excerpt(original),
         replacement=replacement,
         message=message,
+        start=span[0],
+        end=span[1],
     )
 
 
-def _fix_definitional(
-    text: str, roles: Dict[str, str], names_rx: str, corrections: List[Correction]
-) -> str:
-    patterns = []
+@dataclass
+class PartyPatterns:
+    """Compiled party-role patterns for one context (see compile_party_patterns)."""
+
+    roles: Dict[str, str]
+    definitional: List[Tuple[Pattern, str, str]] = field(default_factory=list)
+    appositives: List[Pattern] = field(default_factory=list)
+
+
+def compile_party_patterns(ctx: GateContext) -> Optional[PartyPatterns]:
+    """Role map and compiled name patterns; None unless both parties are named."""
+    party = (ctx.party_name or "").strip()
+    other = (ctx.other_party_name or "").strip()
+    if not (party and other):
+        return None
+    roles = role_map(ctx)
+    names_rx = _name_regex(party, other)
+    patterns = PartyPatterns(roles=roles)
     for role, true_name in roles.items():
         if true_name:
             role_rx = role.replace(" ", r"\s+")
-            patterns.append((rf"\b{role_rx}(\s+is\s+|\s*:\s*)({names_rx})", role, true_name))
+            patterns.definitional.append((
+                re.compile(rf"\b{role_rx}(\s+is\s+|\s*:\s*)({names_rx})", re.I),
+                role, true_name,
+            ))
     if roles["Declarant"]:
-        patterns.append((rf"\b(Declaration\s+of\s+)({names_rx})", "Declarant", roles["Declarant"]))
+        patterns.definitional.append((
+            re.compile(rf"\b(Declaration\s+of\s+)({names_rx})", re.I),
+            "Declarant", roles["Declarant"],
+        ))
+    patterns.appositives = [
+        re.compile(rf"\b({names_rx})\s*\(\s*{_APPOSITIVE_ROLES}\s*\)"),
+        re.compile(rf"\b({names_rx}),\s*the\s+{_APPOSITIVE_ROLES}\b"),
+    ]
+    return patterns
+
 
-    for pattern, role, true_name in patterns:
+def _fix_definitional(
+    doc: SegmentedText, patterns: PartyPatterns, corrections: List[Correction]
+) -> SegmentedText:
+    for pattern, role, true_name in patterns.definitional:
         def repl(match: re.Match) -> str:
             if _matches_person(match.group(2), true_name):
                 return match.group(0)
@@ -97,19 +132,17 @@ def _fix_definitional(
                 match.group(0), fixed,
                 f"The {role.lower()} in this case is {true_name} — "
                 "the draft named the wrong person, so it was corrected.",
+                doc.origin_span(match.start(), match.end()),
             ))
             return fixed
-        text = re.sub(pattern, repl, text, flags=re.IGNORECASE)
-    return text
+        doc = doc.sub(pattern, repl)
+    return doc
 
 
 def _fix_appositives(
-    text: str, roles: Dict[str, str], names_rx: str, corrections: List[Correction]
-) -> str:
-    patterns = [
-        rf"\b({names_rx})\s*\(\s*{_APPOSITIVE_ROLES}\s*\)",
-        rf"\b({names_rx}),\s*the\s+{_APPOSITIVE_ROLES}\b",
-    ]
+    doc: SegmentedText, patterns: PartyPatterns, corrections: List[Correction]
+) -> SegmentedText:
+    roles = patterns.roles
 
     def repl(match: re.Match) -> str:
         name = match.group(1)
@@ -124,38 +157,51 @@ def _fix_appositives(
         corrections.append(_role_correction(
             match.group(0), fixed,
             f"{name} is the {true_role.lower()} in this case — the label was corrected.",
+            doc.origin_span(match.start(), match.end()),
         ))
         return fixed
 
-    for pattern in patterns:
-        text = re.sub(pattern, repl, text)
-    return text
+    for pattern in patterns.appositives:
+        doc = doc.sub(pattern, repl)
+    return doc
 
 
-def _fix_response_title(text: str, ctx: GateContext, corrections: List[Correction]) -> str:
+def _fix_response_title(
+    doc: SegmentedText, ctx: GateContext, corrections: List[Correction]
+) -> SegmentedText:
     if ctx.motion_kind != "response_section":
-        return text
-    new_text, count = _TITLE_RE.subn(rf"\g<1>{_RESPONSE_TITLE}", text)
-    if count:
-        corrections.append(_role_correction(
-            "REQUEST FOR ORDER", _RESPONSE_TITLE,
-            "You are responding to a request, not filing one — the title was "
-            f"corrected to '{_RESPONSE_TITLE}'.",
-        ))
-    return new_text
-
-
-def check_party_roles(text: str, ctx: GateContext) -> Tuple[str, List[Correction]]:
-    """Correct party-role statements against the profile role map."""
+        return doc
+    first = _TITLE_RE.search(doc.text)
+    if first is None:
+        return doc
+    corrections.append(_role_correction(
+        "REQUEST FOR ORDER", _RESPONSE_TITLE,
+        "You are responding to a request, not filing one — the title was "
+        f"corrected to '{_RESPONSE_TITLE}'.",
+        doc.origin_span(first.start(), first.end()),
+    ))
+    return doc.sub(_TITLE_RE, rf"\g<1>{_RESPONSE_TITLE}")
+
+
+def check_party_roles(
+    text: str,
+    ctx: GateContext,
+    patterns: Optional[PartyPatterns] = None,
+    doc: Optional[SegmentedText] = None,
+) -> Tuple[str, List[Correction]]:
+    """Correct party-role statements against the profile role map.
+
+    patterns are compiled from ctx when not supplied by a GatePlan.
+    """
     corrections: List[Correction] = []
-    text = _fix_response_title(text, ctx, corrections)
-    if not ((ctx.party_name or "").strip() and (ctx.other_party_name or "").strip()):
-        return text, corrections
-    roles = role_map(ctx)
-    names_rx = _name_regex(ctx.party_name.strip(), ctx.other_party_name.strip())
-    text = _fix_definitional(text, roles, names_rx, corrections)
-    text = _fix_appositives(text, roles, names_rx, corrections)
-    return text, corrections
+    doc = _fix_response_title(SegmentedText.of(text, doc), ctx, corrections)
+    if patterns is None:
+        patterns = compile_party_patterns(ctx)
+    if patterns is None:
+        return doc.text, corrections
+    doc = _fix_definitional(doc, patterns, corrections)
+    doc = _fix_appositives(doc, patterns, corrections)
+    return doc.text, corrections
 
 
 def _resolve_placeholder(inner: str, roles: Dict[str, str], ctx: GateContext) -> Optional[str]:
@@ -171,15 +217,19 @@ def _resolve_placeholder(inner: str, roles: Dict[str, str], ctx: GateContext) ->
     return None
 
 
-def fill_placeholders(text: str, ctx: GateContext) -> Tuple[str, List[Correction]]:
+def fill_placeholders(
+    text: str, ctx: GateContext, doc: Optional[SegmentedText] = None
+) -> Tuple[str, List[Correction]]:
     """Fill bracketed name placeholders from the profile (info severity)."""
     roles = role_map(ctx)
     corrections: List[Correction] = []
+    doc = SegmentedText.of(text, doc)
 
     def repl(match: re.Match) -> str:
         name = _resolve_placeholder(match.group(1), roles, ctx)
         if not name:
             return match.group(0)
+        start, end = doc.origin_span(match.start(), match.end())
         corrections.append(Correction(
             type="placeholder_filled",
             severity="info",
@@ -187,7 +237,9 @@ def fill_placeholders(text: str, ctx: GateContext) -> Tuple[str, List[Correction
             original=match.group(0),
             replacement=name,
             message=f"Filled in {name} from your saved case information.",
+            start=start,
+            end=end,
         ))
         return name
 
-    return _PLACEHOLDER_RE.sub(repl, text), corrections
+    return doc.sub(_PLACEHOLDER_RE, repl).text, corrections
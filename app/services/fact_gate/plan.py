@@ -0,0 +1,60 @@
+"""
+Compiled gate plan — everything the gate derives from a GateContext, built
+once and reused for every section of a motion (and every sentence of a
+streamed section).
+
+Without a plan each run_fact_gate call rebuilds AllowedFacts from the whole
+intake, re-walks intake for the support check, and recompiles the party-name
+and child-name patterns. A plan does that once. It depends only on the
+ground-truth fields of the context, not on section_name, so one plan serves
+every section; build a new one if intake, profile or children change.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.services.fact_gate.allowed_facts import AllowedFacts, build_allowed_facts
+from app.services.fact_gate.authority_strip import _support_requested
+from app.services.fact_gate.fact_check import AgePatterns, compile_age_patterns
+from app.services.fact_gate.party_check import PartyPatterns, compile_party_patterns
+from app.services.fact_gate.types import GateContext, iter_scalars
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GatePlan:
+    """Per-motion compiled state for run_fact_gate and the semantic check."""
+
+    ctx: GateContext
+    facts: AllowedFacts = field(default_factory=AllowedFacts)
+    facts_ok: bool = True
+    # None means "not precompiled": the pass derives it itself, inside its
+    # own failure handling, exactly as without a plan
+    support_requested: Optional[bool] = None
+    party: Optional[PartyPatterns] = None
+    ages: Optional[AgePatterns] = None
+    intake_lines: List[str] = field(default_factory=list)  # "key: value" scalars
+
+
+def compile_gate_plan(ctx: Optional[GateContext] = None) -> GatePlan:
+    """Build the plan for ctx. Never raises; failed pieces are left to the passes."""
+    if not isinstance(ctx, GateContext):
+        ctx = GateContext()
+    plan = GatePlan(ctx=ctx)
+    try:
+        plan.facts = build_allowed_facts(ctx)
+    except Exception:
+        logger.warning("fact-gate: allowed-facts build failed; fact passes skipped",
+                       exc_info=True)
+        plan.facts_ok = False
+    try:
+        plan.support_requested = _support_requested(ctx)
+        plan.party = compile_party_patterns(ctx)
+        plan.ages = compile_age_patterns(plan.facts)
+        plan.intake_lines = [
+            f"{key}: {value}" for key, value in iter_scalars(ctx.intake_values) if key
+        ]
+    except Exception:
+        logger.warning("fact-gate: plan compile incomplete", exc_info=True)
+    return plan
@@ -0,0 +1,291 @@
+"""
+Segmented text shared by the gate passes.
+
+Each pass used to run sentence_spans over the text it was given, find a
+match's sentence with a linear scan over the spans, and apply replacements
+by re-slicing the whole text once per edit — roughly quadratic on long
+declarations with many amounts, dates or flags. SegmentedText segments once:
+
+- sentence starts are a sorted array searched with bisect;
+- sentence slices and their whitespace-collapsed forms are cached;
+- apply() builds the edited text in one join and re-segments only the
+  sentences around each edit; every other span is shifted, not rescanned.
+
+run_fact_gate threads one SegmentedText through the pipeline. A pass that
+leaves the text unchanged keeps it; a pass that edits through apply() or
+sub() hands over the updated one; any other rewrite is linked as a single
+edit spanning everything that changed (one linear scan).
+
+It is also the gate's edit buffer: every edited text keeps its parent and
+the edits that produced it, so origin_span() maps a position in any later
+text back to the text the gate was given. That is where Correction.start
+and Correction.end point.
+
+The per-match lookups also check the running pass's time budget (budget.py).
+"""
+import bisect
+import re
+from typing import Callable, Dict, List, Optional, Pattern, Tuple, Union
+
+from app.services.fact_gate.budget import check_budget
+from app.services.fact_gate.types import sentence_spans
+
+Span = Tuple[int, int]
+Replacement = Tuple[int, int, str]  # (start, end, new text) in the current text
+_COMPARE_BLOCK = 4096
+
+
+class SegmentedText:
+    """One text and its sentence spans, segmented lazily and at most once."""
+
+    __slots__ = (
+        "text", "_spans", "_starts", "_sentences", "_collapsed", "_successor",
+        "_parent", "_edits", "_edit_bounds",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        spans: Optional[List[Span]] = None,
+        parent: Optional["SegmentedText"] = None,
+        edits: Optional[List[Replacement]] = None,
+    ):
+        self.text = text
+        self._spans = spans
+        self._starts: Optional[List[int]] = None
+        self._sentences: Dict[int, str] = {}
+        self._collapsed: Dict[int, str] = {}
+        self._successor: Optional["SegmentedText"] = None
+        # parent.text with edits (sorted, non-overlapping) applied is text
+        self._parent = parent
+        self._edits = edits or []
+        self._edit_bounds: Optional[Tuple[List[int], List[int], List[int], List[int]]] = None
+
+    @classmethod
+    def of(cls, text: str, doc: Optional["SegmentedText"] = None) -> "SegmentedText":
+        """doc if it (or the edit it produced) segments `text`, else a new one."""
+        return doc.derive(text) if doc is not None else cls(text)
+
+    @property
+    def spans(self) -> List[Span]:
+        if self._spans is None:
+            self._spans = sentence_spans(self.text)
+        return self._spans
+
+    def derive(self, text: str) -> "SegmentedText":
+        """Segmentation of `text`, reusing this one or a result of apply()."""
+        doc: Optional[SegmentedText] = self
+        while doc is not None:
+            if text is doc.text or text == doc.text:
+                return doc
+            doc = doc._successor
+        # Rewritten some other way: one edit from the first to the last change
+        return self.apply([text_edit(self.text, text)])
+
+    def index_at(self, pos: int) -> Optional[int]:
+        """Index of the sentence containing pos; None between sentences."""
+        check_budget()
+        if self._starts is None:
+            self._starts = [start for start, _ in self.spans]
+        i = bisect.bisect_right(self._starts, pos) - 1
+        if i >= 0 and pos < self.spans[i][1]:
+            return i
+        return None
+
+    def sentence_at(self, pos: int) -> Span:
+        """(start, end) of the sentence containing pos; (0, 0) between sentences."""
+        i = self.index_at(pos)
+        return self.spans[i] if i is not None else (0, 0)
+
+    def sentence(self, i: int) -> str:
+        check_budget()
+        cached = self._sentences.get(i)
+        if cached is None:
+            start, end = self.spans[i]
+            cached = self._sentences[i] = self.text[start:end]
+        return cached
+
+    def collapsed(self, i: int) -> str:
+        """Sentence i with whitespace runs collapsed (the form excerpts use)."""
+        cached = self._collapsed.get(i)
+        if cached is None:
+            cached = self._collapsed[i] = " ".join(self.sentence(i).split())
+        return cached
+
+    def apply(self, replacements: List[Replacement], resegment: bool = True) -> "SegmentedText":
+        """The text with replacements applied in one rebuild, segmented incrementally.
+
+        resegment=False leaves the new text to be segmented on first use.
+        """
+        if not replacements:
+            return self
+        edits = sorted(replacements)
+        if any(a[1] > b[0] for a, b in zip(edits, edits[1:])):
+            # Record overlapping edits as one edit covering all of them
+            text = _apply_overlapping(self.text, edits)
+            start, end = edits[0][0], max(edit[1] for edit in edits)
+            edits = [(start, end, text[start:len(text) - (len(self.text) - end)])]
+        else:
+            parts: List[str] = []
+            position = 0
+            for start, end, new in edits:
+                parts.append(self.text[position:start])
+                parts.append(new)
+                position = end
+            parts.append(self.text[position:])
+            text = "".join(parts)
+        spans = self._shifted_spans(text, edits) if resegment and self._spans is not None else None
+        successor = SegmentedText(text, spans, self, edits)
+        self._successor = successor
+        return successor
+
+    def sub(
+        self, pattern: Pattern, repl: Union[str, Callable[[re.Match], str]]
+    ) -> "SegmentedText":
+        """pattern.sub(repl, text) as a single apply(); repl as for re.sub."""
+        edits: List[Replacement] = []
+        for match in pattern.finditer(self.text):
+            check_budget()
+            new = repl(match) if callable(repl) else match.expand(repl)
+            if new != match.group():
+                edits.append((match.start(), match.end(), new))
+        return self.apply(edits)
+
+    def origin_span(self, start: int, end: int) -> Span:
+        """[start, end) of this text mapped back through every apply() to the
+        first text of the chain. Positions inside replaced text widen to the
+        whole of what it replaced."""
+        check_budget()
+        doc = self
+        while doc._parent is not None:
+            start, end = doc._back(start, False), doc._back(end, True)
+            doc = doc._parent
+        return start, max(start, end)
+
+    @property
+    def edits(self) -> List[Replacement]:
+        """The edits (sorted, non-overlapping) that turned the parent's text into this one."""
+        return self._edits
+
+    def edited_spans(self) -> List[Span]:
+        """Where each edit's new text sits in this text."""
+        new_starts, new_ends, _, _ = self._bounds()
+        return list(zip(new_starts, new_ends))
+
+    def _bounds(self) -> Tuple[List[int], List[int], List[int], List[int]]:
+        """(new starts, new ends, old starts, old ends) of the edits."""
+        if self._edit_bounds is None:
+            new_starts, new_ends, old_starts, old_ends = [], [], [], []
+            shift = 0
+            for start, end, new in self._edits:
+                new_starts.append(start + shift)
+                new_ends.append(start + shift + len(new))
+                old_starts.append(start)
+                old_ends.append(end)
+                shift += len(new) - (end - start)
+            self._edit_bounds = (new_starts, new_ends, old_starts, old_ends)
+        return self._edit_bounds
+
+    def _back(self, pos: int, is_end: bool) -> int:
+        """pos in this text as a position in the parent's."""
+        new_starts, new_ends, old_starts, old_ends = self._bounds()
+        # The last edit starting before pos (at or before, for a start)
+        if is_end:
+            k = bisect.bisect_left(new_starts, pos) - 1
+        else:
+            k = bisect.bisect_right(new_starts, pos) - 1
+        if k < 0:
+            return pos
+        if pos < new_ends[k] or (is_end and pos == new_ends[k]):
+            return old_ends[k] if is_end else old_starts[k]
+        return pos - (new_ends[k] - old_ends[k])
+
+    def _dirty(self, edits: List[Replacement]) -> List[bool]:
+        """Sentences an edit touches (with the gap after each) and their neighbours."""
+        if self._starts is None:
+            self._starts = [start for start, _ in self.spans]
+        dirty = [False] * len(self.spans)
+        for start, end, _ in edits:
+            first = max(bisect.bisect_right(self._starts, start) - 1, 0)
+            last = max(bisect.bisect_right(self._starts, end) - 1, 0)
+            for i in range(max(first - 1, 0), min(last + 2, len(dirty))):
+                dirty[i] = True
+        return dirty
+
+    def _shifted_spans(self, text: str, edits: List[Replacement]) -> List[Span]:
+        spans = self.spans
+        if not spans:
+            return sentence_spans(text)
+        dirty = self._dirty(edits)
+        new_spans: List[Span] = []
+        delta = 0
+        applied = 0  # edits wholly before the current position
+
+        def delta_at(pos: int) -> int:
+            nonlocal delta, applied
+            while applied < len(edits) and edits[applied][1] <= pos:
+                start, end, new = edits[applied]
+                delta += len(new) - (end - start)
+                applied += 1
+            return delta
+
+        i = 0
+        while i < len(spans):
+            if not dirty[i]:
+                start, end = spans[i]
+                shift = delta_at(start)
+                new_spans.append((start + shift, end + shift))
+                i += 1
+                continue
+            j = i
+            # A span starting with whitespace can be swallowed by a break that
+            # now follows a new '.', so the region ends at a non-space start
+            while j < len(spans) and (dirty[j] or self.text[spans[j][0]].isspace()):
+                j += 1
+            # Untouched text bounds the region, so rescanning it matches a full scan
+            region_start = new_spans[-1][1] if new_spans else 0
+            region_end = spans[j][0] + delta_at(spans[j][0]) if j < len(spans) else len(text)
+            new_spans.extend(sentence_spans(text, region_start, region_end))
+            i = j
+        return new_spans
+
+
+def text_edit(old: str, new: str) -> Replacement:
+    """The single replacement turning old into new, from the first to the last change."""
+    prefix = _common_prefix(old, new)
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    return prefix, len(old) - suffix, new[prefix:len(new) - suffix]
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Length of the common prefix, compared a block at a time."""
+    n = 0
+    limit = min(len(a), len(b))
+    while n < limit:
+        step = min(_COMPARE_BLOCK, limit - n)
+        if a[n:n + step] != b[n:n + step]:
+            break
+        n += step
+    while n < limit and a[n] == b[n]:
+        n += 1
+    return n
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix, at most limit."""
+    n = 0
+    while n < limit:
+        step = min(_COMPARE_BLOCK, limit - n)
+        if a[len(a) - n - step:len(a) - n] != b[len(b) - n - step:len(b) - n]:
+            break
+        n += step
+    while n < limit and a[len(a) - n - 1] == b[len(b) - n - 1]:
+        n += 1
+    return n
+
+
+def _apply_overlapping(text: str, edits: List[Replacement]) -> str:
+    """Right-to-left application; only reached if a pass emits overlapping edits."""
+    for start, end, new in reversed(edits):
+        text = text[:start] + new + text[end:]
+    return text
@@ -0,0 +1,65 @@
+"""
+Incremental gate for streamed LLM output.
+
+Text arrives in arbitrary deltas. As soon as a sentence is complete (a
+sentence break follows it) it is gated on its own and released, so users see
+gated prose while the model is still writing. The released sentences are a
+preview: finish() runs the full gate over the complete raw text, and that
+GateResult is the authoritative text and corrections — identical to what the
+batch path produces for the same output.
+"""
+from typing import List, Optional, Tuple
+
+from app.services.fact_gate.gate import run_fact_gate
+from app.services.fact_gate.plan import GatePlan, compile_gate_plan
+from app.services.fact_gate.types import (
+    _SENTENCE_BREAK,
+    GateContext,
+    GateResult,
+    sentence_spans,
+)
+
+
+class StreamingGate:
+    """Feed deltas in, get gated complete sentences out."""
+
+    def __init__(self, ctx: Optional[GateContext] = None, plan: Optional[GatePlan] = None):
+        self.ctx = ctx if isinstance(ctx, GateContext) else GateContext()
+        # Every released sentence is gated against the same compiled plan
+        self.plan = plan if isinstance(plan, GatePlan) else compile_gate_plan(self.ctx)
+        self._raw: List[str] = []
+        self._pending = ""
+
+    def feed(self, delta: str) -> List[str]:
+        """Gated pieces for every sentence completed by this delta."""
+        if not delta:
+            return []
+        self._raw.append(delta)
+        self._pending += delta
+        cut = None
+        for match in _SENTENCE_BREAK.finditer(self._pending):
+            cut = match.start()
+        if not cut:
+            return []
+        return self._release(cut)
+
+    def finish(self) -> Tuple[List[str], GateResult]:
+        """(gated pieces for the unterminated tail, full-text GateResult)."""
+        pieces = self._release(len(self._pending))
+        return pieces, run_fact_gate("".join(self._raw), self.ctx, self.plan)
+
+    def _release(self, cut: int) -> List[str]:
+        """Gate each sentence of pending[:cut]; separators ride in front of it."""
+        chunk, self._pending = self._pending[:cut], self._pending[cut:]
+        pieces: List[str] = []
+        position = 0
+        for start, end in sentence_spans(chunk):
+            gated = run_fact_gate(chunk[start:end], self.ctx, self.plan).text
+            pieces.append(chunk[position:start] + gated)
+            position = end
+        if position < len(chunk):
+            if pieces:
+                pieces[-1] += chunk[position:]
+            else:
+                pieces.append(chunk[position:])
+        return pieces
@@ -8,7 +8,10 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.services.fact_gate.segments import SegmentedText
 
 EXCERPT_LIMIT = 120
 
@@ -44,6 +47,10 @@ class Correction:
     original: str  # excerpt of the affected text, <=120 chars
     replacement: Optional[str]
     message: str
+    # [start, end) of the affected text in the text given to the gate; None
+    # for corrections not tied to one place (e.g. the markdown summary)
+    start: Optional[int] = None
+    end: Optional[int] = None
 
     def as_dict(self) -> Dict[str, Any]:
         return {
@@ -60,17 +67,29 @@ class Correction:
 class GateResult:
     text: str
     corrections: List[Correction] = field(default_factory=list)
+    # The gate's final SegmentedText, whose edit chain leads back to the gate
+    # input; regate() edits through it. Not part of the result's value.
+    doc: Optional[SegmentedText] = field(default=None, repr=False, compare=False)
 
     def as_report(self) -> Dict[str, Any]:
         return {"version": 1, "corrections": [c.as_dict() for c in self.corrections]}
 
 
 def excerpt(text: str, limit: int = EXCERPT_LIMIT) -> str:
-    """Whitespace-collapsed excerpt for Correction.original."""
-    text = " ".join(text.split())
-    if len(text) <= limit:
-        return text
-    return text[: limit - 1].rstrip() + "…"
+    """Whitespace-collapsed excerpt for Correction.original.
+
+    Collapses a growing prefix rather than the whole text: excerpts are taken
+    once per match, often of a whole sentence, so collapsing all of it each
+    time would be quadratic in the sentence length.
+    """
+    size = limit + 1
+    while True:
+        head = " ".join(text[:size].split())  # always a prefix of the full collapse
+        if len(head) > limit:
+            return head[: limit - 1].rstrip() + "…"
+        if size >= len(text):
+            return head
+        size *= 2
 
 
 def _is_blank(value: Any) -> bool:
@@ -120,14 +139,21 @@ def iter_scalars(value: Any, key: str = "") -> Iterator[Tuple[str, Any]]:
 _SENTENCE_BREAK = re.compile(r"(?<=[.!?])[\s ]+|\n+")
 
 
-def sentence_spans(text: str) -> List[Tuple[int, int]]:
-    """(start, end) spans of sentences; newlines always break sentences."""
+def sentence_spans(
+    text: str, begin: int = 0, end: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """(start, end) spans of sentences; newlines always break sentences.
+
+    begin/end segment only text[begin:end] (offsets stay absolute); the
+    break pattern still sees the character before begin.
+    """
+    end = len(text) if end is None else end
     spans: List[Tuple[int, int]] = []
-    start = 0
-    for match in _SENTENCE_BREAK.finditer(text):
+    start = begin
+    for match in _SENTENCE_BREAK.finditer(text, begin, end):
         if match.start() > start:
             spans.append((start, match.start()))
         start = match.end()
-    if start < len(text):
-        spans.append((start, len(text)))
+    if start < end:
+        spans.append((start, end))
     return spans
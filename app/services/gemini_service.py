@@ -52,7 +52,7 @@ class GeminiService:
             """
 
             # Generate response
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
 
             return {
                 "success": True,
@@ -87,7 +87,7 @@ class GeminiService:
             """
 
             # Use Pro model for more complex legal writing
-            response = self.pro_model.generate_content(prompt)
+            response = await self.pro_model.generate_content_async(prompt)
 
             return {
                 "success": True,
@@ -129,7 +129,7 @@ class GeminiService:
             Write in a professional, fact-based manner suitable for court filing.
             """
 
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
 
             return {
                 "success": True,
@@ -168,7 +168,7 @@ class GeminiService:
             """
 
             # Use Pro model for complete motion generation
-            response = self.pro_model.generate_content(prompt)
+            response = await self.pro_model.generate_content_async(prompt)
 
             return {
                 "success": True,
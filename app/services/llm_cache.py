@@ -0,0 +1,184 @@
+"""
+Content-addressed cache for LLM generations.
+
+Re-running process-motion, re-downloading a packet, or a double-click sends
+byte-identical prompts; those are answered from cache instead of the
+provider. The key is a SHA-256 over (backend, model, operation, system,
+prompt, max_tokens), so any change to what the model would see is a miss.
+
+Tiers: an in-process LRU with TTL, plus Redis when LLM_CACHE_REDIS_URL is
+set (shared across workers). Concurrent identical calls are coalesced into
+one in-flight provider request (single-flight). Hits are free: they return
+zero tokens and are recorded as their own "llm_cache" usage line, never as
+provider spend. LLM_CACHE_ENABLED=false bypasses the cache (test suite).
+Redis errors fail open to the provider.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from app.services.cost_monitoring_service import track_cache_hit
+from app.services.token_usage import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+Generation = Tuple[str, TokenUsage, str]  # (text, tokens, model) — the generate() contract
+
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+LLM_CACHE_REDIS_URL = os.getenv("LLM_CACHE_REDIS_URL")
+_REDIS_PREFIX = "llm_cache:"
+
+
+def cache_enabled() -> bool:
+    return os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+
+
+def cache_key(
+    backend: str,
+    model: str,
+    operation: str,
+    system: str,
+    prompt: str,
+    max_tokens: Optional[int],
+) -> str:
+    """SHA-256 over every input that changes what the model produces."""
+    payload = json.dumps(
+        [backend, model, operation, system, prompt, max_tokens],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """LRU + TTL memory tier, optional Redis tier, single-flight misses."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        redis_url: Optional[str] = LLM_CACHE_REDIS_URL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis_url = redis_url
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Generation]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._redis = None
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_generate(
+        self,
+        key: str,
+        generate: Callable[[], Awaitable[Generation]],
+        operation: str = "",
+        user_id: Optional[str] = None,
+    ) -> Generation:
+        """Cached (text, zero TokenUsage, model) on a hit; the provider's result on a miss."""
+        if not cache_enabled():
+            return await generate()
+
+        cached = self._get_memory(key) or await self._get_redis(key)
+        if cached is None and key in self._in_flight:
+            cached = await self._join_in_flight(self._in_flight[key])
+        if cached is not None:
+            await self._record_hit(cached, operation, user_id)
+            return cached[0], TokenUsage(), cached[2]
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await generate()
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved: followers re-raise, nobody warns
+            raise
+        else:
+            if result[0]:  # never cache an empty (failed) generation
+                self._put_memory(key, result)
+                await self._put_redis(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.cancel()  # leader cancelled: followers generate themselves
+            self._in_flight.pop(key, None)
+
+    async def _join_in_flight(self, future: asyncio.Future) -> Optional[Generation]:
+        """Single-flight: ride along on the identical request already running."""
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if future.cancelled():
+                return None
+            raise
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _get_memory(self, key: str) -> Optional[Generation]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put_memory(self, key: str, value: Generation) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _redis_client(self):
+        if self._redis is None and self.redis_url:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(self.redis_url)
+        return self._redis
+
+    async def _get_redis(self, key: str) -> Optional[Generation]:
+        try:
+            client = await self._redis_client()
+            if client is None:
+                return None
+            raw = await client.get(_REDIS_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"LLM cache Redis read failed: {e}")
+            return None
+        if not raw:
+            return None
+        text, tokens, model = json.loads(raw)
+        value = (text, int(tokens), model)
+        self._put_memory(key, value)
+        return value
+
+    async def _put_redis(self, key: str, value: Generation) -> None:
+        try:
+            client = await self._redis_client()
+            if client is not None:
+                await client.set(_REDIS_PREFIX + key, json.dumps(value), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"LLM cache Redis write failed: {e}")
+
+    async def _record_hit(
+        self, value: Generation, operation: str, user_id: Optional[str]
+    ) -> None:
+        self.hits += 1
+        await track_cache_hit(operation, tokens_saved=value[1], user_id=user_id)
+
+
+# Singleton instance
+llm_cache = LLMResponseCache()
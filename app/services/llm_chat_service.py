@@ -6,11 +6,11 @@ import logging
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import re
-from vertexai.generative_models import GenerativeModel, GenerationConfig, SafetySetting, HarmCategory, HarmBlockThreshold
-import vertexai
 
 from app.core.config import settings
+from app.core.lazy import LazySingleton
 from app.models.chat import ChatSessionState, ChatSession
+from app.services.llm_clients import llm_clients
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +18,18 @@ class LLMChatService:
     """Extended LLM service for chat conversations"""
 
     def __init__(self):
-        # Initialize Vertex AI
-        vertexai.init(
-            project=settings.PROJECT_ID,
-            location=settings.VERTEX_AI_LOCATION
+        from vertexai.generative_models import (
+            GenerationConfig,
+            HarmBlockThreshold,
+            HarmCategory,
+            SafetySetting,
         )
 
-        # Initialize conversational model with chat-specific system prompt
-        self.chat_model = GenerativeModel(
-            model_name=settings.VERTEX_AI_MODEL,
-            system_instruction=self._get_chat_system_prompt()
+        # Conversational model with chat-specific system prompt; Vertex is
+        # initialized once by the shared client registry
+        self.chat_model = llm_clients.vertex_model(
+            settings.VERTEX_AI_MODEL,
+            self._get_chat_system_prompt()
         )
 
         # Generation config for chat (more conversational)
@@ -144,7 +146,7 @@ Respond in JSON format:
     "reasoning": "brief explanation of classification"
 }}"""
 
-            response = self.chat_model.generate_content(
+            response = await self.chat_model.generate_content_async(
                 prompt,
                 generation_config=self.analysis_config,
                 safety_settings=self.safety_settings
@@ -253,7 +255,7 @@ Respond in JSON format:
     "next_state": "suggested next conversation state"
 }}"""
 
-            response = self.chat_model.generate_content(
+            response = await self.chat_model.generate_content_async(
                 prompt,
                 generation_config=self.chat_config,
                 safety_settings=self.safety_settings
@@ -359,7 +361,7 @@ Extract the following fields if mentioned:
 
 Return extracted data in JSON format with field names as keys."""
 
-            response = self.chat_model.generate_content(
+            response = await self.chat_model.generate_content_async(
                 prompt,
                 generation_config=self.analysis_config,
                 safety_settings=self.safety_settings
@@ -400,7 +402,7 @@ Conversation:
 
 Provide a concise summary:"""
 
-            response = self.chat_model.generate_content(
+            response = await self.chat_model.generate_content_async(
                 prompt,
                 generation_config=self.analysis_config,
                 safety_settings=self.safety_settings
@@ -442,7 +444,7 @@ Respond in JSON:
     "suggestions": ["list of suggestions if invalid"]
 }}"""
 
-            response = self.chat_model.generate_content(
+            response = await self.chat_model.generate_content_async(
                 prompt,
                 generation_config=self.analysis_config,
                 safety_settings=self.safety_settings
@@ -482,7 +484,7 @@ Don't use legal jargon. Be conversational.
 
 Question:"""
 
-            response = self.chat_model.generate_content(
+            response = await self.chat_model.generate_content_async(
                 prompt,
                 generation_config=self.chat_config,
                 safety_settings=self.safety_settings
@@ -494,5 +496,5 @@ Question:"""
             logger.error(f"Clarification generation error: {e}")
             return f"I need to clarify the {field_name}. Could you provide more details?"
 
-# Singleton instance
-llm_chat_service = LLMChatService()
\ No newline at end of file
+# Singleton instance, built on first use (imports Vertex, opens the chat model)
+llm_chat_service = LazySingleton(LLMChatService)
\ No newline at end of file
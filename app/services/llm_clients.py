@@ -0,0 +1,106 @@
+"""
+Process-wide registry of LLM provider clients and service objects.
+
+Services used to build their own: ChatService and ViolationFilingService
+each constructed an LLMService (re-reading llm-prompts.md and, on Vertex,
+re-running vertexai.init), and every ClaudeLLMService opened its own
+AsyncAnthropic connection pool. Everything now borrows from llm_clients:
+
+- anthropic()          one AsyncAnthropic over a keep-alive httpx pool sized
+                       by LLM_MAX_CONNECTIONS / LLM_MAX_KEEPALIVE_CONNECTIONS
+- vertex_model(...)    vertexai.init once; one GenerativeModel per
+                       (model, system instruction)
+- shared(cls)          one instance per service class
+
+The FastAPI lifespan calls aclose() on shutdown, which runs registered
+shutdown hooks (e.g. the batch backend) and closes the pooled client. A
+client borrowed after aclose() is rebuilt on demand.
+"""
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+LLM_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("LLM_KEEPALIVE_EXPIRY_SECONDS", "30"))
+
+
+class LLMClientRegistry:
+    """Owns one pooled client per provider; services borrow, never build."""
+
+    def __init__(
+        self,
+        max_connections: int = LLM_MAX_CONNECTIONS,
+        max_keepalive_connections: int = LLM_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = LLM_KEEPALIVE_EXPIRY_SECONDS,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self._anthropic = None
+        self._vertex_initialized = False
+        self._vertex_models: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._services: Dict[type, Any] = {}
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+
+    def anthropic(self):
+        """The shared AsyncAnthropic client (built on first use)."""
+        if self._anthropic is None:
+            import httpx
+            from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
+            self._anthropic = AsyncAnthropic(
+                http_client=DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry,
+                    )
+                )
+            )
+        return self._anthropic
+
+    def vertex_model(self, model_name: str, system_instruction: Optional[str] = None):
+        """A shared GenerativeModel; vertexai.init runs once per process."""
+        key = (model_name, system_instruction)
+        if key not in self._vertex_models:
+            import vertexai
+            from vertexai.generative_models import GenerativeModel
+
+            if not self._vertex_initialized:
+                from app.core.config import settings
+
+                vertexai.init(project=settings.PROJECT_ID, location=settings.VERTEX_AI_LOCATION)
+                self._vertex_initialized = True
+            self._vertex_models[key] = GenerativeModel(
+                model_name=model_name, system_instruction=system_instruction
+            )
+        return self._vertex_models[key]
+
+    def shared(self, cls: Type[T]) -> T:
+        """One instance of a service class per process."""
+        if cls not in self._services:
+            self._services[cls] = cls()
+        return self._services[cls]
+
+    def on_shutdown(self, hook: Callable[[], Awaitable[None]]) -> None:
+        self._shutdown_hooks.append(hook)
+
+    async def aclose(self) -> None:
+        """Run shutdown hooks, then close pooled connections."""
+        hooks, self._shutdown_hooks = self._shutdown_hooks, []
+        for hook in hooks:
+            try:
+                await hook()
+            except Exception as e:
+                logger.warning(f"LLM shutdown hook failed: {e}")
+        if self._anthropic is not None:
+            client, self._anthropic = self._anthropic, None
+            await client.close()
+
+
+llm_clients = LLMClientRegistry()
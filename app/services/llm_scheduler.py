@@ -0,0 +1,266 @@
+"""
+Outbound scheduler for provider calls.
+
+Nothing used to bound how many calls a worker had in flight, so a burst of
+evidence vision calls or motion drafting could draw 429s that slowed live
+chat turns. Every provider call now takes a slot first:
+
+- per model, at most LLM_MODEL_CONCURRENCY calls run at once, and new calls
+  are admitted by a token bucket (LLM_MODEL_RPS sustained, LLM_MODEL_BURST
+  burst);
+- waiting calls are served by priority class — interactive chat, then
+  drafting, then background ranking/citation work;
+- within a class, users get weighted fair queuing: each user's requests
+  are tagged with a virtual finish time, so one user's 40-section motion
+  cannot push another user's request to the back.
+
+Work nobody is waiting on yet (speculative pre-drafts) runs inside
+background_priority(), which queues its calls as background regardless of
+operation.
+
+metrics() reports queue depth, in-flight calls and wait times per model.
+Cache hits never reach the scheduler; the Message Batches backend bypasses
+it because batches do not draw on the interactive rate limits.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 0
+DRAFTING = 1
+BACKGROUND = 2
+PRIORITY_NAMES = {INTERACTIVE: "interactive", DRAFTING: "drafting", BACKGROUND: "background"}
+
+OPERATION_PRIORITIES = {
+    "chat_response": INTERACTIVE,
+    "intent_classification": INTERACTIVE,
+    "upl_check": INTERACTIVE,
+    "section_rewrite": DRAFTING,
+    "declaration": DRAFTING,
+    "best_interests": DRAFTING,
+    "complete_motion": DRAFTING,
+    "semantic_check": DRAFTING,
+    "served_motion_extraction": DRAFTING,
+    "evidence_ranking": BACKGROUND,
+    "conversation_threading": BACKGROUND,
+    "screenshot_reading": BACKGROUND,
+    "claim_citation": BACKGROUND,
+}
+
+LLM_MODEL_CONCURRENCY = int(os.getenv("LLM_MODEL_CONCURRENCY", "8"))
+LLM_MODEL_RPS = float(os.getenv("LLM_MODEL_RPS", "5"))
+LLM_MODEL_BURST = float(os.getenv("LLM_MODEL_BURST", "10"))
+# Wait-time samples kept per model for the p99 in metrics()
+WAIT_SAMPLES = 500
+
+# Lowest priority class calls in this context may take (see background_priority)
+_priority_floor: ContextVar[int] = ContextVar("llm_priority_floor", default=INTERACTIVE)
+
+
+def priority_for(operation: str) -> int:
+    return max(OPERATION_PRIORITIES.get(operation, DRAFTING), _priority_floor.get())
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Queue every call made in this context (and tasks it spawns) as background."""
+    token = _priority_floor.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        _priority_floor.reset(token)
+
+
+class TokenBucket:
+    """Admission rate: `rate` tokens/second, at most `capacity` banked."""
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = capacity
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self) -> bool:
+        if self.rate <= 0:
+            # LLM_MODEL_RPS=0 turns rate admission off
+            return True
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def seconds_until_token(self) -> float:
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class _Waiter:
+    __slots__ = ("future", "user", "priority", "start", "enqueued")
+
+    def __init__(self, future: asyncio.Future, user: str, priority: int, start: float, enqueued: float):
+        self.future = future
+        self.user = user
+        self.priority = priority
+        self.start = start
+        self.enqueued = enqueued
+
+
+class _ModelQueue:
+    """Priority heaps of waiters plus the model's in-flight count and bucket."""
+
+    def __init__(self, concurrency: int, bucket: TokenBucket):
+        self.concurrency = concurrency
+        self.bucket = bucket
+        self.in_flight = 0
+        self.heaps: Dict[int, List] = defaultdict(list)
+        self.virtual_time: Dict[int, float] = defaultdict(float)
+        self.user_finish: Dict[tuple, float] = {}
+        self.retry_handle: Optional[asyncio.TimerHandle] = None
+        self.waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self.admitted = 0
+
+    def depth(self) -> Dict[str, int]:
+        return {
+            PRIORITY_NAMES[priority]: sum(1 for *_, w in heap if not w.future.done())
+            for priority, heap in sorted(self.heaps.items())
+        }
+
+
+class LLMScheduler:
+    """Per-model admission control; see the module docstring."""
+
+    def __init__(
+        self,
+        concurrency: int = LLM_MODEL_CONCURRENCY,
+        rate: float = LLM_MODEL_RPS,
+        burst: float = LLM_MODEL_BURST,
+        user_weights: Optional[Dict[str, float]] = None,
+        clock=time.monotonic,
+    ):
+        self.concurrency = concurrency
+        self.rate = rate
+        self.burst = burst
+        self.user_weights = user_weights or {}
+        self.clock = clock
+        self._queues: Dict[str, _ModelQueue] = {}
+        self._sequence = itertools.count()
+
+    def _queue(self, model: str) -> _ModelQueue:
+        if model not in self._queues:
+            self._queues[model] = _ModelQueue(
+                self.concurrency, TokenBucket(self.rate, self.burst, self.clock)
+            )
+        return self._queues[model]
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        model: str,
+        operation: str,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[None]:
+        """Hold one of the model's call slots for the duration of the block."""
+        queue = self._queue(model)
+        await self._acquire(queue, priority_for(operation), user_id or "")
+        try:
+            yield
+        finally:
+            queue.in_flight -= 1
+            self._dispatch(queue)
+
+    async def _acquire(self, queue: _ModelQueue, priority: int, user: str) -> None:
+        future = asyncio.get_running_loop().create_future()
+        # Weighted fair queuing: a user's next request starts where their
+        # last one finished, or at the class's virtual time if they were idle
+        start = max(queue.virtual_time[priority], queue.user_finish.get((priority, user), 0.0))
+        finish = start + 1.0 / self.user_weights.get(user, 1.0)
+        queue.user_finish[(priority, user)] = finish
+        waiter = _Waiter(future, user, priority, start, self.clock())
+        heapq.heappush(queue.heaps[priority], (finish, next(self._sequence), waiter))
+        self._dispatch(queue)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as the caller gave up: hand the slot back
+                queue.in_flight -= 1
+                self._dispatch(queue)
+            raise
+
+    def _dispatch(self, queue: _ModelQueue) -> None:
+        while queue.in_flight < queue.concurrency:
+            waiter = self._next_waiter(queue)
+            if waiter is None:
+                return
+            if not queue.bucket.try_take():
+                self._retry_later(queue)
+                return
+            heap = queue.heaps[waiter.priority]
+            heapq.heappop(heap)
+            queue.virtual_time[waiter.priority] = max(
+                queue.virtual_time[waiter.priority], waiter.start
+            )
+            if not heap:
+                # Class drained: nobody is behind, so per-user tags can go
+                for key in [k for k in queue.user_finish if k[0] == waiter.priority]:
+                    del queue.user_finish[key]
+            queue.in_flight += 1
+            queue.admitted += 1
+            queue.waits.append(self.clock() - waiter.enqueued)
+            waiter.future.set_result(None)
+
+    def _next_waiter(self, queue: _ModelQueue) -> Optional[_Waiter]:
+        for priority in sorted(queue.heaps):
+            heap = queue.heaps[priority]
+            # Drop callers that were cancelled while queued
+            while heap and heap[0][2].future.done():
+                heapq.heappop(heap)
+            if heap:
+                return heap[0][2]
+        return None
+
+    def _retry_later(self, queue: _ModelQueue) -> None:
+        if queue.retry_handle is not None and not queue.retry_handle.cancelled():
+            return
+
+        def retry() -> None:
+            queue.retry_handle = None
+            self._dispatch(queue)
+
+        queue.retry_handle = asyncio.get_running_loop().call_later(
+            queue.bucket.seconds_until_token(), retry
+        )
+
+    def metrics(self) -> Dict[str, Dict[str, object]]:
+        """Queue depth, in-flight calls and wait times per model."""
+        report = {}
+        for model, queue in self._queues.items():
+            waits = sorted(queue.waits)
+            report[model] = {
+                "in_flight": queue.in_flight,
+                "queued": queue.depth(),
+                "admitted": queue.admitted,
+                "wait_avg_seconds": round(sum(waits) / len(waits), 4) if waits else 0.0,
+                "wait_p99_seconds": round(waits[math.ceil(0.99 * len(waits)) - 1], 4) if waits else 0.0,
+            }
+        return report
+
+
+llm_scheduler = LLMScheduler()
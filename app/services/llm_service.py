@@ -1,23 +1,31 @@
 """
 LLM Service for motion rewriting using Vertex AI
 """
+import asyncio
+import hashlib
 import os
 import json
-from typing import Awaitable, Callable, Dict, Any, Optional, List
+import re
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 # Conditionally import GCP services
 USE_GCP = os.getenv("USE_GCP", "true").lower() == "true"
 USE_MOCK_LLM = os.getenv("USE_MOCK_LLM", "false").lower() == "true"
 USE_CLAUDE = os.getenv("USE_CLAUDE", "false").lower() == "true"
+# Sections rewritten at once by /process-motion; 1 restores one-at-a-time
+SECTION_CONCURRENCY = int(os.getenv("LLM_SECTION_CONCURRENCY", "4"))
+# Bump whenever _build_rfo_prompt or the system prompt changes wording, so
+# stored section fingerprints stop matching and sections are redrafted
+# (drafting-prefix changes bump prompt_prefix.PROMPT_PREFIX_VERSION instead)
+RFO_PROMPT_VERSION = "1"
+
+from app.core.lazy import LazySingleton, module_available
 
 if USE_GCP and not USE_MOCK_LLM and not USE_CLAUDE:
-    try:
-        from google.cloud import aiplatform
-        from google.cloud.aiplatform import initializer
-        from vertexai.generative_models import GenerativeModel, GenerationConfig, SafetySetting, HarmCategory, HarmBlockThreshold
-        import vertexai
-    except ImportError:
+    # Probe only: the Vertex SDK takes seconds to import, so LLMService
+    # imports it when the Vertex backend is built
+    if not module_available("vertexai"):
         USE_MOCK_LLM = True
         print("Warning: Vertex AI not available, using mock LLM for local development")
 elif not USE_MOCK_LLM and not USE_CLAUDE:
@@ -30,6 +38,15 @@ from app.core.config import settings
 from app.middleware.rate_limit_config import get_token_limit
 from app.services.cost_monitoring_service import track_llm_cost, check_budget
 from app.services.fact_gate.prompt_guard import build_fact_anchor
+from app.services.prompt_prefix import (
+    PROMPT_PREFIX_VERSION,
+    RFO_INSTRUCTIONS,
+    build_drafting_references,
+)
+from app.services.llm_cache import cache_key, llm_cache
+from app.services.llm_clients import llm_clients
+from app.services.llm_scheduler import llm_scheduler
+from app.services.token_usage import TokenUsage, request_token_estimate
 import logging
 
 logger = logging.getLogger(__name__)
@@ -46,6 +63,7 @@ class LLMService:
             self.prompts_content = ""
 
         self.claude_backend = None
+        self.batch_backend = None
         if USE_MOCK_LLM:
             print("Using mock LLM for local development")
             self.model = None
@@ -54,22 +72,30 @@ class LLMService:
         elif USE_CLAUDE:
             from app.services.claude_llm_service import ClaudeLLMService
 
-            self.claude_backend = ClaudeLLMService(self._get_system_prompt())
+            from app.services.claude_batch_service import ClaudeBatchService
+
+            self.claude_backend = ClaudeLLMService(
+                self._get_system_prompt(),
+                build_drafting_references(self.prompts_content)
+            )
+            self.batch_backend = ClaudeBatchService(self.claude_backend)
+            llm_clients.on_shutdown(self.batch_backend.close)
             self.model = None
             self.generation_config = None
             self.safety_settings = None
             self.operation_configs = {}
         else:
-            # Initialize Vertex AI
-            vertexai.init(
-                project=settings.PROJECT_ID,
-                location=settings.VERTEX_AI_LOCATION
+            from vertexai.generative_models import (
+                GenerationConfig,
+                HarmBlockThreshold,
+                HarmCategory,
+                SafetySetting,
             )
 
-            # Initialize model
-            self.model = GenerativeModel(
-                model_name=settings.VERTEX_AI_MODEL,
-                system_instruction=self._get_system_prompt()
+            # Shared model; vertexai.init runs once per process
+            self.model = llm_clients.vertex_model(
+                settings.VERTEX_AI_MODEL,
+                self._get_system_prompt()
             )
 
             # Generation config with smart limits
@@ -142,7 +168,21 @@ IMPORTANT CONSTRAINTS:
         context: Dict[str, Any]
     ) -> str:
         """Build RFO rewrite prompt"""
-        prompt = f"""Task: Rewrite this Request for Order (RFO) section for a California family court.
+        body, anchor = self._rfo_prompt_parts(section_name, user_input, context)
+        return f"{body}\n\n{anchor}\n\n{RFO_INSTRUCTIONS}"
+
+    def _rfo_prompt_parts(
+        self,
+        section_name: str,
+        user_input: str,
+        context: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """(section body, motion fact anchor) of the RFO prompt.
+
+        Claude gets the anchor as a cached system block and the instructions
+        from the drafting reference, so only the body varies per section.
+        """
+        body = f"""Task: Rewrite this Request for Order (RFO) section for a California family court.
 
 Context:
 - Motion Type: Request for Order (FL-300)
@@ -157,36 +197,9 @@ Supporting Facts:
 - Case Number: {context.get('case_number', 'To be assigned')}
 - Children: {json.dumps(context.get('children_info', []))}
 - Current Orders: {context.get('existing_orders', 'None specified')}
-- Changed Circumstances: {context.get('changed_circumstances', 'As described')}
+- Changed Circumstances: {context.get('changed_circumstances', 'As described')}"""
 
-{build_fact_anchor(context)}
-
-Instructions:
-1. Rewrite in formal court language appropriate for California family court
-2. Organize into clear, numbered paragraphs
-3. Start each factual assertion with specific dates when possible
-4. Use "Petitioner/Respondent" not "I/me" (except in declarations)
-5. Do NOT cite any statute, rule of court, case, or courthouse address. Do NOT reference other forms or filing fees.
-6. Maintain professional, neutral tone
-7. Focus on best interests of children (if applicable)
-8. Keep concise and clear
-
-Style Guidelines:
-- Use active voice
-- Short, clear sentences (max 25 words when possible)
-- One point per paragraph
-- Chronological order for facts
-- Legal conclusions must follow factual basis
-
-REDLINES (Never Include):
-- Legal advice or strategy
-- Speculation about other party's motives
-- Inflammatory or emotional language
-- Unsubstantiated claims
-- References to settlement discussions
-- Hearsay without proper foundation"""
-        
-        return prompt
+        return body, build_fact_anchor(context)
     
     def _build_declaration_prompt(self, user_narrative: str, declarant_name: str) -> str:
         """Build declaration rewrite prompt"""
@@ -255,25 +268,55 @@ Format each factor as separate paragraph with supporting facts."""
         
         return prompt
     
+    def backend_for(self, operation: str):
+        """Claude backend for an operation: the batch queue if it is batched."""
+        from app.services.claude_batch_service import is_batched
+
+        if self.batch_backend is not None and is_batched(operation):
+            return self.batch_backend
+        return self.claude_backend
+
     async def _generate(
         self,
         prompt: str,
         operation: str,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        prompt_parts: Optional[Tuple[str, str]] = None
     ) -> tuple:
-        """Generate via the configured backend. Returns (text, tokens, model_name)."""
+        """Generate via the configured backend. Returns (text, TokenUsage, model_name).
+
+        prompt_parts (body, motion prefix) lets Claude cache the prefix as a
+        system block; other backends get the full prompt. Identical requests
+        are answered from llm_cache (tokens == 0 on a hit).
+        """
         if self.claude_backend is not None:
-            return await self.claude_backend.generate(prompt, operation, user_id)
+            backend = self.backend_for(operation)
+            if prompt_parts is not None:
+                body, motion_prefix = prompt_parts
+                return await backend.generate(body, operation, user_id, motion_prefix=motion_prefix)
+            return await backend.generate(prompt, operation, user_id)
 
         config = self.operation_configs.get(operation, self.generation_config)
-        response = self.model.generate_content(
-            prompt,
-            generation_config=config,
-            safety_settings=self.safety_settings
+
+        async def call() -> tuple:
+            # Async SDK call: the sync generate_content would block the event loop
+            # (and every other request on this worker) for the full model latency
+            async with llm_scheduler.slot(settings.VERTEX_AI_MODEL, operation, user_id):
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=config,
+                    safety_settings=self.safety_settings
+                )
+            text = response.text if response.text else ""
+            usage = TokenUsage.from_vertex(getattr(response, "usage_metadata", None))
+            return text, usage or TokenUsage.estimate(prompt, text), settings.VERTEX_AI_MODEL
+
+        max_tokens = config.to_dict().get("max_output_tokens") if config else None
+        key = cache_key(
+            "vertex", settings.VERTEX_AI_MODEL, operation,
+            self._get_system_prompt(), prompt, max_tokens
         )
-        text = response.text if response.text else ""
-        tokens = len(prompt.split()) + len(text.split())
-        return text, tokens, settings.VERTEX_AI_MODEL
+        return await llm_cache.get_or_generate(key, call, operation, user_id)
 
     async def rewrite_rfo_section(
         self,
@@ -297,10 +340,12 @@ Format each factor as separate paragraph with supporting facts."""
             user_input = self._format_answers_to_narrative(user_answers)
 
             # Build prompt
+            prompt_parts = self._rfo_prompt_parts(section_name, user_input, context)
             prompt = self._build_rfo_prompt(section_name, user_input, context)
 
             # Estimate tokens and check budget
-            estimated_tokens = len(prompt.split()) * 2  # Conservative estimate
+            # The prompt plus the full output allowance: the most this call can cost
+            estimated_tokens = request_token_estimate(prompt, get_token_limit("section_rewrite"))
             budget_ok, budget_msg = await check_budget(
                 estimated_tokens,
                 "section_rewrite",
@@ -316,18 +361,15 @@ Format each factor as separate paragraph with supporting facts."""
                     "tokens_used": 0
                 }
 
-            # Get appropriate token limit
-            token_limit = get_token_limit("section_rewrite")
-
             if USE_MOCK_LLM:
                 # Mock mode passes the user's own words through unchanged — this text
                 # lands in filing-ready PDFs, so it must never contain placeholder copy.
                 rewritten_text = user_input
-                tokens_used = len(prompt.split()) + len(rewritten_text.split())
+                tokens_used = TokenUsage.estimate(prompt, rewritten_text)
                 model_name = "mock-llm"
             else:
                 rewritten_text, tokens_used, model_name = await self._generate(
-                    prompt, "section_rewrite", user_id
+                    prompt, "section_rewrite", user_id, prompt_parts
                 )
 
                 # Track usage for cost monitoring
@@ -352,6 +394,103 @@ Format each factor as separate paragraph with supporting facts."""
                 "tokens_used": 0
             }
     
+    async def stream_rfo_section(
+        self,
+        section_name: str,
+        user_answers: Dict[str, Any],
+        context: Dict[str, Any],
+        user_id: Optional[str] = None,
+        outcome: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """Streaming rewrite_rfo_section: yields text as the model produces it.
+
+        Same cost controls as rewrite_rfo_section. Never raises; success,
+        error, tokens_used and model are reported through ``outcome``.
+        """
+        outcome = outcome if outcome is not None else {}
+        outcome.update({"success": False, "error": None, "tokens_used": 0, "model": None})
+        try:
+            if os.getenv("EMERGENCY_SHUTDOWN", "false").lower() == "true":
+                outcome["error"] = "Service temporarily unavailable due to budget limits"
+                return
+
+            user_input = self._format_answers_to_narrative(user_answers)
+            prompt_parts = self._rfo_prompt_parts(section_name, user_input, context)
+            prompt = self._build_rfo_prompt(section_name, user_input, context)
+
+            # The prompt plus the full output allowance: the most this call can cost
+            estimated_tokens = request_token_estimate(prompt, get_token_limit("section_rewrite"))
+            budget_ok, budget_msg = await check_budget(
+                estimated_tokens,
+                "section_rewrite",
+                user_id
+            )
+            if not budget_ok:
+                logger.warning(f"Budget limit reached: {budget_msg}")
+                outcome["error"] = budget_msg
+                return
+
+            if USE_MOCK_LLM:
+                # Word-sized chunks of the user's own words, like rewrite_rfo_section
+                for piece in re.findall(r"\S+\s*", user_input):
+                    yield piece
+                outcome.update(
+                    tokens_used=TokenUsage.estimate(prompt, user_input),
+                    model="mock-llm",
+                )
+            else:
+                streamed: Dict[str, Any] = {}
+                async for piece in self._stream(
+                    prompt, "section_rewrite", user_id, streamed, prompt_parts
+                ):
+                    yield piece
+                outcome.update(tokens_used=streamed["tokens"], model=streamed["model"])
+                await track_llm_cost(
+                    operation="section_rewrite",
+                    tokens=streamed["tokens"],
+                    user_id=user_id
+                )
+            outcome["success"] = True
+
+        except Exception as e:
+            outcome["error"] = str(e)
+
+    async def _stream(
+        self,
+        prompt: str,
+        operation: str,
+        user_id: Optional[str],
+        streamed: Dict[str, Any],
+        prompt_parts: Optional[Tuple[str, str]] = None
+    ) -> AsyncIterator[str]:
+        """Stream via the configured backend; fills streamed["tokens"/"model"]."""
+        if self.claude_backend is not None:
+            body, motion_prefix = prompt_parts or (prompt, None)
+            async for piece in self.claude_backend.stream(
+                body, operation, user_id, streamed, motion_prefix=motion_prefix
+            ):
+                yield piece
+            return
+
+        config = self.operation_configs.get(operation, self.generation_config)
+        text = ""
+        usage = None
+        async with llm_scheduler.slot(settings.VERTEX_AI_MODEL, operation, user_id):
+            chunks = await self.model.generate_content_async(
+                prompt,
+                generation_config=config,
+                safety_settings=self.safety_settings,
+                stream=True
+            )
+            async for chunk in chunks:
+                piece = chunk.text or ""
+                text += piece
+                # Counts arrive on the chunks; the last one carries the final totals
+                usage = TokenUsage.from_vertex(getattr(chunk, "usage_metadata", None)) or usage
+                yield piece
+        streamed["tokens"] = usage or TokenUsage.estimate(prompt, text)
+        streamed["model"] = settings.VERTEX_AI_MODEL
+
     async def rewrite_declaration(
         self,
         narrative: str,
@@ -372,7 +511,7 @@ Format each factor as separate paragraph with supporting facts."""
             prompt = self._build_declaration_prompt(narrative, declarant_name)
 
             # Check budget
-            estimated_tokens = len(prompt.split()) * 2
+            estimated_tokens = request_token_estimate(prompt, get_token_limit("declaration"))
             budget_ok, budget_msg = await check_budget(
                 estimated_tokens,
                 "declaration",
@@ -399,7 +538,7 @@ I declare under penalty of perjury under the laws of the State of California tha
 
 _____________________________
 {declarant_name}"""
-                tokens_used = len(prompt.split()) + len(rewritten_text.split())
+                tokens_used = TokenUsage.estimate(prompt, rewritten_text)
                 model_name = "mock-llm"
             else:
                 rewritten_text, tokens_used, model_name = await self._generate(
@@ -445,7 +584,7 @@ The following California best interests factors support this request:
 1. Health, safety, and welfare of the children.
 2. Stability and continuity in the children's daily routine.
 3. Each parent's ability to provide appropriate care."""
-                tokens_used = len(prompt.split()) + len(enhanced_text.split())
+                tokens_used = TokenUsage.estimate(prompt, enhanced_text)
                 model_name = "mock-llm"
             else:
                 enhanced_text, tokens_used, model_name = await self._generate(
@@ -472,15 +611,54 @@ The following California best interests factors support this request:
         motion_type: str,
         all_drafts: List[Dict[str, Any]],
         profile_data: Dict[str, Any],
-        should_abort: Optional[Callable[[], Awaitable[bool]]] = None
+        should_abort: Optional[Callable[[], Awaitable[bool]]] = None,
+        max_concurrency: int = 1,
+        on_section: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        prefetched: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
-        """Process complete motion through LLM for all sections"""
-        results = []
-        total_tokens = 0
-        aborted = False
+        """Process complete motion through LLM for all sections.
+
+        max_concurrency > 1 fans sections out under a semaphore. Prompts only
+        depend on the user's answers, never on an earlier section's output, so
+        every section can run at once; results keep the input (step_number)
+        order and each call still checks should_abort and the budget.
+
+        A draft carrying the "input_fingerprint" its stored output was made
+        from is not sent to the model when its fingerprint still matches; its
+        result has reused=True and no rewritten_text (the caller keeps the
+        stored output).
+
+        on_section, if given, is awaited with each section result as soon as
+        that section finishes, so callers can persist work incrementally.
+
+        prefetched maps input fingerprints to section results drafted ahead
+        of time (speculative pre-drafts). A section whose fingerprint is there
+        takes that text instead of calling the model; it is returned like a
+        fresh rewrite, with speculative=True, so the caller still gates it.
+        """
+        context = self.motion_context(profile_data)
+
+        if max_concurrency > 1:
+            results, aborted = await self._rewrite_sections_concurrently(
+                all_drafts, context, should_abort, max_concurrency, on_section, prefetched
+            )
+        else:
+            results, aborted = await self._rewrite_sections_sequentially(
+                all_drafts, context, should_abort, on_section, prefetched
+            )
+
+        return {
+            "motion_type": motion_type,
+            "sections": results,
+            "total_tokens": sum(r.get("tokens_used", 0) for r in results),
+            "model": self._backend_model_name(),
+            "aborted": aborted,
+            "success": all(r.get("success") for r in results)
+        }
 
-        # Build context from profile and answers
-        context = {
+    def motion_context(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prompt context shared by every section of a motion"""
+        return {
             "party_role": "Petitioner" if profile_data.get("is_petitioner") else "Respondent",
             "county": profile_data.get("county", "California"),
             "case_number": profile_data.get("case_number", ""),
@@ -488,41 +666,122 @@ The following California best interests factors support this request:
             "party_name": profile_data.get("party_name", ""),
             "other_party_name": profile_data.get("other_party_name", "")
         }
-        
-        # Process each draft section
+
+    def section_fingerprint(
+        self,
+        section_name: str,
+        answers: Dict[str, Any],
+        context: Dict[str, Any]
+    ) -> str:
+        """Hash of everything that shapes a section's prompt and output.
+
+        context is the accumulated section context (profile fields plus the
+        answers of this and earlier steps), exactly as the prompt sees it.
+        """
+        payload = json.dumps(
+            [RFO_PROMPT_VERSION, PROMPT_PREFIX_VERSION, self._backend_model_name(),
+             section_name, answers, context],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _rewrite_draft(
+        self,
+        draft: Dict[str, Any],
+        context: Dict[str, Any],
+        prefetched: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        section_name = draft.get("step_name", "")
+        answers = draft.get("question_data", {})
+        fingerprint = self.section_fingerprint(section_name, answers or {}, context)
+        section = {
+            "step_number": draft.get("step_number"),
+            "section": section_name,
+            "original_answers": answers,
+            "input_fingerprint": fingerprint,
+        }
+        if draft.get("input_fingerprint") == fingerprint:
+            # Inputs unchanged since the stored output was produced
+            return {**section, "rewritten_text": "", "success": True, "error": None,
+                    "tokens_used": 0, "reused": True}
+
+        ahead = (prefetched or {}).get(fingerprint)
+        if ahead:
+            # Drafted speculatively from these exact inputs
+            return {**section, "rewritten_text": ahead.get("rewritten_text", ""),
+                    "success": True, "error": None,
+                    "tokens_used": ahead.get("tokens_used", 0), "model": ahead.get("model"),
+                    "reused": False, "speculative": True}
+
+        result = await self.rewrite_rfo_section(section_name, answers, context)
+        return {
+            **section,
+            "rewritten_text": result.get("rewritten_text", ""),
+            "success": result.get("success", False),
+            "error": result.get("error"),
+            "tokens_used": result.get("tokens_used", 0),
+            "model": result.get("model"),
+            "reused": False
+        }
+
+    async def _rewrite_sections_sequentially(
+        self,
+        all_drafts: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        should_abort: Optional[Callable[[], Awaitable[bool]]],
+        on_section: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        prefetched: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        results = []
         for draft in all_drafts:
             # Stop paying for sections nobody is waiting on (finding L18)
             if should_abort and await should_abort():
-                aborted = True
-                break
-            section_name = draft.get("step_name", "")
-            answers = draft.get("question_data", {})
-            
+                return results, True
             # Add answers to context for next sections
-            context.update(answers)
-            
-            # Rewrite section
-            result = await self.rewrite_rfo_section(section_name, answers, context)
-            
-            results.append({
-                "step_number": draft.get("step_number"),
-                "section": section_name,
-                "original_answers": answers,
-                "rewritten_text": result.get("rewritten_text", ""),
-                "success": result.get("success", False),
-                "error": result.get("error")
-            })
-            
-            total_tokens += result.get("tokens_used", 0)
-        
-        return {
-            "motion_type": motion_type,
-            "sections": results,
-            "total_tokens": total_tokens,
-            "model": self._backend_model_name(),
-            "aborted": aborted,
-            "success": all(r.get("success") for r in results)
-        }
+            context.update(draft.get("question_data", {}))
+            result = await self._rewrite_draft(draft, context, prefetched)
+            if on_section:
+                await on_section(result)
+            results.append(result)
+        return results, False
+
+    async def _rewrite_sections_concurrently(
+        self,
+        all_drafts: List[Dict[str, Any]],
+        context: Dict[str, Any],
+        should_abort: Optional[Callable[[], Awaitable[bool]]],
+        max_concurrency: int,
+        on_section: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+        prefetched: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        # Snapshot the accumulated context each section would have seen in
+        # sequential mode, so prompts are identical in both modes
+        contexts = []
+        for draft in all_drafts:
+            context.update(draft.get("question_data", {}))
+            contexts.append(dict(context))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        aborted = False
+
+        async def run(draft: Dict[str, Any], section_context: Dict[str, Any]):
+            nonlocal aborted
+            async with semaphore:
+                # Checked per section: queued sections never start once the
+                # client is gone, in-flight ones finish (finding L18)
+                if aborted or (should_abort and await should_abort()):
+                    aborted = True
+                    return None
+                result = await self._rewrite_draft(draft, section_context, prefetched)
+            if on_section:
+                await on_section(result)
+            return result
+
+        outcomes = await asyncio.gather(
+            *(run(draft, ctx) for draft, ctx in zip(all_drafts, contexts))
+        )
+        return [r for r in outcomes if r is not None], aborted
 
     def _backend_model_name(self) -> str:
         if USE_MOCK_LLM:
@@ -625,5 +884,6 @@ The following California best interests factors support this request:
         result["enhanced_text"] = result.get("rewritten_text", "")
         return result
 
-# Singleton instance
-llm_service = LLMService()
\ No newline at end of file
+# Singleton instance, shared with every service that needs an LLMService;
+# built on first use since the Vertex backend imports the SDK and opens a model
+llm_service = LazySingleton(lambda: llm_clients.shared(LLMService))
\ No newline at end of file
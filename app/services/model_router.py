@@ -0,0 +1,235 @@
+"""
+Latency-aware model routing for the Claude backend.
+
+OPERATION_MODELS picks a model per operation; the router decides how to
+call it:
+
+- every attempt runs under the operation's deadline (OPERATION_DEADLINES);
+- a timeout, overload (529), rate limit or 5xx on the primary model falls
+  back to its secondary (FALLBACK_MODELS); request errors (4xx) do not;
+- a model whose recent error rate crosses LLM_ROUTER_ERROR_THRESHOLD is
+  demoted behind its fallback until successes bring the rate back down;
+- interactive operations (LLM_HEDGED_OPERATIONS) send a second, hedged
+  request once the first has been outstanding longer than the model's
+  rolling p95, and take whichever answer arrives first.
+
+Latency and error rates are rolling per model and per process. The router
+only needs request(model) -> awaitable, so tests drive it with a fake
+backend and injected latency. An optional admit(model) context (the
+scheduler slot) is entered before each attempt's clocks start, so time
+spent queued never counts against the deadline, the error rate or the p95.
+"""
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import AsyncContextManager, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_DEADLINE_SECONDS = float(os.getenv("LLM_DEFAULT_DEADLINE_SECONDS", "120"))
+
+# Per-attempt deadlines; drafting gets long, interactive calls stay short
+OPERATION_DEADLINES = {
+    "chat_response": 30.0,
+    "intent_classification": 10.0,
+    "upl_check": 15.0,
+    "section_rewrite": 120.0,
+    "declaration": 150.0,
+    "best_interests": 120.0,
+    "complete_motion": 240.0,
+    "served_motion_extraction": 60.0,
+    "evidence_ranking": 90.0,
+    "conversation_threading": 180.0,
+    "screenshot_reading": 180.0,
+    "claim_citation": 60.0,
+    "semantic_check": 120.0,
+}
+
+HEDGED_OPERATIONS = frozenset(
+    op.strip()
+    for op in os.getenv("LLM_HEDGED_OPERATIONS", "chat_response,intent_classification").split(",")
+    if op.strip()
+)
+ROUTER_WINDOW = int(os.getenv("LLM_ROUTER_WINDOW", "50"))
+ROUTER_MIN_SAMPLES = int(os.getenv("LLM_ROUTER_MIN_SAMPLES", "10"))
+ROUTER_ERROR_THRESHOLD = float(os.getenv("LLM_ROUTER_ERROR_THRESHOLD", "0.5"))
+
+# Status codes worth trying another model for: rate limit, 5xx, overloaded
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+
+def deadline_for(operation: str) -> float:
+    return OPERATION_DEADLINES.get(operation, DEFAULT_DEADLINE_SECONDS)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Timeouts, connection failures and overload-style status codes."""
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+    if getattr(exc, "status_code", None) in RETRYABLE_STATUS_CODES:
+        return True
+    try:
+        from anthropic import APIConnectionError
+    except ImportError:
+        return False
+    return isinstance(exc, APIConnectionError)
+
+
+class ModelStats:
+    """Rolling latency and outcome window for one model."""
+
+    def __init__(self, window: int = ROUTER_WINDOW):
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+
+    def record(self, ok: bool, latency: Optional[float] = None) -> None:
+        self.outcomes.append(ok)
+        if ok and latency is not None:
+            self.latencies.append(latency)
+
+    def p95(self) -> Optional[float]:
+        if len(self.latencies) < ROUTER_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    @property
+    def healthy(self) -> bool:
+        if len(self.outcomes) < ROUTER_MIN_SAMPLES:
+            return True
+        return self.error_rate() < ROUTER_ERROR_THRESHOLD
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "samples": len(self.outcomes),
+            "error_rate": round(self.error_rate(), 3),
+            "p95_seconds": self.p95(),
+        }
+
+
+class ModelRouter:
+    """Deadline, fallback and hedging policy around a per-model request."""
+
+    def __init__(
+        self,
+        fallbacks: Optional[Dict[str, str]] = None,
+        hedged_operations: frozenset = HEDGED_OPERATIONS,
+        deadlines: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fallbacks = fallbacks or {}
+        self.hedged_operations = hedged_operations
+        self.deadlines = deadlines
+        self.clock = clock
+        self.stats: Dict[str, ModelStats] = {}
+
+    def stats_for(self, model: str) -> ModelStats:
+        if model not in self.stats:
+            self.stats[model] = ModelStats()
+        return self.stats[model]
+
+    def candidates(self, model: str) -> List[str]:
+        """Models to try in order: an unhealthy primary goes behind its fallback."""
+        fallback = self.fallbacks.get(model)
+        if not fallback or fallback == model:
+            return [model]
+        if not self.stats_for(model).healthy and self.stats_for(fallback).healthy:
+            return [fallback, model]
+        return [model, fallback]
+
+    def deadline(self, operation: str) -> float:
+        if self.deadlines is not None and operation in self.deadlines:
+            return self.deadlines[operation]
+        return deadline_for(operation)
+
+    async def call(
+        self,
+        operation: str,
+        model: str,
+        request: Callable[[str], Awaitable[T]],
+        admit: Optional[Callable[[str], AsyncContextManager]] = None,
+    ) -> T:
+        """Run request(model) under the routing policy; raises the last error."""
+        last_error: Optional[BaseException] = None
+        for candidate in self.candidates(model):
+            try:
+                return await self._attempt(operation, candidate, request, admit)
+            except Exception as exc:
+                if not is_retryable(exc):
+                    raise
+                last_error = exc
+                logger.warning(
+                    f"{operation} on {candidate} failed ({type(exc).__name__}); "
+                    f"trying next model"
+                )
+        raise last_error
+
+    async def _attempt(
+        self,
+        operation: str,
+        model: str,
+        request: Callable[[str], Awaitable[T]],
+        admit: Optional[Callable[[str], AsyncContextManager]] = None,
+    ) -> T:
+        stats = self.stats_for(model)
+        hedge_after = stats.p95() if operation in self.hedged_operations else None
+        # A hedge rides on its attempt's admission rather than queueing again
+        async with admit(model) if admit is not None else nullcontext():
+            start = self.clock()
+            try:
+                result = await asyncio.wait_for(
+                    self._race(model, request, hedge_after), self.deadline(operation)
+                )
+            except Exception as exc:
+                # A bad request says nothing about the model's health
+                if is_retryable(exc):
+                    stats.record(False)
+                raise
+            stats.record(True, self.clock() - start)
+        return result
+
+    async def _race(
+        self,
+        model: str,
+        request: Callable[[str], Awaitable[T]],
+        hedge_after: Optional[float],
+    ) -> T:
+        first = asyncio.ensure_future(request(model))
+        if hedge_after is None:
+            return await first
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+            if not done:
+                logger.info(f"Hedging {model} request after {hedge_after:.2f}s")
+                tasks.append(asyncio.ensure_future(request(model)))
+            return await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _first_success(self, tasks: List[asyncio.Future]) -> T:
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+
+    def report(self) -> Dict[str, Dict[str, object]]:
+        return {model: stats.snapshot() for model, stats in self.stats.items()}
@@ -2,22 +2,18 @@
 OCR service — env-gated Cloud Vision transcription suggestions.
 
 Feature flag: OCR_ENABLED=true enables this service.
-The google-cloud-vision lib is imported conditionally so the module loads
-cleanly even when the package is absent or the flag is off.
+The google-cloud-vision lib is only probed at import and loaded on first
+use, so the module loads cleanly (and quickly) even when the package is
+absent or the flag is off.
 """
 import logging
 import os
 
+from app.core.lazy import module_available
+
 logger = logging.getLogger(__name__)
 
-# ---------------------------------------------------------------------------
-# Conditional import — mirrors the pattern in llm_service.py
-# ---------------------------------------------------------------------------
-try:
-    from google.cloud import vision as _vision_lib
-    _VISION_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    _VISION_AVAILABLE = False
+_VISION_AVAILABLE = module_available("google.cloud.vision")
 
 
 def ocr_enabled() -> bool:
@@ -30,7 +26,9 @@ def ocr_enabled() -> bool:
 
 def _build_vision_client():
     """Construct a Cloud Vision ImageAnnotatorClient. Extracted for easy mocking."""
-    return _vision_lib.ImageAnnotatorClient()
+    from google.cloud import vision
+
+    return vision.ImageAnnotatorClient()
 
 
 def extract_text(image_bytes: bytes) -> str:
@@ -44,8 +42,10 @@ def extract_text(image_bytes: bytes) -> str:
         return ""
 
     try:
+        from google.cloud import vision
+
         client = _build_vision_client()
-        image = _vision_lib.Image(content=image_bytes)
+        image = vision.Image(content=image_bytes)
         response = client.document_text_detection(image=image)
         return response.full_text_annotation.text or ""
     except Exception:
@@ -20,6 +20,7 @@ class OperationType(Enum):
     DATA_EXTRACTION = "data_extraction"
     FILE_UPLOAD = "file_upload"
     BATCH_OPERATION = "batch_operation"
+    MOTION_PROCESSING = "motion_processing"
 
 
 class ProgressStatus(Enum):
@@ -88,10 +89,14 @@ class ProgressIndicatorService:
         self,
         operation_type: OperationType,
         total_steps: int = 100,
-        metadata: Dict[str, Any] = None
+        metadata: Dict[str, Any] = None,
+        operation_id: Optional[str] = None
     ) -> str:
-        """Create a new operation with progress tracking"""
-        operation_id = str(uuid.uuid4())
+        """Create a new operation with progress tracking.
+
+        operation_id lets a caller reuse its own id (e.g. a persisted job id).
+        """
+        operation_id = operation_id or str(uuid.uuid4())
         operation = ProgressIndicator(operation_id, operation_type, total_steps)
         operation.metadata = metadata or {}
 
@@ -0,0 +1,169 @@
+"""
+Stable, versioned prompt prefix for Anthropic prompt caching.
+
+A cache_control breakpoint only pays off when everything before it is
+byte-identical across calls and longer than the model's minimum cacheable
+prefix. The bare system prompt (a few hundred tokens) is below that minimum,
+so drafting calls now carry, in order:
+
+1. stable block   — base system prompt, UPL guardrails, the statute-free
+                    drafting rules and style guide, and the rule and style
+                    text of the llm-prompts.md template for the operation's
+                    document type (guidance_only: no input slots or sample
+                    facts; an RFO rewrite never carries the declaration
+                    template).
+                    Identical for every call of that operation. (breakpoint)
+2. motion block   — the per-motion fact anchor (build_fact_anchor), shared
+                    by every section of one motion. (breakpoint)
+3. user message   — the section-specific task, context and user input.
+
+Each stable block clears the 1024-token minimum of the Sonnet tier
+(tests/test_prompt_prefix.py checks it against the real llm-prompts.md).
+The default Opus drafting tier needs 4096 tokens, more than the drafting
+rules come to, so ClaudeLLMService warns at startup and the stable block
+is only cached when CLAUDE_DRAFTING_MODEL selects a model whose minimum it
+clears. The tier itself is a deployment choice, not this module's. Bump PROMPT_PREFIX_VERSION whenever any of this text changes: the
+version is part of the prefix, so old cache entries and stored section
+fingerprints stop matching.
+"""
+import logging
+import re
+from typing import Dict, Iterable
+
+from app.services.token_usage import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+PROMPT_PREFIX_VERSION = "3"
+
+# Reference sections of llm-prompts.md sent with each drafting operation, in
+# file order. Its system prompt is already the base prompt; its
+# error-handling and checklist prompts are conversational and would leak
+# into document text.
+OPERATION_REFERENCE_SECTIONS = {
+    "section_rewrite": ("RFO Motion Rewrite Prompt Template", "Tone Modulation Settings"),
+    "complete_motion": ("RFO Motion Rewrite Prompt Template", "Tone Modulation Settings"),
+    "declaration": ("Declaration Rewrite Prompt Template", "Tone Modulation Settings"),
+    "best_interests": ("Best Interests Analysis Prompt", "Tone Modulation Settings"),
+}
+
+# Operations that write court documents and get the drafting prefix
+DRAFTING_OPERATIONS = frozenset(OPERATION_REFERENCE_SECTIONS)
+
+# Shortest prefix each model family will cache; below it cache_control is
+# silently ignored. Unknown models assume the strictest minimum.
+MIN_CACHEABLE_TOKENS = {
+    "claude-haiku": 4096,
+    "claude-opus": 4096,
+    "claude-sonnet": 1024,
+}
+DEFAULT_MIN_CACHEABLE_TOKENS = 4096
+
+# Statute-free drafting rules and style guide, shared by the RFO prompt
+RFO_INSTRUCTIONS = """Instructions:
+1. Rewrite in formal court language appropriate for California family court
+2. Organize into clear, numbered paragraphs
+3. Start each factual assertion with specific dates when possible
+4. Use "Petitioner/Respondent" not "I/me" (except in declarations)
+5. Do NOT cite any statute, rule of court, case, or courthouse address. Do NOT reference other forms or filing fees.
+6. Maintain professional, neutral tone
+7. Focus on best interests of children (if applicable)
+8. Keep concise and clear
+
+Style Guidelines:
+- Use active voice
+- Short, clear sentences (max 25 words when possible)
+- One point per paragraph
+- Chronological order for facts
+- Legal conclusions must follow factual basis
+
+REDLINES (Never Include):
+- Legal advice or strategy
+- Speculation about other party's motives
+- Inflammatory or emotional language
+- Unsubstantiated claims
+- References to settlement discussions
+- Hearsay without proper foundation"""
+
+_HEADING = re.compile(r"^## (.+)$", re.MULTILINE)
+# Template input slots ("{user_input}"), and the tone examples' sample facts
+_PLACEHOLDER = re.compile(r"\{[^{}\n]*\}")
+_DROPPED_LINE = re.compile(r"^\s*(```|Task:|- Example:)")
+
+
+def reference_sections(prompts_content: str, titles: Iterable[str]) -> str:
+    """The named '## ' sections of llm-prompts.md, in file order."""
+    wanted = set(titles)
+    headings = list(_HEADING.finditer(prompts_content or ""))
+    sections = []
+    for index, heading in enumerate(headings):
+        if heading.group(1).strip() not in wanted:
+            continue
+        end = headings[index + 1].start() if index + 1 < len(headings) else len(prompts_content)
+        sections.append(prompts_content[heading.start():end].strip())
+    return "\n\n".join(sections)
+
+
+def guidance_only(section_text: str) -> str:
+    """Rule and style text of llm-prompts.md sections, without what a call fills in.
+
+    Drops code fences, the per-call "Task:" line, every line holding a
+    {placeholder}, and the tone settings' example sentences (which carry
+    sample facts and dates the model must never reuse), then any heading
+    left with nothing under it ("User's Draft Input:").
+    """
+    lines = [
+        line for line in section_text.splitlines()
+        if not _PLACEHOLDER.search(line) and not _DROPPED_LINE.match(line)
+    ]
+    blocks = []
+    for block in re.split(r"\n\s*\n", "\n".join(lines)):
+        block = block.strip()
+        if block and not ("\n" not in block and block.endswith(":")):
+            blocks.append(block)
+    return "\n\n".join(blocks)
+
+
+def build_drafting_reference(prompts_content: str, operation: str) -> str:
+    """Drafting rules + style guide + the operation's llm-prompts.md reference, versioned."""
+    parts = [
+        f"DRAFTING REFERENCE (version {PROMPT_PREFIX_VERSION})",
+        "These rules apply to every court document you draft. The guidance "
+        "below is for this document type; apply it only to facts the user "
+        "provided.",
+        RFO_INSTRUCTIONS,
+    ]
+    reference = guidance_only(
+        reference_sections(prompts_content, OPERATION_REFERENCE_SECTIONS[operation])
+    )
+    if reference:
+        parts.append(reference)
+    return "\n\n".join(parts)
+
+
+def build_drafting_references(prompts_content: str) -> Dict[str, str]:
+    """{drafting operation: its reference} for ClaudeLLMService."""
+    return {
+        operation: build_drafting_reference(prompts_content, operation)
+        for operation in OPERATION_REFERENCE_SECTIONS
+    }
+
+
+def min_cacheable_tokens(model: str) -> int:
+    for family, minimum in MIN_CACHEABLE_TOKENS.items():
+        if model.startswith(family):
+            return minimum
+    return DEFAULT_MIN_CACHEABLE_TOKENS
+
+
+def warn_if_uncacheable(prefix: str, model: str) -> bool:
+    """Log when a prefix is too short for the model to cache; True if cacheable."""
+    tokens = estimate_tokens(prefix)
+    minimum = min_cacheable_tokens(model)
+    if tokens < minimum:
+        logger.warning(
+            f"Prompt prefix (~{tokens} tokens) is below {model}'s {minimum}-token "
+            f"cache minimum; prompt caching will not engage"
+        )
+        return False
+    return True
@@ -6,19 +6,31 @@ regexes catch mechanical fabrications (names, dates, amounts, authorities);
 this pass asks the drafting-tier model to refute semantic embellishments the
 regexes cannot see. Flag-only — it never edits text — and fail-open: any
 error or timeout returns [] so motion processing is never blocked.
+
+Long documents are split into overlapping windows on sentence boundaries and
+the windows are checked concurrently under one shared deadline, so check time
+stays roughly flat as declarations grow. Windows that miss the deadline are
+dropped individually; findings from the rest are merged and deduplicated by
+where their claim sits in the full text.
 """
 import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from app.services.fact_gate.types import iter_scalars
+from app.services.claude_batch_service import BATCH_TIMEOUT_SECONDS, is_batched
+from app.services.fact_gate.types import iter_scalars, sentence_spans
 from app.services.llm_json import parse_llm_json
 
+if TYPE_CHECKING:
+    from app.services.fact_gate import GatePlan
+
 logger = logging.getLogger(__name__)
 
 TIMEOUT_SECONDS = 20.0
 MAX_FINDINGS = 10
 CLAIM_LIMIT = 120
+WINDOW_CHARS = 6000
+WINDOW_OVERLAP_SENTENCES = 2
 
 _INSTRUCTIONS = (
     "You are a skeptical reviewer. Try to REFUTE this document: list every "
@@ -35,13 +47,17 @@ async def check_text(
     generated_text: str,
     intake_values: Dict[str, Any],
     context: Dict[str, Any],
+    plan: Optional["GatePlan"] = None,
 ) -> List[Dict[str, Any]]:
-    """Adversarial review of generated text; correction dicts, [] on any failure."""
+    """Adversarial review of generated text; correction dicts, [] on any failure.
+
+    A GatePlan compiled from the same intake supplies its precomputed intake
+    lines instead of walking intake_values again.
+    """
+    # A batched check waits for its batch; the interactive one must not stall
+    timeout = BATCH_TIMEOUT_SECONDS if is_batched("semantic_check") else TIMEOUT_SECONDS
     try:
-        return await asyncio.wait_for(
-            _run_check(generated_text, intake_values, context),
-            timeout=TIMEOUT_SECONDS,
-        )
+        return await _run_check(generated_text, intake_values, context, timeout, plan)
     except Exception as exc:  # fail-open: the checker must never block processing
         logger.warning("Semantic check skipped: %s", exc)
         return []
@@ -51,6 +67,8 @@ async def _run_check(
     generated_text: str,
     intake_values: Dict[str, Any],
     context: Dict[str, Any],
+    timeout: float,
+    plan: Optional["GatePlan"] = None,
 ) -> List[Dict[str, Any]]:
     # Resolved at call time, not import time: test_e2e_regressions reloads
     # app.services.llm_service mid-suite, so a bound import could go stale.
@@ -58,29 +76,128 @@ async def _run_check(
 
     if llm.USE_MOCK_LLM or llm.llm_service.claude_backend is None:
         return []  # honest no-op — never fabricate review results
-    prompt = _build_prompt(generated_text, intake_values, context)
-    raw, _tokens, _model = await llm.llm_service.claude_backend.generate(
-        prompt, "semantic_check"
-    )
-    return _to_corrections(parse_llm_json(raw))
+    backend = llm.llm_service.backend_for("semantic_check")
+    windows = text_windows(generated_text)
+    facts = _facts_block(intake_values, context, plan)
 
+    async def check_window(index: int) -> List[Tuple[int, Optional[Tuple[int, int]], Dict[str, Any]]]:
+        start, end = windows[index]
+        excerpt = (index + 1, len(windows)) if len(windows) > 1 else None
+        prompt = _build_prompt(generated_text[start:end], facts, excerpt)
+        raw, _tokens, _model = await backend.generate(prompt, "semantic_check")
+        return [
+            (index, _locate(generated_text, correction["original"], start, end), correction)
+            for correction in _to_corrections(parse_llm_json(raw))
+        ]
 
-def _build_prompt(
-    generated_text: str,
+    tasks = [asyncio.create_task(check_window(i)) for i in range(len(windows))]
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        for task in tasks:
+            task.cancel()
+    if pending:
+        logger.warning(
+            "Semantic check: %d of %d windows missed the %.0fs deadline",
+            len(pending), len(tasks), timeout,
+        )
+    located = []
+    for task in tasks:
+        if task not in done:
+            continue
+        if task.exception() is not None:
+            logger.warning("Semantic check window failed: %s", task.exception())
+            continue
+        located.extend(task.result())
+    return _merge(located)
+
+
+def text_windows(text: str) -> List[Tuple[int, int]]:
+    """(start, end) windows of whole sentences, each up to WINDOW_CHARS long.
+
+    Consecutive windows share WINDOW_OVERLAP_SENTENCES sentences so a claim
+    spanning a boundary is seen whole by at least one window. A sentence
+    longer than WINDOW_CHARS gets a window of its own.
+    """
+    spans = sentence_spans(text)
+    if len(text) <= WINDOW_CHARS or len(spans) <= 1:
+        return [(0, len(text))]
+    windows: List[Tuple[int, int]] = []
+    first = 0
+    while first < len(spans):
+        last = first
+        while last + 1 < len(spans) and spans[last + 1][1] - spans[first][0] <= WINDOW_CHARS:
+            last += 1
+        windows.append((spans[first][0], spans[last][1]))
+        if last == len(spans) - 1:
+            break
+        first = max(first + 1, last + 1 - WINDOW_OVERLAP_SENTENCES)
+    return windows
+
+
+def _locate(text: str, claim: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """Span of `claim` in the full text, searching its window first."""
+    position = text.find(claim, start, end)
+    if position < 0:
+        position = text.find(claim)
+    return (position, position + len(claim)) if position >= 0 else None
+
+
+def _merge(
+    located: List[Tuple[int, Optional[Tuple[int, int]], Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """Drop findings repeated by overlapping windows; order by position.
+
+    Items are (window index, span, correction). The same claim is kept once.
+    A span overlapping one kept from another window is that window's wording
+    of the same finding; overlapping findings from one window are distinct
+    claims and all stay.
+    """
+    located.sort(key=lambda item: item[1] or (float("inf"), 0))
+    merged: List[Dict[str, Any]] = []
+    spans: List[Tuple[int, Tuple[int, int]]] = []
+    claims = set()
+    for window, span, correction in located:
+        key = " ".join(correction["original"].lower().split())
+        if key in claims:
+            continue
+        if span is not None and any(
+            w != window and s < span[1] and span[0] < e for w, (s, e) in spans
+        ):
+            continue
+        claims.add(key)
+        if span is not None:
+            spans.append((window, span))
+        merged.append(correction)
+    return merged[:MAX_FINDINGS]
+
+
+def _facts_block(
     intake_values: Dict[str, Any],
     context: Dict[str, Any],
+    plan: Optional["GatePlan"] = None,
+) -> str:
+    """Profile context then intake, as key: value scalar lines."""
+    lines = [f"{key}: {value}" for key, value in iter_scalars(context or {}) if key]
+    if plan is not None and plan.ctx.intake_values is intake_values:
+        lines += plan.intake_lines
+    else:
+        lines += [f"{key}: {value}" for key, value in iter_scalars(intake_values or {}) if key]
+    return "\n".join(lines) or "(none provided)"
+
+
+def _build_prompt(
+    generated_text: str,
+    facts: str,
+    excerpt: Optional[Tuple[int, int]] = None,
 ) -> str:
-    lines = [
-        f"{key}: {value}"
-        for source in (context or {}, intake_values or {})
-        for key, value in iter_scalars(source)
-        if key
-    ]
-    facts = "\n".join(lines) or "(none provided)"
+    heading = "GENERATED DOCUMENT"
+    if excerpt:
+        heading += f" (excerpt {excerpt[0]} of {excerpt[1]}; the rest is reviewed separately)"
     return (
         "INTAKE DATA (the only permitted source of facts):\n"
         f"{facts}\n\n"
-        "GENERATED DOCUMENT:\n"
+        f"{heading}:\n"
         f"{generated_text}\n\n"
         f"{_INSTRUCTIONS}"
     )
@@ -0,0 +1,123 @@
+"""
+Token accounting shared by every LLM backend.
+
+Whitespace word counts are 30-50% off real tokenizer counts, and they never
+saw prompt-cache reads or writes. Backends now report a TokenUsage built
+from what the provider returned (Anthropic ``usage``, Vertex
+``usage_metadata``, cached-input tokens included). When a provider reports
+nothing (mock mode, older SDKs), a local tokenizer approximation fills in
+and the usage is marked estimated.
+
+TokenUsage is an int — the total tokens the call processed — so it drops
+into the existing (text, tokens, model) tuples, tokens_used fields and
+sum()s unchanged, while cost tracking reads the breakdown.
+"""
+import re
+from typing import Any, Dict, Optional
+
+# Word pieces and single punctuation marks; long words split every ~4 chars,
+# which tracks BPE tokenizers on English prose far better than str.split()
+_TOKEN_PIECE = re.compile(r"\w+|[^\w\s]")
+_CHARS_PER_TOKEN = 4
+
+# Price of cache traffic relative to a plain input token
+CACHE_WRITE_WEIGHT = 1.25
+CACHE_READ_WEIGHT = 0.1
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Tokenizer approximation for text no provider has counted."""
+    return sum(
+        -(-len(piece) // _CHARS_PER_TOKEN)
+        for piece in _TOKEN_PIECE.findall(text or "")
+    )
+
+
+def _count(value: Any) -> int:
+    # SDK fields are ints or None; anything else (e.g. an unset mock) is 0
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+class TokenUsage(int):
+    """Usage of one LLM call; its int value is the total tokens processed."""
+
+    def __new__(
+        cls,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_input_tokens: int = 0,
+        cache_creation_input_tokens: int = 0,
+        estimated: bool = False,
+    ):
+        total = input_tokens + output_tokens + cache_read_input_tokens + cache_creation_input_tokens
+        usage = super().__new__(cls, total)
+        usage.input_tokens = input_tokens
+        usage.output_tokens = output_tokens
+        usage.cache_read_input_tokens = cache_read_input_tokens
+        usage.cache_creation_input_tokens = cache_creation_input_tokens
+        usage.estimated = estimated
+        return usage
+
+    @classmethod
+    def from_anthropic(cls, usage: Any) -> "TokenUsage":
+        """From a Messages API ``usage`` block (input_tokens excludes cache traffic)."""
+        return cls(
+            input_tokens=_count(getattr(usage, "input_tokens", 0)),
+            output_tokens=_count(getattr(usage, "output_tokens", 0)),
+            cache_read_input_tokens=_count(getattr(usage, "cache_read_input_tokens", 0)),
+            cache_creation_input_tokens=_count(getattr(usage, "cache_creation_input_tokens", 0)),
+        )
+
+    @classmethod
+    def from_vertex(cls, metadata: Any) -> Optional["TokenUsage"]:
+        """From Gemini ``usage_metadata``; None when the response carried none.
+
+        prompt_token_count includes cached_content_token_count, so the
+        cached part is split out rather than counted twice.
+        """
+        prompt = _count(getattr(metadata, "prompt_token_count", 0))
+        output = _count(getattr(metadata, "candidates_token_count", 0))
+        if not prompt and not output:
+            return None
+        cached = min(_count(getattr(metadata, "cached_content_token_count", 0)), prompt)
+        return cls(
+            input_tokens=prompt - cached,
+            output_tokens=output,
+            cache_read_input_tokens=cached,
+        )
+
+    @classmethod
+    def estimate(cls, prompt: str, completion: str = "") -> "TokenUsage":
+        return cls(
+            input_tokens=estimate_tokens(prompt),
+            output_tokens=estimate_tokens(completion),
+            estimated=True,
+        )
+
+    @property
+    def billable_tokens(self) -> int:
+        """Input-token equivalents: cache writes cost more, cache reads far less."""
+        return round(
+            self.input_tokens
+            + self.output_tokens
+            + self.cache_creation_input_tokens * CACHE_WRITE_WEIGHT
+            + self.cache_read_input_tokens * CACHE_READ_WEIGHT
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_input_tokens": self.cache_read_input_tokens,
+            "cache_creation_input_tokens": self.cache_creation_input_tokens,
+            "estimated": self.estimated,
+        }
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"TokenUsage({fields})"
+
+
+def request_token_estimate(prompt: str, max_output_tokens: int) -> int:
+    """Pre-call budget estimate: the prompt plus the most the model may write."""
+    return estimate_tokens(prompt) + max_output_tokens
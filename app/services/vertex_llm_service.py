@@ -3,13 +3,18 @@ Vertex AI LLM Service for GCP integration
 """
 import os
 import json
-from typing import Dict, Any, Optional
-from vertexai import init
-from vertexai.generative_models import GenerativeModel, ChatSession
-import vertexai.preview.generative_models as generative_models
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    from vertexai.generative_models import ChatSession
 
 class VertexLLMService:
     def __init__(self):
+        # The SDK is slow to import; load it with the first instance
+        from vertexai import init
+        from vertexai.generative_models import GenerativeModel
+        import vertexai.preview.generative_models as generative_models
+
         # Initialize Vertex AI with project and location
         project = os.getenv("GOOGLE_CLOUD_PROJECT", "california-motion-writer")
         location = os.getenv("VERTEX_AI_LOCATION", "us-central1")
@@ -97,11 +102,11 @@ class VertexLLMService:
             "raw_response": response
         }
 
-    def create_chat_session(self) -> ChatSession:
+    def create_chat_session(self) -> "ChatSession":
         """Create a new chat session for conversational interactions"""
         return self.model.start_chat(history=[])
 
-    def send_chat_message(self, session: ChatSession, message: str) -> str:
+    def send_chat_message(self, session: "ChatSession", message: str) -> str:
         """Send a message in an existing chat session"""
         try:
             response = session.send_message(
@@ -9,6 +9,7 @@ from pathlib import Path
 import logging
 
 from app.services.pdf_service import PDFService
+from app.services.llm_clients import llm_clients
 from app.services.llm_service import LLMService
 from app.models.motion import Motion, MotionType
 
@@ -19,7 +20,7 @@ class ViolationFilingService:
 
     def __init__(self):
         self.pdf_service = PDFService()
-        self.llm_service = LLMService()
+        self.llm_service = llm_clients.shared(LLMService)
         self.forms_dir = Path("forms/san-diego-violation")
         self.config = self._load_config()
 
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Citation scan time for the authority stripper on large synthetic declarations.
+
+"whole-text" runs every citation pattern over the full text (the previous
+scanner); "anchored" is _citation_spans, which finds each pattern's anchor
+literals with str.find and runs the pattern only in the windows around them.
+Both must find the same citations; the script checks that before timing.
+The last column is the full strip_authority pass with the anchored scanner.
+
+    python scripts/citation_benchmark.py [--sentences 2000 8000 32000] [--density 0.05 0.3] [--runs 5] [--json]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.fact_gate import GateContext  # noqa: E402
+from app.services.fact_gate import authority_strip  # noqa: E402
+
+CITATIONS = [
+    "(Fam. Code, § 3011.)",
+    "pursuant to Family Code section 4055",
+    "In re Marriage of Brown (1976) 15 Cal.3d 838",
+    "Smith v. Jones (2001) 25 Cal.4th 100",
+    "San Diego Superior Court Local Rule 5.1.2",
+    "California Rules of Court, rule 5.92(a)",
+    "under Code of Civil Procedure section 527.6",
+    "Welfare and Institutions Code section 300",
+]
+SENTENCES = [
+    "Respondent did not return the children until 9:40 p.m. on Sunday.",
+    "I asked Respondent in writing to follow the custody schedule.",
+    "In November the exchange happened at the school instead of my home.",
+    "My daughter was upset after the visit and did not sleep that night.",
+    "The court should order that exchanges take place at the police station.",
+]
+
+
+def build_declaration(sentences: int, density: float, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    out = []
+    for n in range(sentences):
+        sentence = rng.choice(SENTENCES)
+        if rng.random() < density:
+            sentence = f"{sentence[:-1]} {rng.choice(CITATIONS)}."
+        out.append(sentence)
+        if n % 6 == 5:
+            out.append("\n\n")
+    return " ".join(out)
+
+
+def whole_text_spans(text: str) -> list:
+    return [(m.start(), m.end()) for rx, _ in authority_strip._CITATIONS for m in rx.finditer(text)]
+
+
+def median_ms(fn, text: str, runs: int) -> float:
+    fn(text)  # warm regex caches
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(text)
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings) * 1000, 2)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sentences", type=int, nargs="+", default=[2000, 8000, 32000])
+    parser.add_argument("--density", type=float, nargs="+", default=[0.05, 0.3],
+                        help="fraction of sentences carrying a citation")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    ctx = GateContext()
+    rows = []
+    for density in args.density:
+        for sentences in args.sentences:
+            text = build_declaration(sentences, density)
+            merge = authority_strip._merge_spans
+            # Same citations both ways, or the comparison is meaningless
+            assert merge(whole_text_spans(text)) == merge(authority_strip._citation_spans(text))
+            whole = median_ms(whole_text_spans, text, args.runs)
+            anchored = median_ms(authority_strip._citation_spans, text, args.runs)
+            rows.append({
+                "chars": len(text),
+                "density": density,
+                "citations": len(merge(whole_text_spans(text))),
+                "whole_text_ms": whole,
+                "anchored_ms": anchored,
+                "speedup": round(whole / anchored, 2),
+                "strip_authority_ms": median_ms(
+                    lambda t: authority_strip.strip_authority(t, set(), ctx), text, args.runs
+                ),
+            })
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'chars':>9} {'density':>7} {'cites':>6} {'whole-text':>11} {'anchored':>9} "
+              f"{'speedup':>7} {'strip':>9}")
+        for row in rows:
+            print(f"{row['chars']:>9} {row['density']:>7} {row['citations']:>6} "
+                  f"{row['whole_text_ms']:>9}ms {row['anchored_ms']:>7}ms "
+                  f"{row['speedup']:>6}x {row['strip_authority_ms']:>7}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
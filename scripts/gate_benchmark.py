@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Per-section fact-gate time with and without a compiled GatePlan.
+
+Gates the sections of a synthetic motion against one context, the way
+/process-motion does: "per-call" rebuilds allowed facts and patterns for
+every section (run_fact_gate(text, ctx)); "plan" compiles them once per
+motion and reuses them (run_fact_gate(text, ctx, plan)). Plan compile time
+is included in the plan figures.
+
+--scaling instead gates one section of growing length and reports the cost
+per character, which stays flat when every pass is linear in the text.
+--regate edits one word in the middle of ever longer gated sections and
+compares gating the edited text in full with regate().
+--many gates a 200-section corpus one section at a time and through
+run_fact_gate_many's worker pool (FACT_GATE_WORKERS = 1, 2, 4, ... CPUs).
+
+    python scripts/gate_benchmark.py [--sections 8] [--intake-fields 200] [--runs 50] [--json]
+    python scripts/gate_benchmark.py --scaling [--json]
+    python scripts/gate_benchmark.py --regate [--json]
+    python scripts/gate_benchmark.py --many [--sections 200] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.fact_gate import (  # noqa: E402
+    GateContext,
+    compile_gate_plan,
+    regate,
+    run_fact_gate,
+    run_fact_gate_many,
+    shutdown_gate_pool,
+)
+from app.services.fact_gate import batch  # noqa: E402
+
+SECTION_TEMPLATE = (
+    "2.{n} Petitioner is Maria Delgado and Respondent is Jacob Delgado. "
+    "On June {day}, 2026 Respondent did not return Sofia Delgado (age 8) and "
+    "Mateo Delgado (age 5) until 9:40 p.m. Order child support of $450 per month. "
+    "Jacob Delgado, the Respondent, has missed {n} exchanges since March 3, 2026. "
+    "I attempted to reach Respondent on multiple occasions.\n\n"
+)
+
+
+def build_context(intake_fields: int) -> GateContext:
+    intake = {
+        f"step_{i}": {
+            "description": f"Event {i} happened on June {i % 28 + 1}, 2026 at 123 Main Street.",
+            "support_amount": f"${100 + i}",
+            "notes": ["late return", f"call on {i % 12 + 1}/{i % 28 + 1}/2026"],
+        }
+        for i in range(intake_fields)
+    }
+    return GateContext(
+        party_name="Maria Delgado",
+        other_party_name="Jacob Delgado",
+        children=[
+            {"name": "Sofia Delgado", "date_of_birth": "2018-03-22"},
+            {"name": "Mateo Delgado", "dob": "2020-11-05"},
+        ],
+        intake_values=intake,
+        profile_addresses=["456 Oak Avenue, San Diego"],
+        today=date(2026, 7, 11),
+    )
+
+
+def time_motion(ctx: GateContext, sections: list, use_plan: bool) -> float:
+    """Seconds to gate every section of one motion."""
+    start = time.perf_counter()
+    plan = compile_gate_plan(ctx) if use_plan else None
+    for n, text in enumerate(sections):
+        ctx.section_name = f"section_{n}"
+        run_fact_gate(text, ctx, plan)
+    return time.perf_counter() - start
+
+
+def scaling_report(ctx: GateContext) -> list:
+    """Microseconds per character gating ever longer sections with many edits."""
+    plan = compile_gate_plan(ctx)
+    rows = []
+    for sentences in (250, 1000, 4000, 16000):
+        # An unknown amount and a flagged phrase in every sentence: one edit each
+        text = " ".join(
+            f"He paid ${900 + n % 50} on multiple occasions." for n in range(sentences)
+        )
+        run_fact_gate(text, ctx, plan)
+        start = time.perf_counter()
+        run_fact_gate(text, ctx, plan)
+        elapsed = time.perf_counter() - start
+        rows.append({
+            "chars": len(text),
+            "ms": round(elapsed * 1000, 1),
+            "us_per_char": round(elapsed * 1e6 / len(text), 2),
+        })
+    return rows
+
+
+def regate_report(ctx: GateContext) -> list:
+    """Full gate vs regate() after a one-word edit, as the section grows."""
+    plan = compile_gate_plan(ctx)
+    rows = []
+    for paragraphs in (50, 500, 5000):
+        text = "\n\n".join(
+            SECTION_TEMPLATE.format(n=n, day=n % 28 + 1).strip() for n in range(paragraphs)
+        )
+        previous = run_fact_gate(text, ctx, plan)
+        middle = previous.text.index("exchanges since", len(previous.text) // 2)
+        edited = previous.text[:middle] + "visits" + previous.text[middle + len("exchanges"):]
+        # Same text both ways, or the comparison is meaningless
+        assert regate(previous, edited, ctx, plan).text == run_fact_gate(edited, ctx, plan).text
+        start = time.perf_counter()
+        run_fact_gate(edited, ctx, plan)
+        full = time.perf_counter() - start
+        start = time.perf_counter()
+        regate(previous, edited, ctx, plan)
+        incremental = time.perf_counter() - start
+        rows.append({
+            "chars": len(text),
+            "corrections": len(previous.corrections),
+            "full_ms": round(full * 1000, 1),
+            "regate_ms": round(incremental * 1000, 2),
+        })
+    return rows
+
+
+def many_report(ctx: GateContext, sections: int) -> list:
+    """Seconds to gate a corpus one by one and across 1, 2, 4, ... workers."""
+    plan = compile_gate_plan(ctx)
+    texts = [SECTION_TEMPLATE.format(n=n, day=n % 28 + 1) * (1 + n % 5) for n in range(sections)]
+    names = [f"section_{n}" for n in range(sections)]
+    start = time.perf_counter()
+    expected = []
+    for text, name in zip(texts, names):
+        ctx.section_name = name
+        expected.append(run_fact_gate(text, ctx, plan))
+    ctx.section_name = ""
+    rows = [{"workers": "one by one", "seconds": round(time.perf_counter() - start, 3)}]
+    batch.FACT_GATE_POOL_MIN_CHARS = 0
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        batch.FACT_GATE_WORKERS = workers
+        shutdown_gate_pool()
+        run_fact_gate_many(texts[:workers * 4], ctx, plan)  # start the workers
+        start = time.perf_counter()
+        results = run_fact_gate_many(texts, ctx, plan, names)
+        rows.append({"workers": workers, "seconds": round(time.perf_counter() - start, 3)})
+        # Same results both ways, or the comparison is meaningless
+        assert results == expected
+        workers *= 2
+    shutdown_gate_pool()
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, help="default 8, or 200 with --many")
+    parser.add_argument("--intake-fields", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--scaling", action="store_true",
+                        help="report cost per character as one section grows")
+    parser.add_argument("--regate", action="store_true",
+                        help="compare a full gate with regate() after a small edit")
+    parser.add_argument("--many", action="store_true",
+                        help="gate a corpus one by one and across the worker pool")
+    args = parser.parse_args()
+
+    ctx = build_context(args.intake_fields)
+    if args.sections is None:
+        args.sections = 200 if args.many else 8
+    if args.scaling:
+        rows = scaling_report(ctx)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            for row in rows:
+                print(f"{row['chars']:>8} chars : {row['ms']:>8} ms  {row['us_per_char']} us/char")
+        return 0
+    if args.regate:
+        rows = regate_report(ctx)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            for row in rows:
+                print(f"{row['chars']:>8} chars, {row['corrections']:>6} corrections : "
+                      f"full {row['full_ms']:>8} ms  regate {row['regate_ms']:>6} ms")
+        return 0
+    if args.many:
+        rows = many_report(ctx, args.sections)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            for row in rows:
+                print(f"{row['workers']:>10} : {row['seconds']} s")
+        return 0
+    sections = [SECTION_TEMPLATE.format(n=n, day=n % 28 + 1) * 3 for n in range(args.sections)]
+    # Same output both ways, or the comparison is meaningless
+    plan = compile_gate_plan(ctx)
+    assert all(run_fact_gate(s, ctx, plan) == run_fact_gate(s, ctx) for s in sections)
+
+    timings = {}
+    for label, use_plan in (("per_call", False), ("plan", True)):
+        time_motion(ctx, sections, use_plan)  # warm regex and import caches
+        runs = [time_motion(ctx, sections, use_plan) for _ in range(args.runs)]
+        timings[label] = statistics.median(runs) / args.sections * 1000
+
+    report = {
+        "sections": args.sections,
+        "intake_fields": args.intake_fields,
+        "runs": args.runs,
+        "per_call_ms_per_section": round(timings["per_call"], 3),
+        "plan_ms_per_section": round(timings["plan"], 3),
+        "speedup": round(timings["per_call"] / timings["plan"], 2),
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"per-section gate, rebuilt per call : {report['per_call_ms_per_section']} ms")
+        print(f"per-section gate, shared plan      : {report['plan_ms_per_section']} ms")
+        print(f"speedup                            : {report['speedup']}x "
+              f"({args.sections} sections, {args.intake_fields} intake steps)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Reproducible synthetic declarations for fact-gate benchmarks.
+
+build_corpus(seed) returns short (a paragraph or two), typical (a full
+declaration section) and long (a whole declaration in one section)
+documents written the way the LLM drafts them: markdown headings and bold
+names, party-role sentences, unfilled placeholders, support amounts and
+incident dates (most from the intake answers in CONTEXT, some not), child
+ages (some stale), statute and case citations, and the occasional
+quantifier or advice phrase. Every pass of the gate has work to do, in
+roughly the proportions real drafts give it.
+
+The same seed always gives the same corpus; digest() fingerprints it so a
+stored timing baseline is only compared against the corpus it was taken on.
+
+    python scripts/gate_corpus.py [--seed 2026] [--out DIR]   # write the corpus as .md files
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+from datetime import date
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.fact_gate import GateContext  # noqa: E402
+
+SEED = 2026
+SIZES = {"short": (40, 1, 2), "typical": (12, 10, 18), "long": (2, 350, 400)}  # docs, paragraphs
+
+CONTEXT = GateContext(
+    motion_kind="rfo_section",
+    party_name="Maria Delgado",
+    other_party_name="Jacob Delgado",
+    is_petitioner=True,
+    case_number="24FL009812N",
+    county="San Diego",
+    children=[
+        {"name": "Sofia Delgado", "date_of_birth": "2018-03-22"},
+        {"name": "Mateo Delgado", "dob": "2020-11-05"},
+    ],
+    intake_values={
+        "support_amount": "$450",
+        "arrears_amount": "$1,350.00",
+        "monthly_income": "3200",
+        "childcare_cost": "$85",
+        "violation_dates": "June 20, 2026; July 4, 2026",
+        "incident_date": "2026-06-14",
+        "last_exchange": "05/02/2026",
+        "home_address": "1420 Alvarado Street, San Diego",
+    },
+    profile_addresses=["1420 Alvarado Street, San Diego"],
+    today=date(2026, 7, 11),
+)
+
+KNOWN_AMOUNTS = ["$450", "$1,350.00", "$85"]
+KNOWN_DATES = ["June 20, 2026", "July 4, 2026", "June 14, 2026", "5/2/2026"]
+CHILDREN = [("Sofia Delgado", "Sofia", 8), ("Mateo Delgado", "Mateo", 5)]
+HEADINGS = ["Custody Exchanges", "Child Support", "Facts Supporting This Request",
+            "The Children's Schedule", "Communication With Respondent"]
+CITATIONS = [
+    "(Fam. Code, § 3011.)",
+    "pursuant to Family Code section 4055",
+    "In re Marriage of Brown (1976) 15 Cal.3d 838",
+    "Montenegro v. Diaz (2001) 26 Cal.4th 249",
+    "San Diego Superior Court Local Rule 5.1.2",
+    "California Rules of Court, rule 5.92(a)",
+]
+WITNESSES = ["Ms. Alvarez, the school counselor", "My sister, Elena Ruiz",
+             "Officer Grant of the San Diego Police Department", "Our neighbor, Tom Whitfield"]
+ROLE_SENTENCES = [
+    "Petitioner is Maria Delgado and Respondent is Jacob Delgado.",
+    "Petitioner is Maria Delgado and Respondent is Jacob Delgado.",
+    "Petitioner is **Jacob Delgado** and Respondent is Maria Delgado.",  # swapped
+    "Jacob Delgado, the Petitioner, filed the original custody request.",  # swapped
+]
+
+
+def _amount(rng: random.Random) -> str:
+    if rng.random() < 0.9:
+        return rng.choice(KNOWN_AMOUNTS)
+    return f"${rng.randint(1, 4)},{rng.randint(0, 999):03d}"
+
+
+def _date(rng: random.Random) -> str:
+    if rng.random() < 0.9:
+        return rng.choice(KNOWN_DATES)
+    return f"{rng.choice(['March', 'April', 'May', 'August'])} {rng.randint(1, 28)}, 2026"
+
+
+def _age(rng: random.Random, actual: int) -> int:
+    return actual if rng.random() < 0.8 else actual - rng.randint(1, 2)
+
+
+def _paragraph(rng: random.Random) -> str:
+    full, first, age = rng.choice(CHILDREN)
+    kind = rng.random()
+    if kind < 0.2:
+        return (
+            f"On {_date(rng)}, Respondent did not return {full} until 9:40 p.m., "
+            f"{rng.randint(2, 5)} hours after the scheduled exchange at my home. "
+            f"{rng.choice(WITNESSES)} was present and saw {first} crying."
+        )
+    if kind < 0.35:
+        return (
+            f"**Jacob Delgado** was ordered to pay {_amount(rng)} per month in child support. "
+            f"Since {_date(rng)} he has paid only {_amount(rng)}, and the arrears are now "
+            f"{_amount(rng)}. Childcare costs me {_amount(rng)} a week."
+        )
+    if kind < 0.5:
+        return (
+            f"{full} is age {_age(rng, age)} and attends Lincoln Elementary. "
+            f"{first} has been {_age(rng, age)} years old since {_date(rng)}, and "
+            f"the school reports {first} missed {rng.randint(2, 9)} days after weekend visits."
+        )
+    if kind < 0.62:
+        return (
+            f"The court may modify custody when it is in the children's best interest "
+            f"{rng.choice(CITATIONS)}. Respondent's conduct has not changed in the past "
+            f"{rng.randint(2, 4)} years."
+        )
+    if kind < 0.72:
+        return (
+            f"{rng.choice(ROLE_SENTENCES)} [PETITIONER'S FULL LEGAL NAME] declares as "
+            "follows: I am the mother of the minor children and have cared for them since birth."
+        )
+    if kind < 0.82:
+        return (
+            f"I asked Respondent on multiple occasions to follow the schedule, and he "
+            f"repeatedly refused. {rng.choice(['You should consider', 'I recommend'])} "
+            f"keeping a written log of every exchange."
+        )
+    if kind < 0.9:
+        events = ["late return", "missed exchange", "no call"]
+        rows = "\n".join(
+            f"| {_date(rng)} | {rng.choice(events)} |" for _ in range(rng.randint(2, 5))
+        )
+        return f"| Date | What happened |\n|---|---|\n{rows}"
+    return (
+        f"- {rng.choice(WITNESSES)} can confirm the exchange on {_date(rng)}.\n"
+        f"- Respondent lives at 88 Pine Court, about {rng.randint(5, 40)} miles away.\n"
+        f"- I earn $3,200 a month and pay {_amount(rng)} for childcare."
+    )
+
+
+def _document(rng: random.Random, paragraphs: int) -> str:
+    parts: List[str] = []
+    for n in range(paragraphs):
+        if n % 8 == 0 and paragraphs > 2:
+            parts.append(f"### {rng.choice(HEADINGS)}")
+        parts.append(f"{n + 1}. {_paragraph(rng)}" if paragraphs > 2 else _paragraph(rng))
+    return "\n\n".join(parts)
+
+
+def build_corpus(seed: int = SEED) -> Dict[str, List[str]]:
+    """{"short": [...], "typical": [...], "long": [...]}, the same for a given seed."""
+    rng = random.Random(seed)
+    return {
+        size: [_document(rng, rng.randint(low, high)) for _ in range(count)]
+        for size, (count, low, high) in SIZES.items()
+    }
+
+
+def digest(corpus: Dict[str, List[str]]) -> str:
+    sha = hashlib.sha256()
+    for size in sorted(corpus):
+        for text in corpus[size]:
+            sha.update(size.encode())
+            sha.update(text.encode())
+    return sha.hexdigest()[:16]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--out", help="write each document to DIR/<size>_<n>.md")
+    args = parser.parse_args()
+    corpus = build_corpus(args.seed)
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        for size, texts in corpus.items():
+            for n, text in enumerate(texts):
+                path = os.path.join(args.out, f"{size}_{n:02d}.md")
+                with open(path, "w", encoding="utf-8") as fh:
+                    fh.write(text)
+    for size, texts in corpus.items():
+        lengths = [len(text) for text in texts]
+        print(f"{size:<8} {len(texts):>3} docs  {min(lengths):>7}-{max(lengths):<7} chars")
+    print(f"digest {digest(corpus)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
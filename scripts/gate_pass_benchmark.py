@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Per-pass fact-gate timing on the synthetic declaration corpus, with an
+opt-in regression check against a stored baseline.
+
+Gates every document of scripts/gate_corpus.py (short, typical and long
+declarations) the way run_fact_gate does, timing each pass on its own:
+segment (the shared sentence segmentation), markdown, authority,
+placeholder, party, amounts, dates, ages and flags. Reports milliseconds
+per document for each pass and corpus size, best of --runs (the least
+disturbed run, as timeit does). The pass loop is checked against
+run_fact_gate first; a mismatch aborts the run.
+
+--save-baseline writes the figures to the baseline file. --check compares
+against it and exits 1 when any pass is more than --tolerance slower (plus
+--slack-ms for timer noise on the shortest passes). Timings are scaled by a
+fixed calibration workload run before every measured run; the best
+calibration and the best runs come from the same stretch of time, so a
+busy or throttled machine slows both alike.
+
+The committed scripts/gate_pass_baseline.json was taken on a single-CPU
+container and is only indicative: calibration corrects for overall machine
+speed, not for differences in caches or Python builds. For a check that
+means something, take the baseline with --save-baseline on the machine
+that runs --check. The baseline records the corpus digest and --check
+refuses to compare against a different corpus.
+
+    python scripts/gate_pass_benchmark.py [--runs 9] [--json]
+    python scripts/gate_pass_benchmark.py --save-baseline [--baseline PATH]
+    python scripts/gate_pass_benchmark.py --check [--tolerance 1.0] [--slack-ms 0.1]
+"""
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS))
+
+from app.services.fact_gate import GateContext, compile_gate_plan, gate, run_fact_gate  # noqa: E402
+from app.services.fact_gate.plan import GatePlan  # noqa: E402
+from app.services.fact_gate.segments import SegmentedText  # noqa: E402
+from gate_corpus import CONTEXT, build_corpus, digest  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(SCRIPTS, "gate_pass_baseline.json")
+
+# gate._passes() correction type -> report label
+PASS_LABELS = {
+    "markdown": "markdown",
+    "authority_removed": "authority",
+    "placeholder_filled": "placeholder",
+    "party_role": "party",
+    "amount": "amounts",
+    "date": "dates",
+    "age": "ages",
+    "upl_flag": "flags",
+}
+
+Timings = Dict[str, Dict[str, float]]  # size -> pass -> ms per document
+
+
+def time_passes(text: str, ctx: GateContext, plan: GatePlan) -> Tuple[str, Dict[str, float]]:
+    """run_fact_gate's pass loop with each pass timed; (gated text, seconds by pass)."""
+    timings = {}
+    start = time.perf_counter()
+    doc = SegmentedText(text)
+    doc.spans
+    timings["segment"] = time.perf_counter() - start
+    for _, correction_type, gate_pass in gate._passes(ctx, plan):
+        start = time.perf_counter()
+        current, _ = gate_pass(doc)
+        doc = doc.derive(current)
+        timings[PASS_LABELS.get(correction_type, correction_type)] = time.perf_counter() - start
+    return doc.text, timings
+
+
+_CALIBRATION_TEXT = "Respondent paid $450 on June 20, 2026 and again on July 4. " * 4000
+
+
+def calibrate() -> float:
+    """Milliseconds for one fixed regex-and-string workload."""
+    start = time.perf_counter()
+    re.findall(r"\$\d+|\b[A-Z]\w+\b", _CALIBRATION_TEXT)
+    " ".join(sorted(_CALIBRATION_TEXT.split()))
+    return (time.perf_counter() - start) * 1000
+
+
+def measure(corpus: Dict[str, List[str]], runs: int) -> Tuple[Timings, float]:
+    """(best-of-runs ms per document, best calibration ms taken between the runs)."""
+    plan = compile_gate_plan(CONTEXT)
+    calibrations: List[float] = []
+    for texts in corpus.values():
+        for text in texts:
+            # Same text both ways, or the timings don't describe the gate
+            assert time_passes(text, CONTEXT, plan)[0] == run_fact_gate(text, CONTEXT, plan).text
+    report: Timings = {}
+    for size, texts in corpus.items():
+        per_run: List[Dict[str, float]] = []
+        for _ in range(runs):
+            calibrations.append(calibrate())
+            totals: Dict[str, float] = defaultdict(float)
+            for text in texts:
+                for label, seconds in time_passes(text, CONTEXT, plan)[1].items():
+                    totals[label] += seconds
+            totals["total"] = sum(totals.values())
+            per_run.append(totals)
+        report[size] = {
+            label: round(min(run[label] for run in per_run) * 1000 / len(texts), 4)
+            for label in per_run[0]
+        }
+    return report, min(calibrations)
+
+
+def regressions(report: Timings, calibration_ms: float, baseline: dict,
+                tolerance: float, slack_ms: float) -> List[str]:
+    scale = calibration_ms / baseline["calibration_ms"]
+    found = []
+    for size, passes in baseline["ms_per_doc"].items():
+        for label, base_ms in passes.items():
+            now_ms = report.get(size, {}).get(label)
+            if now_ms is None:
+                continue
+            limit = base_ms * scale * (1 + tolerance) + slack_ms
+            if now_ms > limit:
+                found.append(f"{size}/{label}: {now_ms:.3f} ms per doc, limit {limit:.3f} "
+                             f"(baseline {base_ms:.3f} x {scale:.2f} machine speed)")
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write this run's figures to the baseline file")
+    parser.add_argument("--check", action="store_true",
+                        help="exit 1 if a pass regressed past the baseline")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="allowed slowdown as a fraction of the baseline")
+    parser.add_argument("--slack-ms", type=float, default=0.1,
+                        help="absolute allowance per document, for timer noise")
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    report, calibration_ms = measure(corpus, args.runs)
+    chars = {size: sum(map(len, texts)) // len(texts) for size, texts in corpus.items()}
+    if args.json:
+        print(json.dumps({"calibration_ms": round(calibration_ms, 3), "chars_per_doc": chars,
+                          "ms_per_doc": report}, indent=2))
+    else:
+        sizes = list(report)
+        print(f"{'ms per doc':<12}" + "".join(f"{size:>12}" for size in sizes))
+        print(f"{'(chars)':<12}" + "".join(f"{chars[size]:>12}" for size in sizes))
+        for label in report[sizes[0]]:
+            print(f"{label:<12}" + "".join(f"{report[size][label]:>12.3f}" for size in sizes))
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump({
+                "corpus": digest(corpus),
+                "calibration_ms": round(calibration_ms, 3),
+                "ms_per_doc": report,
+            }, fh, indent=2)
+            fh.write("\n")
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+    if args.check:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        if baseline.get("corpus") != digest(corpus):
+            print("the corpus changed since the baseline was taken; re-run with --save-baseline",
+                  file=sys.stderr)
+            return 1
+        found = regressions(report, calibration_ms, baseline, args.tolerance, args.slack_ms)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if found:
+            return 1
+        print("no pass regressed past the baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
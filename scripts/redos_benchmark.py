@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Adversarial-input benchmark for the fact gate: fails if any input makes the
+gate superlinear or slow.
+
+Every case is a pathological shape for one of the gate's patterns or for
+the per-match work around them (long whitespace runs, unclosed ** and [,
+comma chains after a $, a sentence holding thousands of "5 years" or
+"numerous", and so on), plus seeded random mixes of all of those tokens.
+Each case is gated at --size and at 4x --size characters, first as the LLM
+text and then as intake answers (compile_gate_plan + a normal section).
+
+A case fails when the 4x input takes more than --max-growth times as long
+as the smaller one (plus --slack seconds for timer noise), or more than
+--max-seconds at all. A linear gate grows about 4x; a quadratic one 16x.
+The per-pass time budget is disabled while measuring, so a slow pass shows
+up as slow instead of being skipped.
+
+    python scripts/redos_benchmark.py [--size 25000] [--fuzz-seeds 5] [--json]
+
+Exits 1 if any case fails.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.fact_gate import GateContext, compile_gate_plan, run_fact_gate  # noqa: E402
+from app.services.fact_gate import gate  # noqa: E402
+
+SECTION = (
+    "Petitioner is Maria Delgado and Respondent is Jacob Delgado. On June 20, 2026 "
+    "Respondent did not return Sofia Delgado (age 8) until 9:40 p.m. Order child "
+    "support of $450 per month.\n\n"
+)
+
+# name -> text of about n characters
+CASES = {
+    "bare_years": lambda n: "5 years " * (n // 8),
+    "amounts_then_support": lambda n: "$5 " * (n // 3) + "child support",
+    "quantifiers": lambda n: "numerous " * (n // 9),
+    "names_and_ages": lambda n: "Sofia age 5 " * (n // 12),
+    "unclosed_bold": lambda n: "**" + "a" * n,
+    "stars": lambda n: "*" * n,
+    "underscores": lambda n: "__a" * (n // 3),
+    "pipes": lambda n: "|" * n,
+    "table_lines": lambda n: "| a | b |\n" * (n // 10),
+    "unclosed_placeholders": lambda n: "[A" * (n // 2),
+    "charrefs": lambda n: "&#" * (n // 2),
+    "hashes": lambda n: "#" * n,
+    "month_then_spaces": lambda n: "June 1" + " " * n + "x",
+    "months": lambda n: "June " * (n // 5),
+    "digits": lambda n: "1" * n,
+    "slashes": lambda n: "1/" * (n // 2),
+    "dollar_commas": lambda n: "$1" + ",111" * (n // 4),
+    "open_parens": lambda n: "(" * n,
+    "case_names": lambda n: "Aa v. " * (n // 6),
+    "in_re": lambda n: "In re " * (n // 6),
+    "code_sections": lambda n: "Family Code section 1" + "(a)" * (n // 3),
+    "role_then_spaces": lambda n: "Petitioner" + " " * n + "x",
+    "name_parens": lambda n: "Maria Delgado (" * (n // 15),
+    "capitalized_words": lambda n: "12 Aa Bb Cc " * (n // 12),
+    "spaces": lambda n: " " * n,
+    "newlines": lambda n: "\n" * n,
+    "nbsp": lambda n: "\xa0" * n,
+    "mojibake": lambda n: "â€" * (n // 2),
+}
+
+# The pieces the cases are built from, for the random mixes
+FUZZ_TOKENS = [
+    "5 years ", "$5 ", "$1,111", ",111", "child support ", "numerous ", "Sofia ", "age 5 ",
+    "**", "__", "*", "_", "`", "|", "| a |\n", "[A", "]", "&#", "&", "#", "June ", "1",
+    "/", "(", ")", "(a)", "v. ", "In re ", "Fam. Code section ", "Petitioner ",
+    "Maria Delgado ", "Aa ", " ", "   ", "\n", "\n\n", ". ", "\xa0", "â€", "for ",
+]
+
+CTX = GateContext(
+    party_name="Maria Delgado",
+    other_party_name="Jacob Delgado",
+    children=[
+        {"name": "Sofia Delgado", "date_of_birth": "2018-03-22"},
+        {"name": "Mateo Delgado", "dob": "2020-11-05"},
+    ],
+    intake_values={"support_amount": "$450", "hearing": "June 20, 2026", "address": "12 Oak Street"},
+    today=date(2026, 7, 11),
+)
+
+
+def fuzz_case(seed: int):
+    def build(n: int) -> str:
+        rng = random.Random(seed)
+        pieces, length = [], 0
+        while length < n:
+            piece = rng.choice(FUZZ_TOKENS) * rng.choice([1, 1, 1, 8, 64])
+            pieces.append(piece)
+            length += len(piece)
+        return "".join(pieces)[:n]
+    return build
+
+
+def time_text(text: str, plan) -> float:
+    start = time.perf_counter()
+    run_fact_gate(text, CTX, plan)
+    return time.perf_counter() - start
+
+
+def time_intake(text: str) -> float:
+    ctx = GateContext(
+        party_name=CTX.party_name,
+        other_party_name=CTX.other_party_name,
+        children=CTX.children,
+        intake_values={**CTX.intake_values, "notes": text, "support_amount": text},
+        today=CTX.today,
+    )
+    start = time.perf_counter()
+    run_fact_gate(SECTION, ctx, compile_gate_plan(ctx))
+    return time.perf_counter() - start
+
+
+def run(size: int, fuzz_seeds: int, max_growth: float, slack: float, max_seconds: float) -> list:
+    gate.FACT_GATE_PASS_BUDGET_SECONDS = 0
+    plan = compile_gate_plan(CTX)
+    cases = dict(CASES)
+    cases.update({f"fuzz_{seed}": fuzz_case(seed) for seed in range(fuzz_seeds)})
+    rows = []
+    for name, build in cases.items():
+        for where, timer in (("text", lambda t: time_text(t, plan)), ("intake", time_intake)):
+            small, large = timer(build(size)), timer(build(4 * size))
+            rows.append({
+                "case": name,
+                "input": where,
+                "small_ms": round(small * 1000, 1),
+                "large_ms": round(large * 1000, 1),
+                "growth": round(large / small, 1) if small else None,
+                "ok": large <= max_growth * small + slack and large <= max_seconds,
+            })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=25000, help="characters in the smaller input")
+    parser.add_argument("--fuzz-seeds", type=int, default=5)
+    parser.add_argument("--max-growth", type=float, default=8.0,
+                        help="allowed time ratio for 4x the input (linear is ~4)")
+    parser.add_argument("--slack", type=float, default=0.25, help="seconds added to the bound")
+    parser.add_argument("--max-seconds", type=float, default=10.0,
+                        help="ceiling for any single gate run")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    rows = run(args.size, args.fuzz_seeds, args.max_growth, args.slack, args.max_seconds)
+    failed = [row for row in rows if not row["ok"]]
+    if args.json:
+        print(json.dumps({"size": args.size, "rows": rows, "failed": len(failed)}, indent=2))
+    else:
+        print(f"{'case':<24}{'input':<8}{'n':>10}{'4n':>11}{'growth':>8}")
+        for row in rows:
+            print(
+                f"{row['case']:<24}{row['input']:<8}{row['small_ms']:>8.1f}ms"
+                f"{row['large_ms']:>9.1f}ms{row['growth'] or 0:>7.1f}x"
+                f"{'' if row['ok'] else '  FAIL'}"
+            )
+        print(f"{len(rows) - len(failed)}/{len(rows)} within bounds")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
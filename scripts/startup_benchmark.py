@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: import time of app.main and time to first /health.
+
+Each measurement runs in a fresh interpreter, the way a new container or a
+restarted worker sees it. Run with the deployment's environment (USE_GCP,
+USE_CLAUDE, DATABASE_URL, ...) so the same backends are selected:
+
+    python scripts/startup_benchmark.py [--runs 5] [--json]
+
+Exits 1 when the median import time or time to /health exceeds its budget
+(STARTUP_IMPORT_BUDGET_SECONDS, STARTUP_HEALTH_BUDGET_SECONDS), so it can
+gate CI or a deploy.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_BUDGET_SECONDS = float(os.getenv("STARTUP_IMPORT_BUDGET_SECONDS", "3.0"))
+HEALTH_BUDGET_SECONDS = float(os.getenv("STARTUP_HEALTH_BUDGET_SECONDS", "6.0"))
+
+# SDKs that must only load when their backend is first used
+HEAVY_MODULES = [
+    "vertexai",
+    "google.cloud.aiplatform",
+    "google.cloud.monitoring_v3",
+    "google.cloud.secretmanager",
+    "google.cloud.pubsub_v1",
+    "google.cloud.vision",
+    "anthropic",
+    "reportlab.platypus",
+    "qrcode",
+    "barcode",
+]
+
+_IMPORT_PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "eager_modules": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure_import() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_health(timeout: float = 60.0) -> float:
+    """Seconds from spawning uvicorn to the first 200 from /health."""
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {server.returncode}")
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                    return time.perf_counter() - start
+            except httpx.TransportError:
+                pass
+            time.sleep(0.02)
+        raise RuntimeError(f"/health not ready after {timeout}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    health = [measure_health() for _ in range(args.runs)]
+
+    report = {
+        "runs": args.runs,
+        "import_seconds_median": round(statistics.median(i["seconds"] for i in imports), 3),
+        "import_seconds_max": round(max(i["seconds"] for i in imports), 3),
+        "health_seconds_median": round(statistics.median(health), 3),
+        "health_seconds_max": round(max(health), 3),
+        "eager_modules": imports[-1]["eager_modules"],
+        "import_budget_seconds": IMPORT_BUDGET_SECONDS,
+        "health_budget_seconds": HEALTH_BUDGET_SECONDS,
+    }
+    within_budget = (
+        report["import_seconds_median"] <= IMPORT_BUDGET_SECONDS
+        and report["health_seconds_median"] <= HEALTH_BUDGET_SECONDS
+    )
+    report["within_budget"] = within_budget
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import app.main : median {report['import_seconds_median']}s "
+              f"(max {report['import_seconds_max']}s, budget {IMPORT_BUDGET_SECONDS}s)")
+        print(f"first /health   : median {report['health_seconds_median']}s "
+              f"(max {report['health_seconds_max']}s, budget {HEALTH_BUDGET_SECONDS}s)")
+        print(f"eager SDKs      : {', '.join(report['eager_modules']) or 'none'}")
+        print("OK" if within_budget else "OVER BUDGET")
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
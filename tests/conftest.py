@@ -1,6 +1,7 @@
 """
 Pytest configuration and fixtures
 """
+import asyncio
 import os
 import sys
 import pytest
@@ -16,6 +17,9 @@ os.environ["USE_MOCK_LLM"] = "true"
 os.environ["SECRET_KEY"] = "test-secret-key-for-testing"
 # Off by default: the shared-IP auth fixture would trip auth limits mid-suite
 os.environ["RATE_LIMIT_ENABLED"] = "false"
+# Off by default: tests reuse prompts and assert on provider calls; the cache
+# tests opt back in with monkeypatch
+os.environ["LLM_CACHE_ENABLED"] = "false"
 
 # Add app to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -31,6 +35,14 @@ from app.models.chat import ChatSession, ChatMessage
 from app.models.evidence import Evidence
 
 from app.api.v1.endpoints.auth import get_password_hash
+from app.services import evidence_storage_service
+
+
+@pytest.fixture(autouse=True)
+def _uploads_in_tmp_path(tmp_path, monkeypatch):
+    """Local-disk evidence uploads land in the test's tmp_path, not ./uploads."""
+    monkeypatch.setattr(evidence_storage_service, "_UPLOADS_ROOT", tmp_path / "uploads")
+
 
 @pytest_asyncio.fixture(scope="function")
 async def test_db():
@@ -98,6 +110,37 @@ async def client() -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
     await engine.dispose()
 
+@pytest_asyncio.fixture
+async def file_client(tmp_path) -> AsyncGenerator[AsyncClient, None]:
+    """Like client, but on a database file, for endpoints that start background work.
+
+    The in-memory database is one shared connection, so a background task's
+    session and the test's requests would share a single transaction.
+    """
+    from app.api.v1.endpoints import llm as llm_endpoints
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with async_session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test", follow_redirects=True) as ac:
+        yield ac
+
+    # Stop background work still holding the database before disposing it
+    tasks = [*llm_endpoints._motion_jobs.values(), *llm_endpoints._predrafts.values()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
 @pytest_asyncio.fixture
 async def test_user(test_db: AsyncSession) -> User:
     """Create a test user."""
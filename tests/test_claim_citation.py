@@ -1,8 +1,10 @@
 """
 Tests for claim_citation_service — inline "(Exhibit X)" citations in the
-declaration with a zero-drift guardrail. Fallback is ALWAYS the original text.
+declaration, spliced locally from a sentence-index map returned by the model.
+Fallback is ALWAYS the original text.
 """
 import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock
 
@@ -30,6 +32,8 @@ CITED_OK = (
     "I keep a written log of every late return."
 )
 
+CITATION_MAP = json.dumps({"citations": {"1": ["A"], "2": ["B"]}})
+
 
 class TestStripAndValidate:
     def test_strip_citations_removes_all_tokens(self):
@@ -56,6 +60,44 @@ class TestStripAndValidate:
         assert ccs.validate_citation_output(DECLARATION, respaced, {"A", "B"}) is True
 
 
+class TestIndexProtocol:
+    def test_prompt_numbers_sentences_and_omits_reproduction(self):
+        spans = ccs.sentence_spans(DECLARATION)
+        prompt = ccs.build_citation_prompt([DECLARATION[s:e] for s, e in spans], LETTERED)
+        assert "[1] Daniel returned the children late" in prompt
+        assert "[3] I keep a written log of every late return." in prompt
+        assert "Exhibit A: email dated 2026-03-01" in prompt
+        assert "Reproduce" not in prompt
+
+    def test_splice_inserts_after_mapped_sentences_only(self):
+        spans = ccs.sentence_spans(DECLARATION)
+        assert ccs.splice_citations(DECLARATION, spans, {0: ["A"], 1: ["B"]}) == CITED_OK
+        assert ccs.splice_citations(DECLARATION, spans, {}) == DECLARATION
+
+    def test_splice_multiple_letters(self):
+        text = "First claim. Second claim."
+        spans = ccs.sentence_spans(text)
+        assert (
+            ccs.splice_citations(text, spans, {1: ["A", "B"]})
+            == "First claim. Second claim. (Exhibit A) (Exhibit B)"
+        )
+
+    def test_parse_drops_invalid_entries(self):
+        data = {"citations": {
+            "1": ["A", "A", "Z"],  # duplicate and unknown letter
+            "2": "B",              # bare string tolerated
+            "0": ["A"],            # out of range (numbers are 1-based)
+            "9": ["A"],
+            "x": ["A"],
+            "3": [7],
+        }}
+        assert ccs.parse_citation_map(data, 3, {"A", "B"}) == {0: ["A"], 1: ["B"]}
+
+    def test_parse_rejects_wrong_shape(self):
+        assert ccs.parse_citation_map({}, 3, {"A"}) == {}
+        assert ccs.parse_citation_map({"citations": ["A"]}, 3, {"A"}) == {}
+
+
 class TestInsertClaimCitations:
     @pytest.mark.asyncio
     async def test_empty_lettered_returns_original(self):
@@ -88,39 +130,61 @@ class TestInsertClaimCitations:
 
         async def _slow(*a, **k):
             await asyncio.sleep(1)
-            return (CITED_OK, 10, "m")
+            return (CITATION_MAP, 10, "m")
 
         monkeypatch.setattr(llm_backend.llm_service, "_generate", _slow)
         out = await ccs.insert_claim_citations(DECLARATION, LETTERED)
         assert out == DECLARATION
 
     @pytest.mark.asyncio
-    async def test_valid_llm_output_is_used(self, monkeypatch):
+    async def test_citation_map_is_spliced(self, monkeypatch):
         monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
         monkeypatch.setattr(
             llm_backend.llm_service, "_generate",
-            AsyncMock(return_value=(CITED_OK, 100, "claude-sonnet-4-6")),
+            AsyncMock(return_value=(f"```json\n{CITATION_MAP}\n```", 100, "claude-sonnet-4-6")),
         )
         out = await ccs.insert_claim_citations(DECLARATION, LETTERED)
         assert out == CITED_OK
 
     @pytest.mark.asyncio
-    async def test_invalid_llm_output_falls_back(self, monkeypatch):
+    async def test_unparseable_map_falls_back(self, monkeypatch):
         monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
-        drifted = CITED_OK.replace("written log", "detailed diary")
+        # A model that reproduces the declaration instead of returning a map
         monkeypatch.setattr(
             llm_backend.llm_service, "_generate",
-            AsyncMock(return_value=(drifted, 100, "claude-sonnet-4-6")),
+            AsyncMock(return_value=(CITED_OK.replace("written log", "diary"), 100, "m")),
         )
         out = await ccs.insert_claim_citations(DECLARATION, LETTERED)
         assert out == DECLARATION
 
+    @pytest.mark.asyncio
+    async def test_truncated_map_is_logged(self, monkeypatch, caplog):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        monkeypatch.setattr(
+            llm_backend.llm_service, "_generate",
+            AsyncMock(return_value=('{"citations": {"1": ["A"], "2": ["', 2048, "m")),
+        )
+        with caplog.at_level("WARNING"):
+            out = await ccs.insert_claim_citations(DECLARATION, LETTERED)
+        assert out == DECLARATION
+        assert "Claim citation map did not parse: sentences=3" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_invalid_entries_dropped_valid_ones_kept(self, monkeypatch):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        raw = json.dumps({"citations": {"1": ["A"], "2": ["Q"], "12": ["B"]}})
+        monkeypatch.setattr(
+            llm_backend.llm_service, "_generate", AsyncMock(return_value=(raw, 40, "m")),
+        )
+        out = await ccs.insert_claim_citations(DECLARATION, LETTERED)
+        assert out == CITED_OK.replace(" (Exhibit B)", "")
+
     @pytest.mark.asyncio
     async def test_no_declaration_content_logged(self, monkeypatch, caplog):
         monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
         monkeypatch.setattr(
             llm_backend.llm_service, "_generate",
-            AsyncMock(return_value=(CITED_OK, 100, "m")),
+            AsyncMock(return_value=(CITATION_MAP, 100, "m")),
         )
         with caplog.at_level("DEBUG"):
             await ccs.insert_claim_citations(DECLARATION, LETTERED)
@@ -0,0 +1,255 @@
+"""
+Tests for the offline Message Batches backend.
+
+FakeBatchServer is a local stand-in for the Anthropic Message Batches API
+(create / retrieve / results / cancel). The real AsyncAnthropic client talks
+to it over an in-process ASGI transport, so the SDK's wire format and JSONL
+result decoding are exercised end to end without network access.
+"""
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from anthropic import AsyncAnthropic
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from app.services import claude_batch_service
+from app.services import llm_service as llm_module
+from app.services import semantic_check_service
+from app.services.claude_batch_service import BatchRequestError, ClaudeBatchService
+from app.services.claude_llm_service import CHAT_MODEL, ClaudeLLMService
+
+pytestmark = pytest.mark.asyncio
+
+BASE_URL = "http://fake-batch"
+
+
+class FakeBatchServer:
+    """In-memory Message Batches API. respond(params) -> text, or a failure type."""
+
+    def __init__(self, respond=None, polls_until_ended: int = 1):
+        self.respond = respond or (lambda params: f"echo: {params['messages'][0]['content']}")
+        self.polls_until_ended = polls_until_ended
+        self.batches = {}
+        self.app = FastAPI()
+        self.app.post("/v1/messages/batches")(self._create)
+        self.app.get("/v1/messages/batches/{batch_id}")(self._retrieve)
+        self.app.get("/v1/messages/batches/{batch_id}/results")(self._results)
+        self.app.post("/v1/messages/batches/{batch_id}/cancel")(self._cancel)
+
+    def client(self) -> AsyncAnthropic:
+        transport = httpx.ASGITransport(app=self.app)
+        return AsyncAnthropic(
+            api_key="test-key",
+            base_url=BASE_URL,
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=transport, base_url=BASE_URL),
+        )
+
+    def _batch_json(self, batch_id):
+        batch = self.batches[batch_id]
+        ended = batch["status"] == "ended"
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": batch["status"],
+            "request_counts": {
+                "processing": 0 if ended else len(batch["requests"]),
+                "succeeded": 0, "errored": 0, "canceled": 0, "expired": 0,
+            },
+            "created_at": now,
+            "expires_at": now,
+            "ended_at": now if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{BASE_URL}/v1/messages/batches/{batch_id}/results" if ended else None,
+        }
+
+    async def _create(self, request: Request):
+        body = await request.json()
+        batch_id = f"msgbatch_{len(self.batches) + 1}"
+        self.batches[batch_id] = {"requests": body["requests"], "status": "in_progress", "polls": 0}
+        return JSONResponse(self._batch_json(batch_id))
+
+    async def _retrieve(self, batch_id: str):
+        batch = self.batches[batch_id]
+        batch["polls"] += 1
+        if batch["status"] == "in_progress" and batch["polls"] >= self.polls_until_ended:
+            batch["status"] = "ended"
+        return JSONResponse(self._batch_json(batch_id))
+
+    async def _cancel(self, batch_id: str):
+        self.batches[batch_id]["status"] = "canceling"
+        return JSONResponse(self._batch_json(batch_id))
+
+    async def _results(self, batch_id: str):
+        lines = []
+        for item in reversed(self.batches[batch_id]["requests"]):  # order not guaranteed
+            params = item["params"]
+            outcome = self.respond(params)
+            if outcome in ("errored", "canceled", "expired"):
+                result = {"type": outcome}
+                if outcome == "errored":
+                    result["error"] = {"type": "error", "error": {"type": "api_error", "message": "x"}}
+            else:
+                result = {"type": "succeeded", "message": {
+                    "id": "msg_1", "type": "message", "role": "assistant",
+                    "model": params["model"],
+                    "content": [{"type": "text", "text": outcome}],
+                    "stop_reason": "end_turn", "stop_sequence": None,
+                    "usage": {"input_tokens": 20, "output_tokens": 5},
+                }}
+            lines.append(json.dumps({"custom_id": item["custom_id"], "result": result}))
+        return Response("\n".join(lines) + "\n", media_type="application/binary")
+
+
+@pytest.fixture(autouse=True)
+def enable_cache(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    claude_batch_service.llm_cache.clear()
+    yield
+    claude_batch_service.llm_cache.clear()
+
+
+def _batch_service(server: FakeBatchServer, **kwargs) -> ClaudeBatchService:
+    backend = ClaudeLLMService(base_system_prompt="Base prompt")
+    backend._client = server.client()
+    options = {"flush_seconds": 0.01, "poll_seconds": 0.01}
+    options.update(kwargs)
+    return ClaudeBatchService(backend, **options)
+
+
+class TestBatchSubmission:
+    async def test_concurrent_requests_share_one_batch(self):
+        server = FakeBatchServer()
+        service = _batch_service(server)
+
+        results = await asyncio.gather(
+            *(service.generate(f"claims {n}", "evidence_ranking") for n in range(3))
+        )
+
+        assert len(server.batches) == 1
+        assert [r[0] for r in results] == [f"echo: claims {n}" for n in range(3)]
+        assert all(r[1:] == (25, CHAT_MODEL) for r in results)
+
+    async def test_request_params_match_interactive_call(self):
+        server = FakeBatchServer()
+        service = _batch_service(server)
+        await service.generate("extract this", "served_motion_extraction")
+
+        params = server.batches["msgbatch_1"]["requests"][0]["params"]
+        assert params["model"] == CHAT_MODEL
+        assert params["max_tokens"] == 1024
+        assert params["system"] == service.backend._system_blocks()
+        assert params["messages"] == [{"role": "user", "content": "extract this"}]
+
+    async def test_full_queue_flushes_without_waiting_for_timer(self):
+        server = FakeBatchServer()
+        service = _batch_service(server, max_requests=2, flush_seconds=60)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(service.generate(f"p{n}", "semantic_check") for n in range(2))),
+            timeout=5,
+        )
+        assert len(results) == 2
+        assert len(server.batches) == 1
+
+    async def test_polls_until_batch_ends(self):
+        server = FakeBatchServer(polls_until_ended=3)
+        service = _batch_service(server)
+        await service.generate("slow", "evidence_ranking")
+        assert server.batches["msgbatch_1"]["polls"] >= 3
+
+    async def test_generate_many_keeps_order_and_per_item_failures(self):
+        server = FakeBatchServer(
+            respond=lambda params: "errored" if "bad" in params["messages"][0]["content"] else "ok"
+        )
+        service = _batch_service(server)
+
+        results = await service.generate_many(["good 1", "bad", "good 2"], "evidence_ranking")
+
+        assert results[0][0] == "ok" and results[2][0] == "ok"
+        assert isinstance(results[1], BatchRequestError)
+        assert len(server.batches) == 1
+
+
+class TestBatchFailures:
+    async def test_expired_request_raises(self):
+        service = _batch_service(FakeBatchServer(respond=lambda params: "expired"))
+        with pytest.raises(BatchRequestError, match="expired"):
+            await service.generate("p", "evidence_ranking")
+
+    async def test_batch_timeout_cancels_and_raises(self):
+        server = FakeBatchServer(polls_until_ended=10_000)
+        service = _batch_service(server, timeout_seconds=0.05)
+        with pytest.raises(BatchRequestError, match="timed out"):
+            await service.generate("p", "evidence_ranking")
+        assert server.batches["msgbatch_1"]["status"] == "canceling"
+
+    async def test_submission_error_fails_every_waiter(self):
+        service = _batch_service(FakeBatchServer())
+        service.backend._client = AsyncMock()
+        service.backend._client.messages.batches.create.side_effect = RuntimeError("529")
+
+        results = await asyncio.gather(
+            *(service.generate(f"p{n}", "evidence_ranking") for n in range(2)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_close_fails_queued_requests(self):
+        service = _batch_service(FakeBatchServer(), flush_seconds=60)
+        waiter = asyncio.create_task(service.generate("p", "evidence_ranking"))
+        await asyncio.sleep(0.01)
+        await service.close()
+        with pytest.raises(BatchRequestError):
+            await waiter
+
+
+class TestBatchCaching:
+    async def test_batched_answer_serves_later_interactive_call(self):
+        server = FakeBatchServer()
+        service = _batch_service(server)
+        text, _, _ = await service.generate("rank these", "evidence_ranking")
+
+        interactive = AsyncMock()
+        service.backend._client = interactive
+        cached = await service.backend.generate("rank these", "evidence_ranking")
+
+        assert cached == (text, 0, CHAT_MODEL)
+        interactive.messages.create.assert_not_called()
+
+
+class TestRouting:
+    async def test_only_listed_operations_use_the_batch_backend(self, monkeypatch):
+        monkeypatch.setattr(claude_batch_service, "BATCH_OPERATIONS", frozenset({"evidence_ranking"}))
+        service = llm_module.llm_service
+        monkeypatch.setattr(service, "claude_backend", AsyncMock())
+        monkeypatch.setattr(service, "batch_backend", AsyncMock())
+
+        assert service.backend_for("evidence_ranking") is service.batch_backend
+        assert service.backend_for("chat_response") is service.claude_backend
+
+    async def test_unlisted_operations_stay_interactive_by_default(self, monkeypatch):
+        service = llm_module.llm_service
+        monkeypatch.setattr(service, "claude_backend", AsyncMock())
+        monkeypatch.setattr(service, "batch_backend", AsyncMock())
+        assert service.backend_for("evidence_ranking") is service.claude_backend
+
+    async def test_batched_semantic_check_uses_batch_backend(self, monkeypatch):
+        monkeypatch.setattr(claude_batch_service, "BATCH_OPERATIONS", frozenset({"semantic_check"}))
+        monkeypatch.setattr(llm_module, "USE_MOCK_LLM", False)
+        service = llm_module.llm_service
+        monkeypatch.setattr(service, "claude_backend", AsyncMock())
+        batch = AsyncMock()
+        batch.generate.return_value = ('{"findings": []}', 10, "m")
+        monkeypatch.setattr(service, "batch_backend", batch)
+
+        assert await semantic_check_service.check_text("Text.", {}, {}) == []
+        batch.generate.assert_awaited_once()
+        service.claude_backend.generate.assert_not_awaited()
@@ -47,10 +47,10 @@ class TestOperationRouting:
     def test_evidence_finder_operations_registered(self):
         assert OPERATION_MODELS["evidence_ranking"] == CHAT_MODEL
         assert OPERATION_MODELS["conversation_threading"] == CHAT_MODEL
-        assert OPERATION_MODELS["claim_citation"] == DRAFTING_MODEL
+        assert OPERATION_MODELS["claim_citation"] == DRAFTING_MODEL  # claim-to-exhibit judgment, not verbatim copying
         assert OPERATION_MAX_TOKENS["evidence_ranking"] == 2000
         assert OPERATION_MAX_TOKENS["conversation_threading"] == 6000
-        assert OPERATION_MAX_TOKENS["claim_citation"] == 6000
+        assert OPERATION_MAX_TOKENS["claim_citation"] == 2048  # sentence-index map, not the declaration
 
     def test_semantic_check_uses_drafting_tier(self):
         assert OPERATION_MODELS["semantic_check"] == DRAFTING_MODEL
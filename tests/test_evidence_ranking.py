@@ -3,6 +3,9 @@ Tests for evidence_ranking_service — LLM relevance ranking of Gmail scan
 candidates against the user's intake claims. Metadata only; bodies never
 reach the prompt.
 """
+import json
+import re
+
 import pytest
 from unittest.mock import AsyncMock
 
@@ -121,3 +124,131 @@ class TestRankCandidates:
         assert "Running behind" in prompt              # snippet
         assert "SECRET FULL BODY CONTENT" not in prompt  # body never sent
         assert CLAIMS[:30] in prompt
+
+
+def _scan(n: int, relevant: set) -> list:
+    return [
+        {"message_id": f"msg-{i}", "from": "daniel@example.com", "date": "2026-03-03",
+         "subject": "Late return of the children" if i in relevant else f"Newsletter {i}",
+         "snippet": "Returned them late again" if i in relevant else "Weekly deals inside"}
+        for i in range(n)
+    ]
+
+
+def _echo_rankings(prompt_calls: list):
+    """A ranker that scores every candidate id it is shown."""
+    async def generate(prompt, operation, user_id=None):
+        prompt_calls.append(prompt)
+        ids = re.findall(r"id=(\S+) \|", prompt)
+        body = {"rankings": [{"message_id": i, "score": 0.5, "why": "w", "tags": []} for i in ids]}
+        return json.dumps(body), 10, "m"
+    return generate
+
+
+@pytest.fixture
+def cached(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    ers.ranking_cache.clear()
+    yield
+    ers.ranking_cache.clear()
+
+
+class TestLexicalPrefilter:
+    def test_bm25_prefers_candidates_sharing_claim_terms(self):
+        scores = ers.lexical_scores(_scan(10, {3}), CLAIMS)
+        assert scores[3] == max(scores)
+        assert scores[3] > scores[0] > 0  # everyone matches on the sender's name
+
+    def test_prefilter_keeps_top_k_in_original_order(self):
+        candidates = _scan(10, {7, 2})
+        kept = ers.prefilter(candidates, CLAIMS, top_k=2)
+        assert [c["message_id"] for c in kept] == ["msg-2", "msg-7"]
+        assert ers.prefilter(candidates, CLAIMS, top_k=50) == candidates
+
+
+class TestScaledRanking:
+    @pytest.mark.asyncio
+    async def test_large_scan_is_prefiltered_and_chunked(self, monkeypatch):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        monkeypatch.setattr(ers, "EVIDENCE_RANKING_TOP_K", 25)
+        monkeypatch.setattr(ers, "EVIDENCE_RANKING_CHUNK_SIZE", 10)
+        prompts = []
+        monkeypatch.setattr(llm_backend.llm_service, "_generate", _echo_rankings(prompts))
+
+        ranked, notice = await ers.rank_candidates(_scan(100, {5, 50, 95}), CLAIMS)
+
+        assert notice is None
+        assert len(prompts) == 3  # 25 candidates in chunks of 10
+        assert len(ranked) == 100  # nothing is dropped from the results
+        scored = {c["message_id"] for c in ranked if "relevance_score" in c}
+        assert len(scored) == 25
+        assert {"msg-5", "msg-50", "msg-95"} <= scored
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_leaves_only_its_candidates_unranked(self, monkeypatch):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        monkeypatch.setattr(ers, "EVIDENCE_RANKING_CHUNK_SIZE", 5)
+        prompts = []
+        echo = _echo_rankings(prompts)
+
+        async def flaky(prompt, operation, user_id=None):
+            if "id=msg-0 " in prompt:
+                raise RuntimeError("overloaded")
+            return await echo(prompt, operation, user_id)
+
+        monkeypatch.setattr(llm_backend.llm_service, "_generate", flaky)
+        ranked, notice = await ers.rank_candidates(_scan(10, set()), CLAIMS)
+
+        assert notice is None
+        assert [("relevance_score" in c) for c in ranked] == [False] * 5 + [True] * 5
+
+    @pytest.mark.asyncio
+    async def test_rescan_reuses_cached_rankings(self, monkeypatch, cached):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        prompts = []
+        monkeypatch.setattr(llm_backend.llm_service, "_generate", _echo_rankings(prompts))
+
+        first, _ = await ers.rank_candidates(_scan(4, set()), CLAIMS, user_id="u1")
+        again, notice = await ers.rank_candidates(_scan(5, set()), CLAIMS, user_id="u1")
+
+        assert notice is None
+        assert again[:4] == first
+        assert len(prompts) == 2
+        assert re.findall(r"id=(\S+) \|", prompts[1]) == ["msg-4"]  # only the new message
+
+    @pytest.mark.asyncio
+    async def test_changed_claims_or_user_miss_the_cache(self, monkeypatch, cached):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        prompts = []
+        monkeypatch.setattr(llm_backend.llm_service, "_generate", _echo_rankings(prompts))
+
+        await ers.rank_candidates(_scan(2, set()), CLAIMS, user_id="u1")
+        await ers.rank_candidates(_scan(2, set()), CLAIMS + " Also missed a visit.", user_id="u1")
+        await ers.rank_candidates(_scan(2, set()), CLAIMS, user_id="u2")
+        assert len(prompts) == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_records_messages_the_model_declined(self, monkeypatch, cached):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        generate = AsyncMock(return_value=('{"rankings": []}', 10, "m"))
+        monkeypatch.setattr(llm_backend.llm_service, "_generate", generate)
+
+        await ers.rank_candidates(CANDIDATES, CLAIMS)
+        ranked, notice = await ers.rank_candidates(CANDIDATES, CLAIMS)
+
+        assert generate.await_count == 1
+        assert notice is None
+        assert all("relevance_score" not in c for c in ranked)
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_cached(self, monkeypatch, cached):
+        monkeypatch.setattr(llm_backend, "USE_MOCK_LLM", False)
+        generate = AsyncMock(return_value=('{"rankings": [{"message_id": "msg-0", "sc', 10, "m"))
+        monkeypatch.setattr(llm_backend.llm_service, "_generate", generate)
+
+        ranked, notice = await ers.rank_candidates(CANDIDATES, CLAIMS)
+        assert notice == ers.NOTICE_UNRANKED
+        assert all("relevance_score" not in c for c in ranked)
+
+        await ers.rank_candidates(CANDIDATES, CLAIMS)
+        assert generate.await_count == 2  # asked again, not remembered as declined
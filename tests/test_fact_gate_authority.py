@@ -6,6 +6,9 @@ test (finding L7): "San Diego Superior Court Local Rule 5.5.2"/"5.5.3",
 "In re Marriage of Burgess", "Family Code section 3027.1", invented
 courthouse street addresses, and unrequested FL-150 instructions.
 """
+import random
+
+from app.services.fact_gate import authority_strip
 from app.services.fact_gate.authority_strip import address_tokens_from, strip_authority
 from app.services.fact_gate.types import GateContext
 
@@ -79,6 +82,54 @@ class TestCitations:
         assert corrections == []
 
 
+class TestAnchoredScan:
+    """_citation_spans scans only around anchor literals; it must find what a
+    whole-text scan of every pattern finds."""
+
+    PIECES = [
+        "(Fam. Code, § 3011.)", "pursuant to Family Code section 4055", "Smith v. Jones (2001) 25 Cal.4th 100",
+        "In re Marriage of Burgess (1996) 13 Cal.4th 25", "San Diego Superior Court Local Rule 5.5.2",
+        "California Rules of Court, rule 5.92(a)", "CIV. CODE SECTIONS 1.2", "Nov. 3", "In the code",
+        "Respondent", "did", "not", "return", "the", "children", ".", "(", ")", "\n", "section", "Code", "v.",
+        "Q" + "x" * 120, "Orange" * 15, "Superior", "Court", "Local Rule 7.1",
+    ]
+
+    @staticmethod
+    def _whole_text(text):
+        merge = authority_strip._merge_spans
+        return merge([(m.start(), m.end()) for rx, _ in authority_strip._CITATIONS for m in rx.finditer(text)])
+
+    def test_matches_a_whole_text_scan(self):
+        long_words = " ".join("Orange" * 15 for _ in range(3))
+        for text in [
+            f"See {'Q' + 'x' * 120} v. Jones (2004) 120 Cal.App.4th 123",
+            f"Follow {long_words} Superior Court Local Rule 5.1.2 for filings.",
+        ]:
+            spans = authority_strip._merge_spans(authority_strip._citation_spans(text))
+            assert spans == self._whole_text(text) != []
+        rng = random.Random(3)
+        for _ in range(300):
+            words = [rng.choice(self.PIECES) for _ in range(rng.randint(1, 150))]
+            text = (" " * rng.choice([1, 1, 2, 90])).join(words)
+            assert authority_strip._merge_spans(authority_strip._citation_spans(text)) == self._whole_text(text)
+
+    def test_long_whitespace_runs_inside_a_citation(self):
+        text = "See Welfare" + " " * 200 + "and\n\n\n" + "\t" * 150 + "Institutions Code section 300 today."
+        out, corrections = strip_authority(text, set(), CTX)
+        assert "Institutions" not in out and "300" not in out
+        assert corrections
+
+    def test_match_running_past_its_window_is_completed(self):
+        section = ".".join(["12"] * 60)
+        text = f"Filing must follow Family Code section {section} and be signed by the petitioner."
+        out, _ = strip_authority(text, set(), CTX)
+        assert "12" not in out
+        assert "signed by the petitioner" in out
+
+    def test_text_without_anchors_is_not_scanned(self):
+        assert authority_strip._citation_spans("Respondent returned the children late. " * 500) == []
+
+
 class TestAddresses:
     def test_unverified_address_removes_whole_sentence(self):
         text = (
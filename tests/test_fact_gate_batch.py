@@ -0,0 +1,107 @@
+"""
+run_fact_gate_many (app/services/fact_gate/batch.py): results are identical
+to gating each text on its own and in input order, whether the batch runs
+in-process or across the worker pool, and a broken pool never fails a batch.
+"""
+from concurrent.futures import Future
+from datetime import date
+
+import pytest
+
+from app.services.fact_gate import (
+    GateContext,
+    compile_gate_plan,
+    regate,
+    run_fact_gate,
+    run_fact_gate_many,
+)
+from app.services.fact_gate import batch
+
+CTX = GateContext(
+    party_name="Maria Delgado",
+    other_party_name="Jacob Delgado",
+    children=[{"name": "Sofia Delgado", "date_of_birth": "2018-03-22"}],
+    intake_values={"support_amount": "$450"},
+    today=date(2026, 7, 11),
+)
+
+TEXTS = [
+    "Petitioner is **Jacob Delgado**. Sofia Delgado, age 3, lives with me.",
+    "Order child support of $450 per month, not $900. (Fam. Code section 4055.)",
+    None,
+    "",
+    "I asked Respondent on multiple occasions. " * 40,
+    "Jacob Delgado, the Petitioner, missed the exchange.",
+]
+NAMES = [f"Section {n}" for n in range(len(TEXTS))]
+
+
+def _one_by_one():
+    results = []
+    for text, name in zip(TEXTS, NAMES):
+        CTX.section_name = name
+        results.append(run_fact_gate(text, CTX))
+    CTX.section_name = ""
+    return results
+
+
+@pytest.fixture
+def pooled(monkeypatch):
+    monkeypatch.setattr(batch, "FACT_GATE_WORKERS", 2)
+    monkeypatch.setattr(batch, "FACT_GATE_POOL_MIN_CHARS", 0)
+    yield
+    batch.shutdown_gate_pool()
+
+
+class TestInProcess:
+    def test_small_batches_never_start_the_pool(self, monkeypatch):
+        def no_pool():
+            raise AssertionError("pool started for a small batch")
+
+        monkeypatch.setattr(batch, "_get_pool", no_pool)
+        assert run_fact_gate_many(TEXTS, CTX, section_names=NAMES) == _one_by_one()
+
+    def test_section_name_defaults_to_the_context(self):
+        ctx = GateContext(section_name="Orders", intake_values={"a": "$1"})
+        results = run_fact_gate_many(["Pay $900.", "Pay $800."], ctx)
+        assert {c.section for r in results for c in r.corrections} == {"Orders"}
+        assert ctx.section_name == "Orders"
+
+    def test_empty_batch(self):
+        assert run_fact_gate_many([], CTX) == []
+
+
+class TestPool:
+    def test_pooled_results_match_one_by_one_and_keep_order(self, pooled):
+        plan = compile_gate_plan(CTX)
+        results = run_fact_gate_many(TEXTS * 3, CTX, plan, NAMES * 3)
+        assert results == _one_by_one() * 3
+
+    def test_pooled_results_drop_the_edit_chain_and_regate_in_full(self, pooled):
+        results = run_fact_gate_many(TEXTS, CTX, section_names=NAMES)
+        assert all(result.doc is None for result in results)
+        edited = results[1].text.replace("per month", "each month")
+        assert regate(results[1], edited, CTX) == run_fact_gate(edited, CTX)
+
+    def test_shards_are_contiguous_and_cover_every_text(self):
+        items = [(text, "") for text in TEXTS * 5]
+        shards = batch._shards(items, 4)
+        assert [item for shard in shards for item in shard] == items
+        assert all(shards)
+
+    def test_broken_pool_falls_back_in_process(self, pooled, monkeypatch):
+        class Broken:
+            def __init__(self):
+                self.submitted = 0
+
+            def submit(self, fn, *args):
+                self.submitted += 1
+                future = Future()
+                if self.submitted == 1:
+                    future.set_result(fn(*args))  # first shard succeeds
+                else:
+                    future.set_exception(RuntimeError("worker died"))
+                return future
+
+        monkeypatch.setattr(batch, "_get_pool", Broken)
+        assert run_fact_gate_many(TEXTS, CTX, section_names=NAMES) == _one_by_one()
@@ -0,0 +1,142 @@
+"""
+regate: after a hand edit of gated text only the touched lines are gated
+again, the text is what gating the edited text in full gives, and the
+corrections of untouched text are carried over with their positions.
+"""
+import random
+from datetime import date
+
+import pytest
+
+from app.services.fact_gate import GateContext, GateResult, compile_gate_plan, regate, run_fact_gate
+from app.services.fact_gate import incremental
+
+CTX = GateContext(
+    party_name="Maria Delgado",
+    other_party_name="Jacob Delgado",
+    is_petitioner=True,
+    children=[{"name": "Sofia Delgado", "date_of_birth": "2018-03-22"}],
+    intake_values={"support_amount": "$450", "incident_date": "2026-06-14"},
+    today=date(2026, 7, 11),
+)
+PLAN = compile_gate_plan(CTX)
+
+RAW = (
+    "### Facts\n"
+    "Petitioner is **Jacob Delgado**. Sofia Delgado, age 3, lives with me.\n\n"
+    "On June 14, 2026, Respondent did not appear. (Fam. Code, § 3011.)\n\n"
+    "I asked Respondent on multiple occasions to pay $450 in child support.\n\n"
+    "Respondent owes $9,999.00 in arrears."
+)
+
+
+def _edit(text, old, new):
+    start = text.index(old)
+    return [(start, start + len(old), new)]
+
+
+class TestMatchesFullGate:
+    @pytest.mark.parametrize("old, new", [
+        ("did not appear", "did not appear or call"),
+        ("child support", "child support. See Family Code section 4055"),
+        ("Respondent owes", "Respondent owes $777 and"),
+        ("arrears.", "arrears.\n| Date | Event |\n|---|---|\n| June 20 | late |"),
+        ("lives with me.", "lives with me.\n  ### Note\n   Jacob Delgado, the Petitioner, lied."),
+        ("\n\nI asked", " I asked"),
+    ])
+    def test_text_is_the_full_gate_of_the_edited_text(self, old, new):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        edits = _edit(previous.text, old, new)
+        start, end, replacement = edits[0]
+        edited = previous.text[:start] + replacement + previous.text[end:]
+        result = regate(previous, edits, CTX, PLAN)
+        assert result.text == run_fact_gate(edited, CTX, PLAN).text
+        assert regate(previous, edited, CTX, PLAN).text == result.text
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_random_edits_and_chains(self, seed):
+        rng = random.Random(seed)
+        inserts = ["", "x", " Pay $900 now.", "\n", " (Fam. Code, § 3011.) ", "**Jacob Delgado**",
+                   " on multiple occasions.", "\n\n  [PETITIONER NAME] declares:"]
+        result = run_fact_gate(RAW, CTX, PLAN)
+        for _ in range(3):
+            text = result.text
+            start = rng.randint(0, len(text))
+            end = min(len(text), start + rng.randint(0, 12))
+            edited = text[:start] + rng.choice(inserts) + text[end:]
+            result = regate(result, edited, CTX, PLAN)
+            assert result.text == run_fact_gate(edited, CTX, PLAN).text
+            for correction in result.corrections:
+                if correction.start is not None:
+                    assert 0 <= correction.start <= correction.end <= len(RAW)
+
+
+class TestOnlyTouchedLines:
+    def test_other_lines_are_not_gated_again(self, monkeypatch):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        gated = []
+        original = incremental.run_fact_gate
+
+        def recording(text, *args):
+            gated.append(text)
+            return original(text, *args)
+
+        monkeypatch.setattr(incremental, "run_fact_gate", recording)
+        regate(previous, _edit(previous.text, "did not appear", "was late"), CTX, PLAN)
+        assert gated == ["On June 14, 2026, Respondent was late.\n"]
+
+    def test_long_text_regates_in_a_fraction_of_the_full_time(self, monkeypatch):
+        raw = "\n\n".join(
+            f"Paragraph {n}. He paid ${900 + n % 50} on multiple occasions." for n in range(2000)
+        )
+        previous = run_fact_gate(raw, CTX, PLAN)
+        gated = []
+        original = incremental.run_fact_gate
+        monkeypatch.setattr(
+            incremental, "run_fact_gate", lambda text, *a: gated.append(text) or original(text, *a)
+        )
+        result = regate(previous, _edit(previous.text, "Paragraph 1000.", "Paragraph one thousand."), CTX, PLAN)
+        assert len(gated) == 1 and len(gated[0]) < 100
+        assert len(result.corrections) == len(previous.corrections)
+
+
+class TestCorrections:
+    def test_untouched_corrections_are_kept_as_they_were(self):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        result = regate(previous, _edit(previous.text, "did not appear", "was late"), CTX, PLAN)
+        assert result.corrections == previous.corrections
+
+    def test_corrections_of_edited_text_are_replaced(self):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        flag = [c for c in previous.corrections if c.type == "quantifier_flag"][0]
+        assert RAW[flag.start:flag.end] == "multiple occasions"
+        result = regate(previous, _edit(previous.text, "on multiple occasions", "twice"), CTX, PLAN)
+        assert not [c for c in result.corrections if c.type == "quantifier_flag"]
+        assert len(result.corrections) == len(previous.corrections) - 1
+
+    def test_new_corrections_point_into_the_first_gate_input(self):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        result = regate(previous, _edit(previous.text, "$450", "$4,500"), CTX, PLAN)
+        amount = [c for c in result.corrections if c.type == "amount" and "4,500" in c.original]
+        assert len(amount) == 1
+        # The user's digits replaced "450", so the correction covers the original amount
+        assert RAW[amount[0].start:amount[0].end] == "$450"
+        assert "$4,500" not in result.text
+
+    def test_report_of_an_unchanged_edit(self):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        result = regate(previous, previous.text, CTX, PLAN)
+        assert result == previous and result.doc is previous.doc
+
+
+class TestFallbacks:
+    def test_result_without_its_segmented_text_is_gated_in_full(self):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        rebuilt = GateResult(text=previous.text, corrections=previous.corrections)
+        edited = previous.text.replace("did not appear", "paid $12")
+        assert regate(rebuilt, edited, CTX, PLAN) == run_fact_gate(edited, CTX, PLAN)
+
+    def test_edit_outside_the_text_is_rejected(self):
+        previous = run_fact_gate(RAW, CTX, PLAN)
+        with pytest.raises(ValueError):
+            regate(previous, [(len(previous.text), len(previous.text) + 1, "x")], CTX, PLAN)
@@ -0,0 +1,116 @@
+"""
+Tests for the compiled gate plan (app/services/fact_gate/plan.py): gating
+with a shared plan is identical to gating without one, and the allowed facts
+and patterns are built once per motion instead of once per section.
+"""
+from datetime import date
+
+from app.services import semantic_check_service
+from app.services.fact_gate import GateContext, StreamingGate, compile_gate_plan, run_fact_gate
+from app.services.fact_gate import plan as plan_module
+
+CTX = GateContext(
+    motion_kind="rfo_section",
+    party_name="Maria Delgado",
+    other_party_name="Jacob Delgado",
+    is_petitioner=True,
+    children=[{"name": "Sofia Delgado", "date_of_birth": "2018-03-22"}],
+    intake_values={
+        "support_amount": "$450",
+        "violation_dates": "June 20, 2026",
+        "details": {"incident_date": "2026-06-14"},
+    },
+    today=date(2026, 7, 11),
+)
+
+SECTIONS = [
+    "2.1 Petitioner is Jacob Delgado. Sofia Delgado (age 6) lives with me.",
+    "Order child support of $450 per month, not $900. (Fam. Code section 4055.)",
+    "On June 14, 2026 and again on June 21, 2026 Respondent did not appear.",
+    "Jacob Delgado, the Petitioner, missed the June 20 exchange.",
+]
+
+
+def _counting_build(monkeypatch):
+    calls = []
+    original = plan_module.build_allowed_facts
+
+    def counting(ctx):
+        calls.append(ctx)
+        return original(ctx)
+
+    monkeypatch.setattr(plan_module, "build_allowed_facts", counting)
+    return calls
+
+
+class TestEquivalence:
+    def test_plan_gives_the_same_result_as_per_call_gating(self):
+        plan = compile_gate_plan(CTX)
+        for text in SECTIONS:
+            assert run_fact_gate(text, CTX, plan) == run_fact_gate(text, CTX)
+
+    def test_plan_alone_uses_its_context(self):
+        plan = compile_gate_plan(CTX)
+        assert run_fact_gate(SECTIONS[0], plan=plan) == run_fact_gate(SECTIONS[0], CTX)
+
+    def test_section_name_comes_from_the_context(self):
+        plan = compile_gate_plan(CTX)
+        plan.ctx.section_name = "Orders Requested"
+        result = run_fact_gate(SECTIONS[1], plan.ctx, plan)
+        assert result.corrections
+        assert {c.section for c in result.corrections} == {"Orders Requested"}
+        plan.ctx.section_name = ""
+
+    def test_yearless_mention_of_a_full_date_entry_is_allowed(self):
+        plan = compile_gate_plan(CTX)
+        assert (6, 20) in plan.facts.dated_month_days
+        result = run_fact_gate("The June 20 exchange did not happen.", plan=plan)
+        assert not [c for c in result.corrections if c.type == "date"]
+
+
+class TestBuiltOnce:
+    def test_sections_share_one_allowed_facts_build(self, monkeypatch):
+        calls = _counting_build(monkeypatch)
+        plan = compile_gate_plan(CTX)
+        for text in SECTIONS:
+            run_fact_gate(text, CTX, plan)
+        assert len(calls) == 1
+
+        for text in SECTIONS:
+            run_fact_gate(text, CTX)
+        assert len(calls) == 1 + len(SECTIONS)
+
+    def test_streaming_gate_compiles_once_per_stream(self, monkeypatch):
+        calls = _counting_build(monkeypatch)
+        gate = StreamingGate(CTX)
+        for text in SECTIONS:
+            gate.feed(text + " ")
+        gate.finish()
+        assert len(calls) == 1
+
+    def test_semantic_check_reuses_the_plan_intake_lines(self):
+        plan = compile_gate_plan(CTX)
+        profile = {"party_name": "Maria Delgado"}
+        with_plan = semantic_check_service._facts_block(CTX.intake_values, profile, plan)
+        without = semantic_check_service._facts_block(CTX.intake_values, profile)
+        assert with_plan == without
+        assert "incident_date: 2026-06-14" in plan.intake_lines
+
+
+class TestNeverRaises:
+    def test_failed_facts_build_is_skipped_on_every_run(self, monkeypatch):
+        def broken(ctx):
+            raise RuntimeError("bad intake")
+
+        monkeypatch.setattr(plan_module, "build_allowed_facts", broken)
+        plan = compile_gate_plan(CTX)
+        assert plan.facts_ok is False
+        for text in SECTIONS[:2]:
+            result = run_fact_gate(text, CTX, plan)
+            skipped = [c for c in result.corrections if c.severity == "info" and c.type == "amount"]
+            assert len(skipped) == 1
+
+    def test_garbage_context_compiles(self):
+        plan = compile_gate_plan(GateContext(children=["junk", None], intake_values={"a": [None]}))
+        assert isinstance(run_fact_gate("Some $12 text.", plan=plan).text, str)
+        assert isinstance(compile_gate_plan(None).ctx, GateContext)
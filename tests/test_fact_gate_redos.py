@@ -0,0 +1,132 @@
+"""
+Adversarial-input guardrails for the fact gate: the linear rewrites of the
+per-match work behave exactly like the forms they replaced, gate time grows
+linearly on pathological inputs, and a pass that runs past its time budget
+is skipped and flagged instead of hanging (budget.py).
+"""
+import random
+import time
+from datetime import date
+
+import pytest
+
+from app.services.fact_gate import GateContext, compile_gate_plan, run_fact_gate
+from app.services.fact_gate import fact_check, gate
+from app.services.fact_gate.budget import PassTimeout, check_budget, pass_budget
+from app.services.fact_gate.types import excerpt
+
+CTX = GateContext(
+    party_name="Maria Delgado",
+    other_party_name="Jacob Delgado",
+    children=[
+        {"name": "Sofia Delgado", "date_of_birth": "2018-03-22"},
+        {"name": "Mateo Delgado", "dob": "2020-11-05"},
+    ],
+    intake_values={"support_amount": "$450", "hearing": "June 20, 2026"},
+    today=date(2026, 7, 11),
+)
+
+# Inputs that were quadratic before the rewrite, and per-pattern worst cases
+ADVERSARIAL = {
+    "bare_years": lambda n: "5 years " * (n // 8),
+    "amounts_then_support": lambda n: "$5 " * (n // 3) + "child support",
+    "quantifiers": lambda n: "numerous " * (n // 9),
+    "names_and_ages": lambda n: "Sofia age 5 " * (n // 12),
+    "unclosed_bold": lambda n: "**" + "a" * n,
+    "unclosed_placeholders": lambda n: "[A" * (n // 2),
+    "dollar_commas": lambda n: "$1" + ",111" * (n // 4),
+    "month_then_spaces": lambda n: "June 1" + " " * n + "x",
+    "role_then_spaces": lambda n: "Petitioner" + " " * n + "x",
+    "open_parens": lambda n: "(" * n,
+}
+
+
+def _old_excerpt(text, limit):
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 1].rstrip() + "…"
+
+
+class TestLinearRewrites:
+    def test_excerpt_matches_collapsing_the_whole_text(self):
+        rng = random.Random(7)
+        pieces = ["a", "bc", " ", "  ", "\n", "\t", "\xa0", "word ", " " * 40, "x" * 25]
+        for _ in range(3000):
+            text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 80)))
+            limit = rng.choice([1, 2, 5, 30, 200])
+            assert excerpt(text, limit) == _old_excerpt(text, limit)
+
+    def test_duration_guard_matches_searching_the_prefix(self):
+        rng = random.Random(3)
+        words = ["for", "past", "approximately", "Nearly", "xfor", "5", "years", "old", "\n", ".", "  "]
+        for _ in range(3000):
+            sentence = "".join(rng.choice(words) + rng.choice(["", " "]) for _ in range(20))
+            for match in fact_check._BARE_YEARS_RE.finditer(sentence):
+                expected = bool(fact_check._DURATION_GUARD_RE.search(sentence[:match.start()]))
+                assert fact_check._duration_guarded(sentence, match.start()) == expected
+
+    def test_age_goes_to_the_nearest_preceding_name_else_the_following_one(self):
+        facts = compile_gate_plan(CTX).facts
+        out, _ = fact_check.check_ages("At age 2, Sofia was age 3, and Mateo was age 4.", facts)
+        assert out == "At age 8, Sofia was age 8, and Mateo was age 5."
+
+
+class TestPassBudget:
+    def test_slow_pass_is_skipped_and_later_passes_still_run(self, monkeypatch):
+        def slow_amounts(text, facts, doc=None):
+            while True:
+                check_budget()
+
+        monkeypatch.setattr(gate, "FACT_GATE_PASS_BUDGET_SECONDS", 0.05)
+        monkeypatch.setattr(gate, "check_amounts", slow_amounts)
+        started = time.perf_counter()
+        result = run_fact_gate("Pay $900 by June 21, 2026.", CTX)
+        assert time.perf_counter() - started < 5
+        assert "$900" in result.text  # the amount pass made no edits
+        assert "[TO BE COMPLETED]" in result.text  # the date pass still ran
+        skipped = [c for c in result.corrections if c.type == "amount"]
+        assert [c.message for c in skipped] == [
+            "The automated amount check took too long on this text and was skipped."
+        ]
+        assert skipped[0].severity == "info"
+
+    def test_real_pass_stops_on_a_pathological_input(self, monkeypatch):
+        monkeypatch.setattr(gate, "FACT_GATE_PASS_BUDGET_SECONDS", 1e-6)
+        text = "$5 " * 5000 + "child support"
+        result = run_fact_gate(text, CTX)
+        assert "took too long" in " ".join(c.message for c in result.corrections)
+        assert result.text.count("$5") == 5000
+
+    def test_zero_budget_disables_the_check(self):
+        with pass_budget(0):
+            check_budget()
+
+    def test_check_raises_once_the_pass_is_past_its_deadline(self):
+        with pytest.raises(PassTimeout):
+            with pass_budget(1e-9):
+                time.sleep(0.001)
+                check_budget()
+
+    def test_check_is_a_no_op_outside_a_pass(self):
+        with pass_budget(1e-9):
+            pass
+        time.sleep(0.001)
+        check_budget()  # the expired deadline was reset on exit
+
+
+class TestAdversarialInputs:
+    SIZE = 20000
+
+    @pytest.mark.parametrize("name", sorted(ADVERSARIAL))
+    def test_gate_time_grows_linearly(self, name, monkeypatch):
+        monkeypatch.setattr(gate, "FACT_GATE_PASS_BUDGET_SECONDS", 0)
+        plan = compile_gate_plan(CTX)
+        timings = []
+        for size in (self.SIZE, 4 * self.SIZE):
+            text = ADVERSARIAL[name](size)
+            started = time.perf_counter()
+            run_fact_gate(text, CTX, plan)
+            timings.append(time.perf_counter() - started)
+        small, large = timings
+        # linear grows ~4x, quadratic ~16x; the slack absorbs timer noise
+        assert large <= 8 * small + 0.25, timings
+        assert large < 10, timings
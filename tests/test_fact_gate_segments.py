@@ -0,0 +1,214 @@
+"""
+Tests for the shared segmented text (app/services/fact_gate/segments.py):
+bisect lookups, incremental re-segmentation after edits (must always equal a
+full re-segmentation), one segmentation shared across the gate passes, and
+mapping positions back through edits to the text the gate was given.
+"""
+import random
+import re
+
+import pytest
+
+from app.services.fact_gate import GateContext, run_fact_gate
+from app.services.fact_gate import segments as segments_module
+from app.services.fact_gate.segments import SegmentedText
+from app.services.fact_gate.types import sentence_spans
+
+TEXT = "First one.  Second $5 here!\n\nThird line\nfourth? Fifth."
+
+
+class TestLookup:
+    def test_sentence_at_uses_the_span_containing_pos(self):
+        doc = SegmentedText(TEXT)
+        assert doc.spans == sentence_spans(TEXT)
+        for i, (start, end) in enumerate(doc.spans):
+            assert doc.index_at(start) == i
+            assert doc.index_at(end - 1) == i
+            assert doc.sentence(i) == TEXT[start:end]
+
+    def test_gaps_belong_to_no_sentence(self):
+        doc = SegmentedText(TEXT)
+        gap = TEXT.index("  ") + 1
+        assert doc.index_at(gap) is None
+        assert doc.sentence_at(gap) == (0, 0)
+
+    def test_collapsed_form_is_cached(self):
+        doc = SegmentedText("A  very\t spaced   sentence.")
+        assert doc.collapsed(0) == "A very spaced sentence."
+        assert doc.collapsed(0) is doc.collapsed(0)
+
+    def test_sentence_spans_range_keeps_absolute_offsets(self):
+        begin = TEXT.index("Third")
+        assert sentence_spans(TEXT, begin) == [s for s in sentence_spans(TEXT) if s[0] >= begin]
+
+
+class TestApply:
+    def test_edits_produce_the_same_text_as_sequential_slicing(self):
+        doc = SegmentedText(TEXT)
+        start = TEXT.index("$5")
+        edited = doc.apply([(start, start + 2, "[TO BE COMPLETED]"), (0, 5, "1st")])
+        assert edited.text == "1st one.  Second [TO BE COMPLETED] here!\n\nThird line\nfourth? Fifth."
+        assert edited.spans == sentence_spans(edited.text)
+
+    def test_successor_is_reused_by_derive(self):
+        doc = SegmentedText(TEXT)
+        edited = doc.apply([(0, 5, "1st")])
+        assert doc.derive(edited.text) is edited
+        assert doc.derive(TEXT) is doc
+        assert doc.apply([]) is doc
+
+    def test_edit_that_creates_or_removes_a_break(self):
+        doc = SegmentedText("One two three four. Five six.")
+        split = doc.apply([(7, 8, ". T")])  # "One two. Three four."
+        assert split.spans == sentence_spans(split.text)
+        joined = split.derive(split.text).apply([(0, len("One two. "), "")])
+        assert joined.spans == sentence_spans(joined.text)
+
+    def test_overlapping_edits_fall_back_to_right_to_left_application(self):
+        doc = SegmentedText("abcdef")
+        doc.spans
+        edited = doc.apply([(0, 3, "X"), (2, 4, "Y")])
+        assert edited.text == "Xef"  # (2, 4) first -> "abYef", then (0, 3)
+        assert edited.spans == sentence_spans(edited.text)
+
+    def test_break_that_now_swallows_a_whitespace_span(self):
+        # "b\n \n" has a lone " " sentence; a "." before it makes the whole
+        # run one break, which a rescan bounded at that span would miss
+        doc = SegmentedText("aaaa bbbb. cccc dddd b\n \n \nee.")
+        doc.spans
+        edited = doc.apply([(21, 22, "b.")])
+        assert edited.spans == sentence_spans(edited.text)
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_incremental_spans_always_match_a_full_rescan(self, seed):
+        rng = random.Random(seed)
+        words = ["alpha", "beta.", "gamma!", "\n", "\n\n", " ", "delta?", "$12", "x.", "  "]
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 80)))
+        doc = SegmentedText(text)
+        doc.spans  # segmented before editing, as in the gate
+        edits, position = [], 0
+        while position < len(text):
+            start = rng.randint(position, len(text))
+            end = min(len(text), start + rng.randint(0, 6))
+            edits.append((start, end, rng.choice(["", "Q", ". ", "\n", "[TO BE COMPLETED]", "ok!"])))
+            position = end + 1
+        edited = doc.apply(edits)
+        assert edited.spans == sentence_spans(edited.text)
+
+
+class TestOrigin:
+    @staticmethod
+    def _random_edits(rng, text, fresh):
+        edits, position = [], 0
+        while position < len(text) and rng.random() < 0.7:
+            start = rng.randint(position, len(text))
+            end = min(len(text), start + rng.randint(0, 4))
+            edits.append((start, end, fresh * rng.randint(0, 3)))
+            position = end + 1
+        return edits
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_surviving_characters_map_back_to_where_they_were(self, seed):
+        rng = random.Random(seed)
+        original = "".join(chr(0x4E00 + i) for i in range(rng.randint(0, 60)))  # all distinct
+        doc = root = SegmentedText(original)
+        for step in range(4):
+            fresh = "xyz."[step]  # never in the original
+            if rng.random() < 0.3:
+                cut = rng.randint(0, len(doc.text))
+                doc = doc.derive(doc.text[:cut] + fresh + doc.text[cut + 1:])
+            else:
+                doc = doc.apply(self._random_edits(rng, doc.text, fresh))
+        for pos, char in enumerate(doc.text):
+            start, end = doc.origin_span(pos, pos + 1)
+            if char in original:
+                assert (start, end) == (original.index(char), original.index(char) + 1)
+            else:
+                assert 0 <= start <= end <= len(root.text)
+
+    def test_replaced_text_widens_to_what_it_replaced(self):
+        doc = SegmentedText("Pay **$900** now.")
+        stripped = doc.sub(re.compile(r"\*\*(.+?)\*\*"), r"\1")
+        filled = stripped.apply([(4, 8, "[TO BE COMPLETED]")])
+        assert filled.text == "Pay [TO BE COMPLETED] now."
+        start, end = filled.origin_span(4, 4 + len("[TO BE COMPLETED]"))
+        assert doc.text[start:end] == "**$900**"
+        assert filled.origin_span(22, 25) == (13, 16)  # "now" after both edits
+
+    def test_sub_matches_re_sub(self):
+        text = "a**b** c**d**e __x__ `y` ** z"
+        for pattern, repl in [
+            (re.compile(r"\*\*(.+?)\*\*"), r"<\1>"),
+            (re.compile(r"x*"), "-"),
+            (re.compile(r"_+"), lambda m: str(len(m.group()))),
+        ]:
+            assert SegmentedText(text).sub(pattern, repl).text == pattern.sub(repl, text)
+
+
+class TestCorrectionPositions:
+    CTX = GateContext(
+        party_name="Maria Delgado",
+        other_party_name="Jacob Delgado",
+        intake_values={"support_amount": "$450"},
+    )
+
+    def test_positions_point_into_the_text_given_to_the_gate(self):
+        text = (
+            "### Facts\n**Note:** Petitioner is Jacob Delgado. (Fam. Code, § 3011.) "
+            "[PETITIONER NAME] asks for $900 in child support on multiple occasions."
+        )
+        result = run_fact_gate(text, self.CTX)
+        quoted = {c.type: text[c.start:c.end] for c in result.corrections if c.start is not None}
+        assert quoted["party_role"] == "Petitioner is Jacob Delgado"
+        assert quoted["authority_removed"] == "(Fam. Code, § 3011.)"
+        assert quoted["placeholder_filled"] == "[PETITIONER NAME]"
+        assert quoted["amount"] == "$900"
+        assert quoted["quantifier_flag"] == "multiple occasions"
+        markdown = [c for c in result.corrections if c.type == "markdown"]
+        assert markdown and markdown[0].start is None
+
+    def test_text_inside_a_markdown_edit_widens_to_the_markup(self):
+        text = "**Petitioner is Jacob Delgado.** He pays."
+        result = run_fact_gate(text, self.CTX)
+        role = [c for c in result.corrections if c.type == "party_role"][0]
+        assert text[role.start:role.end] == "**Petitioner is Jacob Delgado.**"
+
+    def test_report_shape_is_unchanged(self):
+        result = run_fact_gate("Pay $900 now.", self.CTX)
+        assert set(result.corrections[0].as_dict()) == {
+            "type", "severity", "section", "original", "replacement", "message",
+        }
+
+
+class TestSharedAcrossPasses:
+    def test_unedited_text_is_segmented_once_per_gate_run(self, monkeypatch):
+        calls = []
+        original = segments_module.sentence_spans
+
+        def counting(text, *args):
+            calls.append(args)
+            return original(text, *args)
+
+        monkeypatch.setattr(segments_module, "sentence_spans", counting)
+        text = "I asked on multiple occasions. He said no. It rained on $5 day. " * 20
+        ctx = GateContext(intake_values={"amount": "$5"})
+        result = run_fact_gate(text, ctx)
+        assert result.text == text
+        assert calls == [()]  # one full scan shared by every pass
+
+    def test_edits_rescan_only_the_touched_region(self, monkeypatch):
+        calls = []
+        original = segments_module.sentence_spans
+
+        def counting(text, *args):
+            calls.append(args)
+            return original(text, *args)
+
+        monkeypatch.setattr(segments_module, "sentence_spans", counting)
+        text = "Plain sentence here. " * 200 + "He owes $999 now. " + "Plain sentence here. " * 200
+        result = run_fact_gate(text, GateContext())
+        assert "[TO BE COMPLETED]" in result.text
+        full_scans = [args for args in calls if not args]
+        regional = [args for args in calls if args]
+        assert len(full_scans) == 1
+        assert len(regional) == 1 and regional[0][1] - regional[0][0] < 200
@@ -0,0 +1,76 @@
+"""
+StreamingGate: sentences are gated and released as soon as they complete,
+and finish() returns exactly the batch run_fact_gate result for the full text.
+"""
+from datetime import date
+
+from app.services.fact_gate import GateContext, StreamingGate, run_fact_gate
+
+CTX = GateContext(
+    party_name="Maria Delgado",
+    other_party_name="Jacob Delgado",
+    is_petitioner=True,
+    children=[{"name": "Sofia Delgado", "date_of_birth": "2018-03-22"}],
+    intake_values={"incident_date": "2026-06-14"},
+    today=date(2026, 7, 11),
+)
+
+TEXT = (
+    "Petitioner is **Jacob Delgado**. Sofia Delgado, age 3, lives with Petitioner. "
+    "Petitioner relies on Family Code section 3011 for this request. "
+    "On June 14, 2026, Respondent did not appear.\n\n"
+    "Respondent owes $9,999.00 in arrears"
+)
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestStreamingGate:
+    def test_pieces_released_only_for_complete_sentences(self):
+        gate = StreamingGate(CTX)
+        assert gate.feed("Petitioner is **Jacob") == []
+        assert gate.feed(" Delgado**.") == []  # no break yet — could still be "Delgado**.5"
+        pieces = gate.feed(" Sofia")
+        assert pieces == ["Petitioner is Maria Delgado."]
+
+    def test_each_sentence_is_gated(self):
+        gate = StreamingGate(CTX)
+        streamed = []
+        for chunk in _chunks(TEXT, 7):
+            streamed.extend(gate.feed(chunk))
+        tail, _ = gate.finish()
+        streamed.extend(tail)
+        joined = "".join(streamed)
+        assert "**" not in joined
+        assert "Jacob Delgado" not in joined
+        assert "age 8" in joined
+        assert "section 3011" not in joined
+        assert "$9,999.00" not in joined
+
+    def test_finish_matches_batch_gate(self):
+        for size in (1, 5, 64, len(TEXT)):
+            gate = StreamingGate(CTX)
+            for chunk in _chunks(TEXT, size):
+                gate.feed(chunk)
+            _, result = gate.finish()
+            batch = run_fact_gate(TEXT, CTX)
+            assert result.text == batch.text
+            assert result.as_report() == batch.as_report()
+
+    def test_streamed_preview_matches_batch_text_for_sentence_local_output(self):
+        gate = StreamingGate(CTX)
+        pieces = []
+        for chunk in _chunks(TEXT, 11):
+            pieces.extend(gate.feed(chunk))
+        tail, result = gate.finish()
+        assert "".join(pieces + tail) == result.text
+
+    def test_empty_stream(self):
+        gate = StreamingGate()
+        assert gate.feed("") == []
+        tail, result = gate.finish()
+        assert tail == []
+        assert result.text == ""
+        assert result.corrections == []
@@ -0,0 +1,87 @@
+"""
+Tests for deferred singletons and SDK probing (app/core/lazy.py), and that
+importing app.main no longer loads the heavy provider SDKs.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.core.lazy import LazySingleton, is_built, module_available
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Service:
+    built = 0
+
+    def __init__(self):
+        Service.built += 1
+        self.value = "real"
+
+    def greet(self):
+        return f"hello from {self.value}"
+
+
+@pytest.fixture(autouse=True)
+def reset_count():
+    Service.built = 0
+
+
+class TestLazySingleton:
+    def test_built_on_first_attribute_access_only(self):
+        service = LazySingleton(Service)
+        assert Service.built == 0 and not is_built(service)
+
+        assert service.greet() == "hello from real"
+        assert service.value == "real"
+        assert Service.built == 1 and is_built(service)
+
+    def test_setattr_and_monkeypatch_reach_the_instance(self, monkeypatch):
+        service = LazySingleton(Service)
+        service.value = "patched"
+        assert service.greet() == "hello from patched"
+
+        monkeypatch.setattr(service, "greet", lambda: "mocked")
+        assert service.greet() == "mocked"
+        monkeypatch.undo()
+        assert service.greet() == "hello from patched"
+
+    def test_repr_does_not_build(self):
+        service = LazySingleton(Service)
+        assert "not built" in repr(service)
+        assert Service.built == 0
+
+    def test_plain_objects_count_as_built(self):
+        assert is_built(object())
+
+
+class TestModuleAvailable:
+    def test_probe_does_not_import(self):
+        sys.modules.pop("colorsys", None)
+        assert module_available("colorsys")
+        assert "colorsys" not in sys.modules
+
+    def test_missing_modules(self):
+        assert not module_available("no_such_sdk_installed")
+        assert not module_available("no_such_sdk_installed.submodule")
+
+
+def test_app_import_leaves_provider_sdks_unloaded():
+    """Production-like flags: SDKs load when their backend is first used."""
+    probe = (
+        "import json, sys; import app.main; "
+        "print(json.dumps([m for m in ('vertexai', 'google.cloud.aiplatform', "
+        "'google.cloud.monitoring_v3', 'google.cloud.secretmanager', "
+        "'google.cloud.pubsub_v1', 'google.cloud.vision', 'reportlab.platypus') "
+        "if m in sys.modules]))"
+    )
+    env = {**os.environ, "USE_GCP": "true", "USE_MOCK_LLM": "false", "USE_CLAUDE": "false"}
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, env=env,
+        capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
@@ -0,0 +1,206 @@
+"""
+Tests for the content-addressed LLM response cache.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services import llm_cache as llm_cache_module
+from app.services.claude_llm_service import ClaudeLLMService
+from app.services.cost_monitoring_service import cost_monitor
+from app.services.llm_cache import LLMResponseCache, cache_key
+
+
+@pytest.fixture(autouse=True)
+def enable_cache(monkeypatch):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+    llm_cache_module.llm_cache.clear()
+    yield
+    llm_cache_module.llm_cache.clear()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _generator(text="Generated", tokens=120, model="model-x"):
+    return AsyncMock(return_value=(text, tokens, model))
+
+
+class TestCacheKey:
+    def test_identical_inputs_share_a_key(self):
+        args = ("anthropic", "m", "section_rewrite", "sys", "prompt", 3000)
+        assert cache_key(*args) == cache_key(*args)
+
+    @pytest.mark.parametrize("index,value", [
+        (0, "vertex"), (1, "other-model"), (2, "declaration"),
+        (3, "other system"), (4, "prompt "), (5, 4000),
+    ])
+    def test_any_input_change_is_a_different_key(self, index, value):
+        args = ["anthropic", "m", "section_rewrite", "sys", "prompt", 3000]
+        changed = list(args)
+        changed[index] = value
+        assert cache_key(*args) != cache_key(*changed)
+
+
+class TestGetOrGenerate:
+    async def test_hit_returns_zero_tokens_and_skips_provider(self):
+        cache = LLMResponseCache(redis_url=None)
+        generate = _generator()
+
+        first = await cache.get_or_generate("k", generate, "section_rewrite")
+        second = await cache.get_or_generate("k", generate, "section_rewrite")
+
+        assert first == ("Generated", 120, "model-x")
+        assert second == ("Generated", 0, "model-x")
+        assert generate.await_count == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    async def test_hit_is_recorded_as_its_own_usage_line(self):
+        cache = LLMResponseCache(redis_url=None)
+        before = len(cost_monitor.usage_metrics)
+        await cache.get_or_generate("k", _generator(), "declaration", user_id="u1")
+        await cache.get_or_generate("k", _generator(), "declaration", user_id="u1")
+
+        added = cost_monitor.usage_metrics[before:]
+        assert len(added) == 1
+        assert added[0].service == "llm_cache"
+        assert added[0].estimated_cost == 0.0
+        assert added[0].metadata == {"tokens_saved": 120}
+
+    async def test_disabled_cache_always_calls_provider(self, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_ENABLED", "false")
+        cache = LLMResponseCache(redis_url=None)
+        generate = _generator()
+        await cache.get_or_generate("k", generate)
+        await cache.get_or_generate("k", generate)
+        assert generate.await_count == 2
+
+    async def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = LLMResponseCache(ttl_seconds=60, redis_url=None, clock=clock)
+        generate = _generator()
+
+        await cache.get_or_generate("k", generate)
+        clock.now += 59
+        await cache.get_or_generate("k", generate)
+        clock.now += 2
+        await cache.get_or_generate("k", generate)
+
+        assert generate.await_count == 2
+
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = LLMResponseCache(max_entries=2, redis_url=None)
+        generate = _generator()
+        await cache.get_or_generate("a", generate)
+        await cache.get_or_generate("b", generate)
+        await cache.get_or_generate("a", generate)  # a is now most recent
+        await cache.get_or_generate("c", generate)  # evicts b
+
+        assert generate.await_count == 3
+        await cache.get_or_generate("a", generate)
+        assert generate.await_count == 3
+        await cache.get_or_generate("b", generate)
+        assert generate.await_count == 4
+
+    async def test_empty_generation_is_not_cached(self):
+        cache = LLMResponseCache(redis_url=None)
+        generate = _generator(text="")
+        await cache.get_or_generate("k", generate)
+        await cache.get_or_generate("k", generate)
+        assert generate.await_count == 2
+
+    async def test_provider_errors_are_not_cached(self):
+        cache = LLMResponseCache(redis_url=None)
+        generate = AsyncMock(side_effect=[RuntimeError("529"), ("ok", 10, "m")])
+        with pytest.raises(RuntimeError):
+            await cache.get_or_generate("k", generate)
+        assert await cache.get_or_generate("k", generate) == ("ok", 10, "m")
+
+
+class TestSingleFlight:
+    async def test_concurrent_identical_calls_share_one_provider_request(self):
+        cache = LLMResponseCache(redis_url=None)
+        calls = 0
+
+        async def generate():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "Shared", 50, "m"
+
+        results = await asyncio.gather(
+            *(cache.get_or_generate("k", generate) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert results[0] == ("Shared", 50, "m")
+        assert all(r == ("Shared", 0, "m") for r in results[1:])
+
+    async def test_followers_see_the_leaders_error(self):
+        cache = LLMResponseCache(redis_url=None)
+
+        async def generate():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("overloaded")
+
+        results = await asyncio.gather(
+            *(cache.get_or_generate("k", generate) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache._in_flight == {}
+
+    async def test_cancelled_leader_lets_follower_generate(self):
+        cache = LLMResponseCache(redis_url=None)
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+            return "never", 1, "m"
+
+        leader = asyncio.create_task(cache.get_or_generate("k", slow))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_generate("k", _generator("own")))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("own", 120, "model-x")
+
+
+class TestClaudeBackendCaching:
+    def _service(self):
+        service = ClaudeLLMService(base_system_prompt="Base legal writing prompt")
+        block = MagicMock()
+        block.type = "text"
+        block.text = "Drafted section"
+        response = MagicMock()
+        response.content = [block]
+        response.usage.input_tokens = 100
+        response.usage.output_tokens = 50
+        client = AsyncMock()
+        client.messages.create.return_value = response
+        service._client = client
+        return service, client
+
+    async def test_repeat_generate_is_served_from_cache(self):
+        service, client = self._service()
+
+        first = await service.generate("Rewrite this", "section_rewrite")
+        second = await service.generate("Rewrite this", "section_rewrite")
+
+        assert first[1] == 150
+        assert second == ("Drafted section", 0, first[2])
+        assert client.messages.create.await_count == 1
+
+    async def test_different_operation_is_a_miss(self):
+        service, client = self._service()
+        await service.generate("Rewrite this", "section_rewrite")
+        await service.generate("Rewrite this", "declaration")
+        assert client.messages.create.await_count == 2
@@ -0,0 +1,91 @@
+"""
+Tests for the process-wide LLM client registry (app/services/llm_clients.py).
+"""
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.claude_llm_service import ClaudeLLMService
+from app.services.llm_clients import LLMClientRegistry
+
+
+class TestAnthropicClient:
+    def test_one_pooled_client_with_configured_limits(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        registry = LLMClientRegistry(max_connections=7, max_keepalive_connections=3)
+
+        client = registry.anthropic()
+
+        assert registry.anthropic() is client
+        pool = client._client._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+
+    async def test_aclose_closes_client_and_rebuilds_on_demand(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        registry = LLMClientRegistry()
+        client = registry.anthropic()
+
+        await registry.aclose()
+
+        assert client.is_closed()
+        assert registry.anthropic() is not client
+
+    def test_backends_borrow_the_registry_client(self, monkeypatch):
+        from app.services import claude_llm_service
+
+        shared = object()
+        monkeypatch.setattr(claude_llm_service.llm_clients, "anthropic", lambda: shared)
+
+        assert ClaudeLLMService()._get_client() is shared
+        assert ClaudeLLMService("Other prompt")._get_client() is shared
+
+
+class TestVertexModels:
+    def test_init_once_and_models_cached(self, monkeypatch):
+        vertexai = ModuleType("vertexai")
+        vertexai.init = MagicMock()
+        generative_models = ModuleType("vertexai.generative_models")
+        generative_models.GenerativeModel = lambda **kwargs: SimpleNamespace(**kwargs)
+        monkeypatch.setitem(sys.modules, "vertexai", vertexai)
+        monkeypatch.setitem(sys.modules, "vertexai.generative_models", generative_models)
+        registry = LLMClientRegistry()
+
+        drafting = registry.vertex_model("gemini", "drafting prompt")
+        chat = registry.vertex_model("gemini", "chat prompt")
+
+        assert registry.vertex_model("gemini", "drafting prompt") is drafting
+        assert chat is not drafting
+        assert chat.system_instruction == "chat prompt"
+        vertexai.init.assert_called_once()
+
+
+class TestSharedServices:
+    def test_one_instance_per_class(self):
+        registry = LLMClientRegistry()
+
+        class Service:
+            pass
+
+        assert registry.shared(Service) is registry.shared(Service)
+
+    def test_chat_and_violation_services_share_llm_service(self):
+        from app.services.chat_service import ChatService
+
+        chat = ChatService()
+
+        assert chat.llm_service is chat.violation_service.llm_service
+        assert ChatService().llm_service is chat.llm_service
+
+    async def test_shutdown_hooks_run_and_failures_are_logged(self):
+        registry = LLMClientRegistry()
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        closing = AsyncMock()
+        registry.on_shutdown(failing)
+        registry.on_shutdown(closing)
+
+        await registry.aclose()
+
+        closing.assert_awaited_once()
+        await registry.aclose()
+        closing.assert_awaited_once()
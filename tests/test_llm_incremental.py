@@ -0,0 +1,221 @@
+"""
+Re-running /llm/process-motion after editing one intake step must only
+redraft sections whose inputs changed. Each draft stores a fingerprint of
+what produced its llm_output (question data, accumulated profile context,
+prompt version, model); matching sections skip the LLM and the semantic
+check and keep their stored output and corrections. The stored output is
+still re-gated, since the gate checks it against every step's answers.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+
+# Patch the instance the endpoint module holds (see test_llm_gate_integration)
+from app.api.v1.endpoints import llm as llm_endpoint
+from app.services import llm_service as llm_module
+
+pytestmark = pytest.mark.asyncio
+
+PROFILE = {
+    "case_number": "24FL009812N",
+    "county": "San Diego",
+    "is_petitioner": True,
+    "party_name": "Maria Delgado",
+    "other_party_name": "Jacob Delgado",
+}
+DRAFTS = [
+    (1, "case_information", {"case_summary": "Please fix the schedule."}),
+    (2, "relief_requested", {"relief": "Modify weekend visits."}),
+]
+
+
+def _rewriter():
+    """Stand-in rewrite that leaves markdown for the gate to correct."""
+    async def rewrite(section_name, user_answers, context, user_id=None):
+        return {
+            "success": True,
+            "rewritten_text": f"**{section_name}** Petitioner requests relief.",
+            "tokens_used": 10,
+        }
+    return AsyncMock(side_effect=rewrite)
+
+
+async def _create_motion(client: AsyncClient, headers: dict) -> str:
+    resp = await client.post("/api/v1/profiles/", json=PROFILE, headers=headers)
+    assert resp.status_code == 201, resp.text
+    resp = await client.post(
+        "/api/v1/motions/", json={"motion_type": "RFO", "title": "Custody RFO"},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    motion_id = resp.json()["id"]
+    for number, name, question_data in DRAFTS:
+        await _save_draft(client, headers, motion_id, number, name, question_data)
+    return motion_id
+
+
+async def _save_draft(client, headers, motion_id, number, name, question_data):
+    resp = await client.post(
+        f"/api/v1/motions/{motion_id}/drafts",
+        json={"step_number": number, "step_name": name, "question_data": question_data},
+        headers=headers,
+    )
+    assert resp.status_code == 200, resp.text
+
+
+async def _process(client: AsyncClient, headers: dict, motion_id: str) -> dict:
+    resp = await client.post(
+        "/api/v1/llm/process-motion", json={"motion_id": motion_id}, headers=headers
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+@pytest.fixture
+def rewriter(monkeypatch):
+    mock = _rewriter()
+    monkeypatch.setattr(llm_endpoint.llm_service, "rewrite_rfo_section", mock)
+    return mock
+
+
+@pytest.fixture
+def semantic(monkeypatch):
+    mock = AsyncMock(return_value=[])
+    monkeypatch.setattr(llm_endpoint.semantic_check_service, "check_text", mock)
+    return mock
+
+
+class TestProcessMotionReuse:
+    async def test_unchanged_rerun_skips_every_section(
+        self, client, auth_headers, rewriter, semantic
+    ):
+        motion_id = await _create_motion(client, auth_headers)
+        first = await _process(client, auth_headers, motion_id)
+        assert rewriter.await_count == 2
+        assert semantic.await_count == 1
+
+        second = await _process(client, auth_headers, motion_id)
+
+        assert rewriter.await_count == 2
+        assert semantic.await_count == 1
+        assert second["sections_processed"] == 2
+        assert second["sections_reused"] == 2
+        assert second["total_tokens"] == 0
+        assert second["corrections"] == first["corrections"]
+        assert {c["type"] for c in second["corrections"]} == {"markdown"}
+
+    async def test_editing_last_step_redrafts_only_that_section(
+        self, client, auth_headers, rewriter, semantic
+    ):
+        motion_id = await _create_motion(client, auth_headers)
+        await _process(client, auth_headers, motion_id)
+        await _save_draft(client, auth_headers, motion_id, 2, "relief_requested",
+                          {"relief": "Modify holiday visits."})
+
+        body = await _process(client, auth_headers, motion_id)
+
+        redrafted = [call.args[0] for call in rewriter.await_args_list[2:]]
+        assert redrafted == ["relief_requested"]
+        assert body["sections_reused"] == 1
+        assert body["total_tokens"] == 10
+        # Corrections for both sections are still reported
+        assert {c["section"] for c in body["corrections"]} == {
+            "case_information", "relief_requested"
+        }
+        # Only the redrafted section goes to the semantic check
+        checked_text = semantic.await_args_list[-1].args[0]
+        assert "relief_requested" in checked_text
+        assert "case_information" not in checked_text
+
+    async def test_editing_earlier_step_redrafts_later_sections_too(
+        self, client, auth_headers, rewriter, semantic
+    ):
+        """Later prompts see earlier answers in their context."""
+        motion_id = await _create_motion(client, auth_headers)
+        await _process(client, auth_headers, motion_id)
+        await _save_draft(client, auth_headers, motion_id, 1, "case_information",
+                          {"case_summary": "The schedule no longer works."})
+
+        body = await _process(client, auth_headers, motion_id)
+
+        assert rewriter.await_count == 4
+        assert body["sections_reused"] == 0
+
+    async def test_reused_section_is_regated_against_the_current_intake(
+        self, client, auth_headers, rewriter, semantic
+    ):
+        """An earlier section's prompt never sees a later step, but its gate does."""
+        async def rewrite(section_name, user_answers, context, user_id=None):
+            text = "Respondent owes $1,350 in arrears." if section_name == "case_information" \
+                else "Petitioner requests relief."
+            return {"success": True, "rewritten_text": text, "tokens_used": 10}
+
+        rewriter.side_effect = rewrite
+        motion_id = await _create_motion(client, auth_headers)
+        await _save_draft(client, auth_headers, motion_id, 2, "relief_requested",
+                          {"relief": "Order the $1,350 in arrears paid."})
+        first = await _process(client, auth_headers, motion_id)
+        assert not [c for c in first["corrections"] if c["type"] == "amount"]
+        await _save_draft(client, auth_headers, motion_id, 2, "relief_requested",
+                          {"relief": "Modify holiday visits."})
+
+        body = await _process(client, auth_headers, motion_id)
+
+        redrafted = [call.args[0] for call in rewriter.await_args_list[2:]]
+        assert redrafted == ["relief_requested"]
+        assert body["sections_reused"] == 1
+        amounts = [c for c in body["corrections"] if c["type"] == "amount"]
+        assert [(c["section"], c["original"]) for c in amounts] == [("case_information", "$1,350")]
+        resp = await client.get(f"/api/v1/motions/{motion_id}", headers=auth_headers)
+        stored = {d["step_name"]: d["llm_output"] for d in resp.json()["drafts"]}
+        assert "$1,350" not in stored["case_information"]
+
+    async def test_prompt_version_bump_redrafts_everything(
+        self, client, auth_headers, rewriter, semantic, monkeypatch
+    ):
+        motion_id = await _create_motion(client, auth_headers)
+        await _process(client, auth_headers, motion_id)
+        monkeypatch.setattr(llm_module, "RFO_PROMPT_VERSION", "next")
+
+        body = await _process(client, auth_headers, motion_id)
+
+        assert rewriter.await_count == 4
+        assert body["sections_reused"] == 0
+
+    async def test_kept_reviewer_flags_follow_unchanged_text(
+        self, client, auth_headers, rewriter, semantic
+    ):
+        motion_id = await _create_motion(client, auth_headers)
+        # Quotes gated (markdown-stripped) text of the section that stays unchanged
+        semantic.return_value = [{
+            "type": "semantic_flag", "severity": "needs_review", "section": "reviewer",
+            "original": "case_information Petitioner", "replacement": None, "message": "m",
+        }]
+        await _process(client, auth_headers, motion_id)
+        semantic.return_value = []
+        await _save_draft(client, auth_headers, motion_id, 2, "relief_requested",
+                          {"relief": "Modify holiday visits."})
+
+        body = await _process(client, auth_headers, motion_id)
+
+        flags = [c for c in body["corrections"] if c["type"] == "semantic_flag"]
+        assert [f["original"] for f in flags] == ["case_information Petitioner"]
+
+    async def test_stream_reuses_sections_saved_by_batch(
+        self, client, auth_headers, rewriter, semantic, monkeypatch
+    ):
+        motion_id = await _create_motion(client, auth_headers)
+        await _process(client, auth_headers, motion_id)
+        stream = AsyncMock()
+        monkeypatch.setattr(llm_endpoint.llm_service, "stream_rfo_section", stream)
+
+        resp = await client.post(
+            "/api/v1/llm/process-motion/stream", json={"motion_id": motion_id},
+            headers=auth_headers,
+        )
+
+        assert resp.status_code == 200
+        assert '"reused": true' in resp.text
+        assert '"sections_reused": 2' in resp.text
+        stream.assert_not_called()
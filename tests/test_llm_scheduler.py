@@ -0,0 +1,253 @@
+"""
+Tests for the outbound LLM scheduler (app/services/llm_scheduler.py):
+per-model concurrency and token-bucket admission, priority classes,
+per-user fair queuing and the metrics it reports.
+"""
+import asyncio
+
+import pytest
+
+from app.services.llm_scheduler import (
+    BACKGROUND,
+    INTERACTIVE,
+    LLMScheduler,
+    TokenBucket,
+    priority_for,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+async def _hold(scheduler, model="m", operation="section_rewrite", user=None):
+    """Take a slot and keep it until the returned event is set."""
+    release = asyncio.Event()
+    admitted = asyncio.Event()
+
+    async def run():
+        async with scheduler.slot(model, operation, user):
+            admitted.set()
+            await release.wait()
+
+    task = asyncio.create_task(run())
+    await admitted.wait()
+    return release, task
+
+
+async def _record_order(scheduler, jobs, order):
+    """Queue (operation, user, label) jobs behind a held slot; run them."""
+    release, holder = await _hold(scheduler)
+
+    async def job(operation, user, label):
+        async with scheduler.slot("m", operation, user):
+            order.append(label)
+
+    tasks = []
+    for operation, user, label in jobs:
+        tasks.append(asyncio.create_task(job(operation, user, label)))
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(holder, *tasks)
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+        assert bucket.try_take() and bucket.try_take()
+        assert not bucket.try_take()
+        assert bucket.seconds_until_token() == pytest.approx(0.5)
+        clock.now += 0.5
+        assert bucket.try_take()
+
+    def test_zero_rate_disables_admission_limit(self):
+        bucket = TokenBucket(rate=0, capacity=0)
+        assert all(bucket.try_take() for _ in range(100))
+
+
+class TestPriorities:
+    def test_operation_classes(self):
+        assert priority_for("chat_response") == INTERACTIVE
+        assert priority_for("evidence_ranking") == BACKGROUND
+        assert priority_for("claim_citation") == BACKGROUND
+
+    async def test_chat_jumps_queued_drafting_and_background(self):
+        scheduler = LLMScheduler(concurrency=1, rate=0)
+        order = []
+        await _record_order(scheduler, [
+            ("claim_citation", "u1", "citation"),
+            ("section_rewrite", "u1", "draft"),
+            ("chat_response", "u2", "chat"),
+        ], order)
+        assert order == ["chat", "draft", "citation"]
+
+
+class TestFairness:
+    async def test_users_interleave_within_a_class(self):
+        scheduler = LLMScheduler(concurrency=1, rate=0)
+        order = []
+        jobs = [("section_rewrite", "heavy", f"heavy{i}") for i in range(4)]
+        jobs.append(("section_rewrite", "light", "light0"))
+        await _record_order(scheduler, jobs, order)
+        # The light user's one request is not stuck behind all four heavy ones
+        assert order.index("light0") <= 2
+
+    async def test_weights_give_larger_share(self):
+        scheduler = LLMScheduler(concurrency=1, rate=0, user_weights={"paid": 3.0})
+        order = []
+        jobs = []
+        for i in range(4):
+            jobs.append(("section_rewrite", "free", f"free{i}"))
+            jobs.append(("section_rewrite", "paid", f"paid{i}"))
+        await _record_order(scheduler, jobs, order)
+        assert sum(1 for label in order[:4] if label.startswith("paid")) >= 3
+
+
+class TestAdmission:
+    async def test_concurrency_cap_per_model(self):
+        scheduler = LLMScheduler(concurrency=2, rate=0)
+        running = peak = 0
+
+        async def call(model):
+            nonlocal running, peak
+            async with scheduler.slot(model, "section_rewrite"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call("a") for _ in range(6)))
+        assert peak == 2
+        assert scheduler.metrics()["a"]["admitted"] == 6
+
+    async def test_models_are_limited_independently(self):
+        scheduler = LLMScheduler(concurrency=1, rate=0)
+        release, holder = await _hold(scheduler, model="a")
+        async with scheduler.slot("b", "chat_response"):
+            pass
+        release.set()
+        await holder
+
+    async def test_token_bucket_paces_admissions(self):
+        scheduler = LLMScheduler(concurrency=10, rate=50, burst=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        async def call():
+            async with scheduler.slot("m", "section_rewrite"):
+                pass
+
+        await asyncio.gather(*(call() for _ in range(4)))
+        # One burst token, then three more at 50/s
+        assert loop.time() - start >= 0.05
+
+    async def test_cancelled_waiter_releases_its_place(self):
+        scheduler = LLMScheduler(concurrency=1, rate=0)
+        release, holder = await _hold(scheduler)
+
+        async def wait_for_slot():
+            async with scheduler.slot("m", "section_rewrite"):
+                pass
+
+        waiting = asyncio.create_task(wait_for_slot())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        release.set()
+        await holder
+
+        async with scheduler.slot("m", "section_rewrite"):
+            assert scheduler.metrics()["m"]["in_flight"] == 1
+        assert scheduler.metrics()["m"]["in_flight"] == 0
+
+    async def test_slot_released_when_call_raises(self):
+        scheduler = LLMScheduler(concurrency=1, rate=0)
+        with pytest.raises(RuntimeError):
+            async with scheduler.slot("m", "section_rewrite"):
+                raise RuntimeError("provider error")
+        assert scheduler.metrics()["m"]["in_flight"] == 0
+
+
+class TestMetrics:
+    async def test_reports_queue_depth_and_waits(self):
+        scheduler = LLMScheduler(concurrency=1, rate=0)
+        release, holder = await _hold(scheduler)
+        queued = asyncio.create_task(_hold(scheduler, operation="chat_response"))
+        await asyncio.sleep(0.01)
+
+        metrics = scheduler.metrics()["m"]
+        assert metrics["in_flight"] == 1
+        assert metrics["queued"]["interactive"] == 1
+
+        release.set()
+        await holder
+        second_release, second = await queued
+        second_release.set()
+        await second
+        metrics = scheduler.metrics()["m"]
+        assert metrics["wait_p99_seconds"] > 0
+        assert metrics["queued"]["interactive"] == 0
+
+
+class TestChatLatencyUnderDraftingLoad:
+    async def test_chat_wait_stays_bounded(self):
+        scheduler = LLMScheduler(concurrency=2, rate=0)
+        chat_waits = []
+
+        async def draft():
+            async with scheduler.slot("m", "section_rewrite", "drafter"):
+                await asyncio.sleep(0.02)
+
+        async def chat():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            async with scheduler.slot("m", "chat_response", "chatter"):
+                chat_waits.append(loop.time() - start)
+                await asyncio.sleep(0.001)
+
+        drafts = [asyncio.create_task(draft()) for _ in range(20)]
+        await asyncio.sleep(0)
+        await asyncio.gather(*(chat() for _ in range(5)))
+        await asyncio.gather(*drafts)
+        # Each chat waits at most for one in-flight draft, not the backlog of 20
+        assert max(chat_waits) < 0.1
+
+
+class TestBackgroundPriority:
+    def test_context_demotes_every_operation(self):
+        from app.services.llm_scheduler import background_priority
+
+        with background_priority():
+            assert priority_for("chat_response") == BACKGROUND
+            assert priority_for("section_rewrite") == BACKGROUND
+        assert priority_for("chat_response") == INTERACTIVE
+
+    async def test_demoted_drafting_yields_to_normal_drafting(self):
+        from app.services.llm_scheduler import background_priority
+
+        scheduler = LLMScheduler(concurrency=1, rate=0)
+        order = []
+        release, holder = await _hold(scheduler)
+
+        async def speculative():
+            with background_priority():
+                async with scheduler.slot("m", "section_rewrite", "u1"):
+                    order.append("speculative")
+
+        async def drafting():
+            async with scheduler.slot("m", "section_rewrite", "u2"):
+                order.append("drafting")
+
+        tasks = [asyncio.create_task(speculative())]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(drafting()))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *tasks)
+        assert order == ["drafting", "speculative"]
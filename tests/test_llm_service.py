@@ -386,3 +386,132 @@ class TestValidateOutputWalrusBugFix:
         # the walrus expression silently set motion_type=True — fix removes that name)
         assert isinstance(result, dict)
         assert "valid" in result
+
+
+class TestProcessCompleteMotionConcurrency:
+    """max_concurrency > 1 fans sections out without changing what is sent."""
+
+    DRAFTS = [
+        {"step_number": n, "step_name": f"step_{n}", "question_data": {f"q{n}": f"answer {n}"}}
+        for n in (1, 2, 3, 4)
+    ]
+
+    @pytest.mark.asyncio
+    async def test_bounded_fan_out_keeps_step_order(self, llm_service, monkeypatch):
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def rewrite(section_name, answers, context, user_id=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later sections finish first, so input order must be restored
+            await asyncio.sleep(0.01 * (5 - int(section_name.split("_")[1])))
+            in_flight -= 1
+            return {"success": True, "rewritten_text": section_name, "tokens_used": 3}
+
+        monkeypatch.setattr(llm_service, "rewrite_rfo_section", rewrite)
+
+        result = await llm_service.process_complete_motion(
+            motion_type="RFO", all_drafts=self.DRAFTS, profile_data={}, max_concurrency=2
+        )
+
+        assert peak == 2
+        assert [s["step_number"] for s in result["sections"]] == [1, 2, 3, 4]
+        assert [s["rewritten_text"] for s in result["sections"]] == [
+            "step_1", "step_2", "step_3", "step_4"
+        ]
+        assert result["total_tokens"] == 12
+        assert result["aborted"] is False
+
+    @pytest.mark.asyncio
+    async def test_contexts_match_sequential_mode(self, llm_service, monkeypatch):
+        seen = {}
+
+        async def rewrite(section_name, answers, context, user_id=None):
+            seen.setdefault(section_name, []).append(dict(context))
+            return {"success": True, "rewritten_text": "ok", "tokens_used": 1}
+
+        monkeypatch.setattr(llm_service, "rewrite_rfo_section", rewrite)
+        for concurrency in (1, 4):
+            await llm_service.process_complete_motion(
+                motion_type="RFO", all_drafts=self.DRAFTS,
+                profile_data={"party_name": "A"}, max_concurrency=concurrency,
+            )
+
+        for calls in seen.values():
+            sequential, concurrent = calls
+            assert sequential == concurrent
+        assert "q3" not in seen["step_2"][1]
+        assert seen["step_4"][1]["q1"] == "answer 1"
+
+    @pytest.mark.asyncio
+    async def test_abort_checked_for_every_section(self, llm_service, monkeypatch):
+        from unittest.mock import AsyncMock
+
+        rewrite = AsyncMock(return_value={"success": True, "rewritten_text": "ok", "tokens_used": 1})
+        monkeypatch.setattr(llm_service, "rewrite_rfo_section", rewrite)
+
+        result = await llm_service.process_complete_motion(
+            motion_type="RFO", all_drafts=self.DRAFTS, profile_data={},
+            should_abort=AsyncMock(return_value=True), max_concurrency=4,
+        )
+
+        assert rewrite.await_count == 0
+        assert result["sections"] == []
+        assert result["aborted"] is True
+
+    @pytest.mark.asyncio
+    async def test_budget_checked_for_every_section(self, llm_service, monkeypatch):
+        from unittest.mock import AsyncMock
+        from app.services import llm_service as llm_module
+
+        check = AsyncMock(return_value=(True, ""))
+        monkeypatch.setattr(llm_module, "check_budget", check)
+
+        result = await llm_service.process_complete_motion(
+            motion_type="RFO", all_drafts=self.DRAFTS, profile_data={}, max_concurrency=4
+        )
+
+        assert check.await_count == 4
+        assert result["success"] is True
+
+
+class TestVertexCallsDoNotBlockEventLoop:
+    """Vertex generation must go through the SDK's async API (never the sync call)."""
+
+    @pytest.mark.asyncio
+    async def test_generate_uses_async_sdk_call(self, llm_service):
+        response = MagicMock()
+        response.text = "vertex text"
+        model = MagicMock()
+        model.generate_content_async = AsyncMock(return_value=response)
+        llm_service.model = model
+        llm_service.operation_configs = {}
+
+        text, _, _ = await llm_service._generate("one two three", "section_rewrite")
+
+        assert text == "vertex text"
+        model.generate_content_async.assert_awaited_once()
+        model.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chat_service_methods_use_async_sdk_call(self):
+        from app.services.llm_chat_service import LLMChatService
+
+        response = MagicMock()
+        response.text = '{"intent": "GREETING", "confidence": 0.9, "entities": {}}'
+        service = LLMChatService.__new__(LLMChatService)
+        service.chat_model = MagicMock()
+        service.chat_model.generate_content_async = AsyncMock(return_value=response)
+        service.analysis_config = service.chat_config = None
+        service.safety_settings = []
+
+        intent, _, confidence = await service.classify_intent("hello")
+        await service.summarize_conversation([{"sender": "user", "content": "hi"}])
+
+        assert (intent, confidence) == ("GREETING", 0.9)
+        assert service.chat_model.generate_content_async.await_count == 2
+        service.chat_model.generate_content.assert_not_called()
@@ -0,0 +1,208 @@
+"""
+SSE variants of /llm/rewrite and /llm/process-motion: gated sentences stream
+as they complete and the final ``done`` event carries the same payload the
+batch endpoint produces.
+"""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import AsyncClient
+from starlette.requests import Request
+
+from app.api.v1.endpoints import llm as llm_endpoint
+from app.services import llm_service as llm_module
+from app.services.claude_llm_service import DRAFTING_MODEL, ClaudeLLMService
+
+pytestmark = pytest.mark.asyncio
+
+PROFILE = {
+    "case_number": "24FL009812N",
+    "county": "San Diego",
+    "is_petitioner": True,
+    "party_name": "Maria Delgado",
+    "other_party_name": "Jacob Delgado",
+    "children_info": [],
+}
+
+
+def _events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+async def _motion(client: AsyncClient, headers: dict, drafts) -> str:
+    resp = await client.post("/api/v1/profiles/", json=PROFILE, headers=headers)
+    assert resp.status_code == 201, resp.text
+    resp = await client.post(
+        "/api/v1/motions/", json={"motion_type": "RFO", "title": "Stream"}, headers=headers
+    )
+    motion_id = resp.json()["id"]
+    for number, name, data in drafts:
+        resp = await client.post(
+            f"/api/v1/motions/{motion_id}/drafts",
+            json={"step_number": number, "step_name": name, "question_data": data},
+            headers=headers,
+        )
+        assert resp.status_code == 200, resp.text
+    return motion_id
+
+
+def _fake_stream(texts):
+    """stream_rfo_section stand-in yielding each section's text in small deltas."""
+    remaining = list(texts)
+
+    async def stream(section_name, user_answers, context, user_id=None, outcome=None):
+        text = remaining.pop(0)
+        for i in range(0, len(text), 6):
+            yield text[i:i + 6]
+        outcome.update(success=True, error=None, tokens_used=10, model="mock-llm")
+
+    return stream
+
+
+class TestProcessMotionStream:
+    async def test_streams_gated_sentences_and_saves_sections(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        motion_id = await _motion(client, auth_headers, [
+            (1, "case_information", {"summary": "Schedule change."}),
+            (2, "relief_requested", {"relief": "Adjust the schedule."}),
+        ])
+        monkeypatch.setattr(llm_endpoint.llm_service, "stream_rfo_section", _fake_stream([
+            "Petitioner is **Jacob Delgado**. The schedule no longer works.",
+            "Petitioner asks the court to adjust the schedule.",
+        ]))
+
+        resp = await client.post(
+            "/api/v1/llm/process-motion/stream",
+            json={"motion_id": motion_id}, headers=auth_headers,
+        )
+        assert resp.status_code == 200, resp.text
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _events(resp.text)
+
+        names = [name for name, _ in events]
+        assert names[0] == "section"
+        assert names[-1] == "done"
+        text_events = [data for name, data in events if name == "text"]
+        assert text_events[0] == {
+            "step_number": 1, "section": "case_information",
+            "text": "Petitioner is Maria Delgado.",
+        }
+        assert all("**" not in data["text"] for data in text_events)
+
+        done = events[-1][1]
+        assert done["success"] is True
+        assert done["sections_processed"] == 2
+        assert done["total_tokens"] == 20
+        assert {c["type"] for c in done["corrections"]} >= {"markdown", "party_role"}
+
+        detail = (await client.get(f"/api/v1/motions/{motion_id}", headers=auth_headers)).json()
+        outputs = {d["step_number"]: d["llm_output"] for d in detail["drafts"]}
+        assert outputs[1] == "Petitioner is Maria Delgado. The schedule no longer works."
+        assert detail["status"] == "ready_for_review"
+        assert detail["fact_check"] == {"version": 1, "corrections": done["corrections"]}
+
+    async def test_done_payload_matches_batch_endpoint(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        drafts = [(1, "facts", {"facts": "I have been the primary caregiver. Since June 14, 2026."})]
+        motion_id = await _motion(client, auth_headers, drafts)
+
+        resp = await client.post(
+            "/api/v1/llm/process-motion", json={"motion_id": motion_id}, headers=auth_headers
+        )
+        batch = resp.json()
+        # Force a redraft: unchanged sections would otherwise be reused
+        monkeypatch.setattr(llm_module, "RFO_PROMPT_VERSION", "stream-parity")
+        resp = await client.post(
+            "/api/v1/llm/process-motion/stream",
+            json={"motion_id": motion_id}, headers=auth_headers,
+        )
+        done = _events(resp.text)[-1][1]
+
+        for key in ("motion_id", "success", "sections_processed", "total_tokens", "corrections"):
+            assert done[key] == batch[key]
+
+    async def test_disconnected_client_stops_before_any_section(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        motion_id = await _motion(client, auth_headers, [(1, "facts", {"facts": "x"})])
+        monkeypatch.setattr(Request, "is_disconnected", AsyncMock(return_value=True))
+
+        resp = await client.post(
+            "/api/v1/llm/process-motion/stream",
+            json={"motion_id": motion_id}, headers=auth_headers,
+        )
+        events = _events(resp.text)
+        assert [name for name, _ in events] == ["done"]
+        assert events[0][1]["sections_processed"] == 0
+
+    async def test_unknown_motion_is_404(self, client: AsyncClient, auth_headers: dict):
+        resp = await client.post(
+            "/api/v1/llm/process-motion/stream",
+            json={"motion_id": "00000000-0000-0000-0000-000000000000"},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 404
+
+
+class TestRewriteStream:
+    async def test_ends_with_rewrite_response_and_fact_check(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        resp = await client.post(
+            "/api/v1/llm/rewrite/stream",
+            json={
+                "motion_type": "RFO",
+                "section": "facts",
+                "user_input": "I pick up the kids every Friday. He is late.",
+                "context": {},
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 200, resp.text
+        events = _events(resp.text)
+        assert [name for name, _ in events] == ["text", "text", "done"]
+        done = events[-1][1]
+        assert done["success"] is True
+        assert done["rewritten"] == "".join(data["text"] for name, data in events[:-1])
+        assert done["fact_check"] == {"version": 1, "corrections": []}
+
+
+class TestClaudeStream:
+    async def test_yields_deltas_and_reports_usage(self):
+        class _Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            @property
+            async def text_stream(self):
+                for delta in ("Hello ", "world."):
+                    yield delta
+
+            async def get_final_message(self):
+                message = MagicMock()
+                message.usage.input_tokens = 30
+                message.usage.output_tokens = 12
+                return message
+
+        service = ClaudeLLMService("Base prompt")
+        service._client = MagicMock()
+        service._client.messages.stream = MagicMock(return_value=_Stream())
+
+        streamed = {}
+        deltas = [d async for d in service.stream("p", "section_rewrite", None, streamed)]
+
+        assert deltas == ["Hello ", "world."]
+        assert streamed == {"tokens": 42, "model": DRAFTING_MODEL}
+        kwargs = service._client.messages.stream.call_args.kwargs
+        assert kwargs["system"] == service._system_blocks()
+        assert kwargs["max_tokens"] == 3000
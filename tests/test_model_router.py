@@ -0,0 +1,256 @@
+"""
+Tests for latency-aware model routing (app/services/model_router.py):
+deadlines, fallback on overload, error-rate demotion and hedged requests,
+driven by a fake backend with injectable per-model latency.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.claude_llm_service import CHAT_MODEL, FALLBACK_MODELS, ClaudeLLMService
+from app.services.model_router import ModelRouter, ModelStats, is_retryable
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+class FakeBackend:
+    """request(model) with scripted latency and failures per model."""
+
+    def __init__(self, latency=None, failures=None):
+        self.latency = latency or {}
+        self.failures = failures or {}
+        self.calls = []
+        self.cancelled = 0
+
+    async def request(self, model):
+        self.calls.append(model)
+        delay = self.latency.get(model, 0)
+        if isinstance(delay, list):
+            delay = delay.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        failure = self.failures.get(model)
+        if failure is not None:
+            raise failure
+        return f"answer from {model}"
+
+
+def _router(**kwargs):
+    kwargs.setdefault("fallbacks", {"primary": "secondary"})
+    kwargs.setdefault("hedged_operations", frozenset({"chat_response"}))
+    return ModelRouter(**kwargs)
+
+
+def _warm(router, model, latency, samples=20):
+    for _ in range(samples):
+        router.stats_for(model).record(True, latency)
+
+
+class TestRetryable:
+    @pytest.mark.parametrize("status", [429, 500, 503, 529])
+    def test_overload_and_server_errors_are_retryable(self, status):
+        assert is_retryable(StatusError(status))
+
+    def test_request_errors_are_not(self):
+        assert not is_retryable(StatusError(400))
+        assert not is_retryable(ValueError("bad"))
+
+    def test_timeouts_and_connection_errors_are_retryable(self):
+        import anthropic
+        import httpx
+
+        assert is_retryable(asyncio.TimeoutError())
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        assert is_retryable(anthropic.APIConnectionError(request=request))
+
+
+class TestModelStats:
+    def test_p95_needs_min_samples(self):
+        stats = ModelStats()
+        stats.record(True, 1.0)
+        assert stats.p95() is None
+
+    def test_p95_and_error_rate(self):
+        stats = ModelStats()
+        for latency in range(1, 21):
+            stats.record(True, float(latency))
+        stats.record(False)
+        assert stats.p95() == 19.0
+        assert stats.error_rate() == pytest.approx(1 / 21)
+        assert stats.healthy
+
+    def test_window_forgets_old_outcomes(self):
+        stats = ModelStats(window=10)
+        for _ in range(10):
+            stats.record(False)
+        assert not stats.healthy
+        for _ in range(10):
+            stats.record(True, 0.1)
+        assert stats.healthy
+
+
+class TestFallback:
+    async def test_deadline_falls_back_to_secondary(self):
+        backend = FakeBackend(latency={"primary": 1.0})
+        router = _router(deadlines={"section_rewrite": 0.05})
+
+        result = await router.call("section_rewrite", "primary", backend.request)
+
+        assert result == "answer from secondary"
+        assert backend.calls == ["primary", "secondary"]
+        assert backend.cancelled == 1
+        assert router.stats_for("primary").error_rate() == 1.0
+
+    async def test_overload_falls_back(self):
+        backend = FakeBackend(failures={"primary": StatusError(529)})
+        result = await _router().call("section_rewrite", "primary", backend.request)
+        assert result == "answer from secondary"
+
+    async def test_request_error_does_not_fall_back_or_count(self):
+        backend = FakeBackend(failures={"primary": StatusError(400)})
+        router = _router()
+        with pytest.raises(StatusError):
+            await router.call("section_rewrite", "primary", backend.request)
+        assert backend.calls == ["primary"]
+        assert router.stats_for("primary").outcomes.count(False) == 0
+
+    async def test_both_models_failing_raises_last_error(self):
+        backend = FakeBackend(failures={"primary": StatusError(529), "secondary": StatusError(503)})
+        with pytest.raises(StatusError) as excinfo:
+            await _router().call("section_rewrite", "primary", backend.request)
+        assert excinfo.value.status_code == 503
+
+    async def test_unhealthy_primary_is_tried_after_fallback(self):
+        backend = FakeBackend()
+        router = _router()
+        for _ in range(20):
+            router.stats_for("primary").record(False)
+
+        result = await router.call("section_rewrite", "primary", backend.request)
+
+        assert result == "answer from secondary"
+        assert backend.calls == ["secondary"]
+
+    async def test_model_without_fallback_raises(self):
+        backend = FakeBackend(failures={"solo": StatusError(529)})
+        with pytest.raises(StatusError):
+            await _router().call("section_rewrite", "solo", backend.request)
+
+
+class TestAdmission:
+    @staticmethod
+    def _queued(seconds, admitted):
+        @asynccontextmanager
+        async def admit(model):
+            await asyncio.sleep(seconds)
+            admitted.append(model)
+            yield
+        return admit
+
+    async def test_queue_wait_is_outside_the_deadline_and_latency(self):
+        backend = FakeBackend(latency={"primary": 0.01})
+        router = _router(deadlines={"section_rewrite": 0.1})
+        admitted = []
+
+        result = await router.call(
+            "section_rewrite", "primary", backend.request, self._queued(0.3, admitted)
+        )
+
+        assert result == "answer from primary"
+        assert admitted == ["primary"]
+        stats = router.stats_for("primary")
+        assert stats.error_rate() == 0.0
+        assert max(stats.latencies) < 0.1
+
+    async def test_giving_up_in_the_queue_is_not_a_model_failure(self):
+        backend = FakeBackend()
+        router = _router()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                router.call("section_rewrite", "primary", backend.request, self._queued(1.0, [])),
+                0.05,
+            )
+
+        assert backend.calls == []
+        assert not router.stats_for("primary").outcomes
+
+
+class TestHedging:
+    async def test_slow_request_is_hedged_after_p95(self):
+        backend = FakeBackend(latency={"primary": [1.0, 0.0]})
+        router = _router()
+        _warm(router, "primary", 0.02)
+
+        result = await router.call("chat_response", "primary", backend.request)
+
+        assert result == "answer from primary"
+        assert backend.calls == ["primary", "primary"]
+        assert backend.cancelled == 1
+
+    async def test_fast_request_is_not_hedged(self):
+        backend = FakeBackend()
+        router = _router()
+        _warm(router, "primary", 0.5)
+
+        await router.call("chat_response", "primary", backend.request)
+
+        assert backend.calls == ["primary"]
+
+    async def test_drafting_operations_are_never_hedged(self):
+        backend = FakeBackend(latency={"primary": 0.1})
+        router = _router()
+        _warm(router, "primary", 0.01)
+
+        await router.call("section_rewrite", "primary", backend.request)
+
+        assert backend.calls == ["primary"]
+
+    async def test_no_hedge_without_latency_history(self):
+        backend = FakeBackend(latency={"primary": 0.05})
+        await _router().call("chat_response", "primary", backend.request)
+        assert backend.calls == ["primary"]
+
+    async def test_hedge_survives_failed_first_request(self):
+        backend = FakeBackend(latency={"primary": [0.2, 0.0]})
+        router = _router()
+        _warm(router, "primary", 0.01)
+        first_call = True
+        original = backend.request
+
+        async def flaky(model):
+            nonlocal first_call
+            if first_call:
+                first_call = False
+                await asyncio.sleep(0.05)
+                raise StatusError(503)
+            return await original(model)
+
+        assert await router.call("chat_response", "primary", flaky) == "answer from primary"
+
+
+class TestClaudeBackendRouting:
+    async def test_generate_falls_back_on_overload(self):
+        service = ClaudeLLMService("Base")
+        service.router = ModelRouter(FALLBACK_MODELS)
+        response = MagicMock(content=[MagicMock(type="text", text="Hi")])
+        response.usage = SimpleNamespace(input_tokens=3, output_tokens=2)
+        service._client = MagicMock()
+        service._client.messages.create = AsyncMock(side_effect=[StatusError(529), response])
+
+        text, _, model = await service.generate("hello", "chat_response")
+
+        assert text == "Hi"
+        assert model == FALLBACK_MODELS[CHAT_MODEL]
+        models = [c.kwargs["model"] for c in service._client.messages.create.await_args_list]
+        assert models == [CHAT_MODEL, FALLBACK_MODELS[CHAT_MODEL]]
@@ -0,0 +1,199 @@
+"""
+Tests for the resumable motion-processing job API
+(POST/GET /api/v1/llm/process-motion/jobs): submit returns at once, each
+section is committed as it finishes, and a job orphaned by a worker restart
+resumes under the same id without redrafting saved sections.
+"""
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import llm as llm_endpoints
+from app.services.llm_service import llm_service
+
+pytestmark = pytest.mark.asyncio
+
+JOBS = "/api/v1/llm/process-motion/jobs"
+
+
+@pytest.fixture
+def client(file_client):
+    # Jobs write from their own session while the test polls
+    return file_client
+
+
+async def _motion_with_drafts(client: AsyncClient, headers: dict, sections: int = 3) -> str:
+    resp = await client.post(
+        "/api/v1/motions/",
+        json={"motion_type": "RFO", "title": "Job test"},
+        headers=headers,
+    )
+    assert resp.status_code == 201, resp.text
+    motion_id = resp.json()["id"]
+    for n in range(1, sections + 1):
+        resp = await client.post(
+            f"/api/v1/motions/{motion_id}/drafts",
+            json={
+                "step_number": n,
+                "step_name": f"step_{n}",
+                "question_data": {"a": f"answer {n}"},
+            },
+            headers=headers,
+        )
+        assert resp.status_code == 200, resp.text
+    return motion_id
+
+
+async def _wait_for(client: AsyncClient, headers: dict, job_id: str, done) -> dict:
+    for _ in range(500):
+        resp = await client.get(f"{JOBS}/{job_id}", headers=headers)
+        assert resp.status_code == 200, resp.text
+        if done(resp.json()):
+            return resp.json()
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job {job_id} did not reach the expected state")
+
+
+def _finished(job: dict) -> bool:
+    return job["status"] in ("completed", "failed")
+
+
+class TestSubmitAndPoll:
+    async def test_job_completes_and_saves_sections(self, client: AsyncClient, auth_headers: dict):
+        motion_id = await _motion_with_drafts(client, auth_headers)
+
+        resp = await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)
+        assert resp.status_code == 202, resp.text
+        job = resp.json()
+        assert job["status"] == "queued"
+        assert job["sections_total"] == 3
+
+        job = await _wait_for(client, auth_headers, job["job_id"], _finished)
+        assert job["status"] == "completed"
+        assert job["sections_done"] == 3
+        assert job["result"]["sections_processed"] == 3
+        assert job["progress"]["status"] == "completed"
+
+        detail = (await client.get(f"/api/v1/motions/{motion_id}", headers=auth_headers)).json()
+        assert detail["status"] == "ready_for_review"
+        assert all(d["llm_output"] for d in detail["drafts"])
+
+    async def test_submit_while_running_returns_the_active_job(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        motion_id = await _motion_with_drafts(client, auth_headers)
+        release = asyncio.Event()
+        original = llm_service.process_complete_motion
+
+        async def slow(**kwargs):
+            await release.wait()
+            return await original(**kwargs)
+
+        monkeypatch.setattr(llm_service, "process_complete_motion", slow)
+
+        first = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        second = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        assert second["job_id"] == first["job_id"]
+
+        release.set()
+        job = await _wait_for(client, auth_headers, first["job_id"], _finished)
+        assert job["status"] == "completed"
+
+    async def test_failure_is_reported_on_the_job(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        motion_id = await _motion_with_drafts(client, auth_headers)
+
+        async def broken(**kwargs):
+            raise RuntimeError("provider down")
+
+        monkeypatch.setattr(llm_service, "process_complete_motion", broken)
+
+        job = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        job = await _wait_for(client, auth_headers, job["job_id"], _finished)
+        assert job["status"] == "failed"
+        assert "provider down" in job["error"]
+
+
+class TestResume:
+    async def test_stale_job_resumes_without_redrafting_saved_sections(
+        self, client: AsyncClient, auth_headers: dict, monkeypatch
+    ):
+        motion_id = await _motion_with_drafts(client, auth_headers)
+        original = llm_service.process_complete_motion
+        hang = asyncio.Event()
+
+        async def dies_after_first_section(**kwargs):
+            on_section = kwargs["on_section"]
+            saved_one = False
+
+            async def save_then_hang(section):
+                # Only the first finished section reaches the database
+                nonlocal saved_one
+                if not saved_one:
+                    saved_one = True
+                    await on_section(section)
+                await hang.wait()
+
+            return await original(**{**kwargs, "on_section": save_then_hang})
+
+        monkeypatch.setattr(llm_service, "process_complete_motion", dies_after_first_section)
+        job = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        job_id = job["job_id"]
+        saved = await _wait_for(client, auth_headers, job_id, lambda j: j["sections_done"] >= 1)
+
+        # Simulate the worker dying mid-job
+        task = llm_endpoints._motion_jobs[job_id]
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        monkeypatch.setattr(llm_service, "process_complete_motion", original)
+
+        # Not yet stale: resubmitting reports the orphaned job as-is
+        again = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        assert again["job_id"] == job_id and again["resumed"] is False
+
+        monkeypatch.setattr(llm_endpoints, "MOTION_JOB_STALE_SECONDS", -1)
+        resumed = await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)
+        assert resumed.status_code == 202
+        assert resumed.json()["job_id"] == job_id
+        assert resumed.json()["resumed"] is True
+
+        job = await _wait_for(client, auth_headers, job_id, _finished)
+        assert job["status"] == "completed"
+        assert job["result"]["sections_processed"] == 3
+        assert saved["sections_done"] == 1
+        assert job["result"]["sections_reused"] == 1
+
+    async def test_finished_job_is_replaced_by_a_new_one(self, client: AsyncClient, auth_headers: dict):
+        motion_id = await _motion_with_drafts(client, auth_headers, sections=1)
+        first = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        await _wait_for(client, auth_headers, first["job_id"], _finished)
+
+        second = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        assert second["job_id"] != first["job_id"]
+        await _wait_for(client, auth_headers, second["job_id"], _finished)
+
+
+class TestAccess:
+    async def test_unknown_job_is_404(self, client: AsyncClient, auth_headers: dict):
+        resp = await client.get(f"{JOBS}/does-not-exist", headers=auth_headers)
+        assert resp.status_code == 404
+
+    async def test_other_users_job_is_404(self, client: AsyncClient, auth_headers: dict):
+        motion_id = await _motion_with_drafts(client, auth_headers, sections=1)
+        job = (await client.post(JOBS, json={"motion_id": motion_id}, headers=auth_headers)).json()
+        await _wait_for(client, auth_headers, job["job_id"], _finished)
+
+        register = await client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "other@example.com",
+                "password": "otherpass123",
+                "full_name": "Other User",
+                "phone": "555-555-5555",
+            },
+        )
+        other = {"Authorization": f"Bearer {register.json()['access_token']}"}
+        resp = await client.get(f"{JOBS}/{job['job_id']}", headers=other)
+        assert resp.status_code == 404
@@ -0,0 +1,215 @@
+"""
+Tests for the cacheable drafting prefix (app/services/prompt_prefix.py) and
+how the Claude backend lays out system blocks around it.
+"""
+import logging
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services import llm_service as llm_module
+from app.services.claude_llm_service import (
+    DRAFTING_MODEL,
+    OPERATION_MODELS,
+    UPL_GUARDRAILS,
+    ClaudeLLMService,
+)
+from app.services.cost_monitoring_service import CostMonitoringService
+from app.services.llm_cache import llm_cache
+from app.services.prompt_prefix import (
+    PROMPT_PREFIX_VERSION,
+    DRAFTING_OPERATIONS,
+    RFO_INSTRUCTIONS,
+    build_drafting_reference,
+    build_drafting_references,
+    guidance_only,
+    min_cacheable_tokens,
+    reference_sections,
+    warn_if_uncacheable,
+)
+from app.services.token_usage import TokenUsage, estimate_tokens
+
+PROMPTS = """# Prompts
+
+## System Prompt
+You are a legal writing assistant.
+
+## RFO Motion Rewrite Prompt Template
+Rewrite the RFO section.
+
+## Declaration Rewrite Prompt Template
+Rewrite the declaration.
+
+## Error Handling Prompts
+Ask the user to clarify.
+
+## Tone Modulation Settings
+Neutral and formal.
+"""
+
+CONTEXT = {"party_role": "Petitioner", "party_name": "Maria Delgado",
+           "other_party_name": "Jacob Delgado", "children_info": []}
+
+
+def _claude_service(reference="DRAFTING REFERENCE"):
+    service = ClaudeLLMService("Base prompt", {"section_rewrite": reference})
+    response = MagicMock(content=[MagicMock(type="text", text="Drafted")])
+    response.usage = SimpleNamespace(input_tokens=10, output_tokens=5)
+    service._client = MagicMock()
+    service._client.messages.create = AsyncMock(return_value=response)
+    return service
+
+
+class TestDraftingReference:
+    def test_keeps_only_reference_sections_in_file_order(self):
+        text = reference_sections(PROMPTS, ["Tone Modulation Settings", "RFO Motion Rewrite Prompt Template"])
+        assert text.index("## RFO Motion") < text.index("## Tone Modulation")
+        assert "Error Handling" not in text
+        assert "System Prompt" not in text
+
+    def test_reference_is_versioned_and_carries_rules(self):
+        reference = build_drafting_reference(PROMPTS, "section_rewrite")
+        assert f"version {PROMPT_PREFIX_VERSION}" in reference
+        assert RFO_INSTRUCTIONS in reference
+        assert "Rewrite the RFO section." in reference
+
+    def test_reference_carries_only_its_own_template(self):
+        references = build_drafting_references(PROMPTS)
+        assert set(references) == DRAFTING_OPERATIONS
+        assert "Rewrite the declaration." not in references["section_rewrite"]
+        assert "Rewrite the RFO section." not in references["declaration"]
+        assert "Neutral and formal." in references["declaration"]
+
+    def test_reference_is_deterministic(self):
+        assert build_drafting_references(PROMPTS) == build_drafting_references(PROMPTS)
+
+    def test_guidance_drops_input_slots_and_example_facts(self):
+        section = (
+            "## Template\n\n```\nTask: Rewrite this section.\n\nUser's Draft Input:\n"
+            "{user_input}\n\nInstructions:\n1. Be formal\n2. Keep within {max_words} words\n"
+            "```\n\n### Factual\n- Characteristics: Objective\n"
+            "- Example: \"On March 15, 2024, Respondent failed to appear.\""
+        )
+        assert guidance_only(section) == (
+            "## Template\n\nInstructions:\n1. Be formal\n\n### Factual\n- Characteristics: Objective"
+        )
+
+    def test_real_prefixes_carry_no_placeholders_or_sample_facts(self):
+        prompts = llm_module.LLMService().prompts_content
+        assert "{user_input}" in prompts and "March 15, 2024" in prompts
+        for operation, reference in build_drafting_references(prompts).items():
+            assert not re.search(r"\{[^{}]*\}", reference), operation
+            assert "Example:" not in reference and "March 15, 2024" not in reference, operation
+            assert "Style" in reference, operation
+
+    def test_real_prefix_clears_the_sonnet_tier_cache_minimum(self, caplog):
+        llm = llm_module.LLMService()
+        assert llm.prompts_content
+        with caplog.at_level(logging.WARNING, logger="app.services.prompt_prefix"):
+            service = ClaudeLLMService(
+                llm._get_system_prompt(), build_drafting_references(llm.prompts_content)
+            )
+        for operation in DRAFTING_OPERATIONS:
+            prefix = service._system_blocks(operation)[0]["text"]
+            assert OPERATION_MODELS[operation] == DRAFTING_MODEL
+            assert estimate_tokens(prefix) >= min_cacheable_tokens("claude-sonnet-4-6"), operation
+        # The default Opus tier's minimum is out of reach; startup says so
+        if estimate_tokens(prefix) < min_cacheable_tokens(DRAFTING_MODEL):
+            assert "cache minimum" in caplog.text
+
+    def test_min_cacheable_tokens_by_family(self):
+        assert min_cacheable_tokens("claude-sonnet-4-5") == 1024
+        assert min_cacheable_tokens("claude-opus-4-8") == 4096
+        assert min_cacheable_tokens("some-other-model") == 4096
+
+    def test_warns_when_prefix_too_short(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.services.prompt_prefix"):
+            assert warn_if_uncacheable("short prefix", "claude-opus-4-8") is False
+        assert "cache minimum" in caplog.text
+        assert warn_if_uncacheable("word " * 2000, "claude-sonnet-4-5") is True
+
+
+class TestSystemBlocks:
+    def test_drafting_operations_get_reference_in_stable_block(self):
+        blocks = ClaudeLLMService(
+            "Base prompt", {"section_rewrite": "DRAFTING REFERENCE"}
+        )._system_blocks("section_rewrite")
+        assert len(blocks) == 1
+        assert blocks[0]["text"].startswith(f"Base prompt\n\n{UPL_GUARDRAILS}")
+        assert blocks[0]["text"].endswith("DRAFTING REFERENCE")
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_chat_operations_skip_reference(self):
+        blocks = ClaudeLLMService(
+            "Base prompt", {"section_rewrite": "DRAFTING REFERENCE"}
+        )._system_blocks("chat_response")
+        assert "DRAFTING REFERENCE" not in blocks[0]["text"]
+
+    def test_motion_prefix_is_second_cached_block(self):
+        blocks = ClaudeLLMService("Base")._system_blocks("section_rewrite", "FACTS: anchor")
+        assert [b["text"] for b in blocks][1] == "FACTS: anchor"
+        assert blocks[1]["cache_control"] == {"type": "ephemeral"}
+
+    async def test_generate_sends_motion_prefix_and_keys_cache_on_it(self, monkeypatch):
+        monkeypatch.setenv("LLM_CACHE_ENABLED", "true")
+        llm_cache.clear()
+        service = _claude_service()
+
+        await service.generate("body", "section_rewrite", motion_prefix="FACTS: A")
+        await service.generate("body", "section_rewrite", motion_prefix="FACTS: B")
+        await service.generate("body", "section_rewrite", motion_prefix="FACTS: A")
+
+        calls = service._client.messages.create.await_args_list
+        assert len(calls) == 2
+        assert calls[0].kwargs["system"][1]["text"] == "FACTS: A"
+        assert calls[0].kwargs["messages"][0]["content"] == "body"
+        llm_cache.clear()
+
+
+class TestRfoPromptSplit:
+    def test_full_prompt_is_body_anchor_instructions(self):
+        service = llm_module.LLMService()
+        body, anchor = service._rfo_prompt_parts("facts", "My input", CONTEXT)
+        prompt = service._build_rfo_prompt("facts", "My input", CONTEXT)
+        assert prompt == f"{body}\n\n{anchor}\n\n{RFO_INSTRUCTIONS}"
+        assert "Petitioner is Maria Delgado." in anchor
+        assert "Instructions:" not in body
+
+    async def test_claude_section_rewrite_moves_anchor_to_system(self, monkeypatch):
+        service = llm_module.LLMService()
+        backend = MagicMock()
+        backend.generate = AsyncMock(return_value=("Drafted", 10, "claude"))
+        service.claude_backend = backend
+        service.batch_backend = None
+        monkeypatch.setattr(llm_module, "USE_MOCK_LLM", False)
+        monkeypatch.setattr(llm_module, "track_llm_cost", AsyncMock())
+
+        result = await service.rewrite_rfo_section("facts", {"facts": "x"}, CONTEXT)
+
+        assert result["success"] is True
+        prompt, operation, _ = backend.generate.await_args.args
+        assert operation == "section_rewrite"
+        assert "FACTS (authoritative" not in prompt
+        assert "Petitioner is Maria Delgado." in backend.generate.await_args.kwargs["motion_prefix"]
+
+    def test_prefix_version_changes_section_fingerprint(self, monkeypatch):
+        service = llm_module.LLMService()
+        before = service.section_fingerprint("facts", {"a": 1}, CONTEXT)
+        monkeypatch.setattr(llm_module, "PROMPT_PREFIX_VERSION", "test-bump")
+        assert service.section_fingerprint("facts", {"a": 1}, CONTEXT) != before
+
+
+class TestCacheUsageReport:
+    async def test_report_totals_cache_reads_and_writes(self):
+        monitor = CostMonitoringService()
+        await monitor.track_llm_usage("section_rewrite", TokenUsage(
+            input_tokens=100, output_tokens=50, cache_creation_input_tokens=900))
+        await monitor.track_llm_usage("section_rewrite", TokenUsage(
+            input_tokens=100, output_tokens=50, cache_read_input_tokens=900))
+        await monitor.track_llm_usage("chat_response", 300)
+
+        totals = monitor.get_usage_report()["totals"]
+
+        assert totals["cache_read_input_tokens"] == 900
+        assert totals["cache_creation_input_tokens"] == 900
+        assert totals["cache_read_ratio"] == round(900 / 2000, 3)
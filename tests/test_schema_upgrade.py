@@ -46,6 +46,8 @@ async def test_create_tables_adds_fact_check_to_legacy_motions_table():
 
     columns = await _motions_columns(engine)
     assert "fact_check" in columns
+    assert "processing_job" in columns
+    assert "speculative_drafts" in columns
     await engine.dispose()
 
 
@@ -55,3 +57,17 @@ async def test_create_tables_upgrade_is_idempotent():
     await database.create_tables()  # second run must not raise
     assert "fact_check" in await _motions_columns(engine)
     await engine.dispose()
+
+
+async def test_create_tables_adds_input_fingerprint_to_legacy_drafts_table():
+    database, engine = await _database_with_engine()
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("CREATE TABLE motion_drafts (id VARCHAR(36) NOT NULL PRIMARY KEY)")
+        )
+    await database.create_tables()
+
+    async with engine.connect() as conn:
+        rows = await conn.execute(text("PRAGMA table_info(motion_drafts)"))
+        assert "input_fingerprint" in {row[1] for row in rows}
+    await engine.dispose()
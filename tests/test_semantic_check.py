@@ -149,3 +149,120 @@ async def test_no_claude_backend_returns_empty(monkeypatch):
     monkeypatch.setattr(llm_module, "USE_MOCK_LLM", False)
     monkeypatch.setattr(llm_module.llm_service, "claude_backend", None)
     assert await semantic_check_service.check_text(TEXT, INTAKE, CONTEXT) == []
+
+
+def _long_text(sentences: int = 60) -> str:
+    return " ".join(
+        f"Sentence {i} describes event number {i} in some detail for the court." for i in range(sentences)
+    )
+
+
+class TestWindows:
+    def test_short_text_is_one_window(self):
+        assert semantic_check_service.text_windows(TEXT) == [(0, len(TEXT))]
+
+    def test_windows_cover_text_on_sentence_boundaries_with_overlap(self, monkeypatch):
+        monkeypatch.setattr(semantic_check_service, "WINDOW_CHARS", 500)
+        text = _long_text()
+        windows = semantic_check_service.text_windows(text)
+
+        assert len(windows) > 3
+        assert windows[0][0] == 0 and windows[-1][1] == len(text)
+        for (start, end), (next_start, _) in zip(windows, windows[1:]):
+            assert end - start <= 500
+            assert next_start < end  # consecutive windows overlap
+            assert text[next_start:].startswith("Sentence")
+            assert text[:end].endswith(".")
+
+    def test_oversized_sentence_gets_its_own_window(self, monkeypatch):
+        monkeypatch.setattr(semantic_check_service, "WINDOW_CHARS", 50)
+        text = "Short one. " + "x" * 120 + ". Short two."
+        windows = semantic_check_service.text_windows(text)
+        assert [text[s:e] for s, e in windows] == ["Short one.", "x" * 120 + ".", "Short two."]
+
+
+class TestWindowedCheck:
+    async def test_windows_run_concurrently_and_findings_merge(self, monkeypatch):
+        monkeypatch.setattr(semantic_check_service, "WINDOW_CHARS", 500)
+        monkeypatch.setattr(llm_module, "USE_MOCK_LLM", False)
+        text = _long_text()
+        in_flight = peak = 0
+
+        async def generate(prompt, operation):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            # Every window that sees sentence 10 or 50 flags it
+            findings = [
+                {"claim": claim, "reason": "Not in the intake."}
+                for claim in ("event number 50", "event number 10")
+                if claim in prompt
+            ]
+            return _findings_json(findings), 10, "claude-opus-4-8"
+
+        backend = AsyncMock()
+        backend.generate = generate
+        monkeypatch.setattr(llm_module.llm_service, "claude_backend", backend)
+
+        corrections = await semantic_check_service.check_text(text, INTAKE, CONTEXT)
+
+        assert peak == len(semantic_check_service.text_windows(text))
+        assert [c["original"] for c in corrections] == ["event number 10", "event number 50"]
+
+    async def test_overlapping_claims_from_one_window_are_all_kept(self, monkeypatch):
+        _real_backend(monkeypatch, _findings_json([
+            {"claim": "Respondent has denied visits", "reason": "The intake names one visit."},
+            {"claim": "at least twelve occasions", "reason": "No count in the intake."},
+            {"claim": "denied visits on at least twelve", "reason": "Unsupported."},
+        ]))
+        corrections = await semantic_check_service.check_text(TEXT, INTAKE, CONTEXT)
+        assert len(corrections) == 3
+
+    async def test_overlapping_claims_from_different_windows_are_merged(self):
+        text = "A " * 10 + "event number 5 was late."
+        first = {"original": "event number 5 was late", "message": "window 1"}
+        second = {"original": "number 5 was late.", "message": "window 2"}
+        third = {"original": "A A", "message": "window 2"}
+        merged = semantic_check_service._merge([
+            (1, (text.find(second["original"]), len(text)), second),
+            (0, (text.find(first["original"]), len(text) - 1), first),
+            (1, (0, 3), third),
+        ])
+        # window 2's rewording of window 1's claim goes; its unrelated claim stays
+        assert merged == [third, first]
+
+    async def test_windows_past_the_deadline_are_dropped_not_the_whole_check(self, monkeypatch):
+        monkeypatch.setattr(semantic_check_service, "WINDOW_CHARS", 500)
+        monkeypatch.setattr(semantic_check_service, "TIMEOUT_SECONDS", 0.2)
+        monkeypatch.setattr(llm_module, "USE_MOCK_LLM", False)
+
+        async def generate(prompt, operation):
+            if "excerpt 1 of" not in prompt:
+                await asyncio.sleep(5)
+            return _findings_json([{"claim": "event number 1 ", "reason": "Unsupported."}]), 10, "m"
+
+        backend = AsyncMock()
+        backend.generate = generate
+        monkeypatch.setattr(llm_module.llm_service, "claude_backend", backend)
+
+        corrections = await semantic_check_service.check_text(_long_text(), INTAKE, CONTEXT)
+        assert [c["original"] for c in corrections] == ["event number 1"]
+
+    async def test_one_failing_window_keeps_the_others(self, monkeypatch):
+        monkeypatch.setattr(semantic_check_service, "WINDOW_CHARS", 500)
+        monkeypatch.setattr(llm_module, "USE_MOCK_LLM", False)
+
+        async def generate(prompt, operation):
+            if "excerpt 2 of" in prompt:
+                raise RuntimeError("overloaded")
+            claims = [c for c in ("event number 0 ",) if c in prompt]
+            return _findings_json([{"claim": c, "reason": "Unsupported."} for c in claims]), 1, "m"
+
+        backend = AsyncMock()
+        backend.generate = generate
+        monkeypatch.setattr(llm_module.llm_service, "claude_backend", backend)
+
+        corrections = await semantic_check_service.check_text(_long_text(), INTAKE, CONTEXT)
+        assert [c["original"] for c in corrections] == ["event number 0"]
@@ -0,0 +1,192 @@
+"""
+Tests for speculative pre-drafting: when the last intake step is saved (and
+SPECULATIVE_DRAFTING_ENABLED is on) sections are drafted in the background
+and stored by input fingerprint; process-motion uses them when the inputs
+are unchanged and drafts normally when the user edited in between.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.endpoints import llm as llm_endpoints
+from app.services.llm_scheduler import BACKGROUND, priority_for
+from app.services.llm_service import llm_service
+
+pytestmark = pytest.mark.asyncio
+
+# Steps 3-4 are conditional on relief categories not chosen here
+INTAKE = [
+    (1, {"has_existing_case": False, "county": "Los Angeles", "party_role": "petitioner"}),
+    (2, {"relief_categories": ["other"], "emergency_orders": False}),
+    (5, {"background_facts": "We separated in 2022.", "changed_circumstances": "New job."}),
+    (6, {"other_orders": "None"}),
+]
+
+
+@pytest.fixture
+def client(file_client):
+    # The pre-draft writes from its own session while the test makes requests
+    return file_client
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(llm_endpoints, "SPECULATIVE_DRAFTING_ENABLED", True)
+
+
+@pytest.fixture
+def rewrites(monkeypatch):
+    """Count model calls while still producing mock output."""
+    original = llm_service.rewrite_rfo_section
+    calls = []
+
+    async def counting(section_name, answers, context):
+        calls.append((section_name, priority_for("section_rewrite")))
+        return await original(section_name, answers, context)
+
+    monkeypatch.setattr(llm_service, "rewrite_rfo_section", counting)
+    return calls
+
+
+async def _complete_intake(client: AsyncClient, headers: dict) -> tuple:
+    resp = await client.post(
+        "/api/v1/motions/", json={"motion_type": "RFO", "title": "Predraft"}, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+    motion_id = resp.json()["id"]
+    body = None
+    for step, answers in INTAKE:
+        resp = await client.post(
+            "/api/v1/intake/rfo/submit-step",
+            json={"motion_id": motion_id, "step_number": step, "answers": answers},
+            headers=headers,
+        )
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["valid"], body
+    return motion_id, body
+
+
+async def _predrafts_finished() -> None:
+    await asyncio.gather(*llm_endpoints._predrafts.values(), return_exceptions=True)
+
+
+async def _process(client: AsyncClient, headers: dict, motion_id: str) -> dict:
+    resp = await client.post(
+        "/api/v1/llm/process-motion", json={"motion_id": motion_id}, headers=headers
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+class TestDisabled:
+    async def test_no_predraft_by_default(self, client: AsyncClient, auth_headers: dict, rewrites):
+        motion_id, final = await _complete_intake(client, auth_headers)
+        assert final["next_step"] is None
+        assert final["predraft_started"] is False
+
+        result = await _process(client, auth_headers, motion_id)
+        assert result["sections_prefetched"] == 0
+        assert len(rewrites) == len(INTAKE)
+
+
+class TestPredraft:
+    async def test_unchanged_inputs_use_the_predraft(
+        self, client: AsyncClient, auth_headers: dict, enabled, rewrites
+    ):
+        motion_id, final = await _complete_intake(client, auth_headers)
+        assert final["predraft_started"] is True
+        await _predrafts_finished()
+        assert len(rewrites) == len(INTAKE)
+        # Speculative calls queue behind work someone is waiting on
+        assert {priority for _, priority in rewrites} == {BACKGROUND}
+
+        result = await _process(client, auth_headers, motion_id)
+        assert result["success"] is True
+        assert result["sections_prefetched"] == len(INTAKE)
+        assert len(rewrites) == len(INTAKE)  # no further model calls
+
+        detail = (await client.get(f"/api/v1/motions/{motion_id}", headers=auth_headers)).json()
+        assert detail["status"] == "ready_for_review"
+        assert all(d["llm_output"] for d in detail["drafts"])
+
+    async def test_edit_after_predraft_redrafts_affected_sections(
+        self, client: AsyncClient, auth_headers: dict, enabled, rewrites
+    ):
+        motion_id, _ = await _complete_intake(client, auth_headers)
+        await _predrafts_finished()
+        rewrites.clear()
+
+        # Editing step 5 discards the stored pre-draft
+        resp = await client.post(
+            f"/api/v1/motions/{motion_id}/drafts",
+            json={"step_number": 5, "step_name": "facts_circumstances",
+                  "question_data": {"background_facts": "We separated in 2021."}},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 200, resp.text
+
+        result = await _process(client, auth_headers, motion_id)
+        assert result["sections_prefetched"] == 0
+        assert len(rewrites) == len(INTAKE)
+
+    async def test_stale_entries_are_ignored_by_fingerprint(
+        self, client: AsyncClient, auth_headers: dict, enabled, rewrites, monkeypatch
+    ):
+        motion_id, _ = await _complete_intake(client, auth_headers)
+        await _predrafts_finished()
+        rewrites.clear()
+
+        # An edit another worker made without discarding: steps 5 and 6 see
+        # the changed answers in their context, steps 1-2 do not
+        monkeypatch.setattr(llm_endpoints, "discard_predraft", lambda motion: None)
+        from app.api.v1.endpoints import motions as motions_endpoints
+        monkeypatch.setattr(motions_endpoints, "discard_predraft", lambda motion: None)
+        await client.post(
+            f"/api/v1/motions/{motion_id}/drafts",
+            json={"step_number": 5, "step_name": "facts_circumstances",
+                  "question_data": {"background_facts": "We separated in 2021."}},
+            headers=auth_headers,
+        )
+
+        result = await _process(client, auth_headers, motion_id)
+        assert result["sections_prefetched"] == 2
+        assert sorted(name for name, _ in rewrites) == ["facts_circumstances", "other_requests"]
+
+    async def test_process_motion_waits_for_an_inflight_predraft(
+        self, client: AsyncClient, auth_headers: dict, enabled, rewrites, monkeypatch
+    ):
+        release = asyncio.Event()
+        counting = llm_service.rewrite_rfo_section
+
+        async def slow(section_name, answers, context):
+            await release.wait()
+            return await counting(section_name, answers, context)
+
+        monkeypatch.setattr(llm_service, "rewrite_rfo_section", slow)
+        motion_id, _ = await _complete_intake(client, auth_headers)
+
+        processing = asyncio.create_task(_process(client, auth_headers, motion_id))
+        await asyncio.sleep(0.05)
+        assert not processing.done()
+        release.set()
+
+        result = await processing
+        assert result["sections_prefetched"] == len(INTAKE)
+        assert len(rewrites) == len(INTAKE)
+
+    async def test_failed_predraft_falls_back_to_normal_drafting(
+        self, client: AsyncClient, auth_headers: dict, enabled, monkeypatch
+    ):
+        monkeypatch.setattr(
+            llm_service, "process_complete_motion", AsyncMock(side_effect=RuntimeError("down"))
+        )
+        motion_id, _ = await _complete_intake(client, auth_headers)
+        await _predrafts_finished()
+        monkeypatch.undo()
+
+        result = await _process(client, auth_headers, motion_id)
+        assert result["success"] is True
+        assert result["sections_prefetched"] == 0
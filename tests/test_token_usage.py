@@ -0,0 +1,162 @@
+"""
+Tests for provider-reported token accounting (app/services/token_usage.py)
+and its use by the backends, cost tracking and budget checks.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.middleware.rate_limit_config import get_token_limit
+from app.services import llm_service as llm_module
+from app.services.claude_llm_service import ClaudeLLMService
+from app.services.cost_monitoring_service import CostMonitoringService
+from app.services.token_usage import (
+    TokenUsage,
+    estimate_tokens,
+    request_token_estimate,
+)
+
+
+class TestTokenUsage:
+    def test_int_value_is_total_tokens(self):
+        usage = TokenUsage(input_tokens=100, output_tokens=50,
+                           cache_read_input_tokens=1000, cache_creation_input_tokens=10)
+        assert usage == 1160
+        assert isinstance(usage, int)
+        assert sum([usage, TokenUsage(1, 1)]) == 1162
+        assert json.dumps({"tokens_used": usage}) == '{"tokens_used": 1160}'
+
+    def test_billable_discounts_cache_reads_and_charges_cache_writes(self):
+        usage = TokenUsage(input_tokens=100, output_tokens=50,
+                           cache_read_input_tokens=1000, cache_creation_input_tokens=100)
+        assert usage.billable_tokens == 100 + 50 + 100 + 125
+
+    def test_from_anthropic_reads_cache_fields(self):
+        usage = TokenUsage.from_anthropic(SimpleNamespace(
+            input_tokens=12, output_tokens=30,
+            cache_read_input_tokens=900, cache_creation_input_tokens=None,
+        ))
+        assert usage.as_dict() == {
+            "input_tokens": 12, "output_tokens": 30,
+            "cache_read_input_tokens": 900, "cache_creation_input_tokens": 0,
+            "estimated": False,
+        }
+
+    def test_from_anthropic_ignores_unset_mock_fields(self):
+        usage = MagicMock()
+        usage.input_tokens, usage.output_tokens = 100, 50
+        assert TokenUsage.from_anthropic(usage) == 150
+
+    def test_from_vertex_splits_cached_content_out_of_prompt(self):
+        usage = TokenUsage.from_vertex(SimpleNamespace(
+            prompt_token_count=1200, candidates_token_count=300,
+            cached_content_token_count=1000,
+        ))
+        assert (usage.input_tokens, usage.cache_read_input_tokens, usage.output_tokens) == (200, 1000, 300)
+        assert usage == 1500
+
+    def test_from_vertex_without_counts_is_none(self):
+        assert TokenUsage.from_vertex(None) is None
+        assert TokenUsage.from_vertex(MagicMock()) is None
+
+    def test_estimate_is_marked_estimated(self):
+        usage = TokenUsage.estimate("Petitioner requests custody.", "Granted.")
+        assert usage.estimated is True
+        assert usage.input_tokens == estimate_tokens("Petitioner requests custody.")
+
+
+class TestEstimateTokens:
+    def test_empty_text(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens(None) == 0
+
+    def test_counts_punctuation_and_splits_long_words(self):
+        # "the"=1, "," = 1, "Respondent" = 3, "." = 1
+        assert estimate_tokens("the, Respondent.") == 6
+
+    def test_exceeds_whitespace_count_on_legal_prose(self):
+        text = "On 06/14/2026, Respondent (Jacob Delgado) failed to return the children; see FL-341."
+        assert estimate_tokens(text) > len(text.split())
+
+    def test_request_estimate_reserves_output_allowance(self):
+        assert request_token_estimate("one two", 3000) == 3002
+
+
+class TestBackendsReportProviderUsage:
+    async def test_claude_generate_returns_usage_breakdown(self):
+        service = ClaudeLLMService(base_system_prompt="Base")
+        block = MagicMock(type="text", text="Drafted")
+        response = MagicMock(content=[block])
+        response.usage = SimpleNamespace(input_tokens=40, output_tokens=60,
+                                         cache_read_input_tokens=2000,
+                                         cache_creation_input_tokens=0)
+        service._client = AsyncMock()
+        service._client.messages.create.return_value = response
+
+        _, usage, _ = await service.generate("Rewrite", "section_rewrite")
+
+        assert usage.cache_read_input_tokens == 2000
+        assert usage == 2100
+
+    async def test_vertex_generate_uses_usage_metadata(self):
+        service = llm_module.LLMService.__new__(llm_module.LLMService)
+        service.claude_backend = None
+        service.batch_backend = None
+        service.operation_configs = {}
+        service.generation_config = None
+        service.safety_settings = None
+        response = MagicMock(text="vertex text")
+        response.usage_metadata = SimpleNamespace(
+            prompt_token_count=80, candidates_token_count=20, cached_content_token_count=0
+        )
+        service.model = MagicMock()
+        service.model.generate_content_async = AsyncMock(return_value=response)
+
+        _, usage, _ = await service._generate("prompt words", "section_rewrite")
+
+        assert (usage.input_tokens, usage.output_tokens, usage.estimated) == (80, 20, False)
+
+    async def test_vertex_generate_estimates_without_metadata(self):
+        service = llm_module.LLMService.__new__(llm_module.LLMService)
+        service.claude_backend = None
+        service.batch_backend = None
+        service.operation_configs = {}
+        service.generation_config = None
+        service.safety_settings = None
+        service.model = MagicMock()
+        service.model.generate_content_async = AsyncMock(return_value=MagicMock(text="ok"))
+
+        _, usage, _ = await service._generate("prompt words", "section_rewrite")
+
+        assert usage.estimated is True
+        assert usage == estimate_tokens("prompt words") + estimate_tokens("ok")
+
+
+class TestCostAndBudget:
+    async def test_track_llm_usage_charges_billable_tokens(self):
+        monitor = CostMonitoringService()
+        usage = TokenUsage(input_tokens=100, output_tokens=100, cache_read_input_tokens=10_000)
+
+        metric = await monitor.track_llm_usage("section_rewrite", usage)
+
+        assert metric.tokens_used == 10_200
+        assert metric.metadata["cache_read_input_tokens"] == 10_000
+        plain = await monitor.track_llm_usage("section_rewrite", 1_200)
+        assert metric.estimated_cost == pytest.approx(plain.estimated_cost)
+
+    async def test_plain_int_tokens_still_tracked(self):
+        monitor = CostMonitoringService()
+        metric = await monitor.track_llm_usage("section_rewrite", 500)
+        assert metric.tokens_used == 500
+        assert metric.metadata == {}
+
+    async def test_budget_check_reserves_operation_output_limit(self, monkeypatch):
+        check_budget = AsyncMock(return_value=(False, "over budget"))
+        monkeypatch.setattr(llm_module, "check_budget", check_budget)
+
+        await llm_module.llm_service.rewrite_rfo_section("facts", {"facts": "x"}, {})
+
+        estimated = check_budget.await_args.args[0]
+        assert estimated > get_token_limit("section_rewrite")